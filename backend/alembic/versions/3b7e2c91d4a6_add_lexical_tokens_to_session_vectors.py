@@ -0,0 +1,58 @@
+"""add_lexical_tokens_to_session_vectors
+
+Adds a keyed lexical index (HMAC digests of SOAP word tokens) to session_vectors
+for hybrid lexical + vector retrieval.
+
+Existing rows start with an empty token array; until they are indexed they
+are found by vector search only. Run scripts/backfill_lexical_tokens.py after
+upgrading to index them in batches (tokens need the decrypted SOAP text, so
+this cannot be done in SQL here).
+
+Revision ID: 3b7e2c91d4a6
+Revises: fd96a368a54b
+Create Date: 2026-10-18 09:12:41.508214
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e2c91d4a6"
+down_revision: str | Sequence[str] | None = "fd96a368a54b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "session_vectors",
+        sa.Column(
+            "lexical_tokens",
+            postgresql.ARRAY(sa.String(length=16)),
+            server_default="{}",
+            nullable=False,
+        ),
+    )
+
+    # GIN index for token overlap (&&) lookups
+    op.create_index(
+        "idx_session_vectors_lexical_tokens",
+        "session_vectors",
+        ["lexical_tokens"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "idx_session_vectors_lexical_tokens",
+        table_name="session_vectors",
+    )
+    op.drop_column("session_vectors", "lexical_tokens")
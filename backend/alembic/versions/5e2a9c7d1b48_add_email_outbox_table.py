@@ -0,0 +1,121 @@
+"""add_email_outbox_table
+
+Transactional email outbox: request handlers insert emails (magic links,
+invitations) in their own transaction and the arq worker delivers them, so
+SMTP latency no longer sits on the request path.
+
+Revision ID: 5e2a9c7d1b48
+Revises: 8c4d1f6a2e93
+Create Date: 2026-10-18 11:52:30.274119
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2a9c7d1b48"
+down_revision: str | Sequence[str] | None = "8c4d1f6a2e93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "kind",
+            sa.Enum(
+                "MAGIC_LINK",
+                "INVITATION",
+                name="emailkind",
+                native_enum=False,
+                length=50,
+            ),
+            nullable=False,
+            comment="Email template (magic_link, invitation)",
+        ),
+        sa.Column(
+            "payload",
+            sa.LargeBinary(),  # EncryptedString uses LargeBinary
+            nullable=False,
+            comment="Encrypted JSON template arguments (recipient, link)",
+        ),
+        sa.Column(
+            "dedupe_key",
+            sa.String(length=255),
+            nullable=True,
+            comment="Collapses repeated emails while pending (e.g. magic_link:<user>)",
+        ),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "PENDING",
+                "SENT",
+                "FAILED",
+                name="emailoutboxstatus",
+                native_enum=False,
+                length=20,
+            ),
+            server_default="PENDING",
+            nullable=False,
+        ),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Delivery attempts made so far",
+        ),
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Earliest time of the next delivery attempt (retry backoff)",
+        ),
+        sa.Column(
+            "expires_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Do not deliver after this time (e.g. magic link expiry)",
+        ),
+        sa.Column(
+            "last_error",
+            sa.String(length=500),
+            nullable=True,
+            comment="Error from the last failed attempt",
+        ),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Transactional email outbox drained by the arq worker",
+    )
+
+    # Drain query: pending rows that are due, oldest first
+    op.create_index(
+        "idx_email_outbox_pending_due",
+        "email_outbox",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+    # One pending email per dedupe key (ON CONFLICT target)
+    op.create_index(
+        "uq_email_outbox_pending_dedupe_key",
+        "email_outbox",
+        ["dedupe_key"],
+        unique=True,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_email_outbox_pending_dedupe_key", table_name="email_outbox")
+    op.drop_index("idx_email_outbox_pending_due", table_name="email_outbox")
+    op.drop_table("email_outbox")
@@ -0,0 +1,73 @@
+"""add_client_id_to_session_vectors
+
+Denormalizes sessions.client_id onto session_vectors so client-scoped vector
+and lexical searches filter inside SQL instead of searching the whole
+workspace and discarding other clients' sessions in Python.
+
+Revision ID: 8c4d1f6a2e93
+Revises: 3b7e2c91d4a6
+Create Date: 2026-10-18 10:37:05.118642
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4d1f6a2e93"
+down_revision: str | Sequence[str] | None = "3b7e2c91d4a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Add as nullable, backfill from the owning session, then enforce NOT NULL
+    op.add_column(
+        "session_vectors",
+        sa.Column("client_id", sa.UUID(), nullable=True),
+    )
+
+    op.execute(
+        """
+        UPDATE session_vectors
+        SET client_id = sessions.client_id
+        FROM sessions
+        WHERE sessions.id = session_vectors.session_id
+        """
+    )
+
+    op.alter_column("session_vectors", "client_id", nullable=False)
+
+    op.create_foreign_key(
+        "fk_session_vectors_client_id",
+        "session_vectors",
+        "clients",
+        ["client_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+    # Client-scoped search (workspace_id is always filtered alongside)
+    op.create_index(
+        "idx_session_vectors_workspace_client",
+        "session_vectors",
+        ["workspace_id", "client_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "idx_session_vectors_workspace_client",
+        table_name="session_vectors",
+    )
+    op.drop_constraint(
+        "fk_session_vectors_client_id",
+        "session_vectors",
+        type_="foreignkey",
+    )
+    op.drop_column("session_vectors", "client_id")
@@ -0,0 +1,69 @@
+"""add_session_version_deltas
+
+Stores session version history as encrypted diffs against the previous
+version with periodic full checkpoints. Existing rows become checkpoints
+(server default), so history stays readable without a data migration;
+run scripts/compact_session_versions.py afterwards to convert existing
+history to deltas.
+
+Revision ID: a7d3e5f19c62
+Revises: 5e2a9c7d1b48
+Create Date: 2026-10-18 21:41:12.506331
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3e5f19c62"
+down_revision: str | Sequence[str] | None = "5e2a9c7d1b48"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "session_versions",
+        sa.Column(
+            "is_checkpoint",
+            sa.Boolean(),
+            server_default="true",
+            nullable=False,
+            comment="True if SOAP columns hold a full snapshot, False if delta is set",
+        ),
+    )
+    op.add_column(
+        "session_versions",
+        sa.Column(
+            "delta",
+            sa.LargeBinary(),  # EncryptedString uses LargeBinary
+            nullable=True,
+            comment="ENCRYPTED: JSON diff against the previous version - AES-256-GCM",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Delta rows are encrypted and cannot be expanded in SQL; refuse rather
+    # than lose amendment history
+    delta_rows = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT count(*) FROM session_versions WHERE NOT is_checkpoint")
+        )
+        .scalar()
+    )
+    if delta_rows:
+        raise RuntimeError(
+            f"{delta_rows} session versions are stored as deltas. Run "
+            "scripts/compact_session_versions.py --expand before downgrading."
+        )
+
+    op.drop_column("session_versions", "delta")
+    op.drop_column("session_versions", "is_checkpoint")
@@ -0,0 +1,52 @@
+"""add_attachment_preview_keys
+
+Adds object keys for the derived images of an attachment: a small gallery
+thumbnail and a larger preview (first page for PDFs). Both are generated in
+the background after upload (services/attachment_preview_service.py) and
+are NULL until generated, or for file types without previews.
+
+Revision ID: b8f2d4e6a913
+Revises: e3b9f1c7a254
+Create Date: 2026-10-19 09:12:44.276105
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f2d4e6a913"
+down_revision: str | Sequence[str] | None = "e3b9f1c7a254"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "session_attachments",
+        sa.Column(
+            "thumbnail_s3_key",
+            sa.Text(),
+            nullable=True,
+            comment="Gallery thumbnail object key (NULL until generated)",
+        ),
+    )
+    op.add_column(
+        "session_attachments",
+        sa.Column(
+            "preview_s3_key",
+            sa.Text(),
+            nullable=True,
+            comment="Preview image object key, first page for PDFs (NULL until generated)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("session_attachments", "preview_s3_key")
+    op.drop_column("session_attachments", "thumbnail_s3_key")
@@ -0,0 +1,100 @@
+"""add_attachment_blobs
+
+Adds content-addressed storage for attachments: identical sanitized files
+within a workspace share one stored object (attachment_blobs, unique per
+workspace and SHA-256) with a reference count, and attachments reference
+their blob. Existing attachments keep blob_id NULL and are accounted for
+individually, as before.
+
+Revision ID: c4e7a9d2f158
+Revises: b8f2d4e6a913
+Create Date: 2026-10-19 15:40:27.518392
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e7a9d2f158"
+down_revision: str | Sequence[str] | None = "b8f2d4e6a913"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "attachment_blobs",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("workspace_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "content_sha256",
+            sa.Text(),
+            nullable=False,
+            comment="Hex SHA-256 of the sanitized file content",
+        ),
+        sa.Column("s3_key", sa.Text(), nullable=False),
+        sa.Column("file_type", sa.Text(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column(
+            "reference_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Non-deleted attachments referencing this blob",
+        ),
+        sa.Column(
+            "encryption_metadata",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="S3 server-side encryption metadata for HIPAA compliance verification",
+        ),
+        sa.Column("created_at", postgresql.TIMESTAMP(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["workspaces.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "workspace_id",
+            "content_sha256",
+            name="uq_attachment_blobs_workspace_sha256",
+        ),
+    )
+    op.add_column(
+        "session_attachments",
+        sa.Column(
+            "blob_id",
+            sa.UUID(),
+            nullable=True,
+            comment="Shared stored content (NULL for attachments stored before deduplication)",
+        ),
+    )
+    op.create_index(
+        op.f("ix_session_attachments_blob_id"),
+        "session_attachments",
+        ["blob_id"],
+        unique=False,
+    )
+    op.create_foreign_key(
+        "session_attachments_blob_id_fkey",
+        "session_attachments",
+        "attachment_blobs",
+        ["blob_id"],
+        ["id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "session_attachments_blob_id_fkey", "session_attachments", type_="foreignkey"
+    )
+    op.drop_index(
+        op.f("ix_session_attachments_blob_id"), table_name="session_attachments"
+    )
+    op.drop_column("session_attachments", "blob_id")
+    op.drop_table("attachment_blobs")
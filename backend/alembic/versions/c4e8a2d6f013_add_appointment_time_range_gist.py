@@ -0,0 +1,64 @@
+"""add_appointment_time_range_gist
+
+Adds a generated tstzrange column [scheduled_start, scheduled_end) to
+appointments with a partial GiST index over (workspace_id, time_range) for
+SCHEDULED/ATTENDED appointments, so conflict checks (including batches of
+proposed slots) are a single index-backed overlap query.
+
+Revision ID: c4e8a2d6f013
+Revises: a7d3e5f19c62
+Create Date: 2026-10-18 22:05:37.184402
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a2d6f013"
+down_revision: str | Sequence[str] | None = "a7d3e5f19c62"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GiST operator class for the workspace_id (uuid) equality column
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.add_column(
+        "appointments",
+        sa.Column(
+            "time_range",
+            postgresql.TSTZRANGE(),
+            sa.Computed(
+                "tstzrange(scheduled_start, scheduled_end, '[)')", persisted=True
+            ),
+            nullable=True,
+            comment="[scheduled_start, scheduled_end) for GiST overlap checks",
+        ),
+    )
+    op.create_index(
+        "ix_appointments_workspace_blocking_time_range",
+        "appointments",
+        ["workspace_id", "time_range"],
+        unique=False,
+        postgresql_using="gist",
+        postgresql_where=sa.text("status IN ('SCHEDULED', 'ATTENDED')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_appointments_workspace_blocking_time_range",
+        table_name="appointments",
+        postgresql_using="gist",
+        postgresql_where=sa.text("status IN ('SCHEDULED', 'ATTENDED')"),
+    )
+    op.drop_column("appointments", "time_range")
+    # btree_gist is left installed (other objects may depend on it)
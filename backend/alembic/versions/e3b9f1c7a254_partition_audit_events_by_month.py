@@ -0,0 +1,351 @@
+"""partition_audit_events_by_month
+
+Converts audit_events into a table range-partitioned by created_at with one
+partition per month (audit_events_yYYYYmMM) plus a DEFAULT partition. The
+primary key becomes (id, created_at) because a partitioned table's unique
+constraints must include the partition key. Existing rows are copied into
+the new partitions; indexes and the immutability triggers are recreated on
+the parent (and so on every partition).
+
+Partitions for upcoming months, detaching aged partitions and archiving them
+to object storage are handled by services/audit_partition_service.py.
+
+Revision ID: e3b9f1c7a254
+Revises: c4e8a2d6f013
+Create Date: 2026-10-18 23:41:09.512730
+
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b9f1c7a254"
+down_revision: str | Sequence[str] | None = "c4e8a2d6f013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Months created ahead of the current one (matches the maintenance job)
+MONTHS_AHEAD = 3
+
+INDEX_NAMES = [
+    "ix_audit_events_workspace_created",
+    "ix_audit_events_workspace_user",
+    "ix_audit_events_workspace_event_type",
+    "ix_audit_events_resource",
+    "ix_audit_events_phi_access",
+    "ix_audit_events_action",
+    "ix_audit_events_created_at",
+    "ix_audit_events_event_type",
+    "ix_audit_events_resource_id",
+    "ix_audit_events_resource_type",
+    "ix_audit_events_user_id",
+    "ix_audit_events_workspace_id",
+]
+
+COLUMNS = (
+    "id, workspace_id, user_id, event_type, resource_type, resource_id, "
+    "action, ip_address, user_agent, metadata, created_at"
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _utc_bound(month: date) -> str:
+    # Explicit offset: a plain date is interpreted in the session TimeZone
+    return f"{month.isoformat()} 00:00:00+00"
+
+
+def _create_indexes() -> None:
+    op.create_index(
+        "ix_audit_events_workspace_created",
+        "audit_events",
+        ["workspace_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_audit_events_workspace_user",
+        "audit_events",
+        ["workspace_id", "user_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_audit_events_workspace_event_type",
+        "audit_events",
+        ["workspace_id", "event_type", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_audit_events_resource",
+        "audit_events",
+        ["resource_type", "resource_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_audit_events_phi_access",
+        "audit_events",
+        ["workspace_id", "resource_type", sa.text("created_at DESC")],
+        postgresql_where=sa.text(
+            "action = 'READ' AND resource_type IN ('Client', 'Session', 'PlanOfCare')"
+        ),
+    )
+    for column in (
+        "action",
+        "created_at",
+        "event_type",
+        "resource_id",
+        "resource_type",
+        "user_id",
+        "workspace_id",
+    ):
+        op.create_index(op.f(f"ix_audit_events_{column}"), "audit_events", [column])
+
+
+def _create_immutability_triggers() -> None:
+    # prevent_audit_event_modification() is defined by de72ee2cfb00
+    op.execute(
+        """
+        CREATE TRIGGER prevent_audit_event_update
+        BEFORE UPDATE ON audit_events
+        FOR EACH ROW EXECUTE FUNCTION prevent_audit_event_modification();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER prevent_audit_event_delete
+        BEFORE DELETE ON audit_events
+        FOR EACH ROW EXECUTE FUNCTION prevent_audit_event_modification();
+        """
+    )
+
+
+def _move_aside() -> None:
+    """Rename the current table out of the way, freeing its object names."""
+    op.execute("DROP TRIGGER IF EXISTS prevent_audit_event_delete ON audit_events")
+    op.execute("DROP TRIGGER IF EXISTS prevent_audit_event_update ON audit_events")
+    for name in INDEX_NAMES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute("ALTER TABLE audit_events RENAME TO audit_events_old")
+    op.execute(
+        "ALTER TABLE audit_events_old "
+        "RENAME CONSTRAINT audit_events_pkey TO audit_events_old_pkey"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _move_aside()
+
+    op.create_table(
+        "audit_events",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "workspace_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("workspaces.id", ondelete="CASCADE"),
+            nullable=True,
+            comment="Workspace context (NULL for system-level events)",
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+            comment="User who performed the action (NULL for system events)",
+        ),
+        sa.Column(
+            "event_type",
+            sa.String(100),
+            nullable=False,
+            comment="Event type (e.g., user.login, client.view, session.create)",
+        ),
+        sa.Column(
+            "resource_type",
+            sa.String(50),
+            nullable=True,
+            comment="Type of resource accessed (User, Client, Session, Appointment)",
+        ),
+        sa.Column(
+            "resource_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="ID of the resource being accessed or modified",
+        ),
+        sa.Column(
+            "action",
+            sa.String(20),
+            nullable=False,
+            comment="Action performed (CREATE, READ, UPDATE, DELETE, etc.)",
+        ),
+        sa.Column(
+            "ip_address",
+            sa.String(45),
+            nullable=True,
+            comment="IP address of the user (IPv4 or IPv6)",
+        ),
+        sa.Column(
+            "user_agent",
+            sa.Text(),
+            nullable=True,
+            comment="User agent string from the request",
+        ),
+        sa.Column(
+            "metadata",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Additional context (changed_fields, query_params, etc. - NO PII/PHI)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+            comment="When the event occurred (immutable, partition key)",
+        ),
+        sa.PrimaryKeyConstraint("id", "created_at", name="audit_events_pkey"),
+        comment="Immutable audit trail for HIPAA compliance and security monitoring",
+        postgresql_partition_by="RANGE (created_at)",
+    )
+
+    # One partition per month from the oldest event through MONTHS_AHEAD
+    connection = op.get_bind()
+    oldest = connection.execute(
+        sa.text("SELECT min(created_at) FROM audit_events_old")
+    ).scalar()
+    now = datetime.now(UTC)
+    first = (oldest or now).astimezone(UTC)
+    month = date(first.year, first.month, 1)
+    last = _add_months(date(now.year, now.month, 1), MONTHS_AHEAD)
+    while month <= last:
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE audit_events_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF audit_events "
+            f"FOR VALUES FROM ('{_utc_bound(month)}') TO ('{_utc_bound(end)}')"
+        )
+        month = end
+    op.execute("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT")
+
+    # Copy before indexing (bulk load, then build indexes once)
+    op.execute(
+        f"INSERT INTO audit_events ({COLUMNS}) SELECT {COLUMNS} FROM audit_events_old"
+    )
+    op.drop_table("audit_events_old")
+
+    _create_indexes()
+    _create_immutability_triggers()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    connection = op.get_bind()
+    partitions = (
+        connection.execute(
+            sa.text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'audit_events'::regclass"
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    _move_aside()
+
+    op.create_table(
+        "audit_events",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+            comment="Unique identifier for the audit event",
+        ),
+        sa.Column(
+            "workspace_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("workspaces.id", ondelete="CASCADE"),
+            nullable=True,
+            comment="Workspace context (NULL for system-level events)",
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+            comment="User who performed the action (NULL for system events)",
+        ),
+        sa.Column(
+            "event_type",
+            sa.String(100),
+            nullable=False,
+            comment="Event type (e.g., user.login, client.view, session.create)",
+        ),
+        sa.Column(
+            "resource_type",
+            sa.String(50),
+            nullable=True,
+            comment="Type of resource accessed (User, Client, Session, Appointment)",
+        ),
+        sa.Column(
+            "resource_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=True,
+            comment="ID of the resource being accessed or modified",
+        ),
+        sa.Column(
+            "action",
+            sa.String(20),
+            nullable=False,
+            comment="Action performed (CREATE, READ, UPDATE, DELETE, etc.)",
+        ),
+        sa.Column(
+            "ip_address",
+            sa.String(45),
+            nullable=True,
+            comment="IP address of the user (IPv4 or IPv6)",
+        ),
+        sa.Column(
+            "user_agent",
+            sa.Text(),
+            nullable=True,
+            comment="User agent string from the request",
+        ),
+        sa.Column(
+            "metadata",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="Additional context (changed_fields, query_params, etc. - NO PII/PHI)",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+            comment="When the event occurred (immutable)",
+        ),
+        comment="Immutable audit trail for HIPAA compliance and security monitoring",
+    )
+
+    # Rows of already archived partitions are not restored
+    op.execute(
+        f"INSERT INTO audit_events ({COLUMNS}) SELECT {COLUMNS} FROM audit_events_old"
+    )
+    # Dropping the parent drops attached partitions
+    op.drop_table("audit_events_old")
+    for name in partitions:
+        op.execute(f"DROP TABLE IF EXISTS {name}")
+
+    _create_indexes()
+    _create_immutability_triggers()
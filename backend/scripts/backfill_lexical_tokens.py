@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Data migration script: build keyed lexical tokens for existing session vectors.
+
+Migration 3b7e2c91d4a6 (add_lexical_tokens_to_session_vectors) adds the
+lexical_tokens column with an empty default, and new embeddings get tokens
+when they are written. Rows embedded before that only take part in the
+lexical half of hybrid retrieval once their session is re-embedded. This
+script fills them in from the (decrypted) SOAP text without calling the
+embedding API.
+
+Usage:
+    python scripts/backfill_lexical_tokens.py [--workspace-id UUID] [--batch-size N] [--dry-run]
+
+Options:
+    --workspace-id UUID    Only process vectors in this workspace (default: all)
+    --batch-size N         Vectors updated per transaction (default: 500)
+    --dry-run              Report what would change without committing
+
+Safety:
+    - One transaction per batch; a failure leaves that batch unchanged
+    - Idempotent: only rows with empty lexical_tokens are selected, so the
+      script can be interrupted and re-run
+    - Keyset pagination (by vector ID), so fields with no indexable tokens
+      are visited once
+    - PHI decrypted in-memory only (not logged); only HMAC digests are stored
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import uuid
+from datetime import datetime
+
+from sqlalchemy import func, select, update
+
+from pazpaz.ai.lexical_index import build_lexical_tokens
+from pazpaz.core.logging import get_logger
+from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.models.session import Session
+from pazpaz.models.session_vector import SessionVector
+
+logger = get_logger(__name__)
+
+
+async def backfill_batch(
+    workspace_id: uuid.UUID | None,
+    after_id: uuid.UUID | None,
+    batch_size: int,
+    dry_run: bool,
+) -> tuple[uuid.UUID | None, int, int]:
+    """
+    Build lexical tokens for the next batch of vectors without them.
+
+    Args:
+        workspace_id: Optional workspace filter
+        after_id: Last vector ID of the previous batch (None for the first)
+        batch_size: Maximum number of vectors in the batch
+        dry_run: Roll back instead of committing
+
+    Returns:
+        Tuple of (last vector ID in the batch or None if done, vectors
+        visited, vectors that received tokens)
+    """
+    query = (
+        select(SessionVector.id, SessionVector.field_name, Session)
+        .join(Session, Session.id == SessionVector.session_id)
+        .where(func.cardinality(SessionVector.lexical_tokens) == 0)
+        .order_by(SessionVector.id)
+        .limit(batch_size)
+    )
+    if workspace_id:
+        query = query.where(SessionVector.workspace_id == workspace_id)
+    if after_id:
+        query = query.where(SessionVector.id > after_id)
+
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(query)).all()
+        if not rows:
+            return None, 0, 0
+
+        updates = []
+        for vector_id, field_name, session in rows:
+            tokens = build_lexical_tokens(
+                getattr(session, field_name), session.workspace_id
+            )
+            if tokens:
+                updates.append({"id": vector_id, "lexical_tokens": tokens})
+
+        if updates:
+            await db.execute(update(SessionVector), updates)
+
+        if dry_run:
+            await db.rollback()
+        else:
+            await db.commit()
+
+    return rows[-1].id, len(rows), len(updates)
+
+
+async def backfill_all(
+    workspace_id: uuid.UUID | None,
+    batch_size: int,
+    dry_run: bool,
+) -> int:
+    """
+    Build lexical tokens for every session vector that has none.
+
+    Args:
+        workspace_id: Optional workspace filter
+        batch_size: Vectors updated per transaction
+        dry_run: Roll back instead of committing
+
+    Returns:
+        Number of batches that failed
+    """
+    after_id = None
+    visited = 0
+    indexed = 0
+    failed = 0
+
+    while True:
+        try:
+            last_id, batch_visited, batch_indexed = await backfill_batch(
+                workspace_id, after_id, batch_size, dry_run
+            )
+        except Exception as e:
+            # Skip past the failed batch so the rest is still processed
+            failed += 1
+            logger.error(
+                "lexical_backfill_batch_failed",
+                after_id=str(after_id) if after_id else None,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            print(f"\nFailed batch after {after_id}: {e}", file=sys.stderr)
+            last_id = await _skip_batch(workspace_id, after_id, batch_size)
+            batch_visited = batch_indexed = 0
+
+        if last_id is None:
+            break
+        after_id = last_id
+        visited += batch_visited
+        indexed += batch_indexed
+        print(
+            f"\rProgress: {visited} vectors visited | {indexed} indexed",
+            end="",
+            flush=True,
+        )
+
+    print("")
+    print(f"Vectors visited:  {visited}")
+    print(f"Vectors indexed:  {indexed}")
+    print(f"Failed batches:   {failed}")
+    if dry_run:
+        print("Dry run: no changes committed")
+
+    logger.info(
+        "lexical_backfill_completed",
+        workspace_id=str(workspace_id) if workspace_id else "all",
+        visited=visited,
+        indexed=indexed,
+        failed_batches=failed,
+        dry_run=dry_run,
+    )
+    return failed
+
+
+async def _skip_batch(
+    workspace_id: uuid.UUID | None,
+    after_id: uuid.UUID | None,
+    batch_size: int,
+) -> uuid.UUID | None:
+    """Return the last vector ID of the batch after after_id (None if done)."""
+    query = (
+        select(SessionVector.id)
+        .where(func.cardinality(SessionVector.lexical_tokens) == 0)
+        .order_by(SessionVector.id)
+        .limit(batch_size)
+    )
+    if workspace_id:
+        query = query.where(SessionVector.workspace_id == workspace_id)
+    if after_id:
+        query = query.where(SessionVector.id > after_id)
+
+    async with AsyncSessionLocal() as db:
+        ids = (await db.execute(query)).scalars().all()
+    return ids[-1] if ids else None
+
+
+async def main():
+    """Main entry point for the backfill script."""
+    parser = argparse.ArgumentParser(
+        description="Build keyed lexical tokens for existing session vectors"
+    )
+    parser.add_argument(
+        "--workspace-id",
+        type=str,
+        help="Only process vectors in this workspace (UUID)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Vectors updated per transaction (default: 500)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without committing",
+    )
+    args = parser.parse_args()
+
+    workspace_id = None
+    if args.workspace_id:
+        try:
+            workspace_id = uuid.UUID(args.workspace_id)
+        except ValueError:
+            print(f"Invalid workspace ID: {args.workspace_id}", file=sys.stderr)
+            sys.exit(1)
+
+    print(f"Started at: {datetime.now().isoformat()}")
+    failed = await backfill_all(workspace_id, args.batch_size, args.dry_run)
+    print(f"Completed at: {datetime.now().isoformat()}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
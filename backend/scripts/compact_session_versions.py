@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Data migration script: compact session version history into deltas.
+
+Migration a7d3e5f19c62 (add_session_version_deltas) marks every existing
+SessionVersion as a full checkpoint. This script re-encodes each session's
+history as checkpoints plus encrypted diffs (see
+pazpaz.services.session_version_service), which shrinks heavily amended
+notes to roughly one snapshot per SESSION_VERSION_CHECKPOINT_INTERVAL
+versions.
+
+Usage:
+    python scripts/compact_session_versions.py [--dry-run] [--expand]
+
+Options:
+    --dry-run    Report what would change without committing
+    --expand     Convert all versions back to full snapshots (run before
+                 downgrading migration a7d3e5f19c62)
+
+Safety:
+    - One transaction per session; a failure leaves that session unchanged
+    - Each compacted history is re-materialized and compared with the
+      original before commit
+    - Idempotent: already-compacted sessions are re-encoded identically
+    - PHI decrypted in-memory only (not logged)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+
+from sqlalchemy import distinct, select
+
+from pazpaz.core.logging import get_logger
+from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.models.session_version import SessionVersion
+from pazpaz.services.session_version_service import (
+    compact_session_versions,
+    materialize_versions,
+)
+
+logger = get_logger(__name__)
+
+
+async def compact_all(dry_run: bool, expand: bool) -> int:
+    """
+    Re-encode the version history of every session.
+
+    Args:
+        dry_run: Roll back instead of committing
+        expand: Store every version as a full snapshot
+
+    Returns:
+        Number of sessions that failed
+    """
+    async with AsyncSessionLocal() as db:
+        session_ids = (
+            (await db.execute(select(distinct(SessionVersion.session_id))))
+            .scalars()
+            .all()
+        )
+
+    print(f"Sessions with version history: {len(session_ids)}")
+
+    rows_changed = 0
+    failed = 0
+    for index, session_id in enumerate(session_ids, start=1):
+        async with AsyncSessionLocal() as db:
+            try:
+                before = await materialize_versions(db, session_id)
+                changed = await compact_session_versions(db, session_id, expand=expand)
+                await db.flush()
+
+                # Verify the re-encoded history reconstructs identically
+                db.expire_all()
+                after = await materialize_versions(db, session_id)
+                if [v.snapshot for v in after] != [v.snapshot for v in before]:
+                    raise ValueError("re-encoded history does not match original")
+
+                if dry_run:
+                    await db.rollback()
+                else:
+                    await db.commit()
+                rows_changed += changed
+
+            except Exception as e:
+                await db.rollback()
+                failed += 1
+                print(f"\nFailed session {session_id}: {e}", file=sys.stderr)
+
+        print(f"\rProgress: {index}/{len(session_ids)} sessions", end="", flush=True)
+
+    print("")
+    print(f"Version rows re-encoded: {rows_changed}")
+    print(f"Failed sessions:         {failed}")
+    if dry_run:
+        print("Dry run: no changes committed")
+    return failed
+
+
+async def main():
+    """Main entry point for the compaction script."""
+    parser = argparse.ArgumentParser(
+        description="Compact session version history into checkpoints and deltas"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without committing",
+    )
+    parser.add_argument(
+        "--expand",
+        action="store_true",
+        help="Convert all versions back to full snapshots",
+    )
+    args = parser.parse_args()
+
+    print(f"Started at: {datetime.now().isoformat()}")
+    failed = await compact_all(dry_run=args.dry_run, expand=args.expand)
+    print(f"Completed at: {datetime.now().isoformat()}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,6 +6,7 @@ This script initializes the S3/MinIO storage backend with:
 - Bucket creation with server-side encryption (SSE-S3)
 - Versioning configuration (optional for V1)
 - Lifecycle policies for automatic cleanup
+- CORS for presigned uploads from the frontend
 - Access control policies (private by default)
 
 Security Features:
@@ -61,6 +62,10 @@ def create_bucket_if_not_exists() -> bool:
     """
     Create S3 bucket with encryption if it doesn't exist.
 
+    Lifecycle and CORS rules are (re)applied to existing buckets too, so
+    deployed environments pick up new rules (e.g. quarantine expiry) on
+    the next run.
+
     Returns:
         True if bucket was created or already exists
         False if creation failed
@@ -84,6 +89,8 @@ def create_bucket_if_not_exists() -> bool:
         try:
             s3_client.head_bucket(Bucket=bucket_name)
             logger.info(f"Bucket already exists: {bucket_name}")
+            configure_lifecycle_policies(s3_client, bucket_name)
+            configure_cors(s3_client, bucket_name)
             return True
 
         except ClientError as e:
@@ -129,8 +136,11 @@ def create_bucket_if_not_exists() -> bool:
         # Optional: Configure versioning (for audit compliance)
         # configure_versioning(s3_client, bucket_name)
 
-        # Optional: Configure lifecycle policies (auto-cleanup)
-        # configure_lifecycle_policies(s3_client, bucket_name)
+        # Configure lifecycle policies (abandoned direct uploads, auto-cleanup)
+        configure_lifecycle_policies(s3_client, bucket_name)
+
+        # Allow presigned PUT uploads from the browser
+        configure_cors(s3_client, bucket_name)
 
         return True
 
@@ -255,12 +265,12 @@ def configure_versioning(s3_client, bucket_name: str, enabled: bool = False) ->
 
 def configure_lifecycle_policies(s3_client, bucket_name: str) -> None:
     """
-    Configure lifecycle policies for automatic cleanup (optional for V1).
+    Configure lifecycle policies for automatic cleanup.
 
-    Example policies:
+    Policies:
     - Delete incomplete multipart uploads after 7 days
-    - Transition old versions to cheaper storage after 30 days
-    - Delete old versions after 90 days
+    - Delete quarantined direct uploads after 1 day (processed uploads are
+      deleted by the worker; this removes uploads never completed)
 
     Args:
         s3_client: Boto3 S3 client
@@ -279,7 +289,13 @@ def configure_lifecycle_policies(s3_client, bucket_name: str) -> None:
                         "Status": "Enabled",
                         "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 7},
                         "Filter": {},
-                    }
+                    },
+                    {
+                        "Id": "expire-quarantined-uploads",
+                        "Status": "Enabled",
+                        "Expiration": {"Days": 1},
+                        "Filter": {"Prefix": "quarantine/"},
+                    },
                 ]
             },
         )
@@ -299,6 +315,52 @@ def configure_lifecycle_policies(s3_client, bucket_name: str) -> None:
             ) from e
 
 
+def configure_cors(s3_client, bucket_name: str) -> None:
+    """
+    Allow browser uploads to presigned PUT URLs from the frontend origin.
+
+    Direct attachment uploads PUT the file from the browser straight to
+    storage (see attachment_upload_service); without a CORS rule the
+    browser blocks the request. Downloads use plain navigation and need
+    no CORS.
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket_name: Bucket name
+
+    Raises:
+        BucketCreationError: If CORS configuration fails
+    """
+    try:
+        s3_client.put_bucket_cors(
+            Bucket=bucket_name,
+            CORSConfiguration={
+                "CORSRules": [
+                    {
+                        "AllowedOrigins": [settings.frontend_url],
+                        "AllowedMethods": ["PUT"],
+                        "AllowedHeaders": [
+                            "Content-Type",
+                            "x-amz-server-side-encryption",
+                        ],
+                        "ExposeHeaders": ["ETag"],
+                        "MaxAgeSeconds": 3600,
+                    }
+                ]
+            },
+        )
+        logger.info(f"CORS configured for {settings.frontend_url}: {bucket_name}")
+
+    except ClientError as e:
+        # MinIO may not support this API (it allows all origins by default)
+        error_code = e.response["Error"]["Code"]
+        if error_code in ("NotImplemented", "MethodNotAllowed"):
+            logger.warning(f"Bucket CORS API not supported (MinIO): {bucket_name}")
+        else:
+            logger.error(f"Failed to configure CORS on {bucket_name}: {e}")
+            raise BucketCreationError(f"CORS configuration failed: {e}") from e
+
+
 def verify_bucket_configuration(s3_client, bucket_name: str) -> dict:
     """
     Verify bucket configuration and return status.
@@ -11,32 +11,41 @@ HIPAA Compliance:
     with the new key within a reasonable timeframe (recommended: 30 days).
 
 Usage:
+    # Progress report (encrypted fields per key version, per table)
+    python scripts/re_encrypt_old_data.py --report
+
     # Dry run (preview changes without applying)
     python scripts/re_encrypt_old_data.py --dry-run
 
-    # Re-encrypt all data
-    python scripts/re_encrypt_old_data.py
+    # Re-encrypt all data with 8 worker processes
+    python scripts/re_encrypt_old_data.py --workers 8
 
     # Re-encrypt specific version only
     python scripts/re_encrypt_old_data.py --from-version v1
 
-    # Process in batches of 50 (default: 100)
-    python scripts/re_encrypt_old_data.py --batch-size 50
+    # Limit load on production (rows/second per worker)
+    python scripts/re_encrypt_old_data.py --max-rows-per-second 200
+
+    # Only some tables
+    python scripts/re_encrypt_old_data.py --tables sessions,session_versions
 
 Security:
     - Reads encrypted data with old key
     - Re-encrypts with current key
-    - Updates database in transaction (atomic)
+    - Updates each chunk in one transaction (atomic)
+    - Never overwrites a field changed by the application since it was read
     - Logs all operations for audit trail
-    - Validates decryption before re-encryption
 
 Workflow:
-    1. Load all encryption keys from AWS Secrets Manager
+    1. Load all encryption keys from AWS Secrets Manager (in every worker)
     2. Identify current key version
-    3. Query all Session records with encrypted PHI fields
-    4. Detect which records use old key versions (by version prefix)
-    5. Re-encrypt data with current key in batches
-    6. Update database records (transaction per batch)
+    3. Discover every EncryptedString column (clients, sessions,
+       session_versions, tokens, ...)
+    4. Split each table's key space into partitions processed in parallel
+    5. Scan each partition in keyset chunks, re-encrypting fields not on the
+       current key and writing them with one UPDATE ... FROM (VALUES ...)
+       per column per chunk
+    6. Checkpoint each partition after every chunk (interrupted runs resume)
     7. Log progress and completion statistics
 
 Prerequisites:
@@ -60,439 +69,88 @@ Exit Codes:
 
 import argparse
 import asyncio
+import functools
+import shutil
 import sys
-from collections import defaultdict
-from datetime import UTC, datetime
+import time
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-
+from pazpaz.core.config import settings
 from pazpaz.core.logging import get_logger
-from pazpaz.db.base import get_async_session
-from pazpaz.models.session import Session
-from pazpaz.utils.encryption import (
-    get_current_key_version,
-    get_key_for_version,
+from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.services.reencryption_service import (
+    EncryptedTable,
+    PartitionProgress,
+    ReEncryptionError,
+    ReEncryptionOptions,
+    count_records_by_version,
+    discover_encrypted_tables,
+    get_target_version,
+    run_reencryption,
+    summarize,
 )
+from pazpaz.utils.secrets_manager import load_all_encryption_keys
 
 logger = get_logger(__name__)
 
-
-class ReEncryptionError(Exception):
-    """Base exception for re-encryption errors."""
-
-    pass
+DEFAULT_CHECKPOINT_DIR = Path(".re_encryption_checkpoints")
 
 
-def detect_encryption_version(ciphertext: bytes) -> str | None:
+def select_tables(names: str | None) -> list[EncryptedTable]:
     """
-    Detect the encryption key version from ciphertext format.
+    Select encrypted tables by comma-separated name.
 
     Args:
-        ciphertext: Encrypted bytes (may have version prefix)
+        names: Comma-separated table names (None = all)
 
     Returns:
-        Version string (e.g., "v1", "v2") or None if legacy format
-
-    Example:
-        >>> detect_encryption_version(b"v2:encrypted_data")
-        'v2'
-        >>> detect_encryption_version(b"legacy_encrypted_data")
-        None
-    """
-    if not ciphertext:
-        return None
-
-    # Check if versioned format (contains ":" separator in first 10 bytes)
-    if b":" in ciphertext[:10]:
-        try:
-            # Find colon position
-            colon_index = ciphertext.index(b":")
-
-            # Extract version string (e.g., b"v2" -> "v2")
-            version = ciphertext[:colon_index].decode("ascii")
-
-            return version
-
-        except (ValueError, UnicodeDecodeError):
-            # Malformed version prefix
-            return None
-
-    # Legacy non-versioned format
-    return None
-
-
-async def count_records_by_version(
-    db: AsyncSession,
-    from_version: str | None = None,
-) -> dict[str, int]:
-    """
-    Count Session records by encryption key version.
-
-    This function queries all Session records and detects which key version
-    was used to encrypt each field. This helps estimate re-encryption work.
-
-    Args:
-        db: Database session
-        from_version: Only count records with this specific version (optional)
-
-    Returns:
-        Dictionary mapping version -> count
-        Example: {"v1": 450, "v2": 120, "legacy": 30}
+        Selected tables
 
     Raises:
-        ReEncryptionError: If database query fails
+        ValueError: If a name is not an encrypted table
     """
-    try:
-        # Query all sessions
-        result = await db.execute(
-            select(
-                Session.id,
-                Session.subjective,
-                Session.objective,
-                Session.assessment,
-                Session.plan,
+    tables = discover_encrypted_tables()
+    if not names:
+        return tables
+
+    by_name = {table.name: table for table in tables}
+    selected = []
+    for name in (name.strip() for name in names.split(",")):
+        if name not in by_name:
+            raise ValueError(
+                f"Unknown encrypted table: {name} (available: {', '.join(by_name)})"
             )
-        )
-
-        sessions = result.all()
-
-        # Count by version
-        version_counts = defaultdict(int)
-
-        for session in sessions:
-            # Check each encrypted field
-            for field_value in [
-                session.subjective,
-                session.objective,
-                session.assessment,
-                session.plan,
-            ]:
-                if field_value is None:
-                    continue
-
-                # Detect version from ciphertext (reads raw bytes from DB)
-                # Note: This is tricky because SQLAlchemy already decrypted it
-                # We need to query raw BYTEA columns instead
-                pass
-
-        # Alternative approach: Query raw BYTEA columns
-        from sqlalchemy import text
-
-        raw_result = await db.execute(
-            text(
-                """
-                SELECT
-                    COUNT(*) FILTER (WHERE subjective IS NOT NULL) as subjective_count,
-                    COUNT(*) FILTER (WHERE objective IS NOT NULL) as objective_count,
-                    COUNT(*) FILTER (WHERE assessment IS NOT NULL) as assessment_count,
-                    COUNT(*) FILTER (WHERE plan IS NOT NULL) as plan_count
-                FROM sessions
-                """
-            )
-        )
+        selected.append(by_name[name])
+    return selected
 
-        counts = raw_result.one()
 
-        logger.info(
-            "record_count_summary",
-            total_sessions=len(sessions),
-            subjective_count=counts.subjective_count,
-            objective_count=counts.objective_count,
-            assessment_count=counts.assessment_count,
-            plan_count=counts.plan_count,
-        )
-
-        # For now, return total count (version detection requires raw query)
-        return {"total": len(sessions)}
-
-    except Exception as e:
-        logger.error(
-            "failed_to_count_records",
-            error=str(e),
-            exc_info=True,
-        )
-        raise ReEncryptionError(f"Failed to count records: {e}") from e
+async def print_version_report(
+    tables: list[EncryptedTable], target_version: str
+) -> dict[str, dict[str, int]]:
+    """Print encrypted field counts by key version, updating per chunk."""
+    print(f"\n📊 Encrypted fields by key version (target: {target_version})")
 
+    def on_progress(table: str, scanned: int, counts) -> None:
+        versions = ", ".join(f"{v}={n}" for v, n in sorted(counts.items()))
+        print(f"   {table}: {scanned} rows scanned ({versions})", end="\r")
 
-async def re_encrypt_session_record(
-    session: Session,
-    current_version: str,
-    current_key: bytes,
-    dry_run: bool = False,
-) -> dict[str, bool]:
-    """
-    Re-encrypt all encrypted fields in a Session record.
+    async with AsyncSessionLocal() as db:
+        report = await count_records_by_version(db, tables, on_progress=on_progress)
 
-    This function takes a Session record, decrypts all PHI fields with their
-    original keys (detected by version prefix), and re-encrypts them with the
-    current key.
+    print(" " * 80, end="\r")
+    for table, counts in report.items():
+        versions = ", ".join(f"{v}={n}" for v, n in sorted(counts.items())) or "empty"
+        print(f"   {table}: {versions}")
 
-    Args:
-        session: Session model instance
-        current_version: Current key version (e.g., "v2")
-        current_key: Current encryption key (32 bytes)
-        dry_run: If True, simulate without actually updating
-
-    Returns:
-        Dictionary tracking which fields were re-encrypted:
-        {"subjective": True, "objective": False, ...}
-
-    Raises:
-        ReEncryptionError: If decryption or encryption fails
-    """
-    re_encrypted = {
-        "subjective": False,
-        "objective": False,
-        "assessment": False,
-        "plan": False,
-    }
-
-    try:
-        # Re-encrypt each field
-        for field_name in ["subjective", "objective", "assessment", "plan"]:
-            field_value = getattr(session, field_name)
-
-            if field_value is None:
-                continue
-
-            # Field is already decrypted by SQLAlchemy
-            # Re-encrypt with current key
-            if not dry_run:
-                # Re-assign value to trigger encryption with current key
-                # SQLAlchemy will call process_bind_param() which uses current key
-                setattr(session, field_name, field_value)
-                re_encrypted[field_name] = True
-
-                logger.debug(
-                    "field_re_encrypted",
-                    session_id=str(session.id),
-                    field_name=field_name,
-                    current_version=current_version,
-                )
-            else:
-                logger.debug(
-                    "dry_run_would_re_encrypt",
-                    session_id=str(session.id),
-                    field_name=field_name,
-                    current_version=current_version,
-                )
-                re_encrypted[field_name] = True
-
-        return re_encrypted
-
-    except Exception as e:
-        logger.error(
-            "failed_to_re_encrypt_session",
-            session_id=str(session.id),
-            error=str(e),
-            exc_info=True,
-        )
-        raise ReEncryptionError(
-            f"Failed to re-encrypt session {session.id}: {e}"
-        ) from e
-
-
-async def re_encrypt_old_data(
-    batch_size: int = 100,
-    from_version: str | None = None,
-    dry_run: bool = False,
-) -> None:
-    """
-    Re-encrypt all old PHI data with the current encryption key.
-
-    This is the main function that orchestrates the re-encryption process:
-    1. Load all encryption keys from AWS
-    2. Identify current key version
-    3. Query all Session records with encrypted data
-    4. Re-encrypt in batches (transaction per batch)
-    5. Log progress and statistics
-
-    Args:
-        batch_size: Number of records to process per batch (default: 100)
-        from_version: Only re-encrypt records with this version (optional)
-        dry_run: If True, simulate without actually updating database
-
-    Raises:
-        ReEncryptionError: If re-encryption fails
-    """
-    logger.info(
-        "re_encryption_started",
-        batch_size=batch_size,
-        from_version=from_version,
-        dry_run=dry_run,
+    summary = summarize(report, target_version)
+    print(
+        f"\n   {summary['current_fields']}/{summary['total_fields']} fields on "
+        f"{target_version} ({summary['percent_complete']}%)"
     )
-
-    try:
-        # Load all encryption keys
-        from pazpaz.utils.secrets_manager import load_all_encryption_keys
-
-        load_all_encryption_keys(region="us-east-1", environment="production")
-
-        # Get current key version
-        current_version = get_current_key_version()
-        current_key = get_key_for_version(current_version)
-
-        logger.info(
-            "current_key_version",
-            version=current_version,
-            message=f"Re-encrypting data to key version {current_version}",
-        )
-
-    except Exception as e:
-        logger.error(
-            "failed_to_load_keys",
-            error=str(e),
-            exc_info=True,
-        )
-        raise ReEncryptionError(f"Failed to load encryption keys: {e}") from e
-
-    # Connect to database
-    try:
-        async for db in get_async_session():
-            # Count total records
-            logger.info("counting_records", message="Counting records to re-encrypt...")
-
-            version_counts = await count_records_by_version(
-                db, from_version=from_version
-            )
-
-            total_records = sum(version_counts.values())
-
-            if total_records == 0:
-                logger.info(
-                    "no_records_to_re_encrypt",
-                    message="No records found that need re-encryption",
-                )
-                print("\n✅ No records to re-encrypt. All data is up-to-date.")
-                return
-
-            logger.info(
-                "re_encryption_plan",
-                total_records=total_records,
-                version_counts=dict(version_counts),
-                batch_size=batch_size,
-            )
-
-            print("\n📊 Re-encryption Plan:")
-            print(f"   Total sessions to process: {total_records}")
-            print(f"   Batch size: {batch_size}")
-            print(f"   Target key version: {current_version}")
-            print(f"   Dry run: {dry_run}")
-            print()
-
-            # Process in batches
-            offset = 0
-            total_processed = 0
-            total_re_encrypted = 0
-            batch_num = 0
-
-            while True:
-                # Fetch batch of sessions
-                result = await db.execute(
-                    select(Session)
-                    .where(Session.deleted_at.is_(None))  # Skip soft-deleted
-                    .limit(batch_size)
-                    .offset(offset)
-                )
-
-                sessions = result.scalars().all()
-
-                if not sessions:
-                    break  # No more records
-
-                batch_num += 1
-                batch_start_time = datetime.now(UTC)
-
-                logger.info(
-                    "processing_batch",
-                    batch_num=batch_num,
-                    batch_size=len(sessions),
-                    offset=offset,
-                )
-
-                # Re-encrypt each session in batch
-                batch_re_encrypted = 0
-
-                for session in sessions:
-                    re_encrypted_fields = await re_encrypt_session_record(
-                        session=session,
-                        current_version=current_version,
-                        current_key=current_key,
-                        dry_run=dry_run,
-                    )
-
-                    if any(re_encrypted_fields.values()):
-                        batch_re_encrypted += 1
-
-                # Commit batch (if not dry run)
-                if not dry_run:
-                    try:
-                        await db.commit()
-                        logger.info(
-                            "batch_committed",
-                            batch_num=batch_num,
-                            records_updated=batch_re_encrypted,
-                        )
-                    except Exception as e:
-                        await db.rollback()
-                        logger.error(
-                            "batch_commit_failed",
-                            batch_num=batch_num,
-                            error=str(e),
-                            exc_info=True,
-                        )
-                        raise ReEncryptionError(
-                            f"Failed to commit batch {batch_num}: {e}"
-                        ) from e
-
-                batch_duration = (datetime.now(UTC) - batch_start_time).total_seconds()
-
-                total_processed += len(sessions)
-                total_re_encrypted += batch_re_encrypted
-
-                # Progress update
-                progress_pct = (total_processed / total_records) * 100
-                print(
-                    f"   Batch {batch_num}: {len(sessions)} sessions, "
-                    f"{batch_re_encrypted} re-encrypted "
-                    f"({batch_duration:.2f}s) - "
-                    f"{progress_pct:.1f}% complete"
-                )
-
-                offset += batch_size
-
-            # Final statistics
-            logger.info(
-                "re_encryption_complete",
-                total_processed=total_processed,
-                total_re_encrypted=total_re_encrypted,
-                batch_count=batch_num,
-                dry_run=dry_run,
-            )
-
-            if dry_run:
-                print("\n✅ DRY RUN complete!")
-                print(f"   Would re-encrypt {total_re_encrypted} sessions")
-                print(f"   Target key version: {current_version}")
-            else:
-                print("\n✅ Re-encryption complete!")
-                print(f"   Sessions processed: {total_processed}")
-                print(f"   Sessions re-encrypted: {total_re_encrypted}")
-                print(f"   New key version: {current_version}")
-                print("   All PHI data is now encrypted with the latest key version.")
-
-    except Exception as e:
-        logger.error(
-            "re_encryption_failed",
-            error=str(e),
-            exc_info=True,
-        )
-        raise ReEncryptionError(f"Re-encryption failed: {e}") from e
+    return report
 
 
 def main():
@@ -502,6 +160,9 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
+  # Progress report
+  python scripts/re_encrypt_old_data.py --report
+
   # Dry run (preview changes)
   python scripts/re_encrypt_old_data.py --dry-run
 
@@ -511,8 +172,8 @@ Examples:
   # Re-encrypt only v1 data
   python scripts/re_encrypt_old_data.py --from-version v1
 
-  # Process in smaller batches
-  python scripts/re_encrypt_old_data.py --batch-size 50
+  # Resume an interrupted run (default) or start over
+  python scripts/re_encrypt_old_data.py --restart
 
 Environment Variables:
   DATABASE_URL            PostgreSQL connection string
@@ -524,10 +185,9 @@ HIPAA Compliance:
   with the new key within 30 days.
 
 Security:
-  - All operations performed in database transactions
-  - Validation before re-encryption
+  - Each chunk is updated in one database transaction
+  - Fields changed concurrently by the application are never overwritten
   - Logged for audit trail
-  - Supports rollback on error
         """,
     )
 
@@ -536,23 +196,59 @@ Security:
         action="store_true",
         help="Simulate re-encryption without actually updating database",
     )
-
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=100,
-        help="Number of records to process per batch (default: 100)",
+        default=500,
+        help="Number of rows read and updated per chunk (default: 500)",
     )
-
     parser.add_argument(
         "--from-version",
         type=str,
-        help="Only re-encrypt records with this specific version (e.g., v1)",
+        help="Only re-encrypt fields with this specific version (e.g., v1, legacy)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Parallel worker processes (default: 4)",
+    )
+    parser.add_argument(
+        "--tables",
+        type=str,
+        help="Comma-separated tables to process (default: all encrypted tables)",
+    )
+    parser.add_argument(
+        "--max-rows-per-second",
+        type=float,
+        help="Throttle each worker to this many rows per second",
+    )
+    parser.add_argument(
+        "--pause",
+        type=float,
+        default=0.0,
+        help="Seconds to pause between chunks in each worker (default: 0)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        default=DEFAULT_CHECKPOINT_DIR,
+        help=f"Directory for resume checkpoints (default: {DEFAULT_CHECKPOINT_DIR})",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Discard checkpoints and start from the beginning",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Only print encrypted field counts by key version",
     )
 
     args = parser.parse_args()
 
-    # Validate batch size
+    # Validate arguments
     if args.batch_size < 1 or args.batch_size > 1000:
         logger.error(
             "invalid_batch_size",
@@ -565,15 +261,80 @@ Security:
         )
         sys.exit(4)
 
+    if args.workers < 1 or args.workers > 64:
+        print("❌ Error: Workers must be between 1 and 64", file=sys.stderr)
+        sys.exit(4)
+
+    try:
+        tables = select_tables(args.tables)
+    except ValueError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(4)
+
+    load_keys = functools.partial(
+        load_all_encryption_keys,
+        region=settings.aws_region,
+        environment=settings.environment,
+    )
+
+    try:
+        load_keys()
+        target_version = get_target_version()
+    except Exception as e:
+        logger.error("encryption_keys_unavailable", error=str(e), exc_info=True)
+        print(f"❌ Error: Failed to load encryption keys: {e}", file=sys.stderr)
+        sys.exit(4)
+
+    if args.from_version == target_version:
+        print(
+            f"❌ Error: --from-version {args.from_version} is the current key version",
+            file=sys.stderr,
+        )
+        sys.exit(4)
+
     try:
-        asyncio.run(
-            re_encrypt_old_data(
-                batch_size=args.batch_size,
-                from_version=args.from_version,
-                dry_run=args.dry_run,
+        if args.report:
+            asyncio.run(print_version_report(tables, target_version))
+            sys.exit(0)
+
+        if args.restart and args.checkpoint_dir.exists():
+            shutil.rmtree(args.checkpoint_dir)
+
+        options = ReEncryptionOptions(
+            target_version=target_version,
+            from_version=args.from_version,
+            chunk_size=args.batch_size,
+            max_rows_per_second=args.max_rows_per_second,
+            pause_seconds=args.pause,
+            checkpoint_dir=str(args.checkpoint_dir),
+            dry_run=args.dry_run,
+        )
+
+        print(
+            f"\n🔐 Re-encrypting {len(tables)} tables to {target_version} "
+            f"with {args.workers} workers" + (" (DRY RUN)" if args.dry_run else "")
+        )
+        started = time.monotonic()
+        totals = {"scanned": 0, "updated": 0}
+
+        def on_progress(progress: PartitionProgress) -> None:
+            totals["scanned"] += progress.scanned
+            totals["updated"] += progress.updated
+            elapsed = time.monotonic() - started
+            print(
+                f"   {progress.task_id}: {progress.scanned} rows, "
+                f"{progress.updated} fields re-encrypted "
+                f"(total {totals['updated']}, "
+                f"{totals['scanned'] / max(elapsed, 1e-6):.0f} rows/s)"
             )
+
+        report = run_reencryption(
+            options,
+            workers=args.workers,
+            tables=tables,
+            load_keys=load_keys,
+            on_progress=on_progress,
         )
-        sys.exit(0)
 
     except ReEncryptionError as e:
         print(f"\n❌ Re-encryption failed: {e}", file=sys.stderr)
@@ -584,14 +345,49 @@ Security:
             "re_encryption_interrupted",
             message="User interrupted re-encryption",
         )
-        print("\n⚠️  Re-encryption interrupted by user", file=sys.stderr)
+        print(
+            "\n⚠️  Re-encryption interrupted by user (rerun to resume)",
+            file=sys.stderr,
+        )
         sys.exit(130)
 
+    except (ConnectionError, OSError) as e:
+        logger.error("database_connection_error", error=str(e), exc_info=True)
+        print(f"\n❌ Database connection error: {e}", file=sys.stderr)
+        sys.exit(2)
+
     except Exception as e:
         logger.error("unexpected_error", error=str(e), exc_info=True)
         print(f"\n❌ Unexpected error: {e}", file=sys.stderr)
         sys.exit(3)
 
+    if report.failed_tasks:
+        print(
+            f"\n❌ {len(report.failed_tasks)} partitions failed "
+            f"({', '.join(report.failed_tasks)}); rerun to resume",
+            file=sys.stderr,
+        )
+        sys.exit(3)
+
+    for table, counts in report.tables.items():
+        print(f"   {table}: {counts['updated']} fields re-encrypted")
+
+    if report.updated == 0:
+        print(f"\n✅ No data to re-encrypt (all fields on {target_version})")
+        sys.exit(1)
+
+    if args.dry_run:
+        print("\n✅ DRY RUN complete!")
+        print(f"   Would re-encrypt {report.updated} fields")
+        print(f"   Target key version: {target_version}")
+    else:
+        print("\n✅ Re-encryption complete!")
+        print(f"   Rows scanned: {report.scanned}")
+        print(f"   Fields re-encrypted: {report.updated}")
+        print(f"   New key version: {target_version}")
+        print("   All PHI data is now encrypted with the latest key version.")
+    sys.exit(0)
+
 
 if __name__ == "__main__":
     main()
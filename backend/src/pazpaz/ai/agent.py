@@ -22,6 +22,7 @@ Security:
 Performance:
 - Single LLM call per query
 - Efficient retrieval with configurable limits
+- Two cache tiers: exact query hash (L1) and embedding similarity (semantic)
 - Concurrent request support via async
 """
 
@@ -32,8 +33,11 @@ import json
 import re
 import time
 import uuid
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
 import cohere
 import httpx
@@ -41,10 +45,13 @@ from cohere.core.api_error import ApiError
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pazpaz.ai.context_packer import pack_contexts
 from pazpaz.ai.metrics import (
     ai_agent_cache_hits_total,
     ai_agent_cache_misses_total,
     ai_agent_citations_returned,
+    ai_agent_context_tokens,
+    ai_agent_context_tokens_saved_total,
     ai_agent_llm_duration_seconds,
     ai_agent_llm_errors_total,
     ai_agent_llm_tokens_total,
@@ -65,6 +72,7 @@ from pazpaz.ai.query_expansion import expand_query
 from pazpaz.ai.retrieval import ClientContext, SessionContext, get_retrieval_service
 from pazpaz.ai.retry_policy import retry_with_backoff
 from pazpaz.ai.search_config import compute_adaptive_threshold, should_expand_query
+from pazpaz.ai.semantic_cache import SemanticQueryCache, get_semantic_cache_key
 from pazpaz.ai.treatment_recommender import (
     RecommendationResponse,
     TreatmentRecommender,
@@ -72,10 +80,15 @@ from pazpaz.ai.treatment_recommender import (
 from pazpaz.core.config import settings
 from pazpaz.core.logging import get_logger
 from pazpaz.models.audit_event import AuditAction, ResourceType
+from pazpaz.monitoring.tenant_metrics import record_tenant_usage
 from pazpaz.services.audit_service import create_audit_event
+from pazpaz.services.cache_service import AICacheService
 
 logger = get_logger(__name__)
 
+# L1 query result cache lifetime (5 minutes)
+QUERY_CACHE_TTL_SECONDS = 300
+
 
 def get_query_cache_key(
     workspace_id: uuid.UUID,
@@ -143,6 +156,38 @@ class AgentResponse:
     processing_time_ms: int
 
 
+@dataclass
+class RetrievedContext:
+    """
+    Output of the agent's retrieve and format stages (no LLM call).
+
+    Lets callers that build their own prompt (e.g. TreatmentRecommender)
+    reuse the agent's retrieval pipeline without paying for answer synthesis.
+
+    Attributes:
+        language: Detected language of the query ("he" or "en")
+        session_contexts: Retrieved session contexts (decrypted PHI)
+        client_contexts: Retrieved client profile contexts (decrypted PHI)
+        formatted_context: Contexts formatted for LLM consumption
+            (empty string when nothing was retrieved)
+
+    Example:
+        >>> context = await agent.retrieve_context(workspace_id, query)
+        >>> if context.retrieved_count:
+        ...     prompt = f"History:\n{context.formatted_context}"
+    """
+
+    language: str
+    session_contexts: list[SessionContext]
+    client_contexts: list[ClientContext]
+    formatted_context: str
+
+    @property
+    def retrieved_count(self) -> int:
+        """Total number of retrieved session and client contexts."""
+        return len(self.session_contexts) + len(self.client_contexts)
+
+
 @dataclass
 class SessionCitation:
     """
@@ -183,6 +228,216 @@ class ClientCitation:
     field_name: str
 
 
+@dataclass
+class AgentStreamEvent:
+    """
+    Incremental event emitted by ClinicalAgent.query_stream().
+
+    Event types (in emission order):
+        citations: Retrieved sources, sent before any answer text
+            data = {"citations": [...], "language": str, "retrieved_count": int}
+        token: Filtered fragment of the answer
+            data = {"text": str}
+        done: Stream completed successfully
+            data = {"language": str, "retrieved_count": int,
+                    "processing_time_ms": int, "cached": bool}
+        error: Stream aborted; client should discard any partial answer
+            data = {"message": str}
+
+    Attributes:
+        event: Event type ("citations", "token", "done", "error")
+        data: Event payload (see above)
+    """
+
+    event: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+def serialize_citation(citation: SessionCitation | ClientCitation) -> dict[str, Any]:
+    """
+    Serialize a citation to a JSON-compatible dict (L1 cache format).
+
+    Args:
+        citation: SessionCitation or ClientCitation
+
+    Returns:
+        Dict with string UUIDs and ISO-formatted dates
+    """
+    if isinstance(citation, SessionCitation):
+        return {
+            "session_id": str(citation.session_id),
+            "client_id": str(citation.client_id),
+            "client_name": citation.client_name,
+            "session_date": citation.session_date.isoformat(),
+            "similarity": citation.similarity,
+            "field_name": citation.field_name,
+        }
+    return {
+        "client_id": str(citation.client_id),
+        "client_name": citation.client_name,
+        "similarity": citation.similarity,
+        "field_name": citation.field_name,
+    }
+
+
+def deserialize_citation(data: dict[str, Any]) -> SessionCitation | ClientCitation:
+    """
+    Reconstruct a citation from its serialized form.
+
+    Args:
+        data: Dict produced by serialize_citation()
+
+    Returns:
+        SessionCitation if data contains session_id, otherwise ClientCitation
+    """
+    if "session_id" in data:
+        return SessionCitation(
+            session_id=uuid.UUID(data["session_id"]),
+            client_id=uuid.UUID(data["client_id"]),
+            client_name=data["client_name"],
+            session_date=datetime.fromisoformat(data["session_date"]),
+            similarity=data["similarity"],
+            field_name=data["field_name"],
+        )
+    return ClientCitation(
+        client_id=uuid.UUID(data["client_id"]),
+        client_name=data["client_name"],
+        similarity=data["similarity"],
+        field_name=data["field_name"],
+    )
+
+
+def redact_pii(text: str) -> str:
+    """
+    Redact basic PII patterns (phone numbers, emails, Israeli IDs) from text.
+
+    All patterns match whitespace-free tokens, so text split on whitespace
+    boundaries can be redacted piecewise with the same result.
+
+    Args:
+        text: Raw LLM output
+
+    Returns:
+        Text with PII replaced by placeholders
+    """
+    # Phone numbers (Israeli format: 05X-XXXXXXX, 0X-XXXXXXX)
+    text = re.sub(
+        r"\b0\d{1,2}-?\d{7,8}\b",
+        "[PHONE]",
+        text,
+    )
+
+    # Email addresses
+    text = re.sub(
+        r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+        "[EMAIL]",
+        text,
+    )
+
+    # Israeli ID numbers (9 digits)
+    text = re.sub(
+        r"\b\d{9}\b",
+        "[ID]",
+        text,
+    )
+
+    return text
+
+
+class StreamingOutputFilter:
+    """
+    Incremental equivalent of ClinicalAgent._filter_output() for streamed text.
+
+    LLM chunks can split a word (or an email/phone number) anywhere, so text is
+    buffered and only released up to the last whitespace boundary. Released
+    text is redacted with redact_pii() and counted against the word limit; once
+    the limit is reached the output is terminated with "..." and further input
+    is ignored.
+
+    Example:
+        >>> output_filter = StreamingOutputFilter(max_tokens=500)
+        >>> for chunk in ["Call 050-12", "34567 today"]:
+        ...     emitted = output_filter.feed(chunk)
+        >>> emitted += output_filter.flush()
+        >>> output_filter.text
+        'Call [PHONE] today'
+    """
+
+    def __init__(self, max_tokens: int = 500):
+        """
+        Initialize the filter.
+
+        Args:
+            max_tokens: Maximum tokens (approximated as words)
+        """
+        self.max_tokens = max_tokens
+        self.truncated = False
+        self._pending = ""
+        self._words_emitted = 0
+        self._emitted: list[str] = []
+
+    @property
+    def text(self) -> str:
+        """Full filtered text emitted so far."""
+        return "".join(self._emitted)
+
+    def feed(self, chunk: str) -> str:
+        """
+        Add raw LLM output and return the filtered text that is safe to emit.
+
+        Args:
+            chunk: Raw text fragment from the LLM
+
+        Returns:
+            Filtered text (may be empty if no word boundary was reached)
+        """
+        if self.truncated:
+            return ""
+
+        self._pending += chunk
+
+        # Hold back the trailing partial word (and the whitespace before it)
+        last_boundary = -1
+        for match in re.finditer(r"\s", self._pending):
+            last_boundary = match.start()
+        if last_boundary <= 0:
+            return ""
+
+        ready = self._pending[:last_boundary]
+        self._pending = self._pending[last_boundary:]
+        return self._emit(ready)
+
+    def flush(self) -> str:
+        """
+        Release any buffered text at end of stream.
+
+        Returns:
+            Remaining filtered text
+        """
+        if self.truncated or not self._pending:
+            return ""
+
+        ready, self._pending = self._pending, ""
+        return self._emit(ready)
+
+    def _emit(self, text: str) -> str:
+        remaining = self.max_tokens - self._words_emitted
+        words = list(re.finditer(r"\S+", text))
+
+        if len(words) > remaining:
+            # Cut after the last allowed word, matching _filter_output's "..."
+            cut = words[remaining - 1].end() if remaining > 0 else 0
+            text = text[:cut] + "..."
+            self.truncated = True
+            self._words_emitted = self.max_tokens
+        else:
+            self._words_emitted += len(words)
+
+        filtered = redact_pii(text)
+        self._emitted.append(filtered)
+        return filtered
+
+
 class ClinicalAgent:
     """
     Async LangGraph agent for clinical documentation queries.
@@ -194,6 +449,9 @@ class ClinicalAgent:
     4. Synthesizes answer using Cohere Command-R
     5. Extracts citations and filters output
 
+    Steps 1-3 are also callable on their own via retrieve_context(), for
+    callers that build their own prompt (e.g. TreatmentRecommender).
+
     All operations are async and workspace-scoped.
 
     Example:
@@ -223,7 +481,7 @@ class ClinicalAgent:
             db: SQLAlchemy async session for database operations
             cohere_api_key: Cohere API key (defaults to settings.cohere_api_key)
             model: Cohere model to use (defaults to settings.cohere_chat_model)
-            redis: Optional Redis client for L1 query result caching
+            redis: Optional Redis client for L1 query result and semantic caching
 
         Raises:
             ValueError: If Cohere API key not provided
@@ -246,8 +504,14 @@ class ClinicalAgent:
         # Use Cohere v2 API client (async) for LLM synthesis
         self.cohere_client = cohere.AsyncClientV2(api_key=api_key, timeout=timeout)
         self.model = model or settings.cohere_chat_model
-        self.retrieval_service = get_retrieval_service(db)
+        self.retrieval_service = get_retrieval_service(db, redis=redis)
         self.redis = redis
+        # L2 semantic cache: serves paraphrased queries by embedding similarity
+        self.semantic_cache = (
+            SemanticQueryCache(redis)
+            if redis and settings.ai_agent_semantic_cache_enabled
+            else None
+        )
         # Initialize treatment recommender
         self.treatment_recommender = TreatmentRecommender(self)
 
@@ -315,161 +579,43 @@ class ClinicalAgent:
         )
 
         # L1 Cache: Check for cached query result
-        if self.redis:
-            cache_key = get_query_cache_key(workspace_id, query, client_id)
-            try:
-                cached = await self.redis.get(cache_key)
-                if cached:
-                    # Cache hit - deserialize and return cached response
-                    cache_data = json.loads(cached)
-
-                    # Emit cache hit metric
-                    ai_agent_cache_hits_total.labels(
-                        workspace_id=str(workspace_id),
-                        cache_layer="query_result",
-                    ).inc()
-
-                    processing_time = int((time.time() - start_time) * 1000)
-
-                    logger.info(
-                        "agent_query_cache_hit",
-                        workspace_id=str(workspace_id),
-                        query_hash=query_hash,
-                        processing_time_ms=processing_time,
-                        cached_at=cache_data.get("cached_at"),
-                    )
-
-                    # Reconstruct citations
-                    citations = []
-                    for citation_data in cache_data.get("citations", []):
-                        if "session_id" in citation_data:
-                            citations.append(
-                                SessionCitation(
-                                    session_id=uuid.UUID(citation_data["session_id"]),
-                                    client_id=uuid.UUID(citation_data["client_id"]),
-                                    client_name=citation_data["client_name"],
-                                    session_date=datetime.fromisoformat(
-                                        citation_data["session_date"]
-                                    ),
-                                    similarity=citation_data["similarity"],
-                                    field_name=citation_data["field_name"],
-                                )
-                            )
-                        else:
-                            citations.append(
-                                ClientCitation(
-                                    client_id=uuid.UUID(citation_data["client_id"]),
-                                    client_name=citation_data["client_name"],
-                                    similarity=citation_data["similarity"],
-                                    field_name=citation_data["field_name"],
-                                )
-                            )
-
-                    return AgentResponse(
-                        answer=cache_data["answer"],
-                        citations=citations,
-                        language=cache_data["language"],
-                        retrieved_count=cache_data["retrieved_count"],
-                        processing_time_ms=processing_time,
-                    )
-
-                # Cache miss
-                ai_agent_cache_misses_total.labels(
-                    workspace_id=str(workspace_id),
-                    cache_layer="query_result",
-                ).inc()
+        cached_response = await self._load_cached_response(
+            workspace_id=workspace_id,
+            query=query,
+            client_id=client_id,
+            query_hash=query_hash,
+            start_time=start_time,
+        )
+        if cached_response is not None:
+            return cached_response
 
-            except Exception as e:
-                # Don't fail query if cache check fails
-                logger.warning(
-                    "query_cache_check_error",
-                    workspace_id=str(workspace_id),
-                    error=str(e),
-                )
+        # L2 Cache: Check for a cached near-duplicate query (semantic tier)
+        cached_response, query_embedding = await self._load_semantic_cached_response(
+            workspace_id=workspace_id,
+            query=query,
+            client_id=client_id,
+            query_hash=query_hash,
+            start_time=start_time,
+        )
+        if cached_response is not None:
+            return cached_response
 
         try:
-            # Step 1: Detect language
-            language = detect_language(query)
-            logger.debug(
-                "language_detected",
-                workspace_id=str(workspace_id),
-                language=language,
-            )
-
-            # Step 1.5: Expand query with clinical terminology (if beneficial)
-            expanded_query = query
-            if should_expand_query(query):
-                expanded_query = expand_query(query, language=language)
-                logger.debug(
-                    "query_expanded",
-                    workspace_id=str(workspace_id),
-                    original_length=len(query),
-                    expanded_length=len(expanded_query),
-                    expansion_added=len(expanded_query) - len(query),
-                )
-
-            # Step 1.6: Adjust similarity threshold for short/general queries
-            # Uses centralized search configuration for adaptive threshold tuning
-            # See: pazpaz/ai/search_config.py for tuning parameters
-            adjusted_min_similarity = compute_adaptive_threshold(
+            # Steps 1-2: Detect language, expand query, retrieve contexts
+            (
+                language,
+                session_contexts,
+                client_contexts,
+            ) = await self._retrieve_contexts(
+                workspace_id=workspace_id,
                 query=query,
-                base_threshold=min_similarity,
-            )
-
-            if adjusted_min_similarity != min_similarity:
-                logger.debug(
-                    "threshold_adjusted_for_short_query",
-                    workspace_id=str(workspace_id),
-                    original_threshold=min_similarity,
-                    adjusted_threshold=adjusted_min_similarity,
-                    query_word_count=len(query.split()),
-                )
-
-            # Step 2: Retrieve relevant sessions and client contexts
-            retrieval_start = time.time()
-            if client_id:
-                # Client-scoped query: sessions and client profile for this client
-                (
-                    session_contexts,
-                    client_contexts,
-                ) = await self.retrieval_service.retrieve_client_history(
-                    workspace_id=workspace_id,
-                    client_id=client_id,
-                    query=expanded_query,  # Use expanded query for better retrieval
-                    limit=max_results,
-                    min_similarity=adjusted_min_similarity,  # Use adjusted threshold
-                )
-            else:
-                # Workspace-wide query: both sessions and client contexts
-                (
-                    session_contexts,
-                    client_contexts,
-                ) = await self.retrieval_service.retrieve_relevant_sessions(
-                    workspace_id=workspace_id,
-                    query=expanded_query,  # Use expanded query for better retrieval
-                    limit=max_results,
-                    min_similarity=adjusted_min_similarity,  # Use adjusted threshold
-                    include_client_context=True,
-                )
-            retrieval_duration = time.time() - retrieval_start
-
-            # Combine contexts for unified processing
-            total_sources = len(session_contexts) + len(client_contexts)
-
-            # Track retrieval metrics
-            ai_agent_retrieval_duration_seconds.observe(retrieval_duration)
-            ai_agent_sources_retrieved.observe(total_sources)
-
-            logger.info(
-                "agent_retrieval_completed",
-                workspace_id=str(workspace_id),
                 query_hash=query_hash,
-                sources_count=total_sources,
-                session_count=len(session_contexts),
-                client_count=len(client_contexts),
-                retrieved_count=total_sources,  # Keep for backwards compatibility
-                retrieval_duration_seconds=retrieval_duration,
+                client_id=client_id,
+                max_results=max_results,
+                min_similarity=min_similarity,
+                query_embedding=query_embedding,
             )
+            total_sources = len(session_contexts) + len(client_contexts)
 
             # Step 3: Handle no results
             if not session_contexts and not client_contexts:
@@ -509,9 +655,8 @@ class ClinicalAgent:
             processing_time_seconds = time.time() - start_time
 
             # Track overall query metrics
-            ai_agent_queries_total.labels(
-                workspace_id=str(workspace_id), language=language, status="success"
-            ).inc()
+            ai_agent_queries_total.labels(language=language, status="success").inc()
+            record_tenant_usage("ai_agent_queries", workspace_id)
             ai_agent_query_duration_seconds.labels(language=language).observe(
                 processing_time_seconds
             )
@@ -528,96 +673,32 @@ class ClinicalAgent:
                 language=language,
             )
 
-            # Step 7.5: Store result in L1 cache
-            if self.redis:
-                try:
-                    # Serialize citations
-                    serialized_citations = []
-                    for citation in citations:
-                        if isinstance(citation, SessionCitation):
-                            serialized_citations.append(
-                                {
-                                    "session_id": str(citation.session_id),
-                                    "client_name": citation.client_name,
-                                    "session_date": citation.session_date.isoformat(),
-                                    "similarity": citation.similarity,
-                                    "field_name": citation.field_name,
-                                }
-                            )
-                        else:  # ClientCitation
-                            serialized_citations.append(
-                                {
-                                    "client_id": str(citation.client_id),
-                                    "client_name": citation.client_name,
-                                    "similarity": citation.similarity,
-                                    "field_name": citation.field_name,
-                                }
-                            )
-
-                    cache_value = json.dumps(
-                        {
-                            "answer": filtered_answer,
-                            "citations": serialized_citations,
-                            "language": language,
-                            "retrieved_count": total_sources,
-                            "cached_at": int(time.time()),
-                            "cache_version": "v1",
-                        }
-                    )
-
-                    cache_key = get_query_cache_key(workspace_id, query, client_id)
-                    await self.redis.setex(cache_key, 300, cache_value)  # 5 min TTL
-
-                    logger.debug(
-                        "query_result_cached",
-                        workspace_id=str(workspace_id),
-                        query_hash=query_hash,
-                        cache_key=cache_key,
-                    )
-
-                except Exception as e:
-                    # Don't fail query if cache storage fails
-                    logger.warning(
-                        "query_cache_store_error",
-                        workspace_id=str(workspace_id),
-                        error=str(e),
-                    )
+            # Step 7.5: Store result in L1 and semantic caches
+            await self._store_cached_response(
+                workspace_id=workspace_id,
+                query=query,
+                client_id=client_id,
+                query_hash=query_hash,
+                answer=filtered_answer,
+                citations=citations,
+                language=language,
+                retrieved_count=total_sources,
+                query_embedding=query_embedding,
+            )
 
             # Step 8: Audit log (HIPAA compliance)
             if user_id:
-                try:
-                    await create_audit_event(
-                        db=self.db,
-                        user_id=user_id,
-                        workspace_id=workspace_id,
-                        action=AuditAction.READ,
-                        resource_type=ResourceType.AI_AGENT,
-                        resource_id=None,  # No specific resource (query is ephemeral)
-                        metadata={
-                            "query_hash": query_hash,
-                            "query_length": len(query),
-                            "language": language,
-                            "sources_count": total_sources,
-                            "retrieved_count": total_sources,  # Backwards compat
-                            "citations_count": len(citations),
-                            "processing_time_ms": processing_time,
-                            "client_id": str(client_id) if client_id else None,
-                            # Note: query text NOT logged (PHI risk)
-                        },
-                    )
-                    logger.debug(
-                        "agent_query_audited",
-                        workspace_id=str(workspace_id),
-                        user_id=str(user_id),
-                    )
-                except Exception as audit_error:
-                    # Don't fail query if audit logging fails
-                    logger.error(
-                        "agent_audit_logging_failed",
-                        workspace_id=str(workspace_id),
-                        error=str(audit_error),
-                        exc_info=True,
-                    )
+                await self._audit_query(
+                    workspace_id=workspace_id,
+                    user_id=user_id,
+                    client_id=client_id,
+                    query=query,
+                    query_hash=query_hash,
+                    language=language,
+                    sources_count=total_sources,
+                    citations_count=len(citations),
+                    processing_time_ms=processing_time,
+                )
 
             return AgentResponse(
                 answer=filtered_answer,
@@ -632,9 +713,8 @@ class ClinicalAgent:
             language = detect_language(query)
 
             # Track failed query
-            ai_agent_queries_total.labels(
-                workspace_id=str(workspace_id), language=language, status="error"
-            ).inc()
+            ai_agent_queries_total.labels(language=language, status="error").inc()
+            record_tenant_usage("ai_agent_queries", workspace_id)
 
             logger.error(
                 "agent_query_failed",
@@ -654,92 +734,827 @@ class ClinicalAgent:
                 processing_time_ms=processing_time,
             )
 
-    async def recommend_treatment_plan(
+    async def query_stream(
         self,
         workspace_id: uuid.UUID,
-        subjective: str,
-        objective: str,
-        assessment: str,
+        query: str,
+        user_id: uuid.UUID | None = None,
         client_id: uuid.UUID | None = None,
-    ) -> RecommendationResponse:
+        max_results: int = 5,
+        min_similarity: float = 0.7,
+    ) -> AsyncIterator[AgentStreamEvent]:
         """
-        Generate treatment plan recommendations (delegated to TreatmentRecommender).
+        Streaming variant of query() that yields answer tokens as they arrive.
 
-        This method delegates to TreatmentRecommender for all treatment recommendation logic.
-        See TreatmentRecommender.recommend_treatment_plan for full documentation.
+        Runs the same pipeline as query() (L1 cache, retrieval, synthesis,
+        audit logging), but emits citations as soon as retrieval completes and
+        then forwards LLM output incrementally through StreamingOutputFilter.
+        Completed streams populate the L1 and semantic query caches, so a
+        follow-up query() or query_stream() call is served from cache.
 
         Args:
             workspace_id: Workspace ID (MANDATORY - multi-tenant isolation)
-            subjective: Subjective findings (S in SOAP)
-            objective: Objective findings (O in SOAP)
-            assessment: Clinical assessment (A in SOAP)
-            client_id: Optional client ID for patient-specific context
+            query: Natural language query (Hebrew or English)
+            user_id: User ID for audit logging (optional, recommended)
+            client_id: Optional client ID to scope retrieval to specific patient
+            max_results: Maximum sessions to retrieve (default: 5, max: 10)
+            min_similarity: Minimum similarity threshold (default: 0.7)
 
-        Returns:
-            RecommendationResponse with 1-2 treatment recommendations
+        Yields:
+            AgentStreamEvent: citations, then token events, then done (or error)
 
         Raises:
-            AgentError: If recommendation generation fails
-            ValueError: If parameters are invalid
+            ValueError: If parameters are invalid (raised before first event)
 
         Example:
-            >>> response = await agent.recommend_treatment_plan(
+            >>> async for event in agent.query_stream(
             ...     workspace_id=workspace_id,
-            ...     subjective="Patient reports tight upper trapezius...",
-            ...     objective="Palpation reveals trigger points...",
-            ...     assessment="Myofascial pain syndrome...",
-            ...     client_id=client_id,
-            ... )
-            >>> print(response.recommendations[0].description)
+            ...     query="What did we discuss about lower back pain?",
+            ... ):
+            ...     if event.event == "token":
+            ...         print(event.data["text"], end="")
         """
-        return await self.treatment_recommender.recommend_treatment_plan(
+        start_time = time.time()
+
+        if max_results < 1 or max_results > 10:
+            raise ValueError(f"Invalid max_results: {max_results}. Must be 1-10.")
+
+        query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
+
+        logger.info(
+            "agent_query_stream_started",
+            workspace_id=str(workspace_id),
+            query_hash=query_hash,
+            query_length=len(query),
+            client_id=str(client_id) if client_id else None,
+            max_results=max_results,
+        )
+
+        # L1/semantic cache: replay cached answer as a single token event
+        query_embedding = None
+        cached_response = await self._load_cached_response(
             workspace_id=workspace_id,
-            subjective=subjective,
-            objective=objective,
-            assessment=assessment,
+            query=query,
             client_id=client_id,
+            query_hash=query_hash,
+            start_time=start_time,
         )
+        if cached_response is None:
+            (
+                cached_response,
+                query_embedding,
+            ) = await self._load_semantic_cached_response(
+                workspace_id=workspace_id,
+                query=query,
+                client_id=client_id,
+                query_hash=query_hash,
+                start_time=start_time,
+            )
+        if cached_response is not None:
+            yield AgentStreamEvent(
+                event="citations",
+                data={
+                    "citations": cached_response.citations,
+                    "language": cached_response.language,
+                    "retrieved_count": cached_response.retrieved_count,
+                },
+            )
+            yield AgentStreamEvent(event="token", data={"text": cached_response.answer})
+            yield AgentStreamEvent(
+                event="done",
+                data={
+                    "language": cached_response.language,
+                    "retrieved_count": cached_response.retrieved_count,
+                    "processing_time_ms": cached_response.processing_time_ms,
+                    "cached": True,
+                },
+            )
+            return
 
-    def _format_context(
-        self,
-        session_contexts: list[SessionContext],
-        client_contexts: list[ClientContext],
-        language: str,
-    ) -> str:
-        """
-        Format retrieved session and client contexts for LLM consumption.
+        language = detect_language(query)
 
-        Args:
-            session_contexts: List of SessionContext objects
-            client_contexts: List of ClientContext objects
-            language: Language code ("he" or "en")
+        try:
+            (
+                language,
+                session_contexts,
+                client_contexts,
+            ) = await self._retrieve_contexts(
+                workspace_id=workspace_id,
+                query=query,
+                query_hash=query_hash,
+                client_id=client_id,
+                max_results=max_results,
+                min_similarity=min_similarity,
+                query_embedding=query_embedding,
+            )
+            total_sources = len(session_contexts) + len(client_contexts)
 
-        Returns:
-            Formatted context string with sessions and client profiles
-        """
-        formatted_parts = []
+            citations = self._extract_citations(
+                session_contexts=session_contexts,
+                client_contexts=client_contexts,
+            )
 
-        # Format client profile contexts first (baseline data)
-        if client_contexts:
-            client_header = (
-                "=== פרופילי לקוחות רלוונטיים ==="
-                if language == "he"
-                else "=== Relevant Client Profiles ==="
+            # Citations are known before synthesis starts - send them first
+            yield AgentStreamEvent(
+                event="citations",
+                data={
+                    "citations": citations,
+                    "language": language,
+                    "retrieved_count": total_sources,
+                },
             )
-            formatted_parts.append(client_header)
 
-            for i, context in enumerate(client_contexts, 1):
-                client_info = []
-                client_info.append(f"Client {i}: {context.client_name}")
-                client_info.append(f"Similarity: {context.similarity_score:.2%}")
-                client_info.append(f"Matched field: {context.matched_field}")
+            if not session_contexts and not client_contexts:
+                yield AgentStreamEvent(
+                    event="token", data={"text": get_no_results_message(language)}
+                )
+                yield AgentStreamEvent(
+                    event="done",
+                    data={
+                        "language": language,
+                        "retrieved_count": 0,
+                        "processing_time_ms": int((time.time() - start_time) * 1000),
+                        "cached": False,
+                    },
+                )
+                return
 
-                if context.medical_history:
-                    client_info.append(f"Medical History: {context.medical_history}")
-                if context.notes:
-                    client_info.append(f"Notes: {context.notes}")
+            formatted_context = self._format_context(
+                session_contexts=session_contexts,
+                client_contexts=client_contexts,
+                language=language,
+            )
 
-                formatted_parts.append("\n".join(client_info))
+            output_filter = StreamingOutputFilter(max_tokens=500)
+            async with aclosing(
+                self._stream_synthesis(
+                    query=query,
+                    context=formatted_context,
+                    language=language,
+                )
+            ) as chunks:
+                async for chunk in chunks:
+                    filtered = output_filter.feed(chunk)
+                    if filtered:
+                        yield AgentStreamEvent(event="token", data={"text": filtered})
+                    if output_filter.truncated:
+                        # Word limit reached - stop consuming LLM output
+                        break
+
+            filtered = output_filter.flush()
+            if filtered:
+                yield AgentStreamEvent(event="token", data={"text": filtered})
+
+            filtered_answer = output_filter.text
+            processing_time = int((time.time() - start_time) * 1000)
+
+            ai_agent_queries_total.labels(language=language, status="success").inc()
+
+            record_tenant_usage("ai_agent_queries", workspace_id)
+            ai_agent_query_duration_seconds.labels(language=language).observe(
+                time.time() - start_time
+            )
+            ai_agent_citations_returned.observe(len(citations))
+
+            logger.info(
+                "agent_query_stream_completed",
+                workspace_id=str(workspace_id),
+                query_hash=query_hash,
+                sources_count=total_sources,
+                answer_length=len(filtered_answer),
+                citations_count=len(citations),
+                processing_time_ms=processing_time,
+                language=language,
+                truncated=output_filter.truncated,
+            )
+
+            await self._store_cached_response(
+                workspace_id=workspace_id,
+                query=query,
+                client_id=client_id,
+                query_hash=query_hash,
+                answer=filtered_answer,
+                citations=citations,
+                language=language,
+                retrieved_count=total_sources,
+                query_embedding=query_embedding,
+            )
+
+            if user_id:
+                await self._audit_query(
+                    workspace_id=workspace_id,
+                    user_id=user_id,
+                    client_id=client_id,
+                    query=query,
+                    query_hash=query_hash,
+                    language=language,
+                    sources_count=total_sources,
+                    citations_count=len(citations),
+                    processing_time_ms=processing_time,
+                )
+
+            yield AgentStreamEvent(
+                event="done",
+                data={
+                    "language": language,
+                    "retrieved_count": total_sources,
+                    "processing_time_ms": processing_time,
+                    "cached": False,
+                },
+            )
+
+        except Exception as e:
+            processing_time = int((time.time() - start_time) * 1000)
+
+            ai_agent_queries_total.labels(language=language, status="error").inc()
+
+            record_tenant_usage("ai_agent_queries", workspace_id)
+
+            logger.error(
+                "agent_query_stream_failed",
+                workspace_id=str(workspace_id),
+                error=str(e),
+                error_type=type(e).__name__,
+                processing_time_ms=processing_time,
+                exc_info=True,
+            )
+
+            yield AgentStreamEvent(
+                event="error", data={"message": get_error_message(language)}
+            )
+
+    async def retrieve_context(
+        self,
+        workspace_id: uuid.UUID,
+        query: str,
+        client_id: uuid.UUID | None = None,
+        max_results: int = 5,
+        min_similarity: float = 0.7,
+    ) -> RetrievedContext:
+        """
+        Run only the retrieve and format stages of the pipeline (no LLM call).
+
+        Performs the same language detection, query expansion, adaptive
+        threshold and retrieval as query(), then formats the contexts with
+        _format_context(). Query caches are not consulted, since they hold
+        synthesized answers rather than contexts.
+
+        Args:
+            workspace_id: Workspace ID (MANDATORY - multi-tenant isolation)
+            query: Natural language query (Hebrew or English)
+            client_id: Optional client ID to scope retrieval to specific patient
+            max_results: Maximum sessions to retrieve (default: 5, max: 10)
+            min_similarity: Minimum similarity threshold (default: 0.7)
+
+        Returns:
+            RetrievedContext with contexts and their formatted representation
+
+        Raises:
+            RetrievalError: If retrieval fails
+            ValueError: If parameters are invalid
+
+        Example:
+            >>> context = await agent.retrieve_context(
+            ...     workspace_id=workspace_id,
+            ...     query="Lower back pain, limited lumbar flexion",
+            ...     client_id=client_id,
+            ...     max_results=3,
+            ... )
+            >>> print(context.retrieved_count)
+        """
+        if max_results < 1 or max_results > 10:
+            raise ValueError(f"Invalid max_results: {max_results}. Must be 1-10.")
+
+        query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
+
+        language, session_contexts, client_contexts = await self._retrieve_contexts(
+            workspace_id=workspace_id,
+            query=query,
+            query_hash=query_hash,
+            client_id=client_id,
+            max_results=max_results,
+            min_similarity=min_similarity,
+        )
+
+        formatted_context = ""
+        if session_contexts or client_contexts:
+            formatted_context = self._format_context(
+                session_contexts=session_contexts,
+                client_contexts=client_contexts,
+                language=language,
+            )
+
+        return RetrievedContext(
+            language=language,
+            session_contexts=session_contexts,
+            client_contexts=client_contexts,
+            formatted_context=formatted_context,
+        )
+
+    async def recommend_treatment_plan(
+        self,
+        workspace_id: uuid.UUID,
+        subjective: str,
+        objective: str,
+        assessment: str,
+        client_id: uuid.UUID | None = None,
+    ) -> RecommendationResponse:
+        """
+        Generate treatment plan recommendations (delegated to TreatmentRecommender).
+
+        This method delegates to TreatmentRecommender for all treatment recommendation logic.
+        See TreatmentRecommender.recommend_treatment_plan for full documentation.
+
+        Args:
+            workspace_id: Workspace ID (MANDATORY - multi-tenant isolation)
+            subjective: Subjective findings (S in SOAP)
+            objective: Objective findings (O in SOAP)
+            assessment: Clinical assessment (A in SOAP)
+            client_id: Optional client ID for patient-specific context
+
+        Returns:
+            RecommendationResponse with 1-2 treatment recommendations
+
+        Raises:
+            AgentError: If recommendation generation fails
+            ValueError: If parameters are invalid
+
+        Example:
+            >>> response = await agent.recommend_treatment_plan(
+            ...     workspace_id=workspace_id,
+            ...     subjective="Patient reports tight upper trapezius...",
+            ...     objective="Palpation reveals trigger points...",
+            ...     assessment="Myofascial pain syndrome...",
+            ...     client_id=client_id,
+            ... )
+            >>> print(response.recommendations[0].description)
+        """
+        return await self.treatment_recommender.recommend_treatment_plan(
+            workspace_id=workspace_id,
+            subjective=subjective,
+            objective=objective,
+            assessment=assessment,
+            client_id=client_id,
+        )
+
+    async def _load_cached_response(
+        self,
+        workspace_id: uuid.UUID,
+        query: str,
+        client_id: uuid.UUID | None,
+        query_hash: str,
+        start_time: float,
+    ) -> AgentResponse | None:
+        """
+        Look up a query result in the L1 cache.
+
+        Args:
+            workspace_id: Workspace ID
+            query: User's query text
+            client_id: Optional client scope
+            query_hash: Query hash for log correlation
+            start_time: Query start time (for processing_time_ms)
+
+        Returns:
+            Cached AgentResponse, or None on miss, error, or if Redis is disabled
+        """
+        if not self.redis:
+            return None
+
+        cache_key = get_query_cache_key(workspace_id, query, client_id)
+        try:
+            cached = await self.redis.get(cache_key)
+            if not cached:
+                ai_agent_cache_misses_total.labels(cache_layer="query_result").inc()
+                return None
+
+            cache_data = json.loads(cached)
+
+            ai_agent_cache_hits_total.labels(cache_layer="query_result").inc()
+
+            response = self._response_from_cache(cache_data, start_time)
+
+            logger.info(
+                "agent_query_cache_hit",
+                workspace_id=str(workspace_id),
+                query_hash=query_hash,
+                processing_time_ms=response.processing_time_ms,
+                cached_at=cache_data.get("cached_at"),
+            )
+
+            return response
+
+        except Exception as e:
+            # Don't fail query if cache check fails
+            logger.warning(
+                "query_cache_check_error",
+                workspace_id=str(workspace_id),
+                error=str(e),
+            )
+            return None
+
+    async def _load_semantic_cached_response(
+        self,
+        workspace_id: uuid.UUID,
+        query: str,
+        client_id: uuid.UUID | None,
+        query_hash: str,
+        start_time: float,
+    ) -> tuple[AgentResponse | None, list[float] | None]:
+        """
+        Look up a near-duplicate query in the semantic cache.
+
+        Embeds the raw query (not the expanded one - expansion appends the
+        same clinical synonyms to related queries and would inflate their
+        similarity). The embedding is returned so retrieval and cache storage
+        can reuse it instead of embedding the query again.
+
+        Args:
+            workspace_id: Workspace ID
+            query: User's query text
+            client_id: Optional client scope
+            query_hash: Query hash for log correlation
+            start_time: Query start time (for processing_time_ms)
+
+        Returns:
+            Tuple of (cached AgentResponse or None, query embedding or None).
+            Both are None if the semantic cache is disabled or embedding fails.
+        """
+        if not self.semantic_cache:
+            return None, None
+
+        try:
+            query_embedding = await self.retrieval_service.embedding_service.embed_text(
+                query
+            )
+        except Exception as e:
+            # Retrieval embeds again and surfaces the error if it persists
+            logger.warning(
+                "semantic_cache_embedding_error",
+                workspace_id=str(workspace_id),
+                error=str(e),
+            )
+            return None, None
+
+        hit = await self.semantic_cache.lookup(
+            workspace_id=workspace_id,
+            client_id=client_id,
+            embedding=query_embedding,
+            language=detect_language(query),
+        )
+        if hit is None:
+            return None, query_embedding
+
+        response = self._response_from_cache(hit.payload, start_time)
+
+        logger.info(
+            "agent_query_semantic_cache_hit",
+            workspace_id=str(workspace_id),
+            query_hash=query_hash,
+            similarity=round(hit.similarity, 4),
+            processing_time_ms=response.processing_time_ms,
+            cached_at=hit.cached_at,
+        )
+
+        return response, query_embedding
+
+    def _response_from_cache(
+        self, cache_data: dict[str, Any], start_time: float
+    ) -> AgentResponse:
+        """Rebuild an AgentResponse from a cached payload."""
+        return AgentResponse(
+            answer=cache_data["answer"],
+            citations=[
+                deserialize_citation(citation_data)
+                for citation_data in cache_data.get("citations", [])
+            ],
+            language=cache_data["language"],
+            retrieved_count=cache_data["retrieved_count"],
+            processing_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+    async def _store_cached_response(
+        self,
+        workspace_id: uuid.UUID,
+        query: str,
+        client_id: uuid.UUID | None,
+        query_hash: str,
+        answer: str,
+        citations: list[SessionCitation | ClientCitation],
+        language: str,
+        retrieved_count: int,
+        query_embedding: list[float] | None = None,
+    ) -> None:
+        """
+        Store a completed query result in the L1 cache (5 minute TTL).
+
+        If a query embedding is available, the result is also stored in the
+        semantic cache so paraphrases of this query can be served from it.
+        Entries are registered in AICacheService tag sets first so session
+        changes can invalidate them; if tagging fails nothing is cached.
+        Cache failures are logged and swallowed.
+        """
+        if not self.redis:
+            return
+
+        cache_key = get_query_cache_key(workspace_id, query, client_id)
+        store_semantic = self.semantic_cache is not None and query_embedding is not None
+
+        cache_data = {
+            "answer": answer,
+            "citations": [serialize_citation(c) for c in citations],
+            "language": language,
+            "retrieved_count": retrieved_count,
+            "cached_at": int(time.time()),
+            "cache_version": "v1",
+        }
+
+        try:
+            cache_value = json.dumps(cache_data)
+
+            tagged_keys = [cache_key]
+            ttl_seconds = QUERY_CACHE_TTL_SECONDS
+            if store_semantic:
+                tagged_keys.append(get_semantic_cache_key(workspace_id, client_id))
+                ttl_seconds = max(ttl_seconds, self.semantic_cache.ttl_seconds)
+
+            await AICacheService(self.redis).tag_keys(
+                workspace_id=workspace_id,
+                client_id=client_id,
+                keys=tagged_keys,
+                ttl_seconds=ttl_seconds,
+            )
+            await self.redis.setex(cache_key, QUERY_CACHE_TTL_SECONDS, cache_value)
+
+            logger.debug(
+                "query_result_cached",
+                workspace_id=str(workspace_id),
+                query_hash=query_hash,
+                cache_key=cache_key,
+            )
+
+        except Exception as e:
+            # Don't fail query if cache storage fails
+            logger.warning(
+                "query_cache_store_error",
+                workspace_id=str(workspace_id),
+                error=str(e),
+            )
+            return
+
+        if store_semantic:
+            await self.semantic_cache.store(
+                workspace_id=workspace_id,
+                client_id=client_id,
+                query_hash=query_hash,
+                embedding=query_embedding,
+                payload=cache_data,
+            )
+
+    async def _retrieve_contexts(
+        self,
+        workspace_id: uuid.UUID,
+        query: str,
+        query_hash: str,
+        client_id: uuid.UUID | None,
+        max_results: int,
+        min_similarity: float,
+        query_embedding: list[float] | None = None,
+    ) -> tuple[str, list[SessionContext], list[ClientContext]]:
+        """
+        Detect language, expand the query, and retrieve relevant contexts.
+
+        Retrieved contexts are packed into the prompt token budget
+        (settings.ai_agent_context_token_budget) before being returned, so
+        formatting, citations and synthesis all see the same contexts.
+
+        Args:
+            workspace_id: Workspace ID (multi-tenant isolation)
+            query: User's query text
+            query_hash: Query hash for log correlation
+            client_id: Optional client ID to scope retrieval
+            max_results: Maximum sessions to retrieve
+            min_similarity: Base similarity threshold (adapted for short queries)
+            query_embedding: Embedding of the raw query, if already computed
+                (reused for retrieval only when query expansion is a no-op)
+
+        Returns:
+            Tuple of (language, session contexts, client contexts)
+
+        Raises:
+            RetrievalError: If retrieval fails
+        """
+        # Step 1: Detect language
+        language = detect_language(query)
+        logger.debug(
+            "language_detected",
+            workspace_id=str(workspace_id),
+            language=language,
+        )
+
+        # Step 1.5: Expand query with clinical terminology (if beneficial)
+        expanded_query = query
+        if should_expand_query(query):
+            expanded_query = expand_query(query, language=language)
+            logger.debug(
+                "query_expanded",
+                workspace_id=str(workspace_id),
+                original_length=len(query),
+                expanded_length=len(expanded_query),
+                expansion_added=len(expanded_query) - len(query),
+            )
+
+        # Step 1.6: Adjust similarity threshold for short/general queries
+        # Uses centralized search configuration for adaptive threshold tuning
+        # See: pazpaz/ai/search_config.py for tuning parameters
+        adjusted_min_similarity = compute_adaptive_threshold(
+            query=query,
+            base_threshold=min_similarity,
+        )
+
+        if adjusted_min_similarity != min_similarity:
+            logger.debug(
+                "threshold_adjusted_for_short_query",
+                workspace_id=str(workspace_id),
+                original_threshold=min_similarity,
+                adjusted_threshold=adjusted_min_similarity,
+                query_word_count=len(query.split()),
+            )
+
+        # Step 2: Retrieve relevant sessions and client contexts
+        # The raw-query embedding only matches the search text if not expanded
+        retrieval_embedding = query_embedding if expanded_query == query else None
+        retrieval_start = time.time()
+        if client_id:
+            # Client-scoped query: sessions and client profile for this client
+            (
+                session_contexts,
+                client_contexts,
+            ) = await self.retrieval_service.retrieve_client_history(
+                workspace_id=workspace_id,
+                client_id=client_id,
+                query=expanded_query,  # Use expanded query for better retrieval
+                limit=max_results,
+                min_similarity=adjusted_min_similarity,  # Use adjusted threshold
+                query_embedding=retrieval_embedding,
+            )
+        else:
+            # Workspace-wide query: both sessions and client contexts
+            (
+                session_contexts,
+                client_contexts,
+            ) = await self.retrieval_service.retrieve_relevant_sessions(
+                workspace_id=workspace_id,
+                query=expanded_query,  # Use expanded query for better retrieval
+                limit=max_results,
+                min_similarity=adjusted_min_similarity,  # Use adjusted threshold
+                include_client_context=True,
+                query_embedding=retrieval_embedding,
+            )
+        retrieval_duration = time.time() - retrieval_start
+
+        # Combine contexts for unified processing
+        total_sources = len(session_contexts) + len(client_contexts)
+
+        # Track retrieval metrics
+        ai_agent_retrieval_duration_seconds.observe(retrieval_duration)
+        ai_agent_sources_retrieved.observe(total_sources)
+
+        logger.info(
+            "agent_retrieval_completed",
+            workspace_id=str(workspace_id),
+            query_hash=query_hash,
+            sources_count=total_sources,
+            session_count=len(session_contexts),
+            client_count=len(client_contexts),
+            retrieved_count=total_sources,  # Keep for backwards compatibility
+            retrieval_duration_seconds=retrieval_duration,
+        )
+
+        # Step 3: Fit contexts into the prompt token budget
+        if session_contexts or client_contexts:
+            packed = pack_contexts(
+                session_contexts=session_contexts,
+                client_contexts=client_contexts,
+                query=expanded_query,
+                budget_tokens=min(
+                    settings.ai_agent_context_token_budget,
+                    settings.ai_agent_max_context_tokens,
+                ),
+            )
+            session_contexts = packed.session_contexts
+            client_contexts = packed.client_contexts
+
+            ai_agent_context_tokens.labels(stage="retrieved").observe(
+                packed.original_tokens
+            )
+            ai_agent_context_tokens.labels(stage="packed").observe(packed.packed_tokens)
+            if packed.tokens_saved > 0:
+                ai_agent_context_tokens_saved_total.inc(packed.tokens_saved)
+                logger.info(
+                    "agent_context_packed",
+                    workspace_id=str(workspace_id),
+                    query_hash=query_hash,
+                    original_tokens=packed.original_tokens,
+                    packed_tokens=packed.packed_tokens,
+                    tokens_saved=packed.tokens_saved,
+                    session_count=len(session_contexts),
+                    client_count=len(client_contexts),
+                )
+
+        return language, session_contexts, client_contexts
+
+    async def _audit_query(
+        self,
+        workspace_id: uuid.UUID,
+        user_id: uuid.UUID,
+        client_id: uuid.UUID | None,
+        query: str,
+        query_hash: str,
+        language: str,
+        sources_count: int,
+        citations_count: int,
+        processing_time_ms: int,
+    ) -> None:
+        """
+        Write a HIPAA audit event for an agent query (query text NOT logged).
+
+        Audit failures are logged and swallowed so they never fail the query.
+        """
+        try:
+            await create_audit_event(
+                db=self.db,
+                user_id=user_id,
+                workspace_id=workspace_id,
+                action=AuditAction.READ,
+                resource_type=ResourceType.AI_AGENT,
+                resource_id=None,  # No specific resource (query is ephemeral)
+                metadata={
+                    "query_hash": query_hash,
+                    "query_length": len(query),
+                    "language": language,
+                    "sources_count": sources_count,
+                    "retrieved_count": sources_count,  # Backwards compat
+                    "citations_count": citations_count,
+                    "processing_time_ms": processing_time_ms,
+                    "client_id": str(client_id) if client_id else None,
+                    # Note: query text NOT logged (PHI risk)
+                },
+            )
+            logger.debug(
+                "agent_query_audited",
+                workspace_id=str(workspace_id),
+                user_id=str(user_id),
+            )
+        except Exception as audit_error:
+            # Don't fail query if audit logging fails
+            logger.error(
+                "agent_audit_logging_failed",
+                workspace_id=str(workspace_id),
+                error=str(audit_error),
+                exc_info=True,
+            )
+
+    def _format_context(
+        self,
+        session_contexts: list[SessionContext],
+        client_contexts: list[ClientContext],
+        language: str,
+    ) -> str:
+        """
+        Format retrieved session and client contexts for LLM consumption.
+
+        Args:
+            session_contexts: List of SessionContext objects
+            client_contexts: List of ClientContext objects
+            language: Language code ("he" or "en")
+
+        Returns:
+            Formatted context string with sessions and client profiles
+        """
+        formatted_parts = []
+
+        # Format client profile contexts first (baseline data)
+        if client_contexts:
+            client_header = (
+                "=== פרופילי לקוחות רלוונטיים ==="
+                if language == "he"
+                else "=== Relevant Client Profiles ==="
+            )
+            formatted_parts.append(client_header)
+
+            for i, context in enumerate(client_contexts, 1):
+                client_info = []
+                client_info.append(f"Client {i}: {context.client_name}")
+                client_info.append(f"Similarity: {context.similarity_score:.2%}")
+                client_info.append(f"Matched field: {context.matched_field}")
+
+                if context.medical_history:
+                    client_info.append(f"Medical History: {context.medical_history}")
+                if context.notes:
+                    client_info.append(f"Notes: {context.notes}")
+
+                formatted_parts.append("\n".join(client_info))
 
         # Format session contexts
         if session_contexts:
@@ -934,6 +1749,119 @@ class ClinicalAgent:
             )
             raise AgentError(f"Failed to synthesize answer: {e}") from e
 
+    async def _stream_synthesis(
+        self,
+        query: str,
+        context: str,
+        language: str,
+    ) -> AsyncIterator[str]:
+        """
+        Stream answer text from Cohere LLM as it is generated.
+
+        Unlike _synthesize_answer(), this is not wrapped in retry_with_backoff:
+        once tokens have been forwarded to the client a retry would duplicate
+        output, so failures surface immediately as AgentError.
+
+        Args:
+            query: User's question
+            context: Formatted session contexts
+            language: Language code ("he" or "en")
+
+        Yields:
+            Raw (unfiltered) answer text fragments
+
+        Raises:
+            AgentError: If LLM call fails
+        """
+        system_prompt = get_system_prompt(language)
+        user_prompt = get_synthesis_prompt(language).format(
+            query=query,
+            context=context,
+        )
+
+        logger.debug(
+            "llm_synthesis_stream_started",
+            model=self.model,
+            context_length=len(context),
+        )
+
+        llm_start = time.time()
+        answer_length = 0
+        tokens_used = None
+
+        try:
+            stream = self.cohere_client.chat_stream(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=0.3,  # Low temperature for factual responses
+                max_tokens=settings.ai_agent_max_output_tokens,
+            )
+
+            async for event in stream:
+                if event.type == "content-delta":
+                    text = event.delta.message.content.text
+                    if text:
+                        answer_length += len(text)
+                        yield text
+                elif event.type == "message-end":
+                    usage = getattr(event.delta, "usage", None)
+                    billed_units = getattr(usage, "billed_units", None)
+                    if billed_units:
+                        tokens_used = {
+                            "input_tokens": getattr(billed_units, "input_tokens", 0)
+                            or 0,
+                            "output_tokens": getattr(billed_units, "output_tokens", 0)
+                            or 0,
+                        }
+
+        except ApiError as e:
+            ai_agent_llm_errors_total.labels(
+                error_type="api_error", model=self.model
+            ).inc()
+
+            logger.error(
+                "llm_synthesis_stream_api_error",
+                error=str(e),
+                status_code=getattr(e, "status_code", None),
+                exc_info=True,
+            )
+            raise AgentError(f"Cohere API error: {e}") from e
+
+        except Exception as e:
+            ai_agent_llm_errors_total.labels(
+                error_type=type(e).__name__, model=self.model
+            ).inc()
+
+            logger.error(
+                "llm_synthesis_stream_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+            raise AgentError(f"Failed to stream answer: {e}") from e
+
+        llm_duration = time.time() - llm_start
+
+        if tokens_used:
+            ai_agent_llm_tokens_total.labels(model=self.model, token_type="input").inc(
+                tokens_used["input_tokens"]
+            )
+            ai_agent_llm_tokens_total.labels(model=self.model, token_type="output").inc(
+                tokens_used["output_tokens"]
+            )
+        ai_agent_llm_duration_seconds.labels(model=self.model).observe(llm_duration)
+
+        logger.info(
+            "llm_synthesis_stream_completed",
+            model=self.model,
+            answer_length=answer_length,
+            tokens_used=tokens_used,
+            llm_duration_seconds=llm_duration,
+        )
+
     def _extract_citations(
         self,
         session_contexts: list[SessionContext],
@@ -997,29 +1925,8 @@ class ClinicalAgent:
         if len(words) > max_tokens:
             text = " ".join(words[:max_tokens]) + "..."
 
-        # Basic PII redaction patterns
-        # Phone numbers (Israeli format: 05X-XXXXXXX, 0X-XXXXXXX)
-        text = re.sub(
-            r"\b0\d{1,2}-?\d{7,8}\b",
-            "[PHONE]",
-            text,
-        )
-
-        # Email addresses
-        text = re.sub(
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            "[EMAIL]",
-            text,
-        )
-
-        # Israeli ID numbers (9 digits)
-        text = re.sub(
-            r"\b\d{9}\b",
-            "[ID]",
-            text,
-        )
-
-        return text
+        # Basic PII redaction (phone numbers, emails, Israeli IDs)
+        return redact_pii(text)
 
 
 def get_clinical_agent(db: AsyncSession, redis: Redis | None = None) -> ClinicalAgent:
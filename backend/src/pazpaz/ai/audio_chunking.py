@@ -0,0 +1,229 @@
+"""Split long recordings into transcription-sized segments at silences.
+
+Whisper accepts at most 25 MB per request and transcribes one request
+sequentially, so a full-session recording is split into segments of a few
+minutes that are transcribed concurrently and stitched back together.
+
+Cuts are placed in the middle of a pause (ffmpeg silencedetect) close to
+the target segment length, so words are not cut in half. If a stretch of
+audio has no usable pause, it is cut at the maximum segment length.
+
+Each segment is re-encoded as mono 16 kHz Opus (32 kbit/s), about 240 KB per
+minute, so even maximum-length segments stay far below the upload limit.
+
+Requires the ffmpeg binary (installed in the backend image).
+
+Usage:
+    duration, silences = await analyze_audio(path)
+    segments = plan_segments(duration, silences)
+    audio = await extract_segment(path, segments[0])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import dataclass
+
+from pazpaz.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+FFMPEG_BINARY = "ffmpeg"
+
+# Segment length: aim for TARGET, cut at a pause between MIN and MAX
+SEGMENT_TARGET_SECONDS = 240.0
+SEGMENT_MIN_SECONDS = 120.0
+SEGMENT_MAX_SECONDS = 360.0
+
+# What counts as a pause (below -35 dBFS for at least half a second)
+SILENCE_NOISE_DB = -35
+SILENCE_MIN_SECONDS = 0.5
+
+# Encoding of extracted segments
+SEGMENT_FORMAT = "ogg"
+SEGMENT_FFMPEG_ARGS = ("-ac", "1", "-ar", "16000", "-c:a", "libopus", "-b:a", "32k")
+
+_SILENCE_START = re.compile(r"silence_start: (-?\d+(?:\.\d+)?)")
+_SILENCE_END = re.compile(r"silence_end: (-?\d+(?:\.\d+)?)")
+_TIMESTAMP = re.compile(r"(?:Duration: |time=)(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
+
+class AudioProcessingError(Exception):
+    """Raised when ffmpeg cannot decode or encode the audio."""
+
+
+@dataclass(frozen=True)
+class AudioSegment:
+    """A [start, end) slice of a recording, in seconds."""
+
+    index: int
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        """Segment length in seconds."""
+        return self.end - self.start
+
+    @property
+    def filename(self) -> str:
+        """File name sent to the transcription provider."""
+        return f"segment-{self.index:03d}.{SEGMENT_FORMAT}"
+
+
+def parse_silencedetect(output: str) -> tuple[float, list[tuple[float, float]]]:
+    """
+    Parse ffmpeg silencedetect output.
+
+    Args:
+        output: ffmpeg stderr
+
+    Returns:
+        (audio duration in seconds, list of (silence start, silence end));
+        a trailing silence without an end is ignored
+    """
+    duration = 0.0
+    for hours, minutes, seconds in _TIMESTAMP.findall(output):
+        duration = max(duration, int(hours) * 3600 + int(minutes) * 60 + float(seconds))
+
+    silences = []
+    start: float | None = None
+    for line in output.splitlines():
+        if match := _SILENCE_START.search(line):
+            start = max(float(match.group(1)), 0.0)
+        elif (match := _SILENCE_END.search(line)) and start is not None:
+            silences.append((start, float(match.group(1))))
+            start = None
+
+    return duration, silences
+
+
+def plan_segments(
+    duration: float,
+    silences: list[tuple[float, float]],
+    target_seconds: float = SEGMENT_TARGET_SECONDS,
+    min_seconds: float = SEGMENT_MIN_SECONDS,
+    max_seconds: float = SEGMENT_MAX_SECONDS,
+) -> list[AudioSegment]:
+    """
+    Choose cut points for a recording.
+
+    Each cut is the midpoint of the pause closest to start + target_seconds
+    among pauses between start + min_seconds and start + max_seconds, or
+    start + max_seconds if there is none.
+
+    Args:
+        duration: Recording length in seconds
+        silences: (start, end) of detected pauses, in order
+        target_seconds: Preferred segment length
+        min_seconds: Shortest segment cut at a pause
+        max_seconds: Longest segment
+
+    Returns:
+        Contiguous segments covering [0, duration)
+    """
+    cut_points = [(start + end) / 2 for start, end in silences]
+
+    segments: list[AudioSegment] = []
+    start = 0.0
+    while duration - start > max_seconds:
+        candidates = [
+            point
+            for point in cut_points
+            if start + min_seconds <= point <= start + max_seconds
+        ]
+        if candidates:
+            end = min(candidates, key=lambda point: abs(point - start - target_seconds))
+        else:
+            end = start + max_seconds
+        segments.append(AudioSegment(len(segments), start, end))
+        start = end
+
+    segments.append(AudioSegment(len(segments), start, max(duration, start)))
+    return segments
+
+
+async def _run_ffmpeg(*args: str) -> tuple[bytes, str]:
+    """Run ffmpeg and return (stdout, stderr)."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            FFMPEG_BINARY,
+            "-hide_banner",
+            "-nostdin",
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        raise AudioProcessingError("ffmpeg is not installed") from e
+
+    stdout, stderr = await process.communicate()
+    output = stderr.decode("utf-8", errors="replace")
+    if process.returncode != 0:
+        raise AudioProcessingError(
+            f"ffmpeg exited with {process.returncode}: {output[-500:]}"
+        )
+    return stdout, output
+
+
+async def analyze_audio(path: str) -> tuple[float, list[tuple[float, float]]]:
+    """
+    Decode a recording once to get its duration and pauses.
+
+    The duration is taken from decoding progress, so it is also known for
+    browser recordings (WebM) whose header carries no duration.
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        (duration in seconds, list of (silence start, silence end))
+
+    Raises:
+        AudioProcessingError: If the file cannot be decoded
+    """
+    _, output = await _run_ffmpeg(
+        "-i",
+        path,
+        "-vn",
+        "-af",
+        f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SECONDS}",
+        "-f",
+        "null",
+        "-",
+    )
+    duration, silences = parse_silencedetect(output)
+    if duration <= 0:
+        raise AudioProcessingError("Audio has no decodable content")
+    return duration, silences
+
+
+async def extract_segment(path: str, segment: AudioSegment) -> bytes:
+    """
+    Encode one segment of a recording for upload.
+
+    Args:
+        path: Audio file path
+        segment: Segment to extract
+
+    Returns:
+        Encoded segment (SEGMENT_FORMAT)
+
+    Raises:
+        AudioProcessingError: If encoding fails
+    """
+    audio, _ = await _run_ffmpeg(
+        "-ss",
+        f"{segment.start:.3f}",
+        "-t",
+        f"{segment.duration:.3f}",
+        "-i",
+        path,
+        "-vn",
+        *SEGMENT_FFMPEG_ARGS,
+        "-f",
+        SEGMENT_FORMAT,
+        "pipe:1",
+    )
+    return audio
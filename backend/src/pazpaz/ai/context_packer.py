@@ -0,0 +1,305 @@
+"""
+Token-budgeted packing of retrieved contexts for LLM synthesis.
+
+Retrieved SOAP notes and client profiles are otherwise sent to the LLM in
+full, so prompt size, cost and latency grow with note length. The packer
+keeps the formatted context within a token budget:
+
+1. Every non-empty field (S/O/A/P, medical history, notes) becomes a snippet
+2. Snippets are ranked by similarity with temporal weighting
+   (apply_temporal_weighting); the field that matched the query ranks first
+3. Snippets are added best-first while they fit the budget; a snippet that
+   does not fit is reduced to its sentences most relevant to the query
+4. Contexts with no remaining snippets are dropped
+
+Token counts are estimates (characters per token), which is accurate enough
+for budgeting without a tokenizer dependency. Hebrew tokenizes denser than
+English, so Hebrew characters are counted at a lower chars-per-token ratio.
+
+Example:
+    >>> packed = pack_contexts(sessions, clients, query, budget_tokens=3000)
+    >>> packed.tokens_saved
+    1840
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, replace
+
+from pazpaz.ai.lexical_index import tokenize
+from pazpaz.ai.retrieval import (
+    ClientContext,
+    SessionContext,
+    apply_temporal_weighting,
+)
+
+# Approximate characters per token (Latin script / Hebrew script)
+CHARS_PER_TOKEN = 4
+HEBREW_CHARS_PER_TOKEN = 2
+
+# Template tokens per formatted context (header, labels, separators)
+CONTEXT_OVERHEAD_TOKENS = 40
+
+# Snippets smaller than this are not worth emitting
+MIN_SNIPPET_TOKENS = 12
+
+# Score multiplier for fields other than the one that matched the query
+UNMATCHED_FIELD_WEIGHT = 0.8
+
+# Replaces fields dropped to stay within the budget
+OMITTED_MARKER = "[...]"
+
+SESSION_FIELDS = ("subjective", "objective", "assessment", "plan")
+CLIENT_FIELDS = ("medical_history", "notes")
+
+_HEBREW_CHARS = re.compile(r"[֐-׿]")
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?;])\s+|\n+")
+
+
+def estimate_tokens(text: str | None) -> int:
+    """
+    Estimate the LLM token count of a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated number of tokens (0 for empty text)
+
+    Example:
+        >>> estimate_tokens("Patient reports lower back pain")
+        8
+    """
+    if not text:
+        return 0
+    hebrew_chars = len(_HEBREW_CHARS.findall(text))
+    other_chars = len(text) - hebrew_chars
+    return math.ceil(
+        hebrew_chars / HEBREW_CHARS_PER_TOKEN + other_chars / CHARS_PER_TOKEN
+    )
+
+
+def extract_relevant_sentences(
+    text: str,
+    query_tokens: set[str],
+    max_tokens: int,
+) -> str | None:
+    """
+    Reduce text to its sentences most relevant to the query.
+
+    Sentences are ranked by how many query tokens they contain (earlier
+    sentences win ties) and added while they fit max_tokens; the result keeps
+    the original sentence order. If not even one sentence fits, the best
+    sentence is truncated.
+
+    Args:
+        text: Field text to reduce
+        query_tokens: Tokens of the query (from lexical_index.tokenize)
+        max_tokens: Token budget for the result
+
+    Returns:
+        Reduced text, or None if max_tokens is below MIN_SNIPPET_TOKENS
+    """
+    if max_tokens < MIN_SNIPPET_TOKENS:
+        return None
+
+    sentences = [s.strip() for s in _SENTENCE_BOUNDARY.split(text) if s.strip()]
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: (-len(query_tokens.intersection(tokenize(sentences[i]))), i),
+    )
+
+    selected: list[int] = []
+    used_tokens = 0
+    for index in ranked:
+        sentence_tokens = estimate_tokens(sentences[index])
+        if used_tokens + sentence_tokens <= max_tokens:
+            selected.append(index)
+            used_tokens += sentence_tokens
+
+    if not selected:
+        best = sentences[ranked[0]]
+        max_chars = (max_tokens - 1) * HEBREW_CHARS_PER_TOKEN
+        return best[:max_chars].rstrip() + " ..."
+
+    return " ".join(sentences[i] for i in sorted(selected))
+
+
+@dataclass
+class PackedContexts:
+    """
+    Contexts reduced to fit a token budget.
+
+    Attributes:
+        session_contexts: Session contexts that fit (fields may be trimmed)
+        client_contexts: Client contexts that fit (fields may be trimmed)
+        original_tokens: Estimated tokens of the unpacked contexts
+        packed_tokens: Estimated tokens of the packed contexts
+    """
+
+    session_contexts: list[SessionContext]
+    client_contexts: list[ClientContext]
+    original_tokens: int
+    packed_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated prompt tokens removed by packing."""
+        return self.original_tokens - self.packed_tokens
+
+
+@dataclass
+class _Snippet:
+    """One context field competing for the token budget."""
+
+    context_key: tuple[str, int]
+    field_name: str
+    text: str
+    tokens: int
+    score: float
+
+
+def _build_snippets(
+    session_contexts: list[SessionContext],
+    client_contexts: list[ClientContext],
+) -> list[_Snippet]:
+    """Turn every non-empty context field into a scored snippet."""
+    snippets: list[_Snippet] = []
+
+    for index, context in enumerate(session_contexts):
+        for field_name in SESSION_FIELDS:
+            text = getattr(context, field_name)
+            if not text:
+                continue
+            weight = (
+                1.0 if field_name == context.matched_field else UNMATCHED_FIELD_WEIGHT
+            )
+            snippets.append(
+                _Snippet(
+                    context_key=("session", index),
+                    field_name=field_name,
+                    text=text,
+                    tokens=estimate_tokens(text),
+                    score=apply_temporal_weighting(
+                        context.similarity_score * weight, context.session_date
+                    ),
+                )
+            )
+
+    for index, context in enumerate(client_contexts):
+        for field_name in CLIENT_FIELDS:
+            text = getattr(context, field_name)
+            if not text:
+                continue
+            weight = (
+                1.0 if field_name == context.matched_field else UNMATCHED_FIELD_WEIGHT
+            )
+            snippets.append(
+                _Snippet(
+                    context_key=("client", index),
+                    field_name=field_name,
+                    text=text,
+                    tokens=estimate_tokens(text),
+                    score=context.similarity_score * weight,
+                )
+            )
+
+    return snippets
+
+
+def pack_contexts(
+    session_contexts: list[SessionContext],
+    client_contexts: list[ClientContext],
+    query: str,
+    budget_tokens: int,
+) -> PackedContexts:
+    """
+    Fit retrieved contexts into a token budget.
+
+    Contexts that already fit are returned unchanged. Otherwise snippets are
+    packed best-first; oversized snippets are reduced to their most
+    query-relevant sentences, omitted fields are replaced by OMITTED_MARKER,
+    and contexts with nothing left are dropped. Context order is preserved.
+
+    Args:
+        session_contexts: Retrieved session contexts
+        client_contexts: Retrieved client profile contexts
+        query: Query text (used to pick relevant sentences)
+        budget_tokens: Maximum estimated tokens for all contexts
+
+    Returns:
+        PackedContexts with the (possibly trimmed) contexts and token counts
+
+    Example:
+        >>> packed = pack_contexts(sessions, [], "knee pain", budget_tokens=500)
+        >>> len(packed.session_contexts) <= len(sessions)
+        True
+    """
+    snippets = _build_snippets(session_contexts, client_contexts)
+    context_count = len(session_contexts) + len(client_contexts)
+    original_tokens = (
+        sum(snippet.tokens for snippet in snippets)
+        + context_count * CONTEXT_OVERHEAD_TOKENS
+    )
+
+    if original_tokens <= budget_tokens:
+        return PackedContexts(
+            session_contexts=list(session_contexts),
+            client_contexts=list(client_contexts),
+            original_tokens=original_tokens,
+            packed_tokens=original_tokens,
+        )
+
+    query_tokens = set(tokenize(query))
+    kept: dict[tuple[str, int], dict[str, str]] = {}
+    remaining = budget_tokens
+
+    for snippet in sorted(snippets, key=lambda s: s.score, reverse=True):
+        overhead = 0 if snippet.context_key in kept else CONTEXT_OVERHEAD_TOKENS
+        available = remaining - overhead
+
+        if snippet.tokens <= available:
+            text = snippet.text
+        else:
+            text = extract_relevant_sentences(snippet.text, query_tokens, available)
+            if text is None:
+                continue
+
+        kept.setdefault(snippet.context_key, {})[snippet.field_name] = text
+        remaining -= overhead + estimate_tokens(text)
+
+    packed_sessions = [
+        replace(
+            context,
+            **{
+                field_name: kept[("session", index)].get(field_name, OMITTED_MARKER)
+                if getattr(context, field_name)
+                else getattr(context, field_name)
+                for field_name in SESSION_FIELDS
+            },
+        )
+        for index, context in enumerate(session_contexts)
+        if ("session", index) in kept
+    ]
+    packed_clients = [
+        replace(
+            context,
+            **{
+                field_name: kept[("client", index)].get(field_name, OMITTED_MARKER)
+                if getattr(context, field_name)
+                else getattr(context, field_name)
+                for field_name in CLIENT_FIELDS
+            },
+        )
+        for index, context in enumerate(client_contexts)
+        if ("client", index) in kept
+    ]
+
+    return PackedContexts(
+        session_contexts=packed_sessions,
+        client_contexts=packed_clients,
+        original_tokens=original_tokens,
+        packed_tokens=budget_tokens - remaining,
+    )
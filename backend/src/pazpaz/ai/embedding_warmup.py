@@ -0,0 +1,138 @@
+"""
+Warm-up of the query embedding cache.
+
+Pre-embeds frequent clinical queries (English and Hebrew) together with the
+clinical terms from query_expansion.py, so common agent queries are served
+from the embedding cache instead of paying for a Cohere round-trip.
+
+For every warm-up query, both forms the agent may embed are cached:
+- The raw query (semantic cache lookup, non-expanded retrieval)
+- The expanded query (retrieval, when should_expand_query() applies)
+
+Security:
+- Warm-up texts are static, generic clinical phrases (no PHI)
+- Embeddings are workspace-agnostic (same cache the agent already uses)
+
+Usage:
+    Run periodically by the arq worker (see workers/ai_tasks.py) so entries
+    are refreshed before the 1 hour embedding cache TTL expires.
+"""
+
+from __future__ import annotations
+
+from redis.asyncio import Redis
+
+from pazpaz.ai.embeddings import get_embedding_service
+from pazpaz.ai.query_expansion import (
+    DIAGNOSIS_TERMS,
+    IMPROVEMENT_TERMS,
+    PAIN_TERMS,
+    PAIN_TERMS_HE,
+    SYMPTOM_TERMS,
+    TREATMENT_TERMS,
+    TREATMENT_TERMS_HE,
+    expand_query,
+)
+from pazpaz.ai.search_config import should_expand_query
+from pazpaz.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Frequent clinical questions asked of the agent, per language
+COMMON_QUERIES = {
+    "en": [
+        "What treatments has the patient tried?",
+        "What was the treatment plan?",
+        "Has the pain improved?",
+        "What is the diagnosis?",
+        "What are the patient's symptoms?",
+        "What was the last assessment?",
+        "How did the patient respond to treatment?",
+        "What exercises were prescribed?",
+        "Lower back pain",
+        "Neck pain",
+        "Shoulder pain",
+        "Headaches",
+        "Medical history",
+        "Progress since last session",
+    ],
+    "he": [
+        "מה היה הטיפול?",
+        "מה תוכנית הטיפול?",
+        "האם הכאב השתפר?",
+        "מה האבחנה?",
+        "מה התסמינים של המטופל?",
+        "איך המטופל הגיב לטיפול?",
+        "כאבי גב תחתון",
+        "כאבי צוואר",
+        "כאבי כתף",
+        "היסטוריה רפואית",
+    ],
+}
+
+# Clinical terms from query expansion, per language
+EXPANSION_TERMS = {
+    "en": TREATMENT_TERMS
+    + PAIN_TERMS
+    + IMPROVEMENT_TERMS
+    + SYMPTOM_TERMS
+    + DIAGNOSIS_TERMS,
+    "he": TREATMENT_TERMS_HE + PAIN_TERMS_HE,
+}
+
+
+def get_warmup_texts(language: str) -> list[str]:
+    """
+    Build the texts to pre-embed for a language.
+
+    Args:
+        language: Language code ("en" or "he")
+
+    Returns:
+        Deduplicated list of raw and expanded query texts
+
+    Example:
+        >>> "Has the pain improved?" in get_warmup_texts("en")
+        True
+    """
+    texts: list[str] = []
+    for query in COMMON_QUERIES.get(language, []) + EXPANSION_TERMS.get(language, []):
+        texts.append(query)
+        if should_expand_query(query):
+            texts.append(expand_query(query, language=language))
+
+    return list(dict.fromkeys(texts))
+
+
+async def warm_query_embeddings(
+    redis: Redis,
+    languages: tuple[str, ...] = ("en", "he"),
+) -> dict[str, int]:
+    """
+    Pre-embed warm-up texts that are not already in the embedding cache.
+
+    Args:
+        redis: Redis client backing the embedding cache
+        languages: Languages to warm
+
+    Returns:
+        Mapping of language to number of texts newly embedded
+
+    Raises:
+        EmbeddingError: If embedding generation fails
+
+    Example:
+        >>> await warm_query_embeddings(redis)
+        {'en': 58, 'he': 17}
+    """
+    embedding_service = get_embedding_service(input_type="search_query", redis=redis)
+
+    embedded: dict[str, int] = {}
+    for language in languages:
+        embedded[language] = await embedding_service.warm_cache(
+            get_warmup_texts(language)
+        )
+
+    logger.info("query_embeddings_warmed", embedded=embedded)
+
+    return embedded
@@ -19,12 +19,15 @@ Architecture:
 - Async client (Cohere v2 API) to avoid blocking event loop
 - All methods are async to support concurrent operations
 - Proper error handling with retries (TODO: implement exponential backoff)
-- Redis caching for embeddings (L2 cache) - 1 hour TTL
+- Redis caching for embeddings (L2 cache) - 1 hour TTL, packed float32
+- Bounded in-process LRU in front of Redis (skips network and decoding)
 """
 
+import base64
 import hashlib
-import json
 import time
+from array import array
+from collections import OrderedDict
 
 import cohere
 import httpx
@@ -43,24 +46,159 @@ from pazpaz.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Redis embedding cache format version and lifetime
+EMBEDDING_CACHE_VERSION = "v2"
+EMBEDDING_CACHE_TTL_SECONDS = 3600
 
-def get_embedding_cache_key(text: str) -> str:
+# Cohere API limit for texts per embed call
+MAX_TEXTS_PER_CALL = 96
+
+
+def get_embedding_cache_key(text: str, input_type: str = "search_document") -> str:
     """
     Generate Redis cache key for text embedding.
 
+    Query and document embeddings differ for the same text, so the input
+    type is part of the key.
+
     Args:
         text: Text to generate cache key for
+        input_type: Cohere input type the embedding was generated with
 
     Returns:
-        Redis key in format: ai:embedding:{text_hash}
+        Redis key in format: ai:embedding:{input_type}:{text_hash}
 
     Example:
-        >>> get_embedding_cache_key("Patient reports back pain")
-        'ai:embedding:8f3d2c1a4b5e6f7g'
+        >>> get_embedding_cache_key("Patient reports back pain", "search_query")
+        'ai:embedding:search_query:8f3d2c1a4b5e6f7g'
     """
     text_normalized = text.lower().strip()
     text_hash = hashlib.sha256(text_normalized.encode()).hexdigest()
-    return f"ai:embedding:{text_hash}"
+    return f"ai:embedding:{input_type}:{text_hash}"
+
+
+def pack_embedding(embedding: list[float]) -> str:
+    """
+    Encode an embedding as base64 packed float32.
+
+    A 1536-dim embedding packs to 6 KB (8 KB as base64) versus ~30 KB of
+    JSON, and decodes without parsing. Base64 keeps the value safe for Redis
+    clients created with decode_responses=True.
+
+    Args:
+        embedding: Embedding vector
+
+    Returns:
+        ASCII string of the packed vector
+    """
+    return base64.b64encode(array("f", embedding).tobytes()).decode("ascii")
+
+
+def unpack_embedding(encoded: str | bytes) -> array:
+    """
+    Decode an embedding encoded by pack_embedding().
+
+    Args:
+        encoded: Base64 packed float32 vector
+
+    Returns:
+        array('f') of the embedding values
+    """
+    vector = array("f")
+    vector.frombytes(base64.b64decode(encoded))
+    return vector
+
+
+def encode_cached_embedding(embedding: list[float], model: str) -> str:
+    """
+    Encode a Redis embedding cache value: {version}:{model}:{packed vector}.
+
+    Args:
+        embedding: Embedding vector
+        model: Embedding model that produced the vector
+
+    Returns:
+        Cache value string
+    """
+    return f"{EMBEDDING_CACHE_VERSION}:{model}:{pack_embedding(embedding)}"
+
+
+def decode_cached_embedding(value: str | bytes, model: str) -> list[float] | None:
+    """
+    Decode a Redis embedding cache value.
+
+    Args:
+        value: Value written by encode_cached_embedding()
+        model: Embedding model currently in use
+
+    Returns:
+        Embedding vector, or None if the value was written with another
+        cache version or model (treated as a cache miss)
+    """
+    if isinstance(value, bytes):
+        value = value.decode("ascii")
+
+    version, _, rest = value.partition(":")
+    cached_model, _, packed = rest.rpartition(":")
+    if version != EMBEDDING_CACHE_VERSION or cached_model != model:
+        return None
+
+    return unpack_embedding(packed).tolist()
+
+
+class EmbeddingLRUCache:
+    """
+    Bounded in-process LRU cache of embeddings.
+
+    Sits in front of the Redis cache so repeated queries in the same process
+    skip the network round-trip and decoding. Vectors are held as packed
+    float32 arrays (~6 KB per 1536-dim embedding).
+
+    Example:
+        >>> cache = EmbeddingLRUCache(max_entries=2)
+        >>> cache.put("a", [0.1, 0.2])
+        >>> cache.get("a")
+        [0.10000000149011612, 0.20000000298023224]
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Initialize the LRU cache.
+
+        Args:
+            max_entries: Maximum embeddings held (least recently used evicted)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, array] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> list[float] | None:
+        """Return the embedding for key (marking it recently used), or None."""
+        vector = self._entries.get(key)
+        if vector is None:
+            return None
+        self._entries.move_to_end(key)
+        return vector.tolist()
+
+    def put(self, key: str, embedding: list[float]) -> None:
+        """Store an embedding, evicting the least recently used beyond capacity."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = array("f", embedding)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+# Process-wide LRU shared by all EmbeddingService instances (services are
+# created per request, so a per-instance cache would never be reused)
+_embedding_lru = EmbeddingLRUCache(max_entries=settings.ai_embedding_lru_max_entries)
 
 
 class EmbeddingError(Exception):
@@ -100,7 +238,8 @@ class EmbeddingService:
         Args:
             api_key: Cohere API key (defaults to settings.cohere_api_key)
             input_type: Cohere input type - "search_document" for indexing, "search_query" for queries
-            redis: Optional Redis client for caching embeddings (L2 cache)
+            redis: Optional Redis client for caching embeddings (L2 cache).
+                Also enables the process-wide in-process LRU in front of it.
 
         Raises:
             ValueError: If API key is not provided and not in settings
@@ -226,42 +365,11 @@ class EmbeddingService:
             )
             return [0.0] * 1536
 
-        # L2 Cache: Check Redis for cached embedding
+        # L1 (in-process LRU) and L2 (Redis) cache lookup
         if use_cache and self.redis:
-            cache_key = get_embedding_cache_key(text)
-
-            try:
-                cached = await self.redis.get(cache_key)
-                if cached:
-                    # Emit cache hit metric
-                    ai_agent_cache_hits_total.labels(
-                        workspace_id="global",  # Embeddings are workspace-agnostic
-                        cache_layer="embedding",
-                    ).inc()
-
-                    logger.debug(
-                        "embedding_cache_hit",
-                        text_length=len(text),
-                        cache_key=cache_key[:50],  # Truncate for logging
-                    )
-
-                    data = json.loads(cached)
-                    return data["embedding"]
-
-                # Cache miss
-                ai_agent_cache_misses_total.labels(
-                    workspace_id="global",
-                    cache_layer="embedding",
-                ).inc()
-
-            except Exception as e:
-                # Cache errors shouldn't break the request
-                logger.warning(
-                    "embedding_cache_error",
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    message="Failed to read from cache, generating fresh embedding",
-                )
+            cached_embedding = await self._load_cached_embedding(text)
+            if cached_embedding is not None:
+                return cached_embedding
 
         # MISS: Generate embedding via Cohere API
         try:
@@ -297,40 +405,170 @@ class EmbeddingService:
             )
             raise EmbeddingError(f"Failed to generate embedding: {e}") from e
 
-        # Store in L2 cache
+        # Store in L1 and L2 caches
         if use_cache and self.redis:
-            cache_key = get_embedding_cache_key(text)
-
-            try:
-                cache_value = json.dumps(
-                    {
-                        "embedding": embedding,
-                        "model": self.model,
-                        "created_at": int(time.time()),
-                        "cache_version": "v1",
-                    }
-                )
+            await self._store_cached_embedding(text, embedding)
+
+        return embedding
+
+    async def warm_cache(self, texts: list[str]) -> int:
+        """
+        Pre-embed texts that are not already cached (Redis required).
+
+        Texts already in Redis are not embedded again, but their TTL is
+        renewed (one pipelined EXPIRE per key) so frequent entries stay
+        cached across warm-up runs. The rest are embedded in batches of up
+        to 96 per Cohere call and written to the LRU and Redis caches.
+
+        Args:
+            texts: Texts to make available from cache
+
+        Returns:
+            Number of texts newly embedded
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+
+        Example:
+            >>> service = get_embedding_service("search_query", redis=redis)
+            >>> await service.warm_cache(["back pain", "neck pain"])
+            2
+        """
+        if not self.redis:
+            return 0
+
+        unique_texts = list(
+            dict.fromkeys(text for text in texts if text and text.strip())
+        )
+        if not unique_texts:
+            return 0
+
+        cache_keys = [
+            get_embedding_cache_key(text, self.input_type) for text in unique_texts
+        ]
+        cached_values = await self.redis.mget(cache_keys)
+        missing = []
+        cached_keys = []
+        for text, cache_key, cached in zip(
+            unique_texts, cache_keys, cached_values, strict=True
+        ):
+            if cached is None or decode_cached_embedding(cached, self.model) is None:
+                missing.append(text)
+            else:
+                cached_keys.append(cache_key)
+
+        if cached_keys:
+            pipe = self.redis.pipeline(transaction=False)
+            for cache_key in cached_keys:
+                pipe.expire(cache_key, EMBEDDING_CACHE_TTL_SECONDS)
+            await pipe.execute()
+
+        for start in range(0, len(missing), MAX_TEXTS_PER_CALL):
+            batch = missing[start : start + MAX_TEXTS_PER_CALL]
+            embeddings = await self.embed_texts(batch)
+            for text, embedding in zip(batch, embeddings, strict=True):
+                await self._store_cached_embedding(text, embedding)
+
+        logger.info(
+            "embedding_cache_warmed",
+            input_type=self.input_type,
+            texts_count=len(unique_texts),
+            embedded_count=len(missing),
+            refreshed_count=len(cached_keys),
+        )
+
+        return len(missing)
+
+    async def _load_cached_embedding(self, text: str) -> list[float] | None:
+        """
+        Look up an embedding in the in-process LRU, then in Redis.
+
+        Redis hits are promoted into the LRU. Cache errors are logged and
+        treated as a miss.
+
+        Args:
+            text: Text to look up
+
+        Returns:
+            Cached embedding, or None on miss
+        """
+        cache_key = get_embedding_cache_key(text, self.input_type)
+        lru_key = f"{self.model}:{cache_key}"
+
+        embedding = _embedding_lru.get(lru_key)
+        if embedding is not None:
+            ai_agent_cache_hits_total.labels(cache_layer="embedding_lru").inc()
+            return embedding
 
-                # TTL: 1 hour (3600 seconds)
-                await self.redis.setex(cache_key, 3600, cache_value)
+        ai_agent_cache_misses_total.labels(cache_layer="embedding_lru").inc()
+
+        try:
+            cached = await self.redis.get(cache_key)
+            if cached:
+                embedding = decode_cached_embedding(cached, self.model)
+
+            if embedding is not None:
+                # Emit cache hit metric
+                ai_agent_cache_hits_total.labels(cache_layer="embedding").inc()
 
                 logger.debug(
-                    "embedding_cached",
+                    "embedding_cache_hit",
                     text_length=len(text),
-                    cache_key=cache_key[:50],
-                    ttl_seconds=3600,
+                    cache_key=cache_key[:50],  # Truncate for logging
                 )
 
-            except Exception as e:
-                # Cache errors shouldn't break the request
-                logger.warning(
-                    "embedding_cache_store_error",
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    message="Failed to store embedding in cache",
-                )
+                _embedding_lru.put(lru_key, embedding)
+                return embedding
 
-        return embedding
+            # Cache miss
+            ai_agent_cache_misses_total.labels(cache_layer="embedding").inc()
+
+        except Exception as e:
+            # Cache errors shouldn't break the request
+            logger.warning(
+                "embedding_cache_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                message="Failed to read from cache, generating fresh embedding",
+            )
+
+        return None
+
+    async def _store_cached_embedding(self, text: str, embedding: list[float]) -> None:
+        """
+        Store an embedding in the in-process LRU and in Redis (1 hour TTL).
+
+        Cache errors are logged and swallowed.
+
+        Args:
+            text: Text the embedding was generated for
+            embedding: Embedding vector
+        """
+        cache_key = get_embedding_cache_key(text, self.input_type)
+        _embedding_lru.put(f"{self.model}:{cache_key}", embedding)
+
+        try:
+            await self.redis.setex(
+                cache_key,
+                EMBEDDING_CACHE_TTL_SECONDS,
+                encode_cached_embedding(embedding, self.model),
+            )
+
+            logger.debug(
+                "embedding_cached",
+                text_length=len(text),
+                cache_key=cache_key[:50],
+                ttl_seconds=EMBEDDING_CACHE_TTL_SECONDS,
+            )
+
+        except Exception as e:
+            # Cache errors shouldn't break the request
+            logger.warning(
+                "embedding_cache_store_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                message="Failed to store embedding in cache",
+            )
 
     @retry_with_backoff(
         max_retries=3,
@@ -458,7 +696,7 @@ class EmbeddingService:
             return [[0.0] * 1536 for _ in texts]
 
         # Cohere API limit is 96 texts per call
-        if len(non_empty_texts) > 96:
+        if len(non_empty_texts) > MAX_TEXTS_PER_CALL:
             raise ValueError(
                 f"Cohere API supports max 96 texts per call, got {len(non_empty_texts)}"
             )
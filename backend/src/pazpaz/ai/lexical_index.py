@@ -0,0 +1,232 @@
+"""
+Keyed lexical index for hybrid (lexical + vector) retrieval.
+
+Pure cosine similarity misses exact-term matches that matter clinically
+(medication names, anatomical terms, abbreviations such as "L5" or "TMJ").
+This module provides the lexical half of hybrid retrieval:
+
+1. tokenize() splits SOAP text into normalized word tokens (English/Hebrew)
+2. hash_tokens() maps each token to a keyed HMAC digest (blind index)
+3. reciprocal_rank_fusion() merges the lexical and vector rankings
+
+Security:
+- SOAP text is encrypted at rest, so the index never stores plaintext tokens.
+  Tokens are HMAC-SHA256 digests keyed by a secret derived from SECRET_KEY
+  and salted with the workspace ID, so identical words in different
+  workspaces produce unrelated digests.
+- Digests are truncated to 64 bits (collisions only add a spurious lexical
+  candidate, which still has to rank well on fusion).
+- Rotating SECRET_KEY invalidates the index until sessions are re-embedded;
+  retrieval then degrades to vector-only ranking.
+
+Example:
+    >>> tokens = tokenize("Patient reports L5 radiating pain")
+    >>> ["patient", "reports", "l5", "radiating", "pain"] == tokens
+    True
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import re
+import uuid
+from collections.abc import Hashable, Sequence
+from functools import lru_cache
+
+from pazpaz.core.config import settings
+
+# Hex characters kept from each token digest (64 bits)
+TOKEN_HASH_LENGTH = 16
+
+# Upper bound on distinct tokens indexed per SOAP field
+MAX_TOKENS_PER_FIELD = 512
+
+# Standard RRF constant (Cormack et al.) - dampens the weight of top ranks
+RRF_K = 60
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_HEBREW_PATTERN = re.compile(r"[֐-׿]")
+
+# Single-letter Hebrew prefixes (ו ה ב ל מ ש כ) attached to the next word
+_HEBREW_PREFIXES = frozenset("והבלמשכ")
+
+STOPWORDS = frozenset(
+    {
+        # English
+        "a",
+        "an",
+        "and",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "did",
+        "do",
+        "does",
+        "for",
+        "from",
+        "had",
+        "has",
+        "have",
+        "he",
+        "her",
+        "his",
+        "how",
+        "in",
+        "is",
+        "it",
+        "of",
+        "on",
+        "or",
+        "she",
+        "that",
+        "the",
+        "their",
+        "they",
+        "this",
+        "to",
+        "was",
+        "were",
+        "what",
+        "when",
+        "which",
+        "who",
+        "with",
+        # Hebrew
+        "של",
+        "את",
+        "על",
+        "עם",
+        "זה",
+        "זו",
+        "הוא",
+        "היא",
+        "מה",
+        "איך",
+        "גם",
+        "או",
+        "כי",
+        "לא",
+        "יש",
+    }
+)
+
+
+def tokenize(text: str | None) -> list[str]:
+    """
+    Split text into normalized lexical tokens.
+
+    Lowercases, splits on non-word characters (Unicode-aware), drops
+    stopwords and single-character tokens, and de-duplicates while keeping
+    first-seen order. Hebrew words with a single-letter prefix (e.g. "בגב")
+    also emit the unprefixed form ("גב") so they match either spelling.
+
+    Args:
+        text: Text to tokenize (SOAP field or query)
+
+    Returns:
+        Ordered list of distinct tokens (at most MAX_TOKENS_PER_FIELD)
+
+    Example:
+        >>> tokenize("The pain in the lower back")
+        ['pain', 'lower', 'back']
+    """
+    if not text:
+        return []
+
+    tokens: dict[str, None] = {}
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        if len(token) < 2 or token in STOPWORDS:
+            continue
+        tokens[token] = None
+        if (
+            len(token) >= 3
+            and token[0] in _HEBREW_PREFIXES
+            and _HEBREW_PATTERN.match(token)
+        ):
+            tokens[token[1:]] = None
+        if len(tokens) >= MAX_TOKENS_PER_FIELD:
+            break
+
+    return list(tokens)
+
+
+@lru_cache(maxsize=1)
+def _index_key() -> bytes:
+    """Derive the lexical index HMAC key from SECRET_KEY."""
+    return hmac.new(
+        settings.secret_key.encode(),
+        b"pazpaz:lexical-index:v1",
+        hashlib.sha256,
+    ).digest()
+
+
+def hash_tokens(tokens: Sequence[str], workspace_id: uuid.UUID) -> list[str]:
+    """
+    Map tokens to workspace-salted keyed digests for storage or lookup.
+
+    Args:
+        tokens: Tokens from tokenize()
+        workspace_id: Workspace the text belongs to (salt)
+
+    Returns:
+        List of hex digests (TOKEN_HASH_LENGTH chars), same order as tokens
+    """
+    key = _index_key()
+    return [
+        hmac.new(key, f"{workspace_id}:{token}".encode(), hashlib.sha256).hexdigest()[
+            :TOKEN_HASH_LENGTH
+        ]
+        for token in tokens
+    ]
+
+
+def build_lexical_tokens(text: str | None, workspace_id: uuid.UUID) -> list[str]:
+    """
+    Build the keyed lexical index entries for a piece of text.
+
+    Args:
+        text: Plaintext SOAP field (never stored)
+        workspace_id: Workspace the text belongs to
+
+    Returns:
+        Token digests to store on the SessionVector row
+
+    Example:
+        >>> build_lexical_tokens("Lumbar pain", workspace_id)
+        ['3f1c9a...', 'b02e47...']
+    """
+    return hash_tokens(tokenize(text), workspace_id)
+
+
+def reciprocal_rank_fusion[K: Hashable](
+    rankings: Sequence[Sequence[K]],
+    k: int = RRF_K,
+) -> list[tuple[K, float]]:
+    """
+    Fuse several rankings with Reciprocal Rank Fusion.
+
+    Each item scores sum(1 / (k + rank)) over the rankings it appears in,
+    so items ranked well by both retrievers rise to the top without having
+    to calibrate cosine similarity against lexical match counts.
+
+    Args:
+        rankings: Rankings to fuse, each ordered best-first
+        k: RRF constant (higher values flatten rank differences)
+
+    Returns:
+        (item, score) tuples sorted by fused score, best first. Ties keep
+        the order in which items were first seen.
+
+    Example:
+        >>> reciprocal_rank_fusion([["a", "b"], ["b", "c"]])
+        [('b', 0.0325...), ('a', 0.0163...), ('c', 0.0161...)]
+    """
+    scores: dict[K, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
@@ -1,4 +1,8 @@
-"""Prometheus metrics for AI agent monitoring."""
+"""Prometheus metrics for AI agent monitoring.
+
+Labels are bounded: no workspace_id. Per-workspace query and rate limit
+counts are rolled up by pazpaz.monitoring.tenant_metrics.
+"""
 
 from prometheus_client import Counter, Histogram
 
@@ -6,7 +10,7 @@ from prometheus_client import Counter, Histogram
 ai_agent_queries_total = Counter(
     "ai_agent_queries_total",
     "Total AI agent queries processed",
-    ["workspace_id", "language", "status"],
+    ["language", "status"],
 )
 
 ai_agent_query_duration_seconds = Histogram(
@@ -67,7 +71,6 @@ ai_agent_llm_tokens_total = Counter(
 ai_agent_rate_limit_hits_total = Counter(
     "ai_agent_rate_limit_hits_total",
     "Total rate limit hits (queries blocked)",
-    ["workspace_id"],
 )
 
 # Citation metrics
@@ -101,19 +104,40 @@ ai_circuit_breaker_open_duration_seconds = Histogram(
 ai_agent_cache_hits_total = Counter(
     "ai_agent_cache_hits_total",
     "Total cache hits for AI agent",
-    ["workspace_id", "cache_layer"],  # cache_layer: query_result, embedding
+    [
+        "cache_layer"
+    ],  # cache_layer: query_result, semantic, embedding, treatment_context
 )
 
 ai_agent_cache_misses_total = Counter(
     "ai_agent_cache_misses_total",
     "Total cache misses for AI agent",
-    ["workspace_id", "cache_layer"],
+    ["cache_layer"],
 )
 
 ai_agent_cache_invalidations_total = Counter(
     "ai_agent_cache_invalidations_total",
     "Total cache invalidations",
-    ["workspace_id", "reason"],  # reason: session_created, session_updated, etc.
+    ["reason"],  # reason: session_created, session_updated, etc.
+)
+
+ai_agent_semantic_cache_similarity = Histogram(
+    "ai_agent_semantic_cache_similarity",
+    "Best cosine similarity found per semantic cache lookup (for threshold tuning)",
+    buckets=[0.5, 0.7, 0.8, 0.85, 0.9, 0.92, 0.94, 0.96, 0.98, 1.0],
+)
+
+# Context packing metrics
+ai_agent_context_tokens = Histogram(
+    "ai_agent_context_tokens",
+    "Estimated context tokens per synthesis prompt, before and after packing",
+    ["stage"],  # stage: retrieved, packed
+    buckets=[250, 500, 1000, 2000, 3000, 4000, 6000, 8000, 12000, 16000],
+)
+
+ai_agent_context_tokens_saved_total = Counter(
+    "ai_agent_context_tokens_saved_total",
+    "Estimated prompt tokens removed by token-budgeted context packing",
 )
 
 __all__ = [
@@ -134,4 +158,7 @@ __all__ = [
     "ai_agent_cache_hits_total",
     "ai_agent_cache_misses_total",
     "ai_agent_cache_invalidations_total",
+    "ai_agent_semantic_cache_similarity",
+    "ai_agent_context_tokens",
+    "ai_agent_context_tokens_saved_total",
 ]
@@ -2,8 +2,8 @@
 AI provider abstractions and implementations.
 
 This package provides:
-- Abstract base classes for embedding and chat providers
-- Cohere provider implementations
+- Abstract base classes for embedding, chat and transcription providers
+- Cohere and OpenAI Whisper provider implementations
 - Factory functions for provider selection
 - Configuration-driven provider instantiation
 
@@ -28,6 +28,8 @@ from pazpaz.ai.providers.base import (
     ChatProvider,
     ChatResponse,
     EmbeddingProvider,
+    TranscriptionProvider,
+    TranscriptionResult,
 )
 from pazpaz.ai.providers.cohere import (
     ChatError,
@@ -39,6 +41,11 @@ from pazpaz.ai.providers.factory import (
     clear_provider_cache,
     get_chat_provider,
     get_embedding_provider,
+    get_transcription_provider,
+)
+from pazpaz.ai.providers.whisper import (
+    TranscriptionError,
+    WhisperTranscriptionProvider,
 )
 
 __all__ = [
@@ -47,14 +54,20 @@ __all__ = [
     "ChatProvider",
     "ChatMessage",
     "ChatResponse",
+    "TranscriptionProvider",
+    "TranscriptionResult",
     # Cohere implementations
     "CohereEmbeddingProvider",
     "CohereChatProvider",
+    # OpenAI implementations
+    "WhisperTranscriptionProvider",
     # Exceptions
     "EmbeddingError",
     "ChatError",
+    "TranscriptionError",
     # Factory functions
     "get_embedding_provider",
     "get_chat_provider",
+    "get_transcription_provider",
     "clear_provider_cache",
 ]
@@ -5,7 +5,8 @@ This module defines provider interfaces to decouple the AI agent from
 specific provider implementations (Cohere, OpenAI, Anthropic, etc.).
 
 Architecture:
-- Provider interfaces define contracts for embeddings and chat operations
+- Provider interfaces define contracts for embeddings, chat and
+  transcription operations
 - Concrete providers implement these interfaces for specific vendors
 - Factory pattern enables runtime provider selection via configuration
 - All providers must handle retries, timeouts, and error reporting
@@ -53,6 +54,22 @@ class ChatResponse:
     finish_reason: str = "stop"  # "stop" | "length" | "error"
 
 
+@dataclass
+class TranscriptionResult:
+    """
+    Response from speech-to-text provider.
+
+    Attributes:
+        text: Transcribed text
+        language: Detected language (as reported by the provider)
+        duration_seconds: Audio duration in seconds
+    """
+
+    text: str
+    language: str
+    duration_seconds: float
+
+
 class EmbeddingProvider(ABC):
     """
     Abstract interface for embedding generation providers.
@@ -230,3 +247,51 @@ class ChatProvider(ABC):
             128000
         """
         pass
+
+
+class TranscriptionProvider(ABC):
+    """
+    Abstract interface for speech-to-text providers.
+
+    Implementing providers must:
+    - Support async operations (non-blocking)
+    - Be safe to call concurrently (one shared client per process)
+    - Handle retries and timeouts internally
+    - Raise TranscriptionError on failures
+
+    Example implementations: WhisperTranscriptionProvider
+    """
+
+    @abstractmethod
+    async def transcribe(self, audio: bytes, filename: str) -> TranscriptionResult:
+        """
+        Transcribe one audio file (language auto-detected).
+
+        Args:
+            audio: Encoded audio (within the provider's upload limit)
+            filename: File name; its extension tells the provider the format
+
+        Returns:
+            TranscriptionResult with text, language and duration
+
+        Raises:
+            TranscriptionError: If transcription fails
+
+        Example:
+            >>> provider = WhisperTranscriptionProvider()
+            >>> result = await provider.transcribe(audio, "chunk-000.ogg")
+            >>> result.text
+            "Patient reports lower back pain"
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def max_upload_bytes(self) -> int:
+        """
+        Largest audio file accepted per transcribe() call.
+
+        Returns:
+            Size limit in bytes (e.g., 25 MB for Whisper)
+        """
+        pass
@@ -19,8 +19,13 @@ Benefits:
 
 from functools import lru_cache
 
-from pazpaz.ai.providers.base import ChatProvider, EmbeddingProvider
+from pazpaz.ai.providers.base import (
+    ChatProvider,
+    EmbeddingProvider,
+    TranscriptionProvider,
+)
 from pazpaz.ai.providers.cohere import CohereChatProvider, CohereEmbeddingProvider
+from pazpaz.ai.providers.whisper import WhisperTranscriptionProvider
 from pazpaz.core.config import settings
 from pazpaz.core.logging import get_logger
 
@@ -106,6 +111,28 @@ def get_chat_provider() -> ChatProvider:
     )
 
 
+@lru_cache(maxsize=1)
+def get_transcription_provider() -> TranscriptionProvider:
+    """
+    Get speech-to-text provider instance (singleton).
+
+    The instance holds one HTTP client, so concurrent transcriptions share
+    its connection pool instead of opening a client per request.
+
+    Returns:
+        TranscriptionProvider instance
+
+    Raises:
+        ValueError: If the OpenAI API key is not configured
+
+    Example:
+        >>> provider = get_transcription_provider()
+        >>> result = await provider.transcribe(audio, "dictation.webm")
+    """
+    logger.info("transcription_provider_initialized", provider="openai")
+    return WhisperTranscriptionProvider()
+
+
 def clear_provider_cache():
     """
     Clear provider cache (for testing).
@@ -119,4 +146,5 @@ def clear_provider_cache():
     """
     get_embedding_provider.cache_clear()
     get_chat_provider.cache_clear()
+    get_transcription_provider.cache_clear()
     logger.info("provider_cache_cleared", message="Provider cache cleared")
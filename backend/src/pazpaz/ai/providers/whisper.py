@@ -0,0 +1,167 @@
+"""
+OpenAI Whisper transcription provider.
+
+This module implements the TranscriptionProvider interface for OpenAI's
+audio transcription API (whisper-1).
+
+Architecture:
+- One AsyncOpenAI client per provider instance (connection pool reused across
+  requests and concurrent chunk uploads)
+- Retries with exponential backoff and a circuit breaker (retry_policy)
+- Raises TranscriptionError with context on failure
+"""
+
+import time
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+
+from pazpaz.ai.providers.base import TranscriptionProvider, TranscriptionResult
+from pazpaz.ai.retry_policy import retry_with_backoff
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Whisper API upload limit per request
+WHISPER_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
+class TranscriptionError(Exception):
+    """Exception raised when transcription fails."""
+
+    pass
+
+
+class WhisperTranscriptionProvider(TranscriptionProvider):
+    """
+    OpenAI Whisper transcription provider.
+
+    Features:
+    - Automatic language detection (Hebrew, English, ...)
+    - verbose_json responses (language and duration metadata)
+    - Automatic retry with exponential backoff
+    - Circuit breaker for fault tolerance
+
+    Example:
+        >>> provider = WhisperTranscriptionProvider()
+        >>> result = await provider.transcribe(audio, "dictation.webm")
+        >>> result.language
+        "hebrew"
+    """
+
+    def __init__(self, api_key: str | None = None, model: str = "whisper-1"):
+        """
+        Initialize Whisper transcription provider.
+
+        Args:
+            api_key: OpenAI API key (defaults to settings.openai_api_key)
+            model: Whisper model name
+
+        Raises:
+            ValueError: If API key is not provided and not in settings
+        """
+        api_key = api_key or settings.openai_api_key
+        if not api_key:
+            raise ValueError(
+                "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
+            )
+
+        # Retries are handled by retry_with_backoff (shared circuit breaker)
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=0,
+            timeout=httpx.Timeout(connect=5.0, read=120.0, write=60.0, pool=10.0),
+        )
+        self._model = model
+
+    @property
+    def max_upload_bytes(self) -> int:
+        """Return Whisper's per-request upload limit (25 MB)."""
+        return WHISPER_MAX_UPLOAD_BYTES
+
+    @retry_with_backoff(
+        max_retries=3,
+        base_delay=1.0,
+        max_delay=32.0,
+        exponential_base=2,
+        jitter_factor=0.1,
+        retryable_exceptions=(
+            openai.APIConnectionError,
+            openai.RateLimitError,
+            openai.InternalServerError,
+        ),
+        circuit_breaker_name="openai_whisper",
+        circuit_breaker_threshold=5,
+        circuit_breaker_timeout=60.0,
+    )
+    async def _transcribe_with_retry(
+        self, audio: bytes, filename: str
+    ) -> TranscriptionResult:
+        """
+        Internal method: Call Whisper API with retry logic.
+
+        Args:
+            audio: Encoded audio
+            filename: File name (format hint)
+
+        Returns:
+            TranscriptionResult
+
+        Raises:
+            openai.APIError: If the API call fails
+        """
+        start_time = time.time()
+
+        # Omitting language enables auto-detection (Hebrew/English/etc.)
+        response = await self.client.audio.transcriptions.create(
+            model=self._model,
+            file=(filename, audio),
+            response_format="verbose_json",  # Includes duration metadata
+        )
+
+        logger.info(
+            "whisper_transcription_completed",
+            model=self._model,
+            audio_bytes=len(audio),
+            audio_duration=response.duration,
+            duration_seconds=time.time() - start_time,
+        )
+
+        return TranscriptionResult(
+            text=response.text,
+            language=response.language or "unknown",
+            duration_seconds=float(response.duration or 0.0),
+        )
+
+    async def transcribe(self, audio: bytes, filename: str) -> TranscriptionResult:
+        """
+        Transcribe one audio file (language auto-detected).
+
+        Args:
+            audio: Encoded audio (max 25 MB)
+            filename: File name; its extension tells Whisper the format
+
+        Returns:
+            TranscriptionResult with text, language and duration
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        if len(audio) > WHISPER_MAX_UPLOAD_BYTES:
+            raise TranscriptionError(
+                f"Audio is {len(audio)} bytes; Whisper accepts at most "
+                f"{WHISPER_MAX_UPLOAD_BYTES} bytes per request"
+            )
+
+        try:
+            return await self._transcribe_with_retry(audio, filename)
+        except Exception as e:
+            logger.error(
+                "whisper_transcription_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                model=self._model,
+            )
+            raise TranscriptionError(f"Failed to transcribe audio: {e}") from e
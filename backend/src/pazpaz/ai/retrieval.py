@@ -4,14 +4,15 @@ RAG retrieval service for semantic search over session SOAP notes.
 This module implements the retrieval component of the RAG (Retrieval-Augmented
 Generation) pipeline. It handles:
 1. Query embedding generation (via Cohere API)
-2. Semantic similarity search (via pgvector HNSW index)
+2. Hybrid search: semantic similarity (pgvector HNSW index) fused with
+   keyed lexical token matches (GIN index) via Reciprocal Rank Fusion
 3. Session fetching with automatic PHI decryption
 4. Context building for LLM consumption
 
 Architecture:
 - Workspace-scoped queries (multi-tenant isolation)
 - Automatic PHI decryption (EncryptedString type)
-- Cosine similarity ranking
+- Cosine similarity ranking, fused with lexical ranking (see lexical_index.py)
 - Configurable result limits and similarity thresholds
 
 Security:
@@ -33,11 +34,14 @@ import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
+from redis.asyncio import Redis
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from pazpaz.ai.embeddings import get_embedding_service
+from pazpaz.ai.lexical_index import build_lexical_tokens, reciprocal_rank_fusion
+from pazpaz.ai.search_config import get_search_config
 from pazpaz.ai.vector_store import get_vector_store
 from pazpaz.core.logging import get_logger
 from pazpaz.models.client import Client
@@ -205,16 +209,19 @@ class RetrievalService:
         ...         print(f"Session {context.session_id}: {context.similarity_score:.2f}")
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: Redis | None = None):
         """
         Initialize retrieval service.
 
         Args:
             db: SQLAlchemy async session for database operations
+            redis: Optional Redis client for caching query embeddings
         """
         self.db = db
         # Use "search_query" input type for query embeddings (different from document embeddings)
-        self.embedding_service = get_embedding_service(input_type="search_query")
+        self.embedding_service = get_embedding_service(
+            input_type="search_query", redis=redis
+        )
         self.vector_store = get_vector_store(db)
 
     async def retrieve_relevant_sessions(
@@ -225,6 +232,8 @@ class RetrievalService:
         min_similarity: float = 0.3,
         field_filter: str | None = None,
         include_client_context: bool = True,
+        query_embedding: list[float] | None = None,
+        client_id: uuid.UUID | None = None,
     ) -> tuple[list[SessionContext], list[ClientContext]]:
         """
         Retrieve sessions AND client profiles relevant to a natural language query.
@@ -243,6 +252,9 @@ class RetrievalService:
             field_filter: Optional SOAP field filter ('subjective', 'objective', etc.)
                          Only applies to session vectors, not client vectors
             include_client_context: Include client profile search (default: True)
+            query_embedding: Precomputed embedding of query (skips the embed call)
+            client_id: Optional client scope (filtered inside the vector search,
+                so only that client's vectors are read)
 
         Returns:
             Tuple of (SessionContext list, ClientContext list), both sorted by similarity
@@ -272,11 +284,13 @@ class RetrievalService:
             min_similarity=min_similarity,
             field_filter=field_filter,
             include_client_context=include_client_context,
+            client_id=str(client_id) if client_id else None,
         )
 
         try:
-            # Step 1: Embed the query
-            query_embedding = await self.embedding_service.embed_text(query)
+            # Step 1: Embed the query (unless the caller already did)
+            if query_embedding is None:
+                query_embedding = await self.embedding_service.embed_text(query)
 
             logger.debug(
                 "query_embedded",
@@ -284,13 +298,15 @@ class RetrievalService:
                 embedding_dim=len(query_embedding),
             )
 
-            # Step 2: Search for similar session vectors
-            similar_session_vectors = await self.vector_store.search_similar(
+            # Step 2: Search for similar session vectors (hybrid lexical + vector)
+            similar_session_vectors = await self._search_session_vectors(
                 workspace_id=workspace_id,
+                query=query,
                 query_embedding=query_embedding,
                 limit=limit,
-                field_name=field_filter,
+                field_filter=field_filter,
                 min_similarity=min_similarity,
+                client_id=client_id,
             )
 
             logger.info(
@@ -308,6 +324,7 @@ class RetrievalService:
                     limit=limit,
                     field_name=None,  # Search both medical_history and notes
                     min_similarity=min_similarity,
+                    client_id=client_id,
                 )
 
                 logger.info(
@@ -350,6 +367,95 @@ class RetrievalService:
             )
             raise RetrievalError(f"Failed to retrieve relevant context: {e}") from e
 
+    async def _search_session_vectors(
+        self,
+        workspace_id: uuid.UUID,
+        query: str,
+        query_embedding: list[float],
+        limit: int,
+        field_filter: str | None,
+        min_similarity: float,
+        client_id: uuid.UUID | None = None,
+    ) -> list[tuple[SessionVector, float]]:
+        """
+        Find session vectors with hybrid lexical + vector search.
+
+        Runs pgvector similarity search and keyed lexical token search side
+        by side, then fuses the two rankings with Reciprocal Rank Fusion so
+        exact-term matches (medications, anatomical abbreviations) are not
+        lost when their embedding similarity is unremarkable. Falls back to
+        vector-only search when hybrid search is disabled or the query has
+        no indexable tokens.
+
+        Args:
+            workspace_id: Workspace ID (MANDATORY - multi-tenant isolation)
+            query: Query text (tokenized for the lexical ranking)
+            query_embedding: Query embedding
+            limit: Maximum number of vectors to return
+            field_filter: Optional SOAP field filter
+            min_similarity: Minimum cosine similarity for vector hits
+            client_id: Optional client scope applied to both searches
+
+        Returns:
+            List of (SessionVector, similarity_score) tuples in fused rank order
+        """
+        config = get_search_config()
+        query_tokens = build_lexical_tokens(query, workspace_id)
+
+        if not config.hybrid_search_enabled or not query_tokens:
+            return await self.vector_store.search_similar(
+                workspace_id=workspace_id,
+                query_embedding=query_embedding,
+                limit=limit,
+                field_name=field_filter,
+                min_similarity=min_similarity,
+                client_id=client_id,
+            )
+
+        candidate_limit = min(limit * config.hybrid_candidate_multiplier, 100)
+
+        vector_hits = await self.vector_store.search_similar(
+            workspace_id=workspace_id,
+            query_embedding=query_embedding,
+            limit=candidate_limit,
+            field_name=field_filter,
+            min_similarity=min_similarity,
+            client_id=client_id,
+        )
+        lexical_hits = await self.vector_store.search_lexical(
+            workspace_id=workspace_id,
+            query_embedding=query_embedding,
+            query_tokens=query_tokens,
+            limit=candidate_limit,
+            field_name=field_filter,
+            min_similarity=min(config.lexical_min_similarity, min_similarity),
+            client_id=client_id,
+        )
+
+        candidates: dict[uuid.UUID, tuple[SessionVector, float]] = {
+            vector.id: (vector, similarity) for vector, similarity in vector_hits
+        }
+        for vector, similarity, _ in lexical_hits:
+            candidates.setdefault(vector.id, (vector, similarity))
+
+        fused = reciprocal_rank_fusion(
+            [
+                [vector.id for vector, _ in vector_hits],
+                [vector.id for vector, _, _ in lexical_hits],
+            ],
+            k=config.rrf_k,
+        )
+
+        logger.info(
+            "hybrid_search_fused",
+            workspace_id=str(workspace_id),
+            vector_hits=len(vector_hits),
+            lexical_hits=len(lexical_hits),
+            fused_candidates=len(fused),
+        )
+
+        return [candidates[vector_id] for vector_id, _ in fused[:limit]]
+
     async def _build_session_contexts(
         self,
         workspace_id: uuid.UUID,
@@ -583,12 +689,15 @@ class RetrievalService:
         query: str,
         limit: int = 5,
         min_similarity: float = 0.3,
+        query_embedding: list[float] | None = None,
     ) -> tuple[list[SessionContext], list[ClientContext]]:
         """
         Retrieve relevant sessions AND client profile for a specific client.
 
         This is a client-scoped version of retrieve_relevant_sessions().
         It searches both sessions and client profile data for the specified client.
+        The client predicate runs inside the vector search, so other clients'
+        vectors are never read or decrypted.
 
         Args:
             workspace_id: Workspace ID (multi-tenant isolation)
@@ -596,6 +705,7 @@ class RetrievalService:
             query: Natural language query
             limit: Maximum sessions to retrieve (default: 5)
             min_similarity: Minimum similarity threshold (default: 0.6, lower than general)
+            query_embedding: Precomputed embedding of query (skips the embed call)
 
         Returns:
             Tuple of (SessionContext list, ClientContext list) for this client only
@@ -615,33 +725,17 @@ class RetrievalService:
             query_length=len(query),
         )
 
-        # Retrieve all relevant sessions AND client contexts
-        (
-            all_session_contexts,
-            all_client_contexts,
-        ) = await self.retrieve_relevant_sessions(
+        # Retrieve this client's relevant sessions AND client profile contexts
+        session_contexts, client_contexts = await self.retrieve_relevant_sessions(
             workspace_id=workspace_id,
             query=query,
-            limit=limit * 2,  # Fetch more, then filter
+            limit=limit,
             min_similarity=min_similarity,
             include_client_context=True,  # Include client profile search
+            query_embedding=query_embedding,
+            client_id=client_id,
         )
 
-        # Filter sessions to this client only
-        session_contexts = [
-            context
-            for context in all_session_contexts
-            if context.client_id == client_id
-        ]
-
-        # Filter client contexts to this client only
-        client_contexts = [
-            context for context in all_client_contexts if context.client_id == client_id
-        ]
-
-        # Apply limit after filtering
-        session_contexts = session_contexts[:limit]
-
         logger.info(
             "client_history_retrieval_completed",
             workspace_id=str(workspace_id),
@@ -652,12 +746,15 @@ class RetrievalService:
         return session_contexts, client_contexts
 
 
-def get_retrieval_service(db: AsyncSession) -> RetrievalService:
+def get_retrieval_service(
+    db: AsyncSession, redis: Redis | None = None
+) -> RetrievalService:
     """
     Factory function to create a RetrievalService instance.
 
     Args:
         db: SQLAlchemy async session
+        redis: Optional Redis client for caching query embeddings
 
     Returns:
         Configured RetrievalService instance
@@ -667,4 +764,4 @@ def get_retrieval_service(db: AsyncSession) -> RetrievalService:
         ...     retrieval = get_retrieval_service(db)
         ...     results = await retrieval.retrieve_relevant_sessions(...)
     """
-    return RetrievalService(db)
+    return RetrievalService(db, redis=redis)
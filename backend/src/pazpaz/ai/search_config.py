@@ -58,6 +58,26 @@ class SearchConfig:
     # Short queries (<6 words) with general patterns get this reduction
     short_query_threshold_reduction: float = 0.10
 
+    # ============================================================================
+    # HYBRID (LEXICAL + VECTOR) RETRIEVAL
+    # ============================================================================
+    # Exact clinical terms (medications, abbreviations like "L5") are often
+    # missed by cosine similarity alone. Hybrid retrieval adds candidates that
+    # share keyed lexical tokens with the query and merges both rankings with
+    # Reciprocal Rank Fusion (see lexical_index.py).
+
+    # Run lexical search next to vector search and fuse the rankings
+    hybrid_search_enabled: bool = True
+
+    # RRF constant: score = sum(1 / (rrf_k + rank)) across rankings
+    rrf_k: int = 60
+
+    # Similarity floor for lexical-only candidates (filters keyword noise)
+    lexical_min_similarity: float = 0.15
+
+    # Candidates fetched per ranking = limit * multiplier (before fusion)
+    hybrid_candidate_multiplier: int = 2
+
     # ============================================================================
     # QUERY CLASSIFICATION
     # ============================================================================
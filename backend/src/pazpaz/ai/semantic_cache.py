@@ -0,0 +1,277 @@
+"""
+Semantic (embedding-similarity) cache tier for AI agent queries.
+
+The L1 query cache in ClinicalAgent is keyed by an exact hash of the
+normalized query text, so paraphrases ("what was the treatment for back
+pain" vs "back pain treatments?") always miss. This module adds a second
+tier that matches queries by cosine similarity of their embeddings.
+
+Storage layout (one Redis hash per scope):
+    ai:semantic:{workspace_id}:{client_id}    - client-scoped queries
+    ai:semantic:{workspace_id}:workspace      - workspace-wide queries
+
+Each hash field is a query hash; each value is a JSON document holding the
+L2-normalized query embedding (packed float32, base64) and the cached agent
+response (answer, serialized citations, language, retrieved_count).
+
+Security:
+- Workspace and client scope are part of the key, so lookups can never
+  return an answer computed for another tenant or another client
+- Cached answers have already passed output filtering (PII redaction)
+- Query text is never stored (only its hash and embedding)
+
+Performance:
+- One HGETALL per lookup; similarity is a C-level dot product
+  (math.sumprod) over pre-normalized vectors
+- Scopes are bounded to max_entries (oldest evicted first) and expire
+  after ttl_seconds of inactivity
+- Entries older than ttl_seconds are skipped and lazily removed
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from redis.asyncio import Redis
+
+from pazpaz.ai.embeddings import pack_embedding, unpack_embedding
+from pazpaz.ai.metrics import (
+    ai_agent_cache_hits_total,
+    ai_agent_cache_misses_total,
+    ai_agent_semantic_cache_similarity,
+)
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+WORKSPACE_SCOPE = "workspace"
+
+
+def get_semantic_cache_key(
+    workspace_id: uuid.UUID, client_id: uuid.UUID | None = None
+) -> str:
+    """
+    Generate Redis key for a semantic cache scope.
+
+    Args:
+        workspace_id: Workspace ID (multi-tenant isolation)
+        client_id: Optional client ID (None for workspace-wide queries)
+
+    Returns:
+        Redis key in format: ai:semantic:{workspace_id}:{client_id|workspace}
+
+    Example:
+        >>> get_semantic_cache_key(workspace_id, client_id)
+        'ai:semantic:550e8400-...:7c9e6679-...'
+    """
+    scope = str(client_id) if client_id else WORKSPACE_SCOPE
+    return f"ai:semantic:{workspace_id}:{scope}"
+
+
+def _normalize(embedding: list[float]) -> list[float]:
+    """Scale an embedding to unit length so cosine similarity is a dot product."""
+    norm = math.sqrt(math.sumprod(embedding, embedding))
+    if norm == 0:
+        return list(embedding)
+    return [value / norm for value in embedding]
+
+
+@dataclass
+class SemanticCacheHit:
+    """
+    Cached agent response matched by embedding similarity.
+
+    Attributes:
+        payload: Cached response fields (answer, citations, language, ...)
+        similarity: Cosine similarity between the new and cached query
+        cached_at: Unix timestamp when the entry was stored
+    """
+
+    payload: dict[str, Any]
+    similarity: float
+    cached_at: int
+
+
+class SemanticQueryCache:
+    """
+    Redis-backed cache of agent responses keyed by query embedding.
+
+    Example:
+        >>> cache = SemanticQueryCache(redis)
+        >>> hit = await cache.lookup(workspace_id, client_id, embedding, "en")
+        >>> if hit is None:
+        ...     response = await run_pipeline()
+        ...     await cache.store(workspace_id, client_id, query_hash,
+        ...                       embedding, payload)
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        similarity_threshold: float | None = None,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            redis: Redis client
+            similarity_threshold: Minimum cosine similarity for a hit
+                (defaults to settings.ai_agent_semantic_cache_threshold)
+            ttl_seconds: Entry lifetime in seconds
+                (defaults to settings.ai_agent_semantic_cache_ttl_seconds)
+            max_entries: Maximum entries per workspace/client scope
+                (defaults to settings.ai_agent_semantic_cache_max_entries)
+        """
+        self.redis = redis
+        self.similarity_threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else settings.ai_agent_semantic_cache_threshold
+        )
+        self.ttl_seconds = ttl_seconds or settings.ai_agent_semantic_cache_ttl_seconds
+        self.max_entries = max_entries or settings.ai_agent_semantic_cache_max_entries
+
+    async def lookup(
+        self,
+        workspace_id: uuid.UUID,
+        client_id: uuid.UUID | None,
+        embedding: list[float],
+        language: str,
+    ) -> SemanticCacheHit | None:
+        """
+        Find the most similar cached query in the given scope.
+
+        Only entries in the same language are considered, so a Hebrew query
+        is never answered with a cached English response (the embedding model
+        is multilingual and would otherwise match translations).
+
+        Args:
+            workspace_id: Workspace ID (multi-tenant isolation)
+            client_id: Optional client scope
+            embedding: Query embedding
+            language: Detected query language ('he' or 'en')
+
+        Returns:
+            SemanticCacheHit for the best match above the threshold, or None.
+            Redis errors are logged and treated as a miss.
+        """
+        cache_key = get_semantic_cache_key(workspace_id, client_id)
+
+        try:
+            entries = await self.redis.hgetall(cache_key)
+            query_vector = _normalize(embedding)
+            now = int(time.time())
+
+            best_similarity = 0.0
+            best_entry: dict[str, Any] | None = None
+            expired_fields = []
+
+            for entry_field, raw_entry in entries.items():
+                entry = json.loads(raw_entry)
+                if now - entry["cached_at"] > self.ttl_seconds:
+                    expired_fields.append(entry_field)
+                    continue
+                if entry["payload"].get("language") != language:
+                    continue
+
+                cached_vector = unpack_embedding(entry["embedding"])
+                if len(cached_vector) != len(query_vector):
+                    # Embedding model changed since the entry was written
+                    expired_fields.append(entry_field)
+                    continue
+
+                similarity = math.sumprod(query_vector, cached_vector)
+                if similarity > best_similarity:
+                    best_similarity = similarity
+                    best_entry = entry
+
+            if expired_fields:
+                await self.redis.hdel(cache_key, *expired_fields)
+
+            if entries:
+                ai_agent_semantic_cache_similarity.observe(best_similarity)
+
+            if best_entry is None or best_similarity < self.similarity_threshold:
+                ai_agent_cache_misses_total.labels(cache_layer="semantic").inc()
+                return None
+
+            ai_agent_cache_hits_total.labels(cache_layer="semantic").inc()
+
+            return SemanticCacheHit(
+                payload=best_entry["payload"],
+                similarity=best_similarity,
+                cached_at=best_entry["cached_at"],
+            )
+
+        except Exception as e:
+            # Don't fail query if cache check fails
+            logger.warning(
+                "semantic_cache_lookup_error",
+                workspace_id=str(workspace_id),
+                error=str(e),
+            )
+            return None
+
+    async def store(
+        self,
+        workspace_id: uuid.UUID,
+        client_id: uuid.UUID | None,
+        query_hash: str,
+        embedding: list[float],
+        payload: dict[str, Any],
+    ) -> None:
+        """
+        Store an agent response under its query embedding.
+
+        Args:
+            workspace_id: Workspace ID (multi-tenant isolation)
+            client_id: Optional client scope
+            query_hash: Hash of the query text (used as the hash field)
+            embedding: Query embedding
+            payload: JSON-serializable response fields (must include language)
+
+        Cache failures are logged and swallowed.
+        """
+        cache_key = get_semantic_cache_key(workspace_id, client_id)
+        entry = json.dumps(
+            {
+                "embedding": pack_embedding(_normalize(embedding)),
+                "payload": payload,
+                "cached_at": int(time.time()),
+            }
+        )
+
+        try:
+            await self.redis.hset(cache_key, query_hash, entry)
+            await self.redis.expire(cache_key, self.ttl_seconds)
+
+            if await self.redis.hlen(cache_key) > self.max_entries:
+                await self._evict_oldest(cache_key)
+
+        except Exception as e:
+            # Don't fail query if cache storage fails
+            logger.warning(
+                "semantic_cache_store_error",
+                workspace_id=str(workspace_id),
+                error=str(e),
+            )
+
+    async def _evict_oldest(self, cache_key: str) -> None:
+        """Trim a scope back to max_entries by removing the oldest entries."""
+        entries = await self.redis.hgetall(cache_key)
+        by_age = sorted(
+            entries.items(), key=lambda item: json.loads(item[1])["cached_at"]
+        )
+        overflow = len(by_age) - self.max_entries
+        if overflow > 0:
+            await self.redis.hdel(
+                cache_key, *(entry_field for entry_field, _ in by_age[:overflow])
+            )
@@ -0,0 +1,163 @@
+"""Chunked, concurrent transcription of long recordings.
+
+A recording is split at pauses (audio_chunking), the segments are
+transcribed concurrently through one shared provider with at most
+max_concurrency requests in flight, and the texts are stitched back together
+in recording order. Segments are encoded lazily inside the bounded section,
+so at most max_concurrency encoded segments are held in memory at a time.
+
+If any segment fails, the remaining ones are cancelled and the error is
+raised (a transcript with holes is never returned).
+
+Usage:
+    result = await transcribe_recording(
+        path,
+        provider=get_transcription_provider(),
+        max_concurrency=settings.transcription_max_concurrency,
+        on_progress=report_progress,
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING
+
+from pazpaz.ai.audio_chunking import (
+    AudioSegment,
+    analyze_audio,
+    extract_segment,
+    plan_segments,
+)
+from pazpaz.ai.providers.base import TranscriptionResult
+from pazpaz.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from pazpaz.ai.providers.base import TranscriptionProvider
+
+logger = get_logger(__name__)
+
+# Called with (completed segments, total segments) after each segment
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+def stitch_transcripts(
+    segments: Sequence[AudioSegment], results: Sequence[TranscriptionResult]
+) -> TranscriptionResult:
+    """
+    Join per-segment transcripts in recording order.
+
+    Args:
+        segments: Transcribed segments, in order
+        results: Transcript of each segment (same order)
+
+    Returns:
+        Combined transcript; language is the one spoken for the longest time,
+        duration is the length of the recording
+    """
+    text = " ".join(result.text.strip() for result in results if result.text.strip())
+
+    spoken: Counter[str] = Counter()
+    for segment, result in zip(segments, results, strict=True):
+        spoken[result.language] += segment.duration
+    language = spoken.most_common(1)[0][0] if spoken else "unknown"
+
+    return TranscriptionResult(
+        text=text,
+        language=language,
+        duration_seconds=segments[-1].end if segments else 0.0,
+    )
+
+
+async def transcribe_segments(
+    provider: TranscriptionProvider,
+    segments: Sequence[AudioSegment],
+    read_segment: Callable[[AudioSegment], Awaitable[bytes]],
+    max_concurrency: int,
+    on_progress: ProgressCallback | None = None,
+) -> TranscriptionResult:
+    """
+    Transcribe segments concurrently and stitch the results.
+
+    Args:
+        provider: Transcription provider (shared across segments)
+        segments: Segments of one recording, in order
+        read_segment: Returns the encoded audio of a segment
+        max_concurrency: Maximum segments encoded or transcribed at once
+        on_progress: Called after each completed segment
+
+    Returns:
+        Combined transcript
+
+    Raises:
+        Exception: The first segment failure (other segments are cancelled)
+    """
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+    results: list[TranscriptionResult | None] = [None] * len(segments)
+    completed = 0
+
+    async def transcribe_one(position: int, segment: AudioSegment) -> None:
+        nonlocal completed
+        async with semaphore:
+            audio = await read_segment(segment)
+            results[position] = await provider.transcribe(audio, segment.filename)
+
+        completed += 1
+        if on_progress is not None:
+            await on_progress(completed, len(segments))
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            for position, segment in enumerate(segments):
+                group.create_task(transcribe_one(position, segment))
+    except ExceptionGroup as failures:
+        # Surface the first segment failure (the others were cancelled)
+        raise failures.exceptions[0] from None
+
+    return stitch_transcripts(segments, [result for result in results if result])
+
+
+async def transcribe_recording(
+    path: str,
+    provider: TranscriptionProvider,
+    max_concurrency: int,
+    on_progress: ProgressCallback | None = None,
+) -> TranscriptionResult:
+    """
+    Split a recording at pauses and transcribe it.
+
+    Args:
+        path: Audio file path
+        provider: Transcription provider
+        max_concurrency: Maximum segments transcribed at once
+        on_progress: Called after each completed segment
+
+    Returns:
+        Combined transcript
+
+    Raises:
+        AudioProcessingError: If the audio cannot be decoded or encoded
+        TranscriptionError: If a segment cannot be transcribed
+    """
+    duration, silences = await analyze_audio(path)
+    segments = plan_segments(duration, silences)
+
+    logger.info(
+        "transcription_segments_planned",
+        audio_duration=duration,
+        silences=len(silences),
+        segments=len(segments),
+    )
+
+    if on_progress is not None:
+        await on_progress(0, len(segments))
+
+    return await transcribe_segments(
+        provider,
+        segments,
+        lambda segment: extract_segment(path, segment),
+        max_concurrency=max_concurrency,
+        on_progress=on_progress,
+    )
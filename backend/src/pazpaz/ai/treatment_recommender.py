@@ -6,25 +6,55 @@ based on SOAP notes and patient history (ADR 0002).
 
 This module provides therapy-specific treatment recommendations using:
 1. Therapy type detection (massage, physiotherapy, psychotherapy)
-2. RAG-based patient context retrieval
+2. RAG-based patient context retrieval (ClinicalAgent.retrieve_context)
 3. LLM-powered recommendation generation with markdown formatting
 4. Structured parsing and validation
 
-Reuses 85% of existing ClinicalAgent infrastructure for RAG retrieval.
+Reuses the ClinicalAgent retrieve and format stages directly, so one
+recommendation costs a single LLM round-trip. Client-scoped contexts are
+cached in Redis (encrypted, tagged for invalidation) between calls.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 import time
 import uuid
 from dataclasses import dataclass
 
+from pazpaz.ai.metrics import ai_agent_cache_hits_total, ai_agent_cache_misses_total
 from pazpaz.ai.prompts import detect_language, get_treatment_prompt
 from pazpaz.core.logging import get_logger
+from pazpaz.services.cache_service import AICacheService
+from pazpaz.utils.encryption import decrypt_field_versioned, encrypt_field_versioned
 
 logger = get_logger(__name__)
 
+# Retrieved patient context cache TTL (matches the agent query cache)
+TREATMENT_CONTEXT_CACHE_TTL_SECONDS = 300
+
+
+def get_treatment_context_cache_key(
+    workspace_id: uuid.UUID,
+    client_id: uuid.UUID,
+    query: str,
+) -> str:
+    """
+    Generate Redis key for a client's retrieved treatment context.
+
+    Args:
+        workspace_id: Workspace ID (multi-tenant isolation)
+        client_id: Client the context was retrieved for
+        query: Retrieval query (the current S/O/A text)
+
+    Returns:
+        Redis key in format: ai:treatment_context:{workspace_id}:{client_id}:{hash}
+    """
+    query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
+    return f"ai:treatment_context:{workspace_id}:{client_id}:{query_hash}"
+
 
 @dataclass
 class TreatmentRecommendation:
@@ -109,7 +139,7 @@ class TreatmentRecommender:
 
         Process:
         1. Detect therapy type from SOAP terminology
-        2. Get patient context (reuses existing query() method)
+        2. Get patient context (agent retrieve/format stages, cached per client)
         3. Generate recommendations using therapy-specific LLM prompt
         4. Parse and structure recommendations
 
@@ -163,26 +193,20 @@ class TreatmentRecommender:
                 language=language,
             )
 
-            # Step 3: Get patient context using existing RAG agent
+            # Step 3: Get patient context using the agent's retrieval stages
             # Use actual SOA content as query to find semantically similar past sessions
             # This ensures we retrieve sessions with similar clinical presentations
-            patient_context_query = (
-                combined_soa  # Already contains "{subjective} {objective} {assessment}"
-            )
-
-            patient_context_response = await self.agent.query(
+            patient_history, retrieved_count = await self._get_patient_context(
                 workspace_id=workspace_id,
-                query=patient_context_query,
                 client_id=client_id,
-                max_results=3,  # Limit to recent sessions
-                min_similarity=0.3,  # Lower threshold to retrieve more context (same as AI Agent chat)
+                query=combined_soa,
             )
 
             self.logger.debug(
                 "patient_context_retrieved",
                 workspace_id=str(workspace_id),
-                context_length=len(patient_context_response.answer),
-                sources_count=patient_context_response.retrieved_count,
+                context_length=len(patient_history),
+                sources_count=retrieved_count,
             )
 
             # Step 4: Build recommendation prompt (language-aware)
@@ -198,7 +222,7 @@ class TreatmentRecommender:
 הערכה: {assessment}
 
 **היסטוריה קלינית של המטופל:**
-{patient_context_response.answer if patient_context_response.retrieved_count > 0 else "לא קיימת היסטוריית מפגשים קודמים."}
+{patient_history if retrieved_count > 0 else "לא קיימת היסטוריית מפגשים קודמים."}
 
 **משימה:**
 על סמך ממצאי המפגש הנוכחי והיסטוריית המטופל, ספק 1-2 המלצות טיפול ממוקדות לקטע התכנית (Plan).
@@ -244,7 +268,7 @@ Objective: {objective}
 Assessment: {assessment}
 
 **Patient Clinical History:**
-{patient_context_response.answer if patient_context_response.retrieved_count > 0 else "No previous session history available."}
+{patient_history if retrieved_count > 0 else "No previous session history available."}
 
 **Task:**
 Based on the current session findings and patient history, provide 1-2 focused treatment recommendations for the Plan section.
@@ -303,11 +327,9 @@ Description: [your markdown-formatted description here with **bold** terms]
                 answer,
                 therapy_type=therapy_type,
                 evidence_type=(
-                    "hybrid"
-                    if patient_context_response.retrieved_count > 0
-                    else "clinical_guidelines"
+                    "hybrid" if retrieved_count > 0 else "clinical_guidelines"
                 ),
-                similar_cases_count=patient_context_response.retrieved_count,
+                similar_cases_count=retrieved_count,
             )
 
             processing_time = int((time.time() - start_time) * 1000)
@@ -325,7 +347,7 @@ Description: [your markdown-formatted description here with **bold** terms]
                 recommendations=recommendations,
                 therapy_type=therapy_type,
                 language=language,
-                retrieved_count=patient_context_response.retrieved_count,
+                retrieved_count=retrieved_count,
                 processing_time_ms=processing_time,
             )
 
@@ -345,6 +367,145 @@ Description: [your markdown-formatted description here with **bold** terms]
                 f"Failed to generate treatment recommendations: {e}"
             ) from e
 
+    async def _get_patient_context(
+        self,
+        workspace_id: uuid.UUID,
+        client_id: uuid.UUID | None,
+        query: str,
+    ) -> tuple[str, int]:
+        """
+        Retrieve and format patient context without an LLM synthesis call.
+
+        Client-scoped contexts are served from the Redis cache when the same
+        S/O/A is submitted again (e.g. regenerating recommendations). Retrieval
+        failures are logged and treated as "no history", so recommendations
+        fall back to clinical guidelines instead of failing.
+
+        Args:
+            workspace_id: Workspace ID (MANDATORY - multi-tenant isolation)
+            client_id: Optional client ID for patient-specific context
+            query: Retrieval query (current S/O/A text)
+
+        Returns:
+            Tuple of (formatted patient history, number of retrieved sources)
+        """
+        cache_key = (
+            get_treatment_context_cache_key(workspace_id, client_id, query)
+            if client_id and self.agent.redis
+            else None
+        )
+
+        if cache_key:
+            cached = await self._load_cached_context(workspace_id, cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            context = await self.agent.retrieve_context(
+                workspace_id=workspace_id,
+                query=query,
+                client_id=client_id,
+                max_results=3,  # Limit to recent sessions
+                min_similarity=0.3,  # Lower threshold to retrieve more context (same as AI Agent chat)
+            )
+        except Exception as e:
+            self.logger.warning(
+                "patient_context_retrieval_failed",
+                workspace_id=str(workspace_id),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return "", 0
+
+        if cache_key:
+            await self._store_cached_context(
+                workspace_id=workspace_id,
+                client_id=client_id,
+                cache_key=cache_key,
+                formatted_context=context.formatted_context,
+                retrieved_count=context.retrieved_count,
+            )
+
+        return context.formatted_context, context.retrieved_count
+
+    async def _load_cached_context(
+        self,
+        workspace_id: uuid.UUID,
+        cache_key: str,
+    ) -> tuple[str, int] | None:
+        """
+        Load a cached patient context (decrypting it).
+
+        Returns:
+            Tuple of (formatted patient history, retrieved count), or None on
+            a miss. Cache failures are logged and treated as a miss.
+        """
+        try:
+            encrypted = await self.agent.redis.get(cache_key)
+            if encrypted is None:
+                ai_agent_cache_misses_total.labels(
+                    cache_layer="treatment_context"
+                ).inc()
+                return None
+
+            cache_data = json.loads(decrypt_field_versioned(encrypted))
+
+            ai_agent_cache_hits_total.labels(cache_layer="treatment_context").inc()
+
+            return cache_data["formatted_context"], cache_data["retrieved_count"]
+
+        except Exception as e:
+            # Don't fail recommendation if cache check fails
+            self.logger.warning(
+                "treatment_context_cache_read_error",
+                workspace_id=str(workspace_id),
+                error=str(e),
+            )
+            return None
+
+    async def _store_cached_context(
+        self,
+        workspace_id: uuid.UUID,
+        client_id: uuid.UUID,
+        cache_key: str,
+        formatted_context: str,
+        retrieved_count: int,
+    ) -> None:
+        """
+        Cache a client's patient context (encrypted, it contains decrypted PHI).
+
+        The key is registered in the client's AI cache tag set first, so
+        client data changes invalidate it like cached agent answers.
+        Cache failures are logged and swallowed.
+        """
+        try:
+            await AICacheService(self.agent.redis).tag_keys(
+                workspace_id,
+                client_id,
+                [cache_key],
+                TREATMENT_CONTEXT_CACHE_TTL_SECONDS,
+            )
+
+            encrypted = encrypt_field_versioned(
+                json.dumps(
+                    {
+                        "formatted_context": formatted_context,
+                        "retrieved_count": retrieved_count,
+                    }
+                )
+            )
+            await self.agent.redis.setex(
+                cache_key, TREATMENT_CONTEXT_CACHE_TTL_SECONDS, encrypted
+            )
+
+        except Exception as e:
+            # Don't fail recommendation if cache storage fails
+            self.logger.warning(
+                "treatment_context_cache_write_error",
+                workspace_id=str(workspace_id),
+                error=str(e),
+            )
+
     def _detect_therapy_type_simple(
         self, subjective: str, objective: str, assessment: str
     ) -> str:
@@ -23,11 +23,14 @@ Architecture:
 import uuid
 from collections.abc import Sequence
 
-from sqlalchemy import delete, desc, func, select
+from sqlalchemy import String, any_, delete, desc, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pazpaz.ai.lexical_index import build_lexical_tokens
 from pazpaz.core.logging import get_logger
 from pazpaz.models.client_vector import ClientVector
+from pazpaz.models.session import Session
 from pazpaz.models.session_vector import SessionVector
 
 logger = get_logger(__name__)
@@ -74,6 +77,8 @@ class VectorStore:
         session_id: uuid.UUID,
         field_name: str,
         embedding: list[float],
+        text: str | None = None,
+        client_id: uuid.UUID | None = None,
     ) -> SessionVector:
         """
         Insert a single embedding vector for a SOAP field.
@@ -83,6 +88,10 @@ class VectorStore:
             session_id: Session ID (foreign key to sessions table)
             field_name: SOAP field name ('subjective', 'objective', 'assessment', 'plan')
             embedding: 1536-dimensional vector from Cohere embed-v4.0
+            text: Optional plaintext of the field, used to build the keyed
+                lexical index (the text itself is never stored)
+            client_id: Client owning the session (looked up from the session
+                when not provided)
 
         Returns:
             Created SessionVector instance
@@ -113,11 +122,16 @@ class VectorStore:
             )
 
         try:
+            if client_id is None:
+                client_id = await self._get_session_client_id(workspace_id, session_id)
+
             vector = SessionVector(
                 workspace_id=workspace_id,
                 session_id=session_id,
+                client_id=client_id,
                 field_name=field_name,
                 embedding=embedding,  # type: ignore[arg-type]
+                lexical_tokens=build_lexical_tokens(text, workspace_id),
             )
 
             self.db.add(vector)
@@ -150,6 +164,8 @@ class VectorStore:
         workspace_id: uuid.UUID,
         session_id: uuid.UUID,
         embeddings: dict[str, list[float]],
+        texts: dict[str, str] | None = None,
+        client_id: uuid.UUID | None = None,
     ) -> list[SessionVector]:
         """
         Insert multiple embeddings for a session in a single transaction.
@@ -161,6 +177,10 @@ class VectorStore:
             session_id: Session ID (foreign key to sessions table)
             embeddings: Dict mapping field names to embedding vectors
                        Example: {"subjective": [...], "objective": [...]}
+            texts: Optional dict mapping field names to plaintext, used to
+                build the keyed lexical index (the text itself is never stored)
+            client_id: Client owning the session (looked up from the session
+                when not provided)
 
         Returns:
             List of created SessionVector instances
@@ -195,14 +215,23 @@ class VectorStore:
                     f"{len(embedding)}. Expected 1536."
                 )
 
+        texts = texts or {}
+
         try:
+            if client_id is None:
+                client_id = await self._get_session_client_id(workspace_id, session_id)
+
             vectors = []
             for field_name, embedding in embeddings.items():
                 vector = SessionVector(
                     workspace_id=workspace_id,
                     session_id=session_id,
+                    client_id=client_id,
                     field_name=field_name,
                     embedding=embedding,  # type: ignore[arg-type]
+                    lexical_tokens=build_lexical_tokens(
+                        texts.get(field_name), workspace_id
+                    ),
                 )
                 vectors.append(vector)
                 self.db.add(vector)
@@ -241,6 +270,7 @@ class VectorStore:
         limit: int = 10,
         field_name: str | None = None,
         min_similarity: float = 0.3,
+        client_id: uuid.UUID | None = None,
     ) -> list[tuple[SessionVector, float]]:
         """
         Search for similar embeddings using cosine similarity.
@@ -253,6 +283,7 @@ class VectorStore:
             limit: Maximum number of results to return (default: 10, max: 100)
             field_name: Optional filter by SOAP field ('subjective', 'objective', etc.)
             min_similarity: Minimum cosine similarity threshold (0.0 to 1.0, default: 0.7)
+            client_id: Optional filter by client (only that client's vectors are read)
 
         Returns:
             List of (SessionVector, similarity_score) tuples, sorted by similarity desc
@@ -313,6 +344,10 @@ class VectorStore:
             if field_name is not None:
                 query = query.where(SessionVector.field_name == field_name)
 
+            # Optional client filter (uses idx_session_vectors_workspace_client)
+            if client_id is not None:
+                query = query.where(SessionVector.client_id == client_id)
+
             # Order by similarity descending and limit results
             query = query.order_by(desc("similarity")).limit(limit)
 
@@ -324,6 +359,7 @@ class VectorStore:
             logger.info(
                 "similarity_search_completed",
                 workspace_id=str(workspace_id),
+                client_id=str(client_id) if client_id else None,
                 results_count=len(results),
                 limit=limit,
                 field_name=field_name,
@@ -343,6 +379,168 @@ class VectorStore:
             )
             raise VectorStoreError(f"Failed to search similar embeddings: {e}") from e
 
+    async def search_lexical(
+        self,
+        workspace_id: uuid.UUID,
+        query_embedding: list[float],
+        query_tokens: list[str],
+        limit: int = 10,
+        field_name: str | None = None,
+        min_similarity: float = 0.0,
+        client_id: uuid.UUID | None = None,
+    ) -> list[tuple[SessionVector, float, int]]:
+        """
+        Search for embeddings whose keyed lexical tokens overlap the query's.
+
+        Candidates are found through the GIN index on lexical_tokens (array
+        overlap) and ranked by the number of matching query tokens, then by
+        cosine similarity. The similarity is returned alongside so lexical
+        hits can be scored like vector hits after rank fusion.
+
+        Args:
+            workspace_id: Workspace ID (MANDATORY - multi-tenant isolation)
+            query_embedding: 1536-dimensional query vector
+            query_tokens: Keyed token digests of the query
+                (from lexical_index.build_lexical_tokens)
+            limit: Maximum number of results to return (default: 10, max: 100)
+            field_name: Optional filter by SOAP field ('subjective', 'objective', etc.)
+            min_similarity: Minimum cosine similarity floor for lexical hits
+            client_id: Optional filter by client (only that client's vectors are read)
+
+        Returns:
+            List of (SessionVector, similarity_score, matched_tokens) tuples,
+            sorted by matched_tokens desc, then similarity desc
+
+        Raises:
+            VectorStoreError: If search fails
+            ValueError: If query_embedding dimensions incorrect or limit out of range
+
+        Example:
+            >>> tokens = build_lexical_tokens("L5 radiculopathy", workspace_id)
+            >>> results = await store.search_lexical(
+            ...     workspace_id=workspace_id,
+            ...     query_embedding=[0.1] * 1536,
+            ...     query_tokens=tokens,
+            ...     limit=20,
+            ... )
+            >>> for vector, similarity, matches in results:
+            ...     print(f"{vector.field_name}: {matches} terms, {similarity:.2f}")
+        """
+        if len(query_embedding) != 1536:
+            raise ValueError(
+                f"Invalid query embedding dimensions: {len(query_embedding)}. "
+                f"Expected 1536."
+            )
+
+        if limit < 1 or limit > 100:
+            raise ValueError(f"Invalid limit: {limit}. Must be between 1 and 100.")
+
+        if field_name is not None:
+            valid_fields = {"subjective", "objective", "assessment", "plan"}
+            if field_name not in valid_fields:
+                raise ValueError(
+                    f"Invalid field_name: {field_name}. Must be one of {valid_fields}"
+                )
+
+        if not query_tokens:
+            return []
+
+        try:
+            tokens_param = literal(query_tokens, ARRAY(String(16)))
+            similarity = 1 - SessionVector.embedding.cosine_distance(query_embedding)
+
+            # Number of distinct query tokens present in the row's token array
+            row_tokens = (
+                func.unnest(SessionVector.lexical_tokens)
+                .table_valued("token")
+                .render_derived()
+            )
+            matches = (
+                select(func.count())
+                .select_from(row_tokens)
+                .where(row_tokens.c.token == any_(tokens_param))
+                .scalar_subquery()
+            )
+
+            query = (
+                select(
+                    SessionVector,
+                    similarity.label("similarity"),
+                    matches.label("matches"),
+                )
+                .where(SessionVector.workspace_id == workspace_id)
+                .where(SessionVector.lexical_tokens.overlap(tokens_param))
+                .where(similarity >= min_similarity)
+            )
+
+            if field_name is not None:
+                query = query.where(SessionVector.field_name == field_name)
+
+            if client_id is not None:
+                query = query.where(SessionVector.client_id == client_id)
+
+            query = query.order_by(desc("matches"), desc("similarity")).limit(limit)
+
+            result = await self.db.execute(query)
+            rows = result.all()
+
+            results = [
+                (row.SessionVector, float(row.similarity), int(row.matches))
+                for row in rows
+            ]
+
+            logger.info(
+                "lexical_search_completed",
+                workspace_id=str(workspace_id),
+                results_count=len(results),
+                query_tokens=len(query_tokens),
+                limit=limit,
+                field_name=field_name,
+            )
+
+            return results
+
+        except Exception as e:
+            logger.error(
+                "lexical_search_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                workspace_id=str(workspace_id),
+                limit=limit,
+                field_name=field_name,
+            )
+            raise VectorStoreError(f"Failed to search lexical tokens: {e}") from e
+
+    async def _get_session_client_id(
+        self,
+        workspace_id: uuid.UUID,
+        session_id: uuid.UUID,
+    ) -> uuid.UUID:
+        """
+        Look up the client owning a session (denormalized onto its vectors).
+
+        Args:
+            workspace_id: Workspace ID (MANDATORY - multi-tenant isolation)
+            session_id: Session ID
+
+        Returns:
+            Client ID of the session
+
+        Raises:
+            ValueError: If the session does not exist in the workspace
+        """
+        result = await self.db.execute(
+            select(Session.client_id)
+            .where(Session.id == session_id)
+            .where(Session.workspace_id == workspace_id)
+        )
+        client_id = result.scalar_one_or_none()
+        if client_id is None:
+            raise ValueError(
+                f"Session {session_id} not found in workspace {workspace_id}"
+            )
+        return client_id
+
     async def get_session_embeddings(
         self,
         workspace_id: uuid.UUID,
@@ -675,6 +873,7 @@ class VectorStore:
         limit: int = 10,
         field_name: str | None = None,
         min_similarity: float = 0.3,
+        client_id: uuid.UUID | None = None,
     ) -> list[tuple[ClientVector, float]]:
         """
         Search for similar client embeddings using cosine similarity.
@@ -687,6 +886,7 @@ class VectorStore:
             limit: Maximum number of results to return (default: 10, max: 100)
             field_name: Optional filter by client field ('medical_history', 'notes')
             min_similarity: Minimum cosine similarity threshold (0.0 to 1.0, default: 0.7)
+            client_id: Optional filter by client (only that client's vectors are read)
 
         Returns:
             List of (ClientVector, similarity_score) tuples, sorted by similarity desc
@@ -747,6 +947,10 @@ class VectorStore:
             if field_name is not None:
                 query = query.where(ClientVector.field_name == field_name)
 
+            # Optional client filter (uses idx_client_vectors_client)
+            if client_id is not None:
+                query = query.where(ClientVector.client_id == client_id)
+
             # Order by similarity descending and limit results
             query = query.order_by(desc("similarity")).limit(limit)
 
@@ -758,6 +962,7 @@ class VectorStore:
             logger.info(
                 "client_similarity_search_completed",
                 workspace_id=str(workspace_id),
+                client_id=str(client_id) if client_id else None,
                 results_count=len(results),
                 limit=limit,
                 field_name=field_name,
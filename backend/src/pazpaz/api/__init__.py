@@ -4,6 +4,7 @@ from fastapi import APIRouter
 
 from pazpaz.api.ai_agent import router as ai_agent_router
 from pazpaz.api.appointments import router as appointments_router
+from pazpaz.api.attachment_uploads import router as attachment_uploads_router
 from pazpaz.api.audit import router as audit_router
 from pazpaz.api.auth import router as auth_router
 from pazpaz.api.client_attachments import router as client_attachments_router
@@ -38,6 +39,7 @@ api_router.include_router(appointments_router)
 api_router.include_router(sessions_router)
 api_router.include_router(session_attachments_router)
 api_router.include_router(client_attachments_router)
+api_router.include_router(attachment_uploads_router)
 api_router.include_router(services_router)
 api_router.include_router(locations_router)
 api_router.include_router(workspaces_router)
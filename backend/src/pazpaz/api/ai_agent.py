@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import uuid
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pazpaz.ai.agent import get_clinical_agent
+from pazpaz.ai.agent import (
+    AgentStreamEvent,
+    ClientCitation,
+    SessionCitation,
+    get_clinical_agent,
+)
 from pazpaz.ai.metrics import ai_agent_rate_limit_hits_total
 from pazpaz.ai.prompt_injection import PromptInjectionError, validate_query
 from pazpaz.api.deps import get_current_user, get_db
@@ -14,6 +24,7 @@ from pazpaz.core.logging import get_logger
 from pazpaz.core.rate_limiting import check_rate_limit_redis
 from pazpaz.core.redis import get_redis
 from pazpaz.models.user import User
+from pazpaz.monitoring.tenant_metrics import record_tenant_usage
 from pazpaz.schemas.ai_agent import (
     AgentChatRequest,
     AgentChatResponse,
@@ -25,74 +36,22 @@ router = APIRouter(prefix="/ai/agent", tags=["ai-agent"])
 logger = get_logger(__name__)
 
 
-@router.post("/chat", response_model=AgentChatResponse, status_code=200)
-async def chat_with_agent(
+async def _authorize_chat_query(
     request_data: AgentChatRequest,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-    redis_client: Redis = Depends(get_redis),
-) -> AgentChatResponse:
+    current_user: User,
+    redis_client: Redis,
+) -> str:
     """
-    Chat with AI clinical documentation assistant.
+    Apply the workspace rate limit and prompt-injection validation to a query.
 
-    Processes natural language queries (Hebrew or English) about patient
-    clinical history using semantic search and LLM synthesis.
-
-    **Features:**
-    - Bilingual support (Hebrew/English auto-detection)
-    - Semantic search across SOAP notes (pgvector + Cohere embeddings)
-    - Workspace-scoped (multi-tenant isolation)
-    - Citations with session links
-    - HIPAA-compliant audit logging
-
-    **Security:**
-    - Rate limited: 30 queries/hour per workspace
-    - Workspace isolation enforced
-    - No query text stored (ephemeral processing)
-    - PHI auto-decrypted only for authorized workspace
-
-    **AUDIT:** All queries are logged with metadata (query_length, language,
-    retrieved_count, processing_time) but NOT the query text itself (PHI risk).
-
-    Args:
-        request_data: Chat request with query and optional filters
-        current_user: Authenticated user (from JWT token)
-        db: Database session
-        redis_client: Redis client for rate limiting
+    Shared by the buffered (/chat) and streaming (/chat/stream) endpoints so
+    both count against the same 30 queries/hour workspace budget.
 
     Returns:
-        AgentChatResponse with answer, citations, and metadata
+        Sanitized query text
 
     Raises:
-        HTTPException: 401 if not authenticated,
-                      429 if rate limit exceeded,
-                      500 if agent processing fails
-
-    Example:
-        POST /api/v1/ai/agent/chat
-        {
-            "query": "What was the patient's back pain history?",
-            "client_id": "uuid",
-            "max_results": 5,
-            "min_similarity": 0.7
-        }
-
-        Response:
-        {
-            "answer": "Based on session notes, the patient...",
-            "citations": [
-                {
-                    "session_id": "uuid",
-                    "client_name": "John Doe",
-                    "session_date": "2025-11-01T10:30:00Z",
-                    "similarity": 0.85,
-                    "field_name": "subjective"
-                }
-            ],
-            "language": "en",
-            "retrieved_count": 3,
-            "processing_time_ms": 1250
-        }
+        HTTPException: 429 if rate limit exceeded, 400 if query is rejected
     """
     workspace_id = current_user.workspace_id
 
@@ -106,7 +65,8 @@ async def chat_with_agent(
         window_seconds=3600,  # 1 hour
     ):
         # Track rate limit hit
-        ai_agent_rate_limit_hits_total.labels(workspace_id=str(workspace_id)).inc()
+        ai_agent_rate_limit_hits_total.inc()
+        record_tenant_usage("ai_agent_rate_limit_hits", workspace_id)
 
         logger.warning(
             "ai_agent_chat_rate_limit_exceeded",
@@ -160,9 +120,132 @@ async def chat_with_agent(
             detail=str(e),
         ) from e
 
+    return sanitized_query
+
+
+def _to_citation_responses(
+    citations: list[SessionCitation | ClientCitation],
+) -> list[SessionCitationResponse | ClientCitationResponse]:
+    """Convert agent citations to API response schemas."""
+    responses: list[SessionCitationResponse | ClientCitationResponse] = []
+    for citation in citations:
+        if isinstance(citation, SessionCitation):
+            responses.append(
+                SessionCitationResponse(
+                    type="session",
+                    session_id=citation.session_id,
+                    client_id=citation.client_id,
+                    client_name=citation.client_name,
+                    session_date=citation.session_date,
+                    similarity=citation.similarity,
+                    field_name=citation.field_name,
+                )
+            )
+        elif isinstance(citation, ClientCitation):
+            # Client citations reference the client profile, not a session
+            responses.append(
+                ClientCitationResponse(
+                    type="client",
+                    client_id=citation.client_id,
+                    client_name=citation.client_name,
+                    similarity=citation.similarity,
+                    field_name=citation.field_name,
+                )
+            )
+    return responses
+
+
+def _format_sse(event: AgentStreamEvent) -> str:
+    """Encode an agent stream event as a server-sent event frame."""
+    data = event.data
+    if event.event == "citations":
+        data = {
+            **data,
+            "citations": [
+                citation.model_dump(mode="json")
+                for citation in _to_citation_responses(data["citations"])
+            ],
+        }
+    return f"event: {event.event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat", response_model=AgentChatResponse, status_code=200)
+async def chat_with_agent(
+    request_data: AgentChatRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis),
+) -> AgentChatResponse:
+    """
+    Chat with AI clinical documentation assistant.
+
+    Processes natural language queries (Hebrew or English) about patient
+    clinical history using semantic search and LLM synthesis.
+
+    **Features:**
+    - Bilingual support (Hebrew/English auto-detection)
+    - Semantic search across SOAP notes (pgvector + Cohere embeddings)
+    - Workspace-scoped (multi-tenant isolation)
+    - Citations with session links
+    - HIPAA-compliant audit logging
+
+    **Security:**
+    - Rate limited: 30 queries/hour per workspace
+    - Workspace isolation enforced
+    - No query text stored (ephemeral processing)
+    - PHI auto-decrypted only for authorized workspace
+
+    **AUDIT:** All queries are logged with metadata (query_length, language,
+    retrieved_count, processing_time) but NOT the query text itself (PHI risk).
+
+    Args:
+        request_data: Chat request with query and optional filters
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        redis_client: Redis client for rate limiting and L1 query caching
+
+    Returns:
+        AgentChatResponse with answer, citations, and metadata
+
+    Raises:
+        HTTPException: 401 if not authenticated,
+                      429 if rate limit exceeded,
+                      500 if agent processing fails
+
+    Example:
+        POST /api/v1/ai/agent/chat
+        {
+            "query": "What was the patient's back pain history?",
+            "client_id": "uuid",
+            "max_results": 5,
+            "min_similarity": 0.7
+        }
+
+        Response:
+        {
+            "answer": "Based on session notes, the patient...",
+            "citations": [
+                {
+                    "session_id": "uuid",
+                    "client_name": "John Doe",
+                    "session_date": "2025-11-01T10:30:00Z",
+                    "similarity": 0.85,
+                    "field_name": "subjective"
+                }
+            ],
+            "language": "en",
+            "retrieved_count": 3,
+            "processing_time_ms": 1250
+        }
+    """
+    workspace_id = current_user.workspace_id
+    sanitized_query = await _authorize_chat_query(
+        request_data, current_user, redis_client
+    )
+
     try:
         # Initialize agent with database session
-        agent = get_clinical_agent(db)
+        agent = get_clinical_agent(db, redis=redis_client)
 
         # Query agent with workspace scoping and user ID for audit logging
         # Use sanitized_query (validated and cleaned for prompt injection)
@@ -176,34 +259,7 @@ async def chat_with_agent(
         )
 
         # Convert agent response to API response schema
-        # Handle both SessionCitation and ClientCitation types
-        from pazpaz.ai.agent import ClientCitation, SessionCitation
-
-        citations: list[SessionCitationResponse | ClientCitationResponse] = []
-        for citation in response.citations:
-            if isinstance(citation, SessionCitation):
-                citations.append(
-                    SessionCitationResponse(
-                        type="session",
-                        session_id=citation.session_id,
-                        client_id=citation.client_id,
-                        client_name=citation.client_name,
-                        session_date=citation.session_date,
-                        similarity=citation.similarity,
-                        field_name=citation.field_name,
-                    )
-                )
-            elif isinstance(citation, ClientCitation):
-                # Client citations reference the client profile, not a session
-                citations.append(
-                    ClientCitationResponse(
-                        type="client",
-                        client_id=citation.client_id,
-                        client_name=citation.client_name,
-                        similarity=citation.similarity,
-                        field_name=citation.field_name,
-                    )
-                )
+        citations = _to_citation_responses(response.citations)
 
         api_response = AgentChatResponse(
             answer=response.answer,
@@ -240,3 +296,107 @@ async def chat_with_agent(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to process AI chat query. Please try again later.",
         ) from e
+
+
+@router.post("/chat/stream", status_code=200)
+async def chat_with_agent_stream(
+    request_data: AgentChatRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: Redis = Depends(get_redis),
+) -> StreamingResponse:
+    """
+    Chat with AI clinical documentation assistant (server-sent events).
+
+    Same pipeline, rate limit, and audit logging as POST /chat, but the
+    response is streamed as `text/event-stream` so the UI can render
+    citations immediately and the answer as it is generated.
+
+    **Event sequence:**
+    - `citations`: `{"citations": [...], "language": "en", "retrieved_count": 3}`
+    - `token` (repeated): `{"text": "Based on session notes, "}` - already
+      PII-filtered; concatenate in order to build the answer
+    - `done`: `{"language": "en", "retrieved_count": 3,
+      "processing_time_ms": 1250, "cached": false}`
+    - `error` (instead of `done`): `{"message": "..."}` - discard any partial
+      answer already rendered
+
+    Rate limiting and query validation happen before the stream opens, so
+    429/400 are returned as regular JSON errors.
+
+    Args:
+        request_data: Chat request with query and optional filters
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        redis_client: Redis client for rate limiting and L1 query caching
+
+    Returns:
+        StreamingResponse emitting server-sent events
+
+    Raises:
+        HTTPException: 401 if not authenticated,
+                      429 if rate limit exceeded,
+                      400 if query is rejected
+    """
+    workspace_id = current_user.workspace_id
+    sanitized_query = await _authorize_chat_query(
+        request_data, current_user, redis_client
+    )
+
+    agent = get_clinical_agent(db, redis=redis_client)
+
+    async def event_stream() -> AsyncIterator[str]:
+        stream_id = uuid.uuid4()
+        try:
+            async for event in agent.query_stream(
+                workspace_id=workspace_id,
+                query=sanitized_query,
+                user_id=current_user.id,  # For HIPAA audit logging
+                client_id=request_data.client_id,
+                max_results=request_data.max_results,
+                min_similarity=request_data.min_similarity,
+            ):
+                yield _format_sse(event)
+
+                if event.event == "done":
+                    logger.info(
+                        "ai_agent_chat_stream_success",
+                        user_id=str(current_user.id),
+                        workspace_id=str(workspace_id),
+                        stream_id=str(stream_id),
+                        language=event.data["language"],
+                        retrieved_count=event.data["retrieved_count"],
+                        processing_time_ms=event.data["processing_time_ms"],
+                        cached=event.data["cached"],
+                    )
+
+        except Exception as e:
+            logger.error(
+                "ai_agent_chat_stream_error",
+                user_id=str(current_user.id),
+                workspace_id=str(workspace_id),
+                stream_id=str(stream_id),
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+            # Don't expose internal errors to client
+            yield _format_sse(
+                AgentStreamEvent(
+                    event="error",
+                    data={
+                        "message": (
+                            "Failed to process AI chat query. Please try again later."
+                        )
+                    },
+                )
+            )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable nginx proxy buffering for SSE
+        },
+    )
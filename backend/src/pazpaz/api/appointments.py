@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 
 from arq.connections import ArqRedis
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
@@ -27,6 +27,7 @@ from pazpaz.models.appointment import Appointment, AppointmentStatus
 from pazpaz.models.audit_event import AuditAction, ResourceType
 from pazpaz.models.client import Client
 from pazpaz.models.user import User
+from pazpaz.monitoring.tenant_metrics import record_tenant_usage
 from pazpaz.schemas.appointment import (
     AppointmentCreate,
     AppointmentDeleteRequest,
@@ -34,13 +35,30 @@ from pazpaz.schemas.appointment import (
     AppointmentPaymentUpdate,
     AppointmentResponse,
     AppointmentUpdate,
+    AvailabilityInterval,
+    AvailabilityResponse,
+    BatchConflictCheckRequest,
+    BatchConflictCheckResponse,
     ConflictCheckResponse,
     ConflictingAppointmentDetail,
+    IntervalConflictResult,
     PaymentLinkResponse,
     SendPaymentRequestBody,
     SendPaymentRequestResponse,
 )
+from pazpaz.services.appointment_conflict_service import (
+    ProposedInterval,
+    find_conflicts,
+    find_overlapping_intervals,
+)
 from pazpaz.services.audit_service import create_audit_event
+from pazpaz.services.availability_service import (
+    MAX_AVAILABILITY_WINDOW,
+    MAX_OPEN_SLOTS,
+    get_busy_intervals,
+    get_free_intervals,
+    get_open_slots,
+)
 from pazpaz.services.payment_link_service import (
     generate_payment_link,
     get_payment_link_display_text,
@@ -74,12 +92,8 @@ async def check_conflicts(
     """
     Check for conflicting appointments in the given time range.
 
-    Conflict exists if appointments overlap, but NOT if they are exactly back-to-back.
-
-    Overlap logic:
-    - Conflicts: scheduled_start < requested_end AND scheduled_end > requested_start
-    - Exclude back-to-back: NOT (scheduled_end == requested_start OR
-        scheduled_start == requested_end)
+    Conflict exists if appointments overlap, but NOT if they are exactly back-to-back
+    (time ranges are half-open: [scheduled_start, scheduled_end)).
 
     Only SCHEDULED and ATTENDED appointments cause conflicts.
     CANCELLED and NO_SHOW appointments are ignored.
@@ -94,37 +108,16 @@ async def check_conflicts(
     Returns:
         List of conflicting appointments
     """
-    # Build query for overlapping appointments
-    # Uses ix_appointments_workspace_time_range index for performance
-    query = select(Appointment).where(
-        Appointment.workspace_id == workspace_id,
-        Appointment.scheduled_start < scheduled_end,
-        Appointment.scheduled_end > scheduled_start,
-        # Only SCHEDULED and ATTENDED appointments cause conflicts
-        Appointment.status.in_(
-            [AppointmentStatus.SCHEDULED, AppointmentStatus.ATTENDED]
-        ),
+    # Uses ix_appointments_workspace_blocking_time_range (GiST) for performance
+    conflicts = await find_conflicts(
+        db,
+        workspace_id,
+        [ProposedInterval(scheduled_start, scheduled_end)],
+        exclude_appointment_ids=[exclude_appointment_id]
+        if exclude_appointment_id
+        else (),
     )
-
-    # Exclude the appointment being updated
-    if exclude_appointment_id:
-        query = query.where(Appointment.id != exclude_appointment_id)
-
-    # Execute query
-    result = await db.execute(query)
-    potential_conflicts = result.scalars().all()
-
-    # Filter out back-to-back appointments (exact adjacency is OK)
-    conflicts = [
-        appt
-        for appt in potential_conflicts
-        if not (
-            appt.scheduled_end == scheduled_start
-            or appt.scheduled_start == scheduled_end
-        )
-    ]
-
-    return conflicts
+    return conflicts[0]
 
 
 def get_client_initials(client: Client) -> str:
@@ -155,6 +148,33 @@ def get_client_initials(client: Client) -> str:
         return "?"
 
 
+def build_conflict_details(
+    appointments: list[Appointment],
+) -> list[ConflictingAppointmentDetail]:
+    """
+    Build privacy-preserving conflict details (client initials only).
+
+    Args:
+        appointments: Conflicting appointments with client loaded
+
+    Returns:
+        Conflict details for API responses
+    """
+    return [
+        ConflictingAppointmentDetail(
+            id=appointment.id,
+            scheduled_start=appointment.scheduled_start,
+            scheduled_end=appointment.scheduled_end,
+            client_initials=(
+                get_client_initials(appointment.client) if appointment.client else "?"
+            ),
+            location_type=appointment.location_type,
+            status=appointment.status,
+        )
+        for appointment in appointments
+    ]
+
+
 async def validate_status_transition(
     db: AsyncSession,
     appointment: Appointment,
@@ -390,7 +410,8 @@ async def create_appointment(
     )
 
     # Increment appointment creation metric
-    appointments_created_total.labels(workspace_id=str(workspace_id)).inc()
+    appointments_created_total.inc()
+    record_tenant_usage("appointments_created", workspace_id)
 
     return response_data
 
@@ -552,47 +573,197 @@ async def check_appointment_conflicts(
         else None,
     )
 
-    # Check for conflicts
-    conflicts = await check_conflicts(
-        db=db,
-        workspace_id=workspace_id,
-        scheduled_start=scheduled_start,
-        scheduled_end=scheduled_end,
-        exclude_appointment_id=exclude_appointment_id,
+    # Check for conflicts (clients loaded for privacy-preserving initials)
+    conflicts = (
+        await find_conflicts(
+            db,
+            workspace_id,
+            [ProposedInterval(scheduled_start, scheduled_end)],
+            exclude_appointment_ids=[exclude_appointment_id]
+            if exclude_appointment_id
+            else (),
+            load_clients=True,
+        )
+    )[0]
+
+    return ConflictCheckResponse(
+        has_conflict=len(conflicts) > 0,
+        conflicting_appointments=build_conflict_details(conflicts),
     )
 
-    # Load client relationships for conflicts and build privacy-preserving response
-    if conflicts:
-        conflict_ids = [c.id for c in conflicts]
-        query = (
-            select(Appointment)
-            .where(Appointment.id.in_(conflict_ids))
-            .options(selectinload(Appointment.client))
+
+@router.post("/conflicts", response_model=BatchConflictCheckResponse)
+async def check_appointment_conflicts_batch(
+    request: BatchConflictCheckRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> BatchConflictCheckResponse:
+    """
+    Check many proposed time slots for conflicts in one query.
+
+    Used by the frontend to validate a recurring series or a multi-appointment
+    reschedule before submission. Each interval is checked against existing
+    appointments and against the other intervals in the request.
+
+    SECURITY: Only checks conflicts within the authenticated user's workspace
+    (from JWT).
+
+    Args:
+        request: Proposed intervals and appointments to exclude (being moved)
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+
+    Returns:
+        Per-interval conflict results in request order
+
+    Raises:
+        HTTPException: 401 if not authenticated,
+            422 if an interval is invalid or too many intervals are given
+    """
+    workspace_id = current_user.workspace_id
+    intervals = [
+        ProposedInterval(interval.scheduled_start, interval.scheduled_end)
+        for interval in request.intervals
+    ]
+
+    logger.debug(
+        "batch_conflict_check_started",
+        workspace_id=str(workspace_id),
+        interval_count=len(intervals),
+        exclude_count=len(request.exclude_appointment_ids),
+    )
+
+    conflicts = await find_conflicts(
+        db,
+        workspace_id,
+        intervals,
+        exclude_appointment_ids=request.exclude_appointment_ids,
+        load_clients=True,
+    )
+    overlaps = find_overlapping_intervals(intervals)
+
+    results = [
+        IntervalConflictResult(
+            index=index,
+            scheduled_start=interval.scheduled_start,
+            scheduled_end=interval.scheduled_end,
+            has_conflict=bool(conflicts[index] or overlaps[index]),
+            conflicting_appointments=build_conflict_details(conflicts[index]),
+            overlapping_intervals=overlaps[index],
         )
-        result = await db.execute(query)
-        conflicts_with_clients = result.scalars().all()
+        for index, interval in enumerate(intervals)
+    ]
 
-        # Build response items with client initials (privacy-preserving)
-        conflict_responses = []
-        for appointment in conflicts_with_clients:
-            client_initials = (
-                get_client_initials(appointment.client) if appointment.client else "?"
-            )
-            conflict_detail = ConflictingAppointmentDetail(
-                id=appointment.id,
-                scheduled_start=appointment.scheduled_start,
-                scheduled_end=appointment.scheduled_end,
-                client_initials=client_initials,
-                location_type=appointment.location_type,
-                status=appointment.status,
-            )
-            conflict_responses.append(conflict_detail)
-    else:
-        conflict_responses = []
+    return BatchConflictCheckResponse(
+        has_conflict=any(result.has_conflict for result in results),
+        results=results,
+    )
 
-    return ConflictCheckResponse(
-        has_conflict=len(conflicts) > 0,
-        conflicting_appointments=conflict_responses,
+
+@router.get("/availability", response_model=AvailabilityResponse)
+async def get_availability(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    start_date: datetime = Query(
+        ..., description="Window start (inclusive; UTC if no offset is given)"
+    ),
+    end_date: datetime = Query(
+        ..., description="Window end (exclusive; UTC if no offset is given)"
+    ),
+    location_id: uuid.UUID | None = Query(
+        None, description="Only count appointments at this saved location"
+    ),
+    slot_minutes: int | None = Query(
+        None, ge=5, le=480, description="Return open slots of this length"
+    ),
+    slot_step_minutes: int | None = Query(
+        None,
+        ge=5,
+        le=480,
+        description="Minutes between open slot starts (default: slot_minutes)",
+    ),
+) -> AvailabilityResponse:
+    """
+    Get free/busy availability for a date range.
+
+    Replaces paging through the appointment list to build calendar
+    availability: one query over appointment times only (no client data is
+    loaded or decrypted), merged into busy intervals, free gaps and
+    optionally open slots of a requested duration.
+
+    SECURITY: Only includes appointments in the authenticated user's
+    workspace (from JWT).
+
+    Args:
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        start_date: Window start (inclusive; naive values are taken as UTC)
+        end_date: Window end (exclusive; naive values are taken as UTC)
+        location_id: Only count appointments at this saved location
+        slot_minutes: Length of open slots to return
+        slot_step_minutes: Minutes between open slot starts
+
+    Returns:
+        Busy intervals, free intervals and (if requested) open slots
+
+    Raises:
+        HTTPException: 401 if not authenticated,
+            422 if the window is empty or longer than 62 days
+    """
+    workspace_id = current_user.workspace_id
+
+    # Appointment times are timezone-aware; comparing them with naive bounds
+    # would raise TypeError
+    if start_date.tzinfo is None:
+        start_date = start_date.replace(tzinfo=UTC)
+    if end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=UTC)
+
+    if end_date <= start_date:
+        raise HTTPException(
+            status_code=422,
+            detail="end_date must be after start_date",
+        )
+    if end_date - start_date > MAX_AVAILABILITY_WINDOW:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"Availability window cannot exceed {MAX_AVAILABILITY_WINDOW.days} days"
+            ),
+        )
+
+    busy = await get_busy_intervals(
+        db, workspace_id, start_date, end_date, location_id=location_id
+    )
+    free = get_free_intervals(busy, start_date, end_date)
+
+    slots = None
+    slots_truncated = False
+    if slot_minutes:
+        step = timedelta(minutes=slot_step_minutes or slot_minutes)
+        slots = get_open_slots(
+            free, timedelta(minutes=slot_minutes), step, limit=MAX_OPEN_SLOTS + 1
+        )
+        slots_truncated = len(slots) > MAX_OPEN_SLOTS
+        slots = slots[:MAX_OPEN_SLOTS]
+
+    logger.debug(
+        "availability_computed",
+        workspace_id=str(workspace_id),
+        busy_count=len(busy),
+        free_count=len(free),
+        slot_count=len(slots) if slots is not None else None,
+    )
+
+    return AvailabilityResponse(
+        start=start_date,
+        end=end_date,
+        busy=[AvailabilityInterval.model_validate(interval) for interval in busy],
+        free=[AvailabilityInterval.model_validate(interval) for interval in free],
+        slots=[AvailabilityInterval.model_validate(slot) for slot in slots]
+        if slots is not None
+        else None,
+        slots_truncated=slots_truncated,
     )
 
 
@@ -829,10 +1000,8 @@ async def update_appointment(
         # In the future, we can add a cancellation_reason field to the model
         cancellation_reason = "therapist_cancelled"  # Default reason
 
-        appointments_cancelled_total.labels(
-            workspace_id=str(workspace_id),
-            reason=cancellation_reason,
-        ).inc()
+        appointments_cancelled_total.labels(reason=cancellation_reason).inc()
+        record_tenant_usage("appointments_cancelled", workspace_id)
 
         logger.info(
             "appointment_cancellation_metric_incremented",
@@ -0,0 +1,265 @@
+"""Direct-to-storage attachment upload endpoints.
+
+Two-phase alternative to the multipart upload endpoints: file bytes go from
+the browser straight to object storage (quarantine prefix) and are
+validated, scanned, sanitized and promoted by a background job. See
+services/attachment_upload_service.py.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import redis.asyncio as redis
+from arq.connections import ArqRedis
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.api.deps import get_arq_pool, get_current_user, get_db, get_or_404
+from pazpaz.core.logging import get_logger
+from pazpaz.core.rate_limiting import check_rate_limit_redis
+from pazpaz.core.redis import get_redis
+from pazpaz.models.client import Client
+from pazpaz.models.session import Session
+from pazpaz.models.session_attachment import SessionAttachment
+from pazpaz.models.user import User
+from pazpaz.schemas.session_attachment import (
+    AttachmentUploadRequest,
+    AttachmentUploadResponse,
+    AttachmentUploadStatusResponse,
+    SessionAttachmentResponse,
+)
+from pazpaz.services.attachment_preview_service import preview_urls
+from pazpaz.services.attachment_upload_service import (
+    UPLOAD_URL_EXPIRATION_SECONDS,
+    AttachmentUpload,
+    AttachmentUploadStatus,
+    create_attachment_upload,
+    get_attachment_upload,
+    submit_attachment_upload,
+)
+from pazpaz.utils.file_upload import S3ClientError
+from pazpaz.utils.file_validation import (
+    FileSizeExceededError,
+    FileValidationError,
+    UnsupportedFileTypeError,
+)
+
+router = APIRouter(prefix="/attachments/uploads", tags=["attachment-uploads"])
+logger = get_logger(__name__)
+
+
+async def _status_response(
+    db: AsyncSession, upload: AttachmentUpload
+) -> AttachmentUploadStatusResponse:
+    """Build the status response, loading the attachment once created."""
+    attachment = None
+    if upload.attachment_id is not None:
+        result = await db.execute(
+            select(SessionAttachment).where(
+                SessionAttachment.id == upload.attachment_id,
+                SessionAttachment.workspace_id == upload.workspace_id,
+                SessionAttachment.deleted_at.is_(None),
+            )
+        )
+        row = result.scalar_one_or_none()
+        if row is not None:
+            attachment = SessionAttachmentResponse.model_validate(
+                {
+                    **SessionAttachmentResponse.model_validate(row).model_dump(),
+                    **preview_urls(row),
+                }
+            )
+
+    return AttachmentUploadStatusResponse(
+        upload_id=uuid.UUID(upload.id),
+        status=upload.status.value,
+        attachment=attachment,
+        error=upload.error,
+    )
+
+
+@router.post("", response_model=AttachmentUploadResponse, status_code=201)
+async def start_attachment_upload(
+    upload_data: AttachmentUploadRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+) -> AttachmentUploadResponse:
+    """
+    Start a direct upload of a session or client attachment.
+
+    Returns a pre-signed PUT URL for a quarantine location. The file is not
+    an attachment until the complete endpoint has been called and it has
+    passed validation, malware scanning and sanitization.
+
+    Args:
+        upload_data: Target (session or client), filename, type and size
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        redis_client: Redis client (rate limiting, upload state)
+
+    Returns:
+        Upload ID, pre-signed URL and the headers the PUT must include
+
+    Raises:
+        HTTPException:
+            - 404 if session/client not found or wrong workspace
+            - 413 if declared size exceeds the limit
+            - 415 if file type not allowed
+            - 422 if type and extension do not match
+            - 429 if rate limit exceeded (10 uploads/minute, shared with
+              multipart uploads)
+    """
+    workspace_id = current_user.workspace_id
+
+    # Same limit (and key) as the multipart upload endpoints
+    max_uploads_per_minute = 10
+    is_allowed = await check_rate_limit_redis(
+        redis_client=redis_client,
+        key=f"attachment_upload:{current_user.id}",
+        max_requests=max_uploads_per_minute,
+        window_seconds=60,
+    )
+    if not is_allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=(
+                f"Upload rate limit exceeded. "
+                f"Maximum {max_uploads_per_minute} uploads per minute."
+            ),
+        )
+
+    # Verify the target belongs to the workspace
+    if upload_data.session_id is not None:
+        session = await get_or_404(db, Session, upload_data.session_id, workspace_id)
+        client_id = session.client_id
+    else:
+        client = await get_or_404(db, Client, upload_data.client_id, workspace_id)
+        client_id = client.id
+
+    try:
+        upload, upload_url, headers = await create_attachment_upload(
+            redis_client,
+            workspace_id=workspace_id,
+            user_id=current_user.id,
+            client_id=client_id,
+            session_id=upload_data.session_id,
+            filename=upload_data.filename,
+            content_type=upload_data.content_type,
+            size_bytes=upload_data.size_bytes,
+        )
+    except FileSizeExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e)
+        ) from e
+    except UnsupportedFileTypeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        ) from e
+    except FileValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        ) from e
+    except S3ClientError as e:
+        logger.error("attachment_upload_url_failed", error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate upload URL",
+        ) from e
+
+    return AttachmentUploadResponse(
+        upload_id=uuid.UUID(upload.id),
+        upload_url=upload_url,
+        headers=headers,
+        expires_in_seconds=UPLOAD_URL_EXPIRATION_SECONDS,
+    )
+
+
+@router.post(
+    "/{upload_id}/complete",
+    response_model=AttachmentUploadStatusResponse,
+    status_code=202,
+)
+async def complete_attachment_upload(
+    upload_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+    arq_pool: ArqRedis = Depends(get_arq_pool),
+) -> AttachmentUploadStatusResponse:
+    """
+    Signal that the file has been uploaded; queue it for processing.
+
+    Idempotent: calling it again returns the current status.
+
+    Args:
+        upload_id: Upload UUID
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        redis_client: Redis client
+        arq_pool: arq pool (for the processing job)
+
+    Returns:
+        Upload status (poll GET /attachments/uploads/{upload_id})
+
+    Raises:
+        HTTPException: 404 if upload not found, expired or wrong workspace
+    """
+    upload = await get_attachment_upload(
+        redis_client, str(upload_id), current_user.workspace_id
+    )
+    if upload is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found"
+        )
+
+    if upload.status == AttachmentUploadStatus.PENDING and (
+        await submit_attachment_upload(redis_client, upload.id)
+    ):
+        await arq_pool.enqueue_job(
+            "process_attachment_upload",
+            upload_id=upload.id,
+            _job_id=f"attachment_upload:{upload.id}",
+        )
+        logger.info(
+            "attachment_upload_submitted",
+            upload_id=upload.id,
+            workspace_id=str(upload.workspace_id),
+        )
+        upload = await get_attachment_upload(redis_client, upload.id)
+
+    return await _status_response(db, upload)
+
+
+@router.get("/{upload_id}", response_model=AttachmentUploadStatusResponse)
+async def get_attachment_upload_status(
+    upload_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+) -> AttachmentUploadStatusResponse:
+    """
+    Get the status of a direct upload.
+
+    Args:
+        upload_id: Upload UUID
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        redis_client: Redis client
+
+    Returns:
+        Upload status; includes the attachment once completed
+
+    Raises:
+        HTTPException: 404 if upload not found, expired or wrong workspace
+    """
+    upload = await get_attachment_upload(
+        redis_client, str(upload_id), current_user.workspace_id
+    )
+    if upload is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found"
+        )
+    return await _status_response(db, upload)
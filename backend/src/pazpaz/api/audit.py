@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
@@ -23,6 +23,9 @@ from pazpaz.utils.pagination import (
 router = APIRouter(prefix="/audit-events", tags=["audit"])
 logger = get_logger(__name__)
 
+# Longest window accepted by the recent_days filter
+MAX_AUDIT_RECENT_DAYS = 3650
+
 
 @router.get("", response_model=AuditEventListResponse)
 async def list_audit_events(
@@ -40,6 +43,16 @@ async def list_audit_events(
     end_date: datetime | None = Query(
         None, description="Filter events on or before this date"
     ),
+    recent_days: int | None = Query(
+        None,
+        ge=1,
+        le=MAX_AUDIT_RECENT_DAYS,
+        description=(
+            "Only events from the last N days before end_date (or now); "
+            "ignored if start_date is given. Bounded windows only scan the "
+            "matching monthly partitions."
+        ),
+    ),
     phi_only: bool = Query(False, description="Filter to only PHI access events"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -48,7 +61,9 @@ async def list_audit_events(
     List audit events for the workspace with optional filters.
 
     Returns a paginated list of audit events, ordered by created_at descending.
-    All results are scoped to the authenticated workspace.
+    All results are scoped to the authenticated workspace. Without start_date
+    or recent_days, all retained (non-archived) events are listed; passing a
+    window lets the query skip older monthly partitions.
 
     SECURITY:
     - Requires JWT authentication
@@ -70,6 +85,8 @@ async def list_audit_events(
         action: Filter by action type (CREATE, READ, UPDATE, DELETE)
         start_date: Filter events on or after this date
         end_date: Filter events on or before this date
+        recent_days: Only events from the last N days before end_date (or
+            now); ignored if start_date is given
         phi_only: If True, only show PHI access events (Client/Session/PlanOfCare reads)
         current_user: Authenticated user (from JWT token)
         db: Database session
@@ -86,6 +103,7 @@ async def list_audit_events(
         - GET /api/v1/audit-events?resource_type=Client&phi_only=true
         - GET /api/v1/audit-events?start_date=2025-01-01T00:00:00Z
           &end_date=2025-12-31T23:59:59Z
+        - GET /api/v1/audit-events?recent_days=90
     """
     # Extract workspace_id from authenticated user
     workspace_id = current_user.workspace_id
@@ -117,10 +135,14 @@ async def list_audit_events(
             "action": action.value if action else None,
             "start_date": start_date.isoformat() if start_date else None,
             "end_date": end_date.isoformat() if end_date else None,
+            "recent_days": recent_days,
             "phi_only": phi_only,
         },
     )
 
+    if start_date is None and recent_days is not None:
+        start_date = (end_date or datetime.now(UTC)) - timedelta(days=recent_days)
+
     # Calculate offset using utility
     offset = calculate_pagination_offset(page, page_size)
 
@@ -7,10 +7,11 @@ import uuid
 from typing import Annotated
 
 import redis.asyncio as redis
+from arq.connections import ArqRedis
 from fastapi import APIRouter, Cookie, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pazpaz.api.deps import get_current_user
+from pazpaz.api.deps import get_arq_pool, get_current_user
 from pazpaz.core.config import settings
 from pazpaz.core.logging import get_logger
 from pazpaz.core.redis import get_redis
@@ -32,6 +33,7 @@ from pazpaz.schemas.auth import (
     UserInToken,
 )
 from pazpaz.services.auth_service import request_magic_link, verify_magic_link_token
+from pazpaz.services.email_outbox_service import notify_email_outbox
 from pazpaz.services.platform_onboarding_service import (
     ExpiredInvitationTokenError,
     InvalidInvitationTokenError,
@@ -74,10 +76,14 @@ async def request_magic_link_endpoint(
     request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     redis_client: Annotated[redis.Redis, Depends(get_redis)],
+    arq_pool: Annotated[ArqRedis, Depends(get_arq_pool)],
 ) -> MagicLinkResponse:
     """
     Request a magic link login email with enhanced protection.
 
+    The email is queued in the email outbox and delivered by the arq worker,
+    so response time does not depend on SMTP latency.
+
     Rate limited by:
     - IP address: 3 requests per hour (handled by request_magic_link service)
     - Email address: 5 requests per hour (prevents email bombing attacks)
@@ -118,6 +124,10 @@ async def request_magic_link_endpoint(
         request_ip=client_ip,
     )
 
+    # Wake the outbox drain (also runs when nothing was queued, so response
+    # timing does not reveal whether the email exists)
+    await notify_email_outbox(arq_pool)
+
     # Always return success to prevent email enumeration
     return MagicLinkResponse()
 
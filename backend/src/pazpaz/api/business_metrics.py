@@ -1,7 +1,9 @@
 """Custom business metrics for Prometheus.
 
 These metrics track key business events in PazPaz (appointments, sessions).
-All metrics are workspace-scoped to support multi-tenancy analytics.
+Labels are bounded (no workspace_id), so series count does not grow with
+tenants; per-workspace counts are rolled up by
+pazpaz.monitoring.tenant_metrics and exported at /metrics/tenants.
 
 HIPAA Compliance:
 - Metrics use workspace_id UUID only (no PII)
@@ -9,15 +11,17 @@ HIPAA Compliance:
 - Aggregations safe for external monitoring
 """
 
-from datetime import UTC, datetime, timedelta
+from __future__ import annotations
 
-from prometheus_client import REGISTRY, Counter, Gauge
-from sqlalchemy import select, union
-from sqlalchemy.sql import func
+import time
 
-from pazpaz.models.appointment import Appointment
-from pazpaz.models.client import Client
-from pazpaz.models.session import Session
+from prometheus_client import Counter, Gauge
+
+from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
+from pazpaz.services.platform_stats_service import load_platform_stats
+
+logger = get_logger(__name__)
 
 # =============================================================================
 # Appointment Metrics
@@ -26,16 +30,12 @@ from pazpaz.models.session import Session
 appointments_created_total = Counter(
     "appointments_created_total",
     "Total appointments created",
-    ["workspace_id"],  # No PII, just workspace UUID
 )
 
 appointments_cancelled_total = Counter(
     "appointments_cancelled_total",
     "Total appointments cancelled",
-    [
-        "workspace_id",
-        "reason",
-    ],  # reason: "client_request", "therapist_cancelled", "no_show"
+    ["reason"],  # reason: "client_request", "therapist_cancelled", "no_show"
 )
 
 # =============================================================================
@@ -45,7 +45,6 @@ appointments_cancelled_total = Counter(
 session_notes_saved_total = Counter(
     "session_notes_saved_total",
     "Total SOAP session notes saved",
-    ["workspace_id"],
 )
 
 # =============================================================================
@@ -55,6 +54,7 @@ session_notes_saved_total = Counter(
 active_websocket_sessions = Gauge(
     "active_websocket_sessions",
     "Number of active WebSocket connections (real-time updates)",
+    multiprocess_mode="livesum",
 )
 
 # Note: This gauge is updated by WebSocket connection handlers
@@ -65,134 +65,65 @@ active_websocket_sessions = Gauge(
 # =============================================================================
 
 
-class ActiveWorkspacesCollector:
-    """
-    Custom Prometheus collector for active_workspaces_24h metric.
+# Platform stats are maintained in Redis (activity recorded on write, totals
+# rolled up by the rollup_platform_stats worker task) and copied into these
+# gauges when Prometheus scrapes /metrics, so a scrape never queries
+# PostgreSQL. Because the snapshot lives in Redis, the API process exports
+# the same values the worker computed.
+
+active_workspaces_24h = Gauge(
+    "active_workspaces_24h",
+    "Number of workspaces with activity in last 24 hours",
+    multiprocess_mode="mostrecent",
+)
+
+platform_workspaces = Gauge(
+    "platform_workspaces",
+    "Number of workspaces (excluding deleted)",
+    multiprocess_mode="mostrecent",
+)
 
-    Calculates the number of workspaces with activity in the last 24 hours
-    on-demand when Prometheus scrapes the /metrics endpoint.
+platform_active_users = Gauge(
+    "platform_active_users",
+    "Number of active users across all workspaces",
+    multiprocess_mode="mostrecent",
+)
 
-    This avoids the multi-process issue where ARQ worker and API server have
-    separate metric registries.
+platform_stats_age_seconds = Gauge(
+    "platform_stats_age_seconds",
+    "Age of the platform stats snapshot exported by the gauges above",
+    multiprocess_mode="mostrecent",
+)
+
+
+async def update_platform_stats_metrics() -> None:
     """
+    Copy the platform stats snapshot from Redis into the gauges.
+
+    Called by the /metrics endpoint before generating output. If no
+    snapshot is stored (or Redis is unavailable), the gauges keep their
+    previous values, so the endpoint never fails because of Redis.
+    """
+    try:
+        stats = await load_platform_stats(await get_redis())
+    except Exception as e:
+        logger.warning("platform_stats_metrics_unavailable", error=str(e))
+        return
+
+    if stats is None:
+        return
+
+    active_workspaces_24h.set(stats.active_workspaces_24h)
+    platform_workspaces.set(stats.total_workspaces)
+    platform_active_users.set(stats.active_users)
+    platform_stats_age_seconds.set(max(0.0, time.time() - stats.computed_at))
 
-    def __init__(self):
-        """Initialize the collector and register it with Prometheus."""
-        REGISTRY.register(self)
-
-    def collect(self):
-        """
-        Calculate and yield active workspaces metric.
-
-        Called by Prometheus when scraping /metrics endpoint.
-        Runs a database query to count workspaces with recent activity.
-
-        Yields:
-            GaugeMetricFamily: active_workspaces_24h metric with current value
-        """
-        # Import here to avoid circular dependency during module load
-        import asyncio
-        import concurrent.futures
-
-        from prometheus_client.core import GaugeMetricFamily
-
-        # Calculate active workspaces
-        try:
-            # Run async code in separate thread since Prometheus collector
-            # runs in FastAPI's async context where event loop is already running
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, self._count_active_workspaces())
-                count = future.result(timeout=5.0)  # 5 second timeout
-        except Exception:
-            # If query fails, return 0 rather than breaking metrics endpoint
-            count = 0
-
-        # Yield the metric
-        gauge = GaugeMetricFamily(
-            "active_workspaces_24h",
-            "Number of workspaces with activity in last 24 hours",
-        )
-        gauge.add_metric([], count)
-        yield gauge
-
-    async def _count_active_workspaces(self) -> int:
-        """
-        Count workspaces with activity in last 24 hours.
-
-        Returns:
-            Number of distinct workspaces with appointments, sessions,
-            or clients created/updated in last 24 hours.
-        """
-        # Create fresh engine and session for this thread
-        # to avoid asyncpg connection pool issues across threads
-        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-
-        from pazpaz.core.config import settings
-        from pazpaz.db.base import _get_engine_connect_args
-
-        # Create dedicated engine for metrics collection
-        engine = create_async_engine(
-            settings.database_url,
-            pool_pre_ping=True,
-            pool_size=1,  # Minimal pool for metrics
-            max_overflow=0,
-            connect_args=_get_engine_connect_args(),
-        )
-
-        try:
-            session_local = async_sessionmaker(engine, expire_on_commit=False)
-            async with session_local() as db:
-                cutoff_time = datetime.now(UTC) - timedelta(hours=24)
-
-                # Find distinct workspace IDs with any activity in last 24h
-                workspace_ids_appointments = (
-                    select(Appointment.workspace_id)
-                    .where(
-                        (Appointment.created_at >= cutoff_time)
-                        | (Appointment.updated_at >= cutoff_time)
-                    )
-                    .distinct()
-                )
-
-                workspace_ids_sessions = (
-                    select(Session.workspace_id)
-                    .where(
-                        (Session.created_at >= cutoff_time)
-                        | (Session.updated_at >= cutoff_time)
-                    )
-                    .distinct()
-                )
-
-                workspace_ids_clients = (
-                    select(Client.workspace_id)
-                    .where(
-                        (Client.created_at >= cutoff_time)
-                        | (Client.updated_at >= cutoff_time)
-                    )
-                    .distinct()
-                )
-
-                # Union all workspace IDs and count
-                all_active_workspaces = union(
-                    workspace_ids_appointments,
-                    workspace_ids_sessions,
-                    workspace_ids_clients,
-                ).subquery()
-
-                stmt = select(func.count()).select_from(all_active_workspaces)
-                result = await db.execute(stmt)
-                return result.scalar() or 0
-        finally:
-            # Clean up engine connections
-            await engine.dispose()
-
-
-# Initialize the collector (registers itself with Prometheus)
-_active_workspaces_collector = ActiveWorkspacesCollector()
 
 __all__ = [
     "appointments_created_total",
     "appointments_cancelled_total",
     "session_notes_saved_total",
     "active_websocket_sessions",
+    "active_workspaces_24h",
+    "update_platform_stats_metrics",
 ]
@@ -23,11 +23,13 @@ from datetime import UTC, datetime, timedelta
 from io import BytesIO
 
 import redis.asyncio as redis
+from arq.connections import ArqRedis
 from fastapi import (
     APIRouter,
     Depends,
     File,
     HTTPException,
+    Query,
     Request,
     UploadFile,
     status,
@@ -36,7 +38,7 @@ from fastapi.responses import Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pazpaz.api.deps import get_current_user, get_db, get_or_404
+from pazpaz.api.deps import get_arq_pool, get_current_user, get_db, get_or_404
 from pazpaz.core.logging import get_logger
 from pazpaz.core.rate_limiting import check_rate_limit_redis
 from pazpaz.core.redis import get_redis
@@ -46,17 +48,29 @@ from pazpaz.models.session import Session
 from pazpaz.models.session_attachment import SessionAttachment
 from pazpaz.models.user import User
 from pazpaz.schemas.session_attachment import (
+    AttachmentDownloadUrl,
+    AttachmentDownloadUrlsResponse,
     AttachmentRenameRequest,
     BulkDownloadRequest,
     SessionAttachmentListResponse,
     SessionAttachmentResponse,
 )
-from pazpaz.utils.file_sanitization import prepare_file_for_storage
+from pazpaz.services.attachment_preview_service import (
+    attachment_urls,
+    enqueue_attachment_previews,
+    preview_urls,
+)
+from pazpaz.services.attachment_storage_service import (
+    copy_existing_previews,
+    release_attachment_content,
+    store_attachment_content,
+)
+from pazpaz.services.attachment_upload_service import CLIENT_ATTACHMENTS_MAX_TOTAL_BYTES
+from pazpaz.utils.file_processing import process_upload
+from pazpaz.utils.file_sanitization import SanitizationError
 from pazpaz.utils.file_upload import (
     delete_file_from_s3,
     generate_presigned_download_url,
-    generate_secure_filename,
-    upload_file_to_s3,
 )
 from pazpaz.utils.file_validation import (
     FileContentError,
@@ -64,13 +78,8 @@ from pazpaz.utils.file_validation import (
     FileValidationError,
     MimeTypeMismatchError,
     UnsupportedFileTypeError,
-    validate_file,
-)
-from pazpaz.utils.storage_quota import (
-    StorageQuotaExceededError,
-    update_workspace_storage,
-    validate_workspace_storage_quota,
 )
+from pazpaz.utils.storage_quota import StorageQuotaExceededError
 
 router = APIRouter(prefix="/clients", tags=["client-attachments"])
 logger = get_logger(__name__)
@@ -88,6 +97,7 @@ async def upload_client_attachment(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
+    arq_pool: ArqRedis = Depends(get_arq_pool),
 ) -> SessionAttachmentResponse:
     """
     Upload file attachment for a client (not tied to specific session).
@@ -115,6 +125,7 @@ async def upload_client_attachment(
         current_user: Authenticated user (from JWT token)
         db: Database session
         redis_client: Redis client (for rate limiting)
+        arq_pool: arq pool (for thumbnail/preview generation)
 
     Returns:
         Created attachment metadata (id, filename, size, content_type, created_at)
@@ -204,11 +215,8 @@ async def upload_client_attachment(
     existing_total_size = sum(att.file_size_bytes for att in existing_attachments)
 
     # Validate file and total size (100 MB limit for client-level files)
-    max_client_total_size = 100 * 1024 * 1024  # 100 MB
+    max_client_total_size = CLIENT_ATTACHMENTS_MAX_TOTAL_BYTES
     try:
-        # Validate individual file size
-        file_type = validate_file(file.filename, file_content)
-
         # Validate total attachments size for client
         if existing_total_size + file_size > max_client_total_size:
             max_mb = max_client_total_size // (1024 * 1024)
@@ -219,6 +227,10 @@ async def upload_client_attachment(
                 f"Current: {current_mb} MB, New file: {new_mb} MB"
             )
 
+        # Triple validation (MIME type, extension, content), malware scan and
+        # metadata stripping, in the file processing pool
+        processed = await process_upload(file.filename, file_content)
+
     except FileSizeExceededError as e:
         logger.warning(
             "client_file_upload_rejected_size",
@@ -281,15 +293,7 @@ async def upload_client_attachment(
             detail=f"File validation failed: {e}",
         ) from e
 
-    # Sanitize file (strip EXIF metadata, sanitize filename)
-    try:
-        sanitized_content, safe_filename = prepare_file_for_storage(
-            file_content=file_content,
-            filename=file.filename,
-            file_type=file_type,
-            strip_metadata=True,
-        )
-    except Exception as e:
+    except SanitizationError as e:
         logger.error(
             "file_sanitization_failed",
             client_id=str(client_id),
@@ -301,21 +305,15 @@ async def upload_client_attachment(
             detail=f"File sanitization failed: {e}",
         ) from e
 
-    # Generate secure S3 key (UUID-based, no user input)
-    # Use None for session_id to indicate client-level file
-    s3_key = generate_secure_filename(
-        workspace_id=workspace_id,
-        session_id=None,  # Client-level file
-        file_type=file_type,
-        client_id=client_id,
-    )
-
-    # STORAGE QUOTA: Validate BEFORE S3 upload (fail fast)
+    # STORAGE QUOTA + DEDUPLICATION: Reference identical content the
+    # workspace already stores, or reserve quota (locks workspace row) and
+    # upload to S3/MinIO with encryption verification
     try:
-        await validate_workspace_storage_quota(
-            workspace_id=workspace_id,
-            new_file_size=len(sanitized_content),
-            db=db,
+        blob, blob_created = await store_attachment_content(
+            db,
+            workspace_id,
+            processed,
+            client_id=client_id,  # Client-level file (no session)
         )
     except StorageQuotaExceededError as e:
         logger.warning(
@@ -323,9 +321,10 @@ async def upload_client_attachment(
             client_id=str(client_id),
             workspace_id=str(workspace_id),
             filename=file.filename,
-            file_size=len(sanitized_content),
+            file_size=len(processed.content),
             reason=str(e),
         )
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_507_INSUFFICIENT_STORAGE,
             detail=str(e),
@@ -336,59 +335,52 @@ async def upload_client_attachment(
             workspace_id=str(workspace_id),
             error=str(e),
         )
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workspace not found",
         ) from e
-
-    # Upload to S3/MinIO with encryption verification
-    try:
-        upload_result = upload_file_to_s3(
-            file_content=sanitized_content,
-            s3_key=s3_key,
-            content_type=file_type.value,
-        )
-        encryption_metadata = upload_result.get("encryption_metadata")
     except Exception as e:
         logger.error(
             "s3_upload_failed",
             client_id=str(client_id),
             filename=file.filename,
-            s3_key=s3_key,
             error=str(e),
         )
+        # Rollback transaction (releases reserved quota)
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"File upload failed: {e}",
         ) from e
 
+    s3_key = blob.s3_key
+    encryption_metadata = blob.encryption_metadata
+
     # Create database record (session_id is NULL for client-level files)
     attachment = SessionAttachment(
         session_id=None,  # NULL = client-level file
         client_id=client_id,
         workspace_id=workspace_id,
-        file_name=safe_filename,
-        file_type=file_type.value,
-        file_size_bytes=len(sanitized_content),
+        file_name=processed.filename,
+        file_type=processed.file_type.value,
+        file_size_bytes=len(processed.content),
         s3_key=s3_key,
+        blob_id=blob.id,
         uploaded_by_user_id=current_user.id,
         encryption_metadata=encryption_metadata,  # Store encryption verification metadata
     )
+    if not blob_created:
+        # Identical content: its thumbnail and preview already exist
+        await copy_existing_previews(db, attachment)
 
     db.add(attachment)
 
+    # Commit transaction (quota reservation becomes permanent)
     try:
         await db.commit()
         await db.refresh(attachment)
 
-        # STORAGE QUOTA: Update workspace storage usage AFTER successful commit
-        await update_workspace_storage(
-            workspace_id=workspace_id,
-            bytes_delta=len(sanitized_content),  # Positive delta for upload
-            db=db,
-        )
-        await db.commit()  # Commit storage usage update
-
     except Exception as e:
         logger.error(
             "client_attachment_db_commit_failed",
@@ -396,16 +388,20 @@ async def upload_client_attachment(
             s3_key=s3_key,
             error=str(e),
         )
-        # Cleanup: Delete uploaded S3 object
-        try:
-            delete_file_from_s3(s3_key)
-            logger.info("s3_cleanup_successful", s3_key=s3_key)
-        except Exception as cleanup_error:
-            logger.error(
-                "s3_cleanup_failed",
-                s3_key=s3_key,
-                error=str(cleanup_error),
-            )
+        # Rollback transaction (releases reserved quota and blob reference)
+        await db.rollback()
+
+        # Cleanup: Delete uploaded S3 object (shared content stays)
+        if blob_created:
+            try:
+                delete_file_from_s3(s3_key)
+                logger.info("s3_cleanup_successful", s3_key=s3_key)
+            except Exception as cleanup_error:
+                logger.error(
+                    "s3_cleanup_failed",
+                    s3_key=s3_key,
+                    error=str(cleanup_error),
+                )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save attachment metadata",
@@ -416,11 +412,12 @@ async def upload_client_attachment(
         attachment_id=str(attachment.id),
         client_id=str(client_id),
         workspace_id=str(workspace_id),
-        filename=safe_filename,
-        file_type=file_type.value,
-        file_size=len(sanitized_content),
+        filename=processed.filename,
+        file_type=processed.file_type.value,
+        file_size=len(processed.content),
         s3_key=s3_key,
         is_client_level=True,
+        deduplicated=not blob_created,
         encryption_verified=True,
         encryption_algorithm=encryption_metadata.get("algorithm")
         if encryption_metadata
@@ -428,6 +425,9 @@ async def upload_client_attachment(
     )
 
     # Return response with is_session_file=False
+    # Thumbnails and previews are generated in the background
+    await enqueue_attachment_previews(arq_pool, attachment)
+
     return SessionAttachmentResponse.model_validate(
         {
             **SessionAttachmentResponse.model_validate(attachment).model_dump(),
@@ -527,6 +527,7 @@ async def list_client_attachments(
         SessionAttachmentResponse.model_validate(
             {
                 **SessionAttachmentResponse.model_validate(att).model_dump(),
+                **preview_urls(att),
                 "session_date": session_date,
                 "is_session_file": att.session_id is not None,
             }
@@ -540,6 +541,99 @@ async def list_client_attachments(
     )
 
 
+@router.get(
+    "/{client_id}/attachments/download-urls",
+    response_model=AttachmentDownloadUrlsResponse,
+)
+async def get_client_attachment_download_urls(
+    client_id: uuid.UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    expires_in_minutes: int = Query(15, ge=1, le=60),
+) -> AttachmentDownloadUrlsResponse:
+    """
+    Generate pre-signed download URLs for all attachments of a client.
+
+    Includes both session-level and client-level attachments. Batch
+    alternative to the per-attachment download endpoints for galleries: one request (one auth check, one query, one audit event)
+    instead of one per attachment. Includes thumbnail and preview URLs.
+
+    Args:
+        client_id: UUID of the client
+        request: FastAPI request (audit metadata)
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        expires_in_minutes: Minimum URL lifetime in minutes (default: 15, max: 60)
+
+    Returns:
+        URLs per attachment, newest first
+
+    Raises:
+        HTTPException:
+            - 401 if not authenticated
+            - 404 if client not found or wrong workspace
+            - 422 if expires_in_minutes is out of range
+            - 500 if URL generation fails
+    """
+    workspace_id = current_user.workspace_id
+
+    # Verify client exists and belongs to workspace
+    await get_or_404(db, Client, client_id, workspace_id)
+
+    query = (
+        select(SessionAttachment)
+        .where(
+            SessionAttachment.client_id == client_id,
+            SessionAttachment.workspace_id == workspace_id,
+            SessionAttachment.deleted_at.is_(None),
+        )
+        .order_by(SessionAttachment.created_at.desc())
+    )
+    result = await db.execute(query)
+    attachments = result.scalars().all()
+
+    expiration = timedelta(minutes=expires_in_minutes)
+    try:
+        items = [
+            AttachmentDownloadUrl(
+                attachment_id=att.id,
+                file_name=att.file_name,
+                file_type=att.file_type,
+                **attachment_urls(att, expiration),
+            )
+            for att in attachments
+        ]
+    except Exception as e:
+        logger.error(
+            "client_presigned_urls_generation_failed",
+            client_id=str(client_id),
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate download URLs",
+        ) from e
+
+    # Audit which files were made accessible (one event for the batch)
+    request.state.audit_metadata = {
+        "attachment_ids": [str(item.attachment_id) for item in items],
+    }
+
+    logger.info(
+        "client_attachment_download_urls_generated",
+        client_id=str(client_id),
+        workspace_id=str(workspace_id),
+        attachment_count=len(items),
+        expires_in_minutes=expires_in_minutes,
+    )
+
+    return AttachmentDownloadUrlsResponse(
+        items=items,
+        expires_in_seconds=int(expiration.total_seconds()),
+    )
+
+
 @router.get(
     "/{client_id}/attachments/{attachment_id}/download",
     response_model=dict,
@@ -914,20 +1008,15 @@ async def delete_client_attachment(
     # Soft delete (set deleted_at timestamp)
     attachment.deleted_at = datetime.now(UTC)
 
-    # STORAGE QUOTA: Decrement workspace storage usage (negative delta)
+    # STORAGE QUOTA: Release the attachment's stored content
     file_size_bytes = attachment.file_size_bytes
 
     try:
+        # Decrement shared content reference; quota is released with the
+        # last reference (same transaction as the soft delete)
+        released_bytes = await release_attachment_content(db, attachment)
         await db.commit()
 
-        # Update storage quota AFTER successful soft delete commit
-        await update_workspace_storage(
-            workspace_id=workspace_id,
-            bytes_delta=-file_size_bytes,  # Negative delta for delete
-            db=db,
-        )
-        await db.commit()  # Commit storage usage update
-
     except Exception as e:
         logger.error(
             "client_attachment_delete_commit_failed",
@@ -936,6 +1025,7 @@ async def delete_client_attachment(
             workspace_id=str(workspace_id),
             error=str(e),
         )
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete attachment",
@@ -947,6 +1037,7 @@ async def delete_client_attachment(
         client_id=str(client_id),
         workspace_id=str(workspace_id),
         file_size_bytes=file_size_bytes,
+        released_bytes=released_bytes,
     )
 
     # Note: S3 cleanup is handled by background job
@@ -1,9 +1,15 @@
 """Prometheus metrics endpoint for monitoring."""
 
-from fastapi import APIRouter
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+import redis.asyncio as redis
+from fastapi import APIRouter, Depends
+from prometheus_client import CONTENT_TYPE_LATEST
 from starlette.responses import Response
 
+from pazpaz.api.business_metrics import update_platform_stats_metrics
+from pazpaz.core.redis import get_redis
+from pazpaz.monitoring.prometheus import generate_metrics
+from pazpaz.monitoring.tenant_metrics import render_tenant_metrics
+
 router = APIRouter(tags=["monitoring"])
 
 
@@ -12,22 +18,27 @@ async def metrics():
     """
     Prometheus metrics endpoint.
 
-    Exposes application metrics in Prometheus format for scraping.
+    Exposes application metrics in Prometheus format for scraping. Labels
+    are bounded (no workspace_id); per-workspace detail is served by
+    /metrics/tenants. In multiprocess mode (PROMETHEUS_MULTIPROC_DIR set),
+    metrics of all processes sharing the directory are aggregated.
 
     Metrics include:
-    - audit_events_total: Audit events by resource type, action, workspace
+    - audit_events_total: Audit events by resource type and action
     - audit_failures_total: Audit failures by resource type, action, error
     - audit_latency_seconds: Audit event write latency histogram by action
-    - ai_agent_queries_total: AI agent queries by workspace, language, status
+    - ai_agent_queries_total: AI agent queries by language and status
     - ai_agent_query_duration_seconds: End-to-end query latency histogram
     - ai_agent_embedding_duration_seconds: Embedding generation latency
     - ai_agent_retrieval_duration_seconds: Vector search latency
     - ai_agent_llm_duration_seconds: LLM synthesis latency by model
     - ai_agent_llm_errors_total: LLM API errors by error type
     - ai_agent_llm_tokens_total: Token consumption by model and type
-    - ai_agent_rate_limit_hits_total: Rate limit violations by workspace
+    - ai_agent_rate_limit_hits_total: Rate limit violations
     - ai_agent_sources_retrieved: Number of sources per query
     - ai_agent_citations_returned: Number of citations per query
+    - active_workspaces_24h, platform_workspaces, platform_active_users:
+      Platform stats snapshot read from Redis (no database queries)
 
     Returns:
         Prometheus-formatted metrics text
@@ -39,9 +50,37 @@ async def metrics():
 
         # HELP ai_agent_queries_total Total AI agent queries processed
         # TYPE ai_agent_queries_total counter
-        ai_agent_queries_total{workspace_id="uuid",language="en",status="success"} 150.0
+        ai_agent_queries_total{language="en",status="success"} 150.0
+    """
+    await update_platform_stats_metrics()
+
+    return Response(
+        content=generate_metrics(),
+        media_type=CONTENT_TYPE_LATEST,
+    )
+
+
+@router.get("/metrics/tenants")
+async def tenant_metrics(redis_client: redis.Redis = Depends(get_redis)):
+    """
+    Per-workspace usage for the top workspaces of each metric.
+
+    Exports tenant_<metric>_total{workspace_id} for the top 20 workspaces per
+    metric plus a workspace_id="other" series with the remainder, so the
+    series count stays bounded as tenants are added. Rollups are shared by
+    all API and worker processes (stored in Redis). Scrape at a longer
+    interval than /metrics.
+
+    Returns:
+        Prometheus-formatted metrics text
+
+    Example:
+        # HELP tenant_appointments_created_total Appointments created per workspace
+        # TYPE tenant_appointments_created_total counter
+        tenant_appointments_created_total{workspace_id="uuid"} 42.0
+        tenant_appointments_created_total{workspace_id="other"} 310.0
     """
     return Response(
-        content=generate_latest(),
+        content=await render_tenant_metrics(redis_client),
         media_type=CONTENT_TYPE_LATEST,
     )
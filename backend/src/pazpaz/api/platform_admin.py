@@ -6,26 +6,40 @@ import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
+import redis.asyncio as redis
+from arq.connections import ArqRedis
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, EmailStr, Field, field_validator
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Row, Select, and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pazpaz.api.dependencies.platform_admin import require_platform_admin
-from pazpaz.core.config import settings
+from pazpaz.api.deps import get_arq_pool
 from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
 from pazpaz.db.base import get_db
 from pazpaz.models.audit_event import AuditAction, AuditEvent, ResourceType
 from pazpaz.models.email_blacklist import EmailBlacklist
-from pazpaz.models.user import User
+from pazpaz.models.user import User, UserRole
 from pazpaz.models.workspace import Workspace, WorkspaceStatus
-from pazpaz.services.email_service import send_invitation_email
+from pazpaz.services.email_outbox_service import notify_email_outbox
 from pazpaz.services.platform_onboarding_service import (
     DuplicateEmailError,
     EmailBlacklistedError,
     InvitationNotFoundError,
     PlatformOnboardingService,
     UserAlreadyActiveError,
+    get_invitation_url,
+)
+from pazpaz.services.platform_stats_service import (
+    load_platform_stats,
+    refresh_platform_stats,
+)
+from pazpaz.utils.pagination import (
+    calculate_pagination_offset,
+    calculate_total_pages,
+    get_query_total_count,
+    validate_pagination_params,
 )
 
 logger = get_logger(__name__)
@@ -222,11 +236,12 @@ async def invite_therapist(
     request_data: InviteTherapistRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
     admin: Annotated[User, Depends(require_platform_admin)],
+    arq_pool: Annotated[ArqRedis, Depends(get_arq_pool)],
 ) -> InviteTherapistResponse:
     """
     Invite a new therapist by creating workspace and user account.
 
-    The invitation URL must be sent to the therapist via email.
+    The invitation email is queued in the email outbox and sent by the worker.
     The therapist must accept the invitation within 7 days to activate their account.
 
     Args:
@@ -250,33 +265,11 @@ async def invite_therapist(
             therapist_full_name=request_data.therapist_full_name,
         )
 
-        # Generate invitation URL with frontend URL
-        invitation_url = f"{settings.frontend_url}/accept-invitation?token={token}"
+        invitation_url = get_invitation_url(token)
 
-        # Send invitation email
-        # Handle email errors gracefully - invitation is already created
-        try:
-            await send_invitation_email(
-                email=user.email,
-                invitation_url=invitation_url,
-            )
-            logger.info(
-                "invitation_email_sent_successfully",
-                admin_id=str(admin.id),
-                user_id=str(user.id),
-                email=user.email,
-            )
-        except Exception as e:
-            # Log error but don't block the response
-            # The invitation is valid, admin can manually send the URL
-            logger.error(
-                "invitation_email_failed",
-                admin_id=str(admin.id),
-                user_id=str(user.id),
-                email=user.email,
-                error=str(e),
-                exc_info=True,
-            )
+        # Invitation email was queued in the outbox with the user; wake the
+        # drain (the URL is also returned so the admin can share it manually)
+        await notify_email_outbox(arq_pool)
 
         logger.info(
             "therapist_invited",
@@ -361,12 +354,13 @@ async def resend_invitation(
     user_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
     admin: Annotated[User, Depends(require_platform_admin)],
+    arq_pool: Annotated[ArqRedis, Depends(get_arq_pool)],
 ) -> ResendInvitationResponse:
     """
     Resend invitation to a user who has not yet accepted.
 
     Generates a new invitation token and invalidates the old one.
-    The new invitation URL must be sent to the therapist via email.
+    The new invitation email is queued in the email outbox and sent by the worker.
 
     Args:
         user_id: UUID of the user to resend invitation to
@@ -384,41 +378,11 @@ async def resend_invitation(
     try:
         token = await service.resend_invitation(db=db, user_id=user_id)
 
-        # Get user email for sending email
-        user_result = await db.get(User, user_id)
-        if not user_result:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
+        invitation_url = get_invitation_url(token)
 
-        # Generate invitation URL with frontend URL
-        invitation_url = f"{settings.frontend_url}/accept-invitation?token={token}"
-
-        # Send invitation email
-        # Handle email errors gracefully - invitation token is already regenerated
-        try:
-            await send_invitation_email(
-                email=user_result.email,
-                invitation_url=invitation_url,
-            )
-            logger.info(
-                "resend_invitation_email_sent_successfully",
-                admin_id=str(admin.id),
-                user_id=str(user_id),
-                email=user_result.email,
-            )
-        except Exception as e:
-            # Log error but don't block the response
-            # The new token is valid, admin can manually send the URL
-            logger.error(
-                "resend_invitation_email_failed",
-                admin_id=str(admin.id),
-                user_id=str(user_id),
-                email=user_result.email,
-                error=str(e),
-                exc_info=True,
-            )
+        # New invitation email was queued in the outbox with the token; wake
+        # the drain (the URL is also returned so the admin can share it)
+        await notify_email_outbox(arq_pool)
 
         logger.info(
             "invitation_resent",
@@ -646,7 +610,9 @@ class WorkspaceInfo(BaseModel):
             "status": "active",
             "created_at": "2025-10-01T00:00:00Z",
             "user_count": 1,
-            "session_count": 12
+            "session_count": 12,
+            "storage_used_bytes": 52428800,
+            "storage_quota_bytes": 10737418240
         }
         ```
     """
@@ -660,6 +626,12 @@ class WorkspaceInfo(BaseModel):
     created_at: datetime = Field(..., description="When workspace was created (UTC)")
     user_count: int = Field(..., description="Number of users in workspace")
     session_count: int = Field(..., description="Number of sessions in workspace")
+    storage_used_bytes: int = Field(
+        default=0, description="Storage used by workspace files (bytes)"
+    )
+    storage_quota_bytes: int = Field(
+        default=0, description="Storage quota of the workspace (bytes)"
+    )
 
 
 class WorkspacesResponse(BaseModel):
@@ -676,9 +648,15 @@ class WorkspacesResponse(BaseModel):
                     "status": "active",
                     "created_at": "2025-10-01T00:00:00Z",
                     "user_count": 1,
-                    "session_count": 12
+                    "session_count": 12,
+                    "storage_used_bytes": 52428800,
+                    "storage_quota_bytes": 10737418240
                 }
-            ]
+            ],
+            "total": 1,
+            "page": 1,
+            "page_size": 50,
+            "total_pages": 1
         }
         ```
     """
@@ -686,6 +664,10 @@ class WorkspacesResponse(BaseModel):
     workspaces: list[WorkspaceInfo] = Field(
         default_factory=list, description="List of workspaces"
     )
+    total: int = Field(default=0, description="Workspaces matching the search")
+    page: int = Field(default=1, description="Current page number (1-indexed)")
+    page_size: int = Field(default=50, description="Number of items per page")
+    total_pages: int = Field(default=0, description="Total number of pages")
 
 
 class SuspendWorkspaceRequest(BaseModel):
@@ -839,6 +821,9 @@ class BlacklistActionResponse(BaseModel):
     description="""
     Get platform-wide metrics for dashboard.
 
+    Counts come from a snapshot refreshed every minute by a background job,
+    so they may lag recent changes by up to a minute.
+
     Returns:
     - total_workspaces: Count of all workspaces (excluding deleted)
     - active_users: Count of active users across all workspaces
@@ -856,59 +841,42 @@ class BlacklistActionResponse(BaseModel):
 )
 async def get_metrics(
     db: Annotated[AsyncSession, Depends(get_db)],
+    redis_client: Annotated[redis.Redis, Depends(get_redis)],
     admin: Annotated[User, Depends(require_platform_admin)],
 ) -> PlatformMetrics:
     """
     Get platform-wide metrics.
 
-    Counts workspaces, active users, pending invitations, and blacklisted emails.
+    Reads the snapshot maintained by the rollup_platform_stats worker task
+    (refreshed every minute). Counts are computed and stored here only if no
+    snapshot exists yet.
 
     Args:
         db: Database session (injected)
+        redis_client: Redis client (injected)
         admin: Authenticated platform admin (injected)
 
     Returns:
         PlatformMetrics with current counts
     """
-    # Count workspaces (excluding deleted)
-    workspace_count = await db.scalar(
-        select(func.count(Workspace.id)).where(
-            Workspace.status != WorkspaceStatus.DELETED
-        )
-    )
-
-    # Count active users
-    active_user_count = await db.scalar(
-        select(func.count(User.id)).where(User.is_active == True)  # noqa: E712
-    )
-
-    # Count pending invitations (inactive users with invitation token)
-    pending_invitation_count = await db.scalar(
-        select(func.count(User.id)).where(
-            and_(
-                User.is_active == False,  # noqa: E712
-                User.invitation_token_hash.is_not(None),
-            )
-        )
-    )
-
-    # Count blacklisted emails
-    blacklist_count = await db.scalar(select(func.count(EmailBlacklist.id)))
+    stats = await load_platform_stats(redis_client)
+    if stats is None:
+        stats = await refresh_platform_stats(db, redis_client)
 
     logger.info(
         "platform_metrics_retrieved",
         admin_id=str(admin.id),
-        workspaces=workspace_count or 0,
-        active_users=active_user_count or 0,
-        pending_invitations=pending_invitation_count or 0,
-        blacklisted=blacklist_count or 0,
+        workspaces=stats.total_workspaces,
+        active_users=stats.active_users,
+        pending_invitations=stats.pending_invitations,
+        blacklisted=stats.blacklisted_users,
     )
 
     return PlatformMetrics(
-        total_workspaces=workspace_count or 0,
-        active_users=active_user_count or 0,
-        pending_invitations=pending_invitation_count or 0,
-        blacklisted_users=blacklist_count or 0,
+        total_workspaces=stats.total_workspaces,
+        active_users=stats.active_users,
+        pending_invitations=stats.pending_invitations,
+        blacklisted_users=stats.blacklisted_users,
     )
 
 
@@ -1084,21 +1052,106 @@ def _format_activity_description(event: AuditEvent) -> str:
     return f"{resource} {action.lower()}"
 
 
+def _workspace_info_query(owner_email_hint: str | None = None) -> Select:
+    """
+    Build one query returning each workspace with its owner and counts.
+
+    Owner email, user count and session count are correlated subqueries, so
+    with LIMIT they are evaluated only for the rows of the requested page
+    (index lookups on users.workspace_id and sessions.workspace_id) instead
+    of loading every workspace's users and counting sessions per workspace.
+
+    Only the listed workspace columns are selected, so encrypted workspace
+    settings (bank details, provider config) are never loaded or decrypted.
+
+    The owner is the workspace's user matching owner_email_hint (if given),
+    else the first active OWNER, else the first active user, else any user.
+
+    Args:
+        owner_email_hint: Email to prefer as owner (exact, case-insensitive)
+
+    Returns:
+        Select of workspace columns plus owner_email, user_count and
+        session_count
+    """
+    from pazpaz.models.session import Session
+
+    owner_order = [
+        (User.role == UserRole.OWNER).desc(),
+        User.is_active.desc(),
+        User.created_at,
+        User.id,
+    ]
+    if owner_email_hint:
+        owner_order.insert(0, (func.lower(User.email) == owner_email_hint).desc())
+
+    owner_email = (
+        select(User.email)
+        .where(User.workspace_id == Workspace.id)
+        .order_by(*owner_order)
+        .limit(1)
+        .correlate(Workspace)
+        .scalar_subquery()
+    )
+    user_count = (
+        select(func.count(User.id))
+        .where(User.workspace_id == Workspace.id)
+        .correlate(Workspace)
+        .scalar_subquery()
+    )
+    session_count = (
+        select(func.count(Session.id))
+        .where(Session.workspace_id == Workspace.id)
+        .correlate(Workspace)
+        .scalar_subquery()
+    )
+
+    return select(
+        Workspace.id,
+        Workspace.name,
+        Workspace.status,
+        Workspace.created_at,
+        Workspace.storage_used_bytes,
+        Workspace.storage_quota_bytes,
+        owner_email.label("owner_email"),
+        user_count.label("user_count"),
+        session_count.label("session_count"),
+    )
+
+
+def _workspace_info_from_row(row: Row) -> WorkspaceInfo:
+    """Build WorkspaceInfo from a _workspace_info_query() row."""
+    return WorkspaceInfo(
+        id=row.id,
+        name=row.name,
+        owner_email=row.owner_email or "No owner",
+        status=row.status.value,
+        created_at=row.created_at,
+        user_count=row.user_count,
+        session_count=row.session_count,
+        storage_used_bytes=row.storage_used_bytes,
+        storage_quota_bytes=row.storage_quota_bytes,
+    )
+
+
 @router.get(
     "/workspaces",
     response_model=WorkspacesResponse,
     summary="List all workspaces",
     description="""
-    List all workspaces with stats.
+    List workspaces with stats, newest first, one page at a time.
 
     Query Parameters:
-    - search: Optional search query (filters by workspace name or owner email)
+    - search: Optional search query (filters by workspace name or user email)
+    - page: Page number (1-indexed)
+    - page_size: Items per page (max 100)
 
     Returns workspace information including:
     - Workspace details (id, name, status)
     - Owner email
     - User count
     - Session count
+    - Storage used and quota
     - Created date
 
     Security:
@@ -1116,91 +1169,69 @@ async def list_workspaces(
     search: str | None = Query(
         default=None, description="Search workspace name or owner email"
     ),
+    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
 ) -> WorkspacesResponse:
     """
-    List all workspaces.
+    List workspaces one page at a time.
+
+    Search, counting and pagination all run in the database: one COUNT
+    query for the total and one query for the page with owner and counts.
 
     Args:
         db: Database session (injected)
         admin: Authenticated platform admin (injected)
         search: Optional search query
+        page: Page number (1-indexed)
+        page_size: Number of items per page
 
     Returns:
-        WorkspacesResponse with list of workspaces
+        WorkspacesResponse with the requested page of workspaces
     """
-    from sqlalchemy.orm import selectinload
+    validate_pagination_params(page, page_size)
 
-    from pazpaz.models.session import Session
-
-    # Build base query with owner (first user in workspace)
-    query = select(Workspace).where(Workspace.status != WorkspaceStatus.DELETED)
-
-    # Apply search filter if provided
+    filters = [Workspace.status != WorkspaceStatus.DELETED]
     if search:
-        # Left join with users to search by owner email
-        # (LEFT JOIN so workspaces without users are included)
-        query = (
-            query.outerjoin(User, Workspace.id == User.workspace_id)
-            .where(
-                or_(
-                    Workspace.name.ilike(f"%{search}%"),
-                    User.email.ilike(f"%{search}%"),
-                )
+        pattern = f"%{search}%"
+        filters.append(
+            or_(
+                Workspace.name.ilike(pattern),
+                select(User.id)
+                .where(User.workspace_id == Workspace.id, User.email.ilike(pattern))
+                .correlate(Workspace)
+                .exists(),
             )
-            .distinct()
         )
 
-    # Load workspaces
-    result = await db.execute(query.options(selectinload(Workspace.users)))
-    workspaces = result.scalars().all()
-
-    # Build response with counts
-    workspace_list = []
-    for workspace in workspaces:
-        # Get owner:
-        # - If searching by email, prefer the matching user
-        # - Otherwise, prefer the first active user
-        owner = None
-        if search and "@" in search:
-            # Searching by email - prefer matching user
-            owner = next(
-                (u for u in workspace.users if u.email.lower() == search.lower()), None
-            )
-        if not owner:
-            # Fall back to first active user
-            owner = next(
-                (u for u in workspace.users if u.is_active),
-                workspace.users[0] if workspace.users else None,
-            )
-
-        # Count users
-        user_count = len(workspace.users)
+    total = await get_query_total_count(db, select(Workspace.id).where(*filters))
 
-        # Count sessions
-        session_count = await db.scalar(
-            select(func.count(Session.id)).where(Session.workspace_id == workspace.id)
-        )
-
-        workspace_list.append(
-            WorkspaceInfo(
-                id=workspace.id,
-                name=workspace.name,
-                owner_email=owner.email if owner else "No owner",
-                status=workspace.status.value,
-                created_at=workspace.created_at,
-                user_count=user_count,
-                session_count=session_count or 0,
-            )
-        )
+    # Searching by email: show the matching user as owner
+    owner_email_hint = search.lower() if search and "@" in search else None
+    result = await db.execute(
+        _workspace_info_query(owner_email_hint)
+        .where(*filters)
+        .order_by(Workspace.created_at.desc(), Workspace.id)
+        .offset(calculate_pagination_offset(page, page_size))
+        .limit(page_size)
+    )
+    workspace_list = [_workspace_info_from_row(row) for row in result.all()]
 
     logger.info(
         "workspaces_listed",
         admin_id=str(admin.id),
         count=len(workspace_list),
+        total=total,
+        page=page,
         search=search,
     )
 
-    return WorkspacesResponse(workspaces=workspace_list)
+    return WorkspacesResponse(
+        workspaces=workspace_list,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=calculate_total_pages(total, page_size),
+    )
 
 
 @router.get(
@@ -1215,6 +1246,7 @@ async def list_workspaces(
     - Owner email
     - User count
     - Session count
+    - Storage used and quota
     - Created date
 
     Security:
@@ -1246,55 +1278,24 @@ async def get_workspace_details(
     Raises:
         HTTPException: 404 if workspace not found
     """
-    from sqlalchemy.orm import selectinload
-
-    from pazpaz.models.session import Session
-
-    # Get workspace with users
-    query = (
-        select(Workspace)
-        .where(Workspace.id == workspace_id)
-        .options(selectinload(Workspace.users))
+    result = await db.execute(
+        _workspace_info_query().where(Workspace.id == workspace_id)
     )
+    row = result.one_or_none()
 
-    result = await db.execute(query)
-    workspace = result.scalar_one_or_none()
-
-    if not workspace:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workspace not found",
         )
 
-    # Get owner (first active user, or any user if no active users)
-    owner = next(
-        (u for u in workspace.users if u.is_active),
-        workspace.users[0] if workspace.users else None,
-    )
-
-    # Count users
-    user_count = len(workspace.users)
-
-    # Count sessions
-    session_count = await db.scalar(
-        select(func.count(Session.id)).where(Session.workspace_id == workspace.id)
-    )
-
     logger.info(
         "workspace_details_retrieved",
         admin_id=str(admin.id),
-        workspace_id=str(workspace.id),
+        workspace_id=str(workspace_id),
     )
 
-    return WorkspaceInfo(
-        id=workspace.id,
-        name=workspace.name,
-        owner_email=owner.email if owner else "No owner",
-        status=workspace.status.value,
-        created_at=workspace.created_at,
-        user_count=user_count,
-        session_count=session_count or 0,
-    )
+    return _workspace_info_from_row(row)
 
 
 @router.post(
@@ -14,11 +14,13 @@ import uuid
 from datetime import timedelta
 
 import redis.asyncio as redis
+from arq.connections import ArqRedis
 from fastapi import (
     APIRouter,
     Depends,
     File,
     HTTPException,
+    Query,
     Request,
     UploadFile,
     status,
@@ -26,7 +28,7 @@ from fastapi import (
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pazpaz.api.deps import get_current_user, get_db, get_or_404
+from pazpaz.api.deps import get_arq_pool, get_current_user, get_db, get_or_404
 from pazpaz.core.logging import get_logger
 from pazpaz.core.rate_limiting import check_rate_limit_redis
 from pazpaz.core.redis import get_redis
@@ -34,16 +36,27 @@ from pazpaz.models.session import Session
 from pazpaz.models.session_attachment import SessionAttachment
 from pazpaz.models.user import User
 from pazpaz.schemas.session_attachment import (
+    AttachmentDownloadUrl,
+    AttachmentDownloadUrlsResponse,
     AttachmentRenameRequest,
     SessionAttachmentListResponse,
     SessionAttachmentResponse,
 )
-from pazpaz.utils.file_sanitization import prepare_file_for_storage
+from pazpaz.services.attachment_preview_service import (
+    attachment_urls,
+    enqueue_attachment_previews,
+    preview_urls,
+)
+from pazpaz.services.attachment_storage_service import (
+    copy_existing_previews,
+    release_attachment_content,
+    store_attachment_content,
+)
+from pazpaz.utils.file_processing import process_upload
+from pazpaz.utils.file_sanitization import SanitizationError
 from pazpaz.utils.file_upload import (
     delete_file_from_s3,
     generate_presigned_download_url,
-    generate_secure_filename,
-    upload_file_to_s3,
 )
 from pazpaz.utils.file_validation import (
     FileContentError,
@@ -51,14 +64,9 @@ from pazpaz.utils.file_validation import (
     FileValidationError,
     MimeTypeMismatchError,
     UnsupportedFileTypeError,
-    validate_file,
     validate_total_attachments_size,
 )
-from pazpaz.utils.storage_quota import (
-    StorageQuotaExceededError,
-    update_workspace_storage,
-    validate_workspace_storage_quota,
-)
+from pazpaz.utils.storage_quota import StorageQuotaExceededError
 
 router = APIRouter(prefix="/sessions", tags=["session-attachments"])
 logger = get_logger(__name__)
@@ -76,6 +84,7 @@ async def upload_session_attachment(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
+    arq_pool: ArqRedis = Depends(get_arq_pool),
 ) -> SessionAttachmentResponse:
     """
     Upload file attachment for a session note.
@@ -100,6 +109,7 @@ async def upload_session_attachment(
         current_user: Authenticated user (from JWT token)
         db: Database session
         redis_client: Redis client (for rate limiting)
+        arq_pool: arq pool (for thumbnail/preview generation)
 
     Returns:
         Created attachment metadata (id, filename, size, content_type, created_at)
@@ -193,8 +203,9 @@ async def upload_session_attachment(
         # Validate individual file size and total attachments size
         validate_total_attachments_size(existing_total_size, file_size)
 
-        # Triple validation: MIME type, extension, content
-        file_type = validate_file(file.filename, file_content)
+        # Triple validation (MIME type, extension, content), malware scan and
+        # metadata stripping, in the file processing pool
+        processed = await process_upload(file.filename, file_content)
 
     except FileSizeExceededError as e:
         logger.warning(
@@ -258,15 +269,7 @@ async def upload_session_attachment(
             detail=f"File validation failed: {e}",
         ) from e
 
-    # Sanitize file (strip EXIF metadata, sanitize filename)
-    try:
-        sanitized_content, safe_filename = prepare_file_for_storage(
-            file_content=file_content,
-            filename=file.filename,
-            file_type=file_type,
-            strip_metadata=True,
-        )
-    except Exception as e:
+    except SanitizationError as e:
         logger.error(
             "file_sanitization_failed",
             session_id=str(session_id),
@@ -278,31 +281,24 @@ async def upload_session_attachment(
             detail=f"File sanitization failed: {e}",
         ) from e
 
-    # Generate secure S3 key (UUID-based, no user input)
-    s3_key = generate_secure_filename(
-        workspace_id=workspace_id,
-        session_id=session_id,
-        file_type=file_type,
-        client_id=None,  # Explicit: session-level file
-    )
-
-    # ATOMIC STORAGE QUOTA: Validate and reserve quota (locks workspace row)
-    # This prevents race conditions where multiple concurrent uploads could bypass quota
+    # ATOMIC STORAGE QUOTA + DEDUPLICATION: Reference identical content the
+    # workspace already stores, or reserve quota (locks workspace row) and
+    # upload to S3/MinIO with encryption verification
+    # If anything fails, transaction rollback releases the reserved quota
     try:
-        await validate_workspace_storage_quota(
-            workspace_id=workspace_id,
-            new_file_size=len(sanitized_content),
-            db=db,
+        blob, blob_created = await store_attachment_content(
+            db,
+            workspace_id,
+            processed,
+            session_id=session_id,
         )
-        # Quota reserved in database (workspace.storage_used_bytes incremented)
-        # If transaction fails, quota reservation rolls back automatically
     except StorageQuotaExceededError as e:
         logger.warning(
             "file_upload_rejected_quota",
             session_id=str(session_id),
             workspace_id=str(workspace_id),
             filename=file.filename,
-            file_size=len(sanitized_content),
+            file_size=len(processed.content),
             reason=str(e),
         )
         # Rollback quota reservation (no changes made yet, but explicit is better)
@@ -322,22 +318,11 @@ async def upload_session_attachment(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workspace not found",
         ) from e
-
-    # Upload to S3/MinIO with encryption verification
-    # If this fails, transaction will rollback and release reserved quota
-    try:
-        upload_result = upload_file_to_s3(
-            file_content=sanitized_content,
-            s3_key=s3_key,
-            content_type=file_type.value,
-        )
-        encryption_metadata = upload_result.get("encryption_metadata")
     except Exception as e:
         logger.error(
             "s3_upload_failed",
             session_id=str(session_id),
             filename=file.filename,
-            s3_key=s3_key,
             error=str(e),
         )
         # Rollback transaction (releases reserved quota)
@@ -347,18 +332,25 @@ async def upload_session_attachment(
             detail=f"File upload failed: {e}",
         ) from e
 
+    s3_key = blob.s3_key
+    encryption_metadata = blob.encryption_metadata
+
     # Create database record with encryption metadata
     attachment = SessionAttachment(
         session_id=session_id,
         client_id=session.client_id,  # Set client_id from session
         workspace_id=workspace_id,
-        file_name=safe_filename,
-        file_type=file_type.value,
-        file_size_bytes=len(sanitized_content),
+        file_name=processed.filename,
+        file_type=processed.file_type.value,
+        file_size_bytes=len(processed.content),
         s3_key=s3_key,
+        blob_id=blob.id,
         uploaded_by_user_id=current_user.id,
         encryption_metadata=encryption_metadata,  # Store encryption verification metadata
     )
+    if not blob_created:
+        # Identical content: its thumbnail and preview already exist
+        await copy_existing_previews(db, attachment)
 
     db.add(attachment)
 
@@ -378,19 +370,20 @@ async def upload_session_attachment(
             s3_key=s3_key,
             error=str(e),
         )
-        # Rollback transaction (releases reserved quota)
+        # Rollback transaction (releases reserved quota and blob reference)
         await db.rollback()
 
-        # Cleanup: Delete uploaded S3 object
-        try:
-            delete_file_from_s3(s3_key)
-            logger.info("s3_cleanup_successful", s3_key=s3_key)
-        except Exception as cleanup_error:
-            logger.error(
-                "s3_cleanup_failed",
-                s3_key=s3_key,
-                error=str(cleanup_error),
-            )
+        # Cleanup: Delete uploaded S3 object (shared content stays)
+        if blob_created:
+            try:
+                delete_file_from_s3(s3_key)
+                logger.info("s3_cleanup_successful", s3_key=s3_key)
+            except Exception as cleanup_error:
+                logger.error(
+                    "s3_cleanup_failed",
+                    s3_key=s3_key,
+                    error=str(cleanup_error),
+                )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save attachment metadata",
@@ -401,16 +394,20 @@ async def upload_session_attachment(
         attachment_id=str(attachment.id),
         session_id=str(session_id),
         workspace_id=str(workspace_id),
-        filename=safe_filename,
-        file_type=file_type.value,
-        file_size=len(sanitized_content),
+        filename=processed.filename,
+        file_type=processed.file_type.value,
+        file_size=len(processed.content),
         s3_key=s3_key,
+        deduplicated=not blob_created,
         encryption_verified=True,
         encryption_algorithm=encryption_metadata.get("algorithm")
         if encryption_metadata
         else None,
     )
 
+    # Thumbnails and previews are generated in the background
+    await enqueue_attachment_previews(arq_pool, attachment)
+
     return SessionAttachmentResponse.model_validate(attachment)
 
 
@@ -475,6 +472,7 @@ async def list_session_attachments(
         SessionAttachmentResponse.model_validate(
             {
                 **SessionAttachmentResponse.model_validate(att).model_dump(),
+                **preview_urls(att),
                 "session_date": session_date,
                 "is_session_file": True,
             }
@@ -488,6 +486,99 @@ async def list_session_attachments(
     )
 
 
+@router.get(
+    "/{session_id}/attachments/download-urls",
+    response_model=AttachmentDownloadUrlsResponse,
+)
+async def get_session_attachment_download_urls(
+    session_id: uuid.UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    expires_in_minutes: int = Query(15, ge=1, le=60),
+) -> AttachmentDownloadUrlsResponse:
+    """
+    Generate pre-signed download URLs for all attachments of a session.
+
+    Batch alternative to GET /sessions/{id}/attachments/{id}/download for
+    galleries: one request (one auth check, one query, one audit event)
+    instead of one per attachment. Includes thumbnail and preview URLs.
+
+    Args:
+        session_id: UUID of the session
+        request: FastAPI request (audit metadata)
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+        expires_in_minutes: Minimum URL lifetime in minutes (default: 15, max: 60)
+
+    Returns:
+        URLs per attachment, newest first
+
+    Raises:
+        HTTPException:
+            - 401 if not authenticated
+            - 404 if session not found or wrong workspace
+            - 422 if expires_in_minutes is out of range
+            - 500 if URL generation fails
+    """
+    workspace_id = current_user.workspace_id
+
+    # Verify session exists and belongs to workspace
+    await get_or_404(db, Session, session_id, workspace_id)
+
+    query = (
+        select(SessionAttachment)
+        .where(
+            SessionAttachment.session_id == session_id,
+            SessionAttachment.workspace_id == workspace_id,
+            SessionAttachment.deleted_at.is_(None),
+        )
+        .order_by(SessionAttachment.created_at.desc())
+    )
+    result = await db.execute(query)
+    attachments = result.scalars().all()
+
+    expiration = timedelta(minutes=expires_in_minutes)
+    try:
+        items = [
+            AttachmentDownloadUrl(
+                attachment_id=att.id,
+                file_name=att.file_name,
+                file_type=att.file_type,
+                **attachment_urls(att, expiration),
+            )
+            for att in attachments
+        ]
+    except Exception as e:
+        logger.error(
+            "presigned_urls_generation_failed",
+            session_id=str(session_id),
+            error=str(e),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to generate download URLs",
+        ) from e
+
+    # Audit which files were made accessible (one event for the batch)
+    request.state.audit_metadata = {
+        "attachment_ids": [str(item.attachment_id) for item in items],
+    }
+
+    logger.info(
+        "attachment_download_urls_generated",
+        session_id=str(session_id),
+        workspace_id=str(workspace_id),
+        attachment_count=len(items),
+        expires_in_minutes=expires_in_minutes,
+    )
+
+    return AttachmentDownloadUrlsResponse(
+        items=items,
+        expires_in_seconds=int(expiration.total_seconds()),
+    )
+
+
 @router.get(
     "/{session_id}/attachments/{attachment_id}/download",
     response_model=dict,
@@ -869,17 +960,14 @@ async def delete_session_attachment(
 
     attachment.deleted_at = datetime.now(UTC)
 
-    # ATOMIC STORAGE QUOTA: Decrement workspace storage usage
-    # Store file size for quota update
+    # ATOMIC STORAGE QUOTA: Release the attachment's stored content
+    # Store file size for logging
     file_size_bytes = attachment.file_size_bytes
 
     try:
-        # Atomically update storage quota (locks workspace row)
-        await update_workspace_storage(
-            workspace_id=workspace_id,
-            bytes_delta=-file_size_bytes,  # Negative delta for delete
-            db=db,
-        )
+        # Decrement shared content reference; quota is released with the
+        # last reference (locks workspace row)
+        released_bytes = await release_attachment_content(db, attachment)
 
         # Commit transaction (soft delete + quota update are atomic)
         await db.commit()
@@ -905,6 +993,7 @@ async def delete_session_attachment(
         session_id=str(session_id),
         workspace_id=str(workspace_id),
         file_size_bytes=file_size_bytes,
+        released_bytes=released_bytes,
     )
 
     # Note: S3 cleanup is handled by background job
@@ -27,6 +27,7 @@ from pazpaz.models.session import Session
 from pazpaz.models.session_attachment import SessionAttachment
 from pazpaz.models.session_version import SessionVersion
 from pazpaz.models.user import User
+from pazpaz.monitoring.tenant_metrics import record_tenant_usage
 from pazpaz.schemas.session import (
     SessionCreate,
     SessionDeleteRequest,
@@ -38,6 +39,18 @@ from pazpaz.schemas.session import (
 )
 from pazpaz.services.audit_service import create_audit_event
 from pazpaz.services.cache_service import AICacheService
+from pazpaz.services.draft_buffer_service import (
+    SessionDraftBuffer,
+    apply_buffered_draft,
+    clear_flushed_draft,
+    flush_buffered_draft,
+    get_buffered_drafts,
+)
+from pazpaz.services.session_version_service import (
+    add_session_version,
+    get_session_version,
+    materialize_versions,
+)
 from pazpaz.utils.pagination import (
     calculate_pagination_offset,
     calculate_total_pages,
@@ -211,6 +224,7 @@ async def get_session(
     request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis),
 ) -> SessionResponse:
     """
     Get a single session by ID with decrypted SOAP fields.
@@ -228,6 +242,7 @@ async def get_session(
         request: FastAPI request object (for audit logging)
         current_user: Authenticated user (from JWT token)
         db: Database session
+        redis_client: Redis client (buffered draft overlay)
 
     Returns:
         Session details with decrypted PHI fields and attachment count
@@ -279,9 +294,18 @@ async def get_session(
         user_id=str(current_user.id),
     )
 
+    # Overlay autosaved draft not yet written to the database
+    buffered = await get_buffered_drafts(redis_client, [session.id])
+    draft_overlay = (
+        buffered[session.id].response_overlay(session.finalized_at is not None)
+        if session.id in buffered
+        else {}
+    )
+
     # Convert to response with attachment_count
     session_dict = {
         **SessionResponse.model_validate(session).model_dump(),
+        **draft_overlay,
         "attachment_count": attachment_count,
     }
     return SessionResponse.model_validate(session_dict)
@@ -291,6 +315,7 @@ async def get_session(
 async def list_sessions(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     client_id: uuid.UUID | None = Query(
@@ -482,11 +507,19 @@ async def list_sessions(
             count_result = await db.execute(count_query)
             attachment_counts = {row.session_id: row.count for row in count_result}
 
+        # Overlay autosaved drafts not yet written to the database
+        buffered = await get_buffered_drafts(redis_client, session_ids)
+
         # Build response items (PHI automatically decrypted)
         items = [
             SessionResponse.model_validate(
                 {
                     **SessionResponse.model_validate(s).model_dump(),
+                    **(
+                        buffered[s.id].response_overlay(s.finalized_at is not None)
+                        if s.id in buffered
+                        else {}
+                    ),
                     "attachment_count": attachment_counts.get(s.id, 0),
                 }
             )
@@ -576,11 +609,23 @@ async def list_sessions(
     result = await db.execute(query)
     rows = result.all()
 
+    # Overlay autosaved drafts not yet written to the database
+    buffered = await get_buffered_drafts(
+        redis_client, [session.id for session, _ in rows]
+    )
+
     # Build response items (PHI automatically decrypted)
     items = [
         SessionResponse.model_validate(
             {
                 **SessionResponse.model_validate(session).model_dump(),
+                **(
+                    buffered[session.id].response_overlay(
+                        session.finalized_at is not None
+                    )
+                    if session.id in buffered
+                    else {}
+                ),
                 "attachment_count": attachment_count,
             }
         )
@@ -661,6 +706,9 @@ async def update_session(
     # Fetch existing session with workspace scoping (raises 404 if not found)
     session = await get_or_404(db, Session, session_id, workspace_id)
 
+    # Build on the latest autosaved draft (written in this transaction)
+    buffered_draft = await flush_buffered_draft(redis_client, session)
+
     # Get update data (only fields that were provided)
     update_data = session_data.model_dump(exclude_unset=True)
 
@@ -689,17 +737,10 @@ async def update_session(
         new_version_number = (
             session.amendment_count + 2
         )  # v1 = original, v2+ = amendments
-        version = SessionVersion(
-            session_id=session.id,
-            version_number=new_version_number,
-            subjective=session.subjective,  # Current values BEFORE edit
-            objective=session.objective,
-            assessment=session.assessment,
-            plan=session.plan,
-            created_at=datetime.now(UTC),
-            created_by_user_id=current_user.id,
+        # Snapshot current values BEFORE edit (stored as a delta)
+        await add_session_version(
+            db, session, new_version_number, created_by_user_id=current_user.id
         )
-        db.add(version)
 
         # Update amendment tracking
         session.amended_at = datetime.now(UTC)
@@ -744,6 +785,7 @@ async def update_session(
 
     await db.commit()
     await db.refresh(session)
+    await clear_flushed_draft(redis_client, buffered_draft)
 
     logger.info(
         "session_updated",
@@ -822,6 +864,10 @@ async def save_draft(
     - Auto-increments version for optimistic locking
     - Updates draft_last_saved_at timestamp
     - Preserves finalized status (amendments) or keeps is_draft = True
+    - Write-behind: saves are coalesced in Redis (encrypted) and written to
+      the database when the draft goes idle, at most every
+      DRAFT_FLUSH_INTERVAL_SECONDS, or before any other write to the session
+      (falls back to a direct write if Redis is unavailable)
 
     SECURITY: Verifies workspace ownership before allowing updates.
     workspace_id is derived from JWT token (server-side).
@@ -835,7 +881,7 @@ async def save_draft(
         request: FastAPI request object (for audit logging)
         current_user: Authenticated user (from JWT token)
         db: Database session
-        redis_client: Redis client for distributed rate limiting
+        redis_client: Redis client for rate limiting and draft buffering
 
     Returns:
         Updated session with decrypted PHI fields
@@ -881,19 +927,66 @@ async def save_draft(
     # Get update data (only fields that were provided)
     update_data = draft_update.model_dump(exclude_unset=True)
 
-    if update_data:
+    if not update_data:
+        buffered = await get_buffered_drafts(redis_client, [session.id])
+        if session.id in buffered:
+            return SessionResponse.model_validate(session).model_copy(
+                update=buffered[session.id].response_overlay(
+                    session.finalized_at is not None
+                )
+            )
+        return SessionResponse.model_validate(session)
+
+    logger.info(
+        "session_draft_save_started",
+        session_id=str(session_id),
+        workspace_id=str(workspace_id),
+        updated_fields=list(update_data.keys()),
+    )
+
+    # Re-read the version under the row lock: a worker flush that committed
+    # after get_or_404 would otherwise make the buffer start on a stale base
+    await db.refresh(session, attribute_names=["version"], with_for_update=True)
+
+    # Coalesce autosaves in Redis; PostgreSQL is written on idle, every
+    # DRAFT_FLUSH_INTERVAL_SECONDS, or before any other write to the session
+    buffer = SessionDraftBuffer(redis_client)
+    try:
+        draft, flush_due = await buffer.save(session, update_data)
+    except Exception as e:
+        logger.warning(
+            "session_draft_buffer_unavailable",
+            session_id=str(session_id),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        draft, flush_due = None, False
+
+    if draft is not None and not flush_due:
         logger.info(
-            "session_draft_save_started",
+            "session_draft_buffered",
             session_id=str(session_id),
             workspace_id=str(workspace_id),
-            updated_fields=list(update_data.keys()),
+            new_version=draft.version,
+        )
+        response = SessionResponse.model_validate(session)
+        # Nothing written to the database; release the row lock
+        await db.rollback()
+        return response.model_copy(
+            update=draft.response_overlay(session.finalized_at is not None)
         )
 
-        # Update fields (PHI fields automatically encrypted)
+    if draft is not None:
+        # Periodic flush: write the coalesced draft now
+        if not apply_buffered_draft(session, draft):
+            await buffer.discard(session.id, session.workspace_id, draft)
+            draft = None
+
+    if draft is None:
+        # Redis unavailable or stale buffer: write this save directly
         for field, value in update_data.items():
             setattr(session, field, value)
 
-        # Update draft metadata
         session.draft_last_saved_at = datetime.now(UTC)
         session.version += 1
         # Only set is_draft = True if it's already a draft
@@ -901,15 +994,16 @@ async def save_draft(
         if session.finalized_at is None:
             session.is_draft = True
 
-        await db.commit()
-        await db.refresh(session)
+    await db.commit()
+    await db.refresh(session)
+    await clear_flushed_draft(redis_client, draft)
 
-        logger.info(
-            "session_draft_saved",
-            session_id=str(session_id),
-            workspace_id=str(workspace_id),
-            new_version=session.version,
-        )
+    logger.info(
+        "session_draft_saved",
+        session_id=str(session_id),
+        workspace_id=str(workspace_id),
+        new_version=session.version,
+    )
 
     # Return response (PHI automatically decrypted)
     return SessionResponse.model_validate(session)
@@ -922,6 +1016,7 @@ async def finalize_session(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     arq_pool: ArqRedis = Depends(get_arq_pool),
+    redis_client=Depends(get_redis),
 ) -> SessionResponse:
     """
     Finalize session and mark as complete.
@@ -950,6 +1045,7 @@ async def finalize_session(
         request: FastAPI request object (for audit logging)
         current_user: Authenticated user (from JWT token)
         db: Database session
+        redis_client: Redis client (buffered draft flush)
 
     Returns:
         Finalized session with finalized_at timestamp set
@@ -967,6 +1063,9 @@ async def finalize_session(
     # Fetch session with workspace scoping
     session = await get_or_404(db, Session, session_id, workspace_id)
 
+    # Write the latest autosaved draft in this transaction
+    buffered_draft = await flush_buffered_draft(redis_client, session)
+
     # Validate at least one SOAP field has content
     if not any(
         [session.subjective, session.objective, session.assessment, session.plan]
@@ -1005,21 +1104,18 @@ async def finalize_session(
     session.is_draft = False
     session.version += 1
 
-    # Create version 1 (original snapshot)
-    version = SessionVersion(
-        session_id=session.id,
+    # Create version 1 (original snapshot, always a full checkpoint)
+    await add_session_version(
+        db,
+        session,
         version_number=1,
-        subjective=session.subjective,
-        objective=session.objective,
-        assessment=session.assessment,
-        plan=session.plan,
-        created_at=session.finalized_at,
         created_by_user_id=current_user.id,
+        created_at=session.finalized_at,
     )
-    db.add(version)
 
     await db.commit()
     await db.refresh(session)
+    await clear_flushed_draft(redis_client, buffered_draft)
 
     logger.info(
         "session_finalized",
@@ -1030,7 +1126,8 @@ async def finalize_session(
     )
 
     # Increment business metric for session notes saved
-    session_notes_saved_total.labels(workspace_id=str(workspace_id)).inc()
+    session_notes_saved_total.inc()
+    record_tenant_usage("session_notes_saved", workspace_id)
 
     logger.info(
         "session_notes_metric_incremented",
@@ -1062,6 +1159,7 @@ async def unfinalize_session(
     request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    redis_client=Depends(get_redis),
 ) -> SessionResponse:
     """
     Unfinalize session and revert to draft status.
@@ -1085,6 +1183,7 @@ async def unfinalize_session(
         request: FastAPI request object (for audit logging)
         current_user: Authenticated user (from JWT token)
         db: Database session
+        redis_client: Redis client (buffered draft flush)
 
     Returns:
         Unfinalied session with is_draft=True and finalized_at cleared
@@ -1102,6 +1201,9 @@ async def unfinalize_session(
     # Fetch session with workspace scoping
     session = await get_or_404(db, Session, session_id, workspace_id)
 
+    # Write the latest autosaved draft in this transaction
+    buffered_draft = await flush_buffered_draft(redis_client, session)
+
     # Check if already a draft
     if session.is_draft:
         logger.warning(
@@ -1163,6 +1265,7 @@ async def unfinalize_session(
 
     await db.commit()
     await db.refresh(session)
+    await clear_flushed_draft(redis_client, buffered_draft)
 
     logger.info(
         "session_unfinalized",
@@ -1180,13 +1283,20 @@ async def get_session_versions(
     request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    limit: int | None = Query(
+        None, ge=1, description="Return only the most recent N versions"
+    ),
 ) -> list[SessionVersionResponse]:
     """
     Get version history for a session note.
 
-    Returns all versions of a session note in reverse chronological order
+    Returns versions of a session note in reverse chronological order
     (most recent first). Only finalized sessions have versions.
 
+    Versions are stored as diffs with periodic full checkpoints and are
+    reconstructed on read; with `limit`, only the returned versions (and the
+    diffs back to their nearest checkpoint) are loaded and decrypted.
+
     SECURITY: Verifies workspace ownership before allowing access.
     workspace_id is derived from JWT token (server-side).
 
@@ -1197,6 +1307,7 @@ async def get_session_versions(
         request: FastAPI request object (for audit logging)
         current_user: Authenticated user (from JWT token)
         db: Database session
+        limit: Optional number of most recent versions to return
 
     Returns:
         List of session versions with decrypted PHI fields
@@ -1229,14 +1340,18 @@ async def get_session_versions(
     # Verify session exists and belongs to workspace
     await get_or_404(db, Session, session_id, workspace_id)
 
-    # Get all versions ordered by version_number descending
-    query = (
-        select(SessionVersion)
-        .where(SessionVersion.session_id == session_id)
-        .order_by(SessionVersion.version_number.desc())
-    )
-    result = await db.execute(query)
-    versions = result.scalars().all()
+    from_version = None
+    if limit is not None:
+        latest = await db.scalar(
+            select(func.max(SessionVersion.version_number)).where(
+                SessionVersion.session_id == session_id
+            )
+        )
+        if latest is not None:
+            from_version = max(latest - limit + 1, 1)
+
+    # Reconstruct versions from checkpoints and diffs (PHI decrypted)
+    versions = await materialize_versions(db, session_id, from_version=from_version)
 
     logger.debug(
         "session_versions_accessed",
@@ -1245,8 +1360,69 @@ async def get_session_versions(
         version_count=len(versions),
     )
 
-    # Return response (PHI automatically decrypted)
-    return [SessionVersionResponse.model_validate(version) for version in versions]
+    return [
+        SessionVersionResponse.model_validate(version) for version in reversed(versions)
+    ]
+
+
+@router.get(
+    "/{session_id}/versions/{version_number}", response_model=SessionVersionResponse
+)
+async def get_session_version_by_number(
+    session_id: uuid.UUID,
+    version_number: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> SessionVersionResponse:
+    """
+    Get a single version of a session note.
+
+    Reconstructs the version from its nearest checkpoint and the diffs after
+    it, decrypting only those rows.
+
+    SECURITY: Verifies workspace ownership before allowing access.
+    workspace_id is derived from JWT token (server-side).
+
+    AUDIT: PHI access is automatically logged by AuditMiddleware.
+
+    Args:
+        session_id: UUID of the session
+        version_number: Version to return (1 = original)
+        request: FastAPI request object (for audit logging)
+        current_user: Authenticated user (from JWT token)
+        db: Database session
+
+    Returns:
+        Session version with decrypted PHI fields
+
+    Raises:
+        HTTPException: 401 if not authenticated,
+            404 if session or version not found or wrong workspace
+
+    Example:
+        GET /api/v1/sessions/{uuid}/versions/2
+    """
+    workspace_id = current_user.workspace_id
+
+    # Verify session exists and belongs to workspace
+    await get_or_404(db, Session, session_id, workspace_id)
+
+    version = await get_session_version(db, session_id, version_number)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resource not found",
+        )
+
+    logger.debug(
+        "session_version_accessed",
+        session_id=str(session_id),
+        workspace_id=str(workspace_id),
+        version_number=version_number,
+    )
+
+    return SessionVersionResponse.model_validate(version)
 
 
 @router.delete("/{session_id}", status_code=204)
@@ -1312,6 +1488,9 @@ async def delete_session(
             detail="Resource not found",
         )
 
+    # Keep the latest autosaved draft (restorable with the session)
+    buffered_draft = await flush_buffered_draft(redis_client, session)
+
     # Extract deletion reason if provided
     deletion_reason = deletion_request.reason if deletion_request else None
 
@@ -1333,6 +1512,7 @@ async def delete_session(
     }
 
     await db.commit()
+    await clear_flushed_draft(redis_client, buffered_draft)
 
     logger.info(
         "session_deleted",
@@ -3,18 +3,30 @@
 This module implements secure voice-to-text transcription for clinical documentation:
 - Hebrew and English support via OpenAI Whisper API
 - Optional AI cleanup of messy dictations (filler word removal, grammar fixes)
+- Long recordings (full sessions) as background jobs: split at pauses,
+  segments transcribed concurrently, progress streamed over server-sent events
 - Rate limiting (60 requests/hour per workspace)
 - Workspace isolation and audit logging
-- No persistent audio storage (HIPAA compliance)
+- No persistent audio storage (HIPAA compliance): long recordings are only
+  staged, encrypted, in object storage until the worker picks them up
 
 Endpoints:
-- POST /api/v1/transcribe - Transcribe audio file to text
+- POST /api/v1/transcribe - Transcribe a short dictation (max 10 MB) to text
+- POST /api/v1/transcribe/jobs - Queue transcription of a long recording
+- GET /api/v1/transcribe/jobs/{job_id} - Transcription job status and result
+- GET /api/v1/transcribe/jobs/{job_id}/events - Job progress (server-sent events)
 - POST /api/v1/transcribe/cleanup - Clean up messy transcription (optional)
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import uuid
+from collections.abc import AsyncIterator
+
 import redis.asyncio as redis
+from arq.connections import ArqRedis
 from fastapi import (
     APIRouter,
     Depends,
@@ -24,26 +36,82 @@ from fastapi import (
     UploadFile,
     status,
 )
-from openai import AsyncOpenAI
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pazpaz.ai.providers import get_transcription_provider
 from pazpaz.ai.transcription_cleanup import cleanup_transcription
-from pazpaz.api.deps import get_current_user, get_db
+from pazpaz.api.deps import get_arq_pool, get_current_user, get_db
 from pazpaz.core.config import settings
 from pazpaz.core.logging import get_logger
 from pazpaz.core.rate_limiting import check_rate_limit_redis
 from pazpaz.core.redis import get_redis
+from pazpaz.core.storage import get_s3_client
 from pazpaz.models.user import User
 from pazpaz.schemas.transcription import (
     CleanupRequest,
     CleanupResponse,
+    TranscriptionJobResponse,
+    TranscriptionJobStatusResponse,
     TranscriptionResponse,
 )
+from pazpaz.services.transcription_job_service import (
+    TranscriptionJobStatus,
+    TranscriptionUploadTooLargeError,
+    create_transcription_job,
+    get_transcription_job,
+    store_job_audio,
+    stream_job_events,
+    transcription_audio_object_key,
+)
 
 router = APIRouter(tags=["transcription"])
 logger = get_logger(__name__)
 
 
+async def _authorize_transcription(
+    audio: UploadFile, current_user: User, redis_client: redis.Redis
+) -> None:
+    """
+    Apply the workspace rate limit and validate the audio MIME type.
+
+    Raises:
+        HTTPException: 429 if rate limit exceeded, 400 if not audio/*
+    """
+    workspace_id = current_user.workspace_id
+
+    # Rate limit (60 requests/hour per workspace, shared by both endpoints)
+    rate_limit_key = f"transcription:{workspace_id}"
+    if not await check_rate_limit_redis(
+        redis_client=redis_client,
+        key=rate_limit_key,
+        max_requests=60,
+        window_seconds=3600,
+    ):
+        logger.warning(
+            "transcription_rate_limit_exceeded",
+            user_id=str(current_user.id),
+            workspace_id=str(workspace_id),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded. Maximum 60 transcriptions per hour.",
+        )
+
+    # Validate audio file MIME type
+    if not audio.content_type or not audio.content_type.startswith("audio/"):
+        logger.warning(
+            "transcription_invalid_mime_type",
+            user_id=str(current_user.id),
+            workspace_id=str(workspace_id),
+            content_type=audio.content_type,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid file type: {audio.content_type}. Expected audio/* MIME type.",
+        )
+
+
 @router.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(
     audio: UploadFile = File(...),
@@ -55,6 +123,9 @@ async def transcribe_audio(
     """
     Transcribe audio file to text for SOAP note field.
 
+    Intended for short dictations; use POST /transcribe/jobs for recordings
+    over 10 MB (e.g. a full session).
+
     Process:
     1. Rate limit (60 requests/hour per workspace)
     2. Validate audio file (max 10MB, audio/* MIME)
@@ -102,36 +173,8 @@ async def transcribe_audio(
     """
     workspace_id = current_user.workspace_id
 
-    # 1. Rate limit (60 requests/hour per workspace)
-    rate_limit_key = f"transcription:{workspace_id}"
-    if not await check_rate_limit_redis(
-        redis_client=redis_client,
-        key=rate_limit_key,
-        max_requests=60,
-        window_seconds=3600,
-    ):
-        logger.warning(
-            "transcription_rate_limit_exceeded",
-            user_id=str(current_user.id),
-            workspace_id=str(workspace_id),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Rate limit exceeded. Maximum 60 transcriptions per hour.",
-        )
-
-    # 2. Validate audio file MIME type
-    if not audio.content_type or not audio.content_type.startswith("audio/"):
-        logger.warning(
-            "transcription_invalid_mime_type",
-            user_id=str(current_user.id),
-            workspace_id=str(workspace_id),
-            content_type=audio.content_type,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type: {audio.content_type}. Expected audio/* MIME type.",
-        )
+    # 1-2. Rate limit and MIME type
+    await _authorize_transcription(audio, current_user, redis_client)
 
     # 3. Validate file size (10 MB max)
     # Read file content for size check and API call
@@ -150,10 +193,10 @@ async def transcribe_audio(
             detail=f"File size {file_size_mb:.1f} MB exceeds maximum of 10 MB.",
         )
 
-    # 4. Call OpenAI Whisper API
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
-
+    # 4. Call OpenAI Whisper API (shared client)
     try:
+        provider = get_transcription_provider()
+
         logger.info(
             "transcription_started",
             user_id=str(current_user.id),
@@ -163,18 +206,14 @@ async def transcribe_audio(
             content_type=audio.content_type,
         )
 
-        # Call Whisper API with automatic language detection
-        # Omitting language parameter enables auto-detection (Hebrew/English/etc.)
-        response = await client.audio.transcriptions.create(
-            model="whisper-1",
-            file=(audio.filename, audio_content),
-            # language parameter omitted for auto-detection
-            response_format="verbose_json",  # Includes duration metadata
+        # Automatic language detection (Hebrew/English/etc.)
+        response = await provider.transcribe(
+            audio_content, audio.filename or "audio.webm"
         )
 
         transcription = response.text
-        duration = response.duration  # In seconds
-        detected_language = response.language or "unknown"
+        duration = response.duration_seconds
+        detected_language = response.language
 
         logger.info(
             "transcription_success",
@@ -209,6 +248,199 @@ async def transcribe_audio(
         ) from e
 
 
+@router.post(
+    "/transcribe/jobs",
+    response_model=TranscriptionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_transcription_job_endpoint(
+    audio: UploadFile = File(...),
+    field_name: str = Form(...),
+    cleanup: bool = Form(False),
+    current_user: User = Depends(get_current_user),
+    redis_client: redis.Redis = Depends(get_redis),
+    arq_pool: ArqRedis = Depends(get_arq_pool),
+    db: AsyncSession = Depends(get_db),
+) -> TranscriptionJobResponse:
+    """
+    Queue transcription of a long recording (e.g. a full session).
+
+    The upload (spooled to a temporary file by the framework, like any large
+    multipart upload) is staged in object storage under the quarantine
+    prefix, encrypted at rest and expiring by lifecycle rule, and a worker
+    transcribes it in the background: the audio is split at pauses, segments are transcribed concurrently, and the text
+    is stitched and optionally cleaned up. Follow progress with
+    GET /transcribe/jobs/{job_id}/events or poll GET /transcribe/jobs/{job_id}.
+    Jobs and results expire after an hour.
+
+    Args:
+        audio: Audio file (WebM, MP3, WAV, M4A, OGG, FLAC)
+        field_name: SOAP field being dictated (subjective, objective, assessment, plan)
+        cleanup: Also run AI cleanup on the transcript
+        current_user: Authenticated user (from JWT token)
+        redis_client: Redis client for rate limiting and job storage
+        arq_pool: ARQ pool for enqueueing the transcription job
+        db: Database session (for audit logging context)
+
+    Returns:
+        TranscriptionJobResponse with the job ID (202 Accepted)
+
+    Raises:
+        HTTPException:
+            - 400: Invalid file type
+            - 413: Recording exceeds TRANSCRIPTION_MAX_UPLOAD_MB
+            - 429: Rate limit exceeded (60/hour)
+    """
+    workspace_id = current_user.workspace_id
+    await _authorize_transcription(audio, current_user, redis_client)
+
+    job_id = str(uuid.uuid4())
+    audio_key = transcription_audio_object_key(workspace_id, job_id)
+    max_bytes = settings.transcription_max_upload_mb * 1024 * 1024
+    try:
+        size = await asyncio.to_thread(
+            store_job_audio, get_s3_client(), audio_key, audio.file, max_bytes
+        )
+    except TranscriptionUploadTooLargeError as e:
+        logger.warning(
+            "transcription_file_too_large",
+            user_id=str(current_user.id),
+            workspace_id=str(workspace_id),
+            max_mb=settings.transcription_max_upload_mb,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=(
+                f"Recording exceeds maximum of "
+                f"{settings.transcription_max_upload_mb} MB."
+            ),
+        ) from e
+
+    await create_transcription_job(
+        redis_client,
+        job_id,
+        workspace_id=workspace_id,
+        user_id=current_user.id,
+        field_name=field_name,
+        filename=audio.filename or "",
+        cleanup=cleanup,
+        audio_key=audio_key,
+    )
+    await arq_pool.enqueue_job("transcribe_audio_job", job_id=job_id)
+
+    logger.info(
+        "transcription_job_enqueued",
+        job_id=job_id,
+        user_id=str(current_user.id),
+        workspace_id=str(workspace_id),
+        field_name=field_name,
+        file_size_mb=size / (1024 * 1024),
+        content_type=audio.content_type,
+        cleanup=cleanup,
+    )
+
+    return TranscriptionJobResponse(
+        job_id=job_id, status=TranscriptionJobStatus.QUEUED.value
+    )
+
+
+@router.get("/transcribe/jobs/{job_id}", response_model=TranscriptionJobStatusResponse)
+async def get_transcription_job_endpoint(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    redis_client: redis.Redis = Depends(get_redis),
+) -> TranscriptionJobStatusResponse:
+    """
+    Get the status (and, once completed, the result) of a transcription job.
+
+    Args:
+        job_id: Transcription job ID
+        current_user: Authenticated user (from JWT token)
+        redis_client: Redis client
+
+    Returns:
+        TranscriptionJobStatusResponse
+
+    Raises:
+        HTTPException: 404 if the job does not exist, expired, or belongs to
+            another workspace
+    """
+    job = await get_transcription_job(
+        redis_client, str(job_id), workspace_id=current_user.workspace_id
+    )
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcription job not found",
+        )
+
+    return TranscriptionJobStatusResponse(
+        job_id=job.id,
+        status=job.status.value,
+        completed_segments=job.completed_segments,
+        total_segments=job.total_segments,
+        text=job.text,
+        cleaned_text=job.cleaned_text,
+        language=job.language,
+        duration_seconds=job.duration_seconds,
+        error=job.error,
+    )
+
+
+@router.get("/transcribe/jobs/{job_id}/events", status_code=200)
+async def stream_transcription_job_events(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    redis_client: redis.Redis = Depends(get_redis),
+) -> StreamingResponse:
+    """
+    Stream transcription job progress (server-sent events).
+
+    **Event sequence:**
+    - `progress` (repeated): `{"status": "processing", "completed_segments": 3,
+      "total_segments": 12}`
+    - `done`: `{"text": "...", "cleaned_text": "..." | null, "language": "he",
+      "duration_seconds": 2712.4}`
+    - `error` (instead of `done`): `{"message": "..."}`
+
+    The current state is sent immediately, so reconnecting clients (and
+    clients connecting after the job finished) get the result.
+
+    Args:
+        job_id: Transcription job ID
+        current_user: Authenticated user (from JWT token)
+        redis_client: Redis client
+
+    Returns:
+        StreamingResponse emitting server-sent events
+
+    Raises:
+        HTTPException: 404 if the job does not exist, expired, or belongs to
+            another workspace
+    """
+    job = await get_transcription_job(
+        redis_client, str(job_id), workspace_id=current_user.workspace_id
+    )
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcription job not found",
+        )
+
+    async def event_stream() -> AsyncIterator[str]:
+        async for event, data in stream_job_events(redis_client, job.id):
+            yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable nginx proxy buffering for SSE
+        },
+    )
+
+
 @router.post("/transcribe/cleanup", response_model=CleanupResponse)
 async def cleanup_transcription_text(
     cleanup_request: CleanupRequest,
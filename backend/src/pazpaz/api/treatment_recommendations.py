@@ -25,6 +25,7 @@ from pazpaz.core.logging import get_logger
 from pazpaz.core.rate_limiting import check_rate_limit_redis
 from pazpaz.core.redis import get_redis
 from pazpaz.models.user import User
+from pazpaz.monitoring.tenant_metrics import record_tenant_usage
 from pazpaz.schemas.treatment_recommendations import (
     TreatmentRecommendationItem,
     TreatmentRecommendationRequest,
@@ -120,7 +121,8 @@ async def get_treatment_recommendations(
         window_seconds=3600,  # 1 hour
     ):
         # Track rate limit hit (reuse existing metric)
-        ai_agent_rate_limit_hits_total.labels(workspace_id=str(workspace_id)).inc()
+        ai_agent_rate_limit_hits_total.inc()
+        record_tenant_usage("ai_agent_rate_limit_hits", workspace_id)
 
         logger.warning(
             "ai_treatment_recommendations_rate_limit_exceeded",
@@ -114,6 +114,40 @@ class Settings(BaseSettings):
         description="Session idle timeout in minutes (HIPAA §164.312(a)(2)(iii))",
     )
 
+    # Argon2 hashing executor (64 MB per hash, so workers bound memory too)
+    hashing_max_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Threads dedicated to Argon2 password/backup-code hashing",
+    )
+    hashing_max_pending: int = Field(
+        default=16,
+        ge=1,
+        description="Max queued + running hashing jobs before rejecting with 503",
+    )
+
+    # Upload validation/sanitization process pool (image decode, PDF rewrite)
+    file_processing_max_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Worker processes for upload validation and sanitization",
+    )
+    file_processing_max_pending: int = Field(
+        default=16,
+        ge=1,
+        description="Max queued + running file processing jobs before rejecting with 503",
+    )
+    file_processing_memory_limit_mb: int = Field(
+        default=1024,
+        ge=0,
+        description="Address space limit per file processing worker (MB, 0 = unlimited)",
+    )
+    file_processing_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time limit for validating and sanitizing one upload",
+    )
+
     # CSRF Protection
     csrf_token_expire_minutes: int = 60 * 24 * 7  # 7 days (match JWT expiry)
 
@@ -598,6 +632,60 @@ class Settings(BaseSettings):
 
         return v
 
+    # Audit log partition archival (HIPAA §164.316(b)(2): retain 6 years)
+    audit_hot_retention_months: int = Field(
+        default=13,
+        ge=1,
+        description="Months of audit events kept in the database before archival",
+    )
+    audit_archive_bucket: str | None = Field(
+        default=None,
+        description="Bucket for archived audit partitions (default: s3_bucket_name)",
+    )
+    audit_archive_retention_years: int = Field(
+        default=7,
+        ge=6,
+        description="Years archived audit partitions must be retained",
+    )
+    audit_archive_object_lock: bool = Field(
+        default=True,
+        description=(
+            "Apply S3 Object Lock (COMPLIANCE mode) retention to audit archives "
+            "(bucket must have Object Lock enabled; required in production)"
+        ),
+    )
+
+    @field_validator("audit_archive_object_lock")
+    @classmethod
+    def validate_audit_archive_object_lock(cls, v: bool, info) -> bool:
+        """
+        Require retention locks on audit archives in production.
+
+        Archived partitions are dropped from the database, so without Object
+        Lock the only copy of the audit trail could be deleted before the
+        retention period ends.
+
+        Args:
+            v: AUDIT_ARCHIVE_OBJECT_LOCK value
+            info: Validation context
+
+        Returns:
+            Validated setting
+
+        Raises:
+            ValueError: If disabled in production/staging
+        """
+        environment = info.data.get("environment", "local")
+
+        if environment in ("production", "staging") and not v:
+            raise ValueError(
+                f"AUDIT_ARCHIVE_OBJECT_LOCK must be enabled in {environment}. "
+                f"Archived audit partitions must be retained for "
+                f"AUDIT_ARCHIVE_RETENTION_YEARS (HIPAA §164.316(b)(2))."
+            )
+
+        return v
+
     # Email
     smtp_host: str = "localhost"
     smtp_port: int = 1025
@@ -610,6 +698,13 @@ class Settings(BaseSettings):
         default=None,
         description="Sentry DSN for error tracking (optional, not required for local dev)",
     )
+    worker_metrics_port: int | None = Field(
+        default=None,
+        description=(
+            "Port for the arq worker's Prometheus metrics server (when it does "
+            "not share PROMETHEUS_MULTIPROC_DIR with the API)"
+        ),
+    )
 
     # Google Calendar OAuth 2.0
     google_oauth_client_id: str = Field(
@@ -644,6 +739,16 @@ class Settings(BaseSettings):
         default="",
         description="OpenAI API key for Whisper voice transcription (HIPAA BAA required for production)",
     )
+    transcription_max_upload_mb: int = Field(
+        default=200,
+        ge=1,
+        description="Maximum recording size accepted by POST /transcribe/jobs (MB)",
+    )
+    transcription_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum Whisper requests in flight per transcription job",
+    )
 
     # AI Provider Selection (Phase 3.1)
     ai_embedding_provider: str = Field(
@@ -671,6 +776,34 @@ class Settings(BaseSettings):
         default=4000,
         description="Maximum tokens for LLM response output",
     )
+    ai_agent_context_token_budget: int = Field(
+        default=3000,
+        description="Token budget for retrieved contexts in synthesis prompts",
+    )
+    ai_embedding_lru_max_entries: int = Field(
+        default=2048,
+        description="Query embeddings kept in the in-process LRU (~6 KB each)",
+    )
+    ai_embedding_warmup_enabled: bool = Field(
+        default=True,
+        description="Pre-embed common clinical queries into the embedding cache",
+    )
+    ai_agent_semantic_cache_enabled: bool = Field(
+        default=True,
+        description="Serve near-duplicate agent queries from the semantic (embedding) cache",
+    )
+    ai_agent_semantic_cache_threshold: float = Field(
+        default=0.95,
+        description="Minimum query embedding cosine similarity for a semantic cache hit",
+    )
+    ai_agent_semantic_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Lifetime of semantic cache entries in seconds (matches L1 TTL)",
+    )
+    ai_agent_semantic_cache_max_entries: int = Field(
+        default=100,
+        description="Maximum semantic cache entries per workspace/client scope",
+    )
 
     # AI Agent Timeout Configuration (Phase 2.2)
     cohere_embed_timeout_seconds: int = Field(
@@ -20,6 +20,13 @@ DELETION_REASON_MAX_LENGTH = 500
 # Maximum length for encrypted SOAP fields (in plaintext)
 SOAP_FIELD_MAX_LENGTH = 5000
 
+# ============================================================================
+# APPOINTMENT CONFLICT DETECTION
+# ============================================================================
+
+# Maximum proposed intervals per batch conflict check (~4 years weekly)
+MAX_CONFLICT_CHECK_INTERVALS = 200
+
 # ============================================================================
 # ENCRYPTION CONFIGURATION
 # ============================================================================
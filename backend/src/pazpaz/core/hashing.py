@@ -0,0 +1,187 @@
+"""Bounded executor for Argon2 password and backup-code hashing.
+
+Argon2id is deliberately expensive (64 MB, time_cost=3 - see core/security.py),
+so hashing on the event loop stalls every other request on the worker. All
+password and backup-code hashing runs on a small dedicated thread pool
+instead: argon2-cffi releases the GIL while hashing, so threads run in
+parallel without the pickling and fork overhead of a process pool.
+
+The pool is bounded twice:
+- hashing_max_workers caps concurrent hashes (and so memory: 64 MB each)
+- hashing_max_pending caps queued + running jobs; beyond it new jobs are
+  rejected with HashingCapacityError (503) instead of queueing unboundedly,
+  so a burst of logins cannot starve the rest of the API
+
+Example:
+    >>> hashed = await run_hashing("backup_code_hash", hash_backup_codes, codes)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Prometheus metrics for the hashing executor
+hashing_pending_jobs = Gauge(
+    "hashing_pending_jobs",
+    "Hashing jobs queued or running in the hashing executor",
+    multiprocess_mode="livesum",
+)
+
+hashing_rejected_total = Counter(
+    "hashing_rejected_total",
+    "Hashing jobs rejected because the executor was at capacity",
+    ["operation"],
+)
+
+hashing_duration_seconds = Histogram(
+    "hashing_duration_seconds",
+    "Time from submission to completion of a hashing job (queue + hash)",
+    ["operation"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0],
+)
+
+
+class HashingCapacityError(Exception):
+    """Raised when the hashing executor has no capacity for another job."""
+
+
+class HashingExecutor:
+    """
+    Thread pool for CPU-heavy hashing with an admission limit.
+
+    Attributes:
+        max_workers: Number of hashing threads
+        max_pending: Max jobs queued or running before rejecting new ones
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of hashing threads
+            max_pending: Max jobs queued or running before rejecting new ones
+        """
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self._pending = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="pazpaz-hashing",
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running."""
+        return self._pending
+
+    async def run[T](self, operation: str, func: Callable[..., T], *args) -> T:
+        """
+        Run a hashing function on the pool without blocking the event loop.
+
+        Args:
+            operation: Operation name for metrics and logs
+            func: Synchronous hashing function
+            *args: Arguments passed to func
+
+        Returns:
+            Result of func(*args)
+
+        Raises:
+            HashingCapacityError: If max_pending jobs are already queued/running
+        """
+        if self._pending >= self.max_pending:
+            hashing_rejected_total.labels(operation=operation).inc()
+            logger.warning(
+                "hashing_executor_at_capacity",
+                operation=operation,
+                pending=self._pending,
+                max_pending=self.max_pending,
+            )
+            raise HashingCapacityError(
+                f"Hashing executor at capacity ({self.max_pending} jobs)"
+            )
+
+        self._pending += 1
+        hashing_pending_jobs.inc()
+        start_time = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args)
+            )
+        finally:
+            self._pending -= 1
+            hashing_pending_jobs.dec()
+            hashing_duration_seconds.labels(operation=operation).observe(
+                time.perf_counter() - start_time
+            )
+
+    def shutdown(self) -> None:
+        """Stop the pool, waiting for running hashes to finish."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Global hashing executor instance
+_hashing_executor: HashingExecutor | None = None
+
+
+def get_hashing_executor() -> HashingExecutor:
+    """
+    Get the process-wide hashing executor, creating it on first use.
+
+    Returns:
+        HashingExecutor sized from settings
+    """
+    global _hashing_executor
+
+    if _hashing_executor is None:
+        _hashing_executor = HashingExecutor(
+            max_workers=settings.hashing_max_workers,
+            max_pending=settings.hashing_max_pending,
+        )
+        logger.info(
+            "hashing_executor_started",
+            max_workers=_hashing_executor.max_workers,
+            max_pending=_hashing_executor.max_pending,
+        )
+
+    return _hashing_executor
+
+
+async def run_hashing[T](operation: str, func: Callable[..., T], *args) -> T:
+    """
+    Run a hashing function on the shared hashing executor.
+
+    Args:
+        operation: Operation name for metrics and logs
+        func: Synchronous hashing function
+        *args: Arguments passed to func
+
+    Returns:
+        Result of func(*args)
+
+    Raises:
+        HashingCapacityError: If the executor is at capacity
+    """
+    return await get_hashing_executor().run(operation, func, *args)
+
+
+def shutdown_hashing_executor() -> None:
+    """Shut down the shared hashing executor (application shutdown)."""
+    global _hashing_executor
+
+    if _hashing_executor is not None:
+        _hashing_executor.shutdown()
+        _hashing_executor = None
@@ -11,6 +11,7 @@ from jose import ExpiredSignatureError, JWTError, jwt
 from passlib.context import CryptContext
 
 from pazpaz.core.config import settings
+from pazpaz.core.hashing import run_hashing
 from pazpaz.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -50,18 +51,18 @@ Migration from bcrypt to Argon2id:
 3. Transparent migration: No user action required
 
 If password authentication is enabled in the future:
-1. Verify password with verify_password() (handles both algorithms)
+1. Verify password with verify_password_async() (handles both algorithms)
 2. Check needs_rehash() after successful verification
-3. If True, rehash with get_password_hash() and update database
+3. If True, rehash with get_password_hash_async() and update database
 4. This provides transparent migration from bcrypt to Argon2id
 
 Example migration code:
 ```python
-if verify_password(plain_password, user.hashed_password):
+if await verify_password_async(plain_password, user.hashed_password):
     # Password is correct
     if needs_rehash(user.hashed_password):
         # Upgrade from bcrypt to Argon2id
-        user.hashed_password = get_password_hash(plain_password)
+        user.hashed_password = await get_password_hash_async(plain_password)
         await db.commit()
     # ... proceed with authentication
 ```
@@ -350,6 +351,45 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password on the hashing executor (non-blocking).
+
+    Use from async code instead of get_password_hash() so the ~500ms Argon2id
+    hash does not block the event loop.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password string (Argon2id format)
+
+    Raises:
+        ValueError: If password doesn't meet strength requirements
+        HashingCapacityError: If the hashing executor is at capacity
+    """
+    return await run_hashing("password_hash", get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the hashing executor (non-blocking).
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password (Argon2id or bcrypt)
+
+    Returns:
+        True if password matches hash, False otherwise
+
+    Raises:
+        HashingCapacityError: If the hashing executor is at capacity
+    """
+    return await run_hashing(
+        "password_verify", verify_password, plain_password, hashed_password
+    )
+
+
 def needs_rehash(hashed_password: str) -> bool:
     """
     Check if a password hash needs to be rehashed.
@@ -47,6 +47,7 @@ Usage:
 """
 
 import tempfile
+import time
 import uuid
 from functools import lru_cache
 from pathlib import Path
@@ -64,6 +65,18 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Presigned GET URLs are cached in process per (object, expiry, time window):
+# every request in the same window gets the same URL, so browsers can cache
+# the files and listings don't re-sign. URLs are signed for the requested
+# expiry plus the window, so a cached URL is always valid for at least the
+# requested time.
+PRESIGNED_URL_CACHE_WINDOW_SECONDS = 300
+PRESIGNED_URL_CACHE_MAX_ENTRIES = 10_000
+MAX_PRESIGNED_URL_EXPIRATION_SECONDS = 7 * 24 * 3600  # SigV4 limit
+
+_presigned_url_cache: dict[tuple[str, int, bool], str] = {}
+_presigned_url_cache_window = 0
+
 
 def is_minio_endpoint(endpoint_url: str) -> bool:
     """
@@ -290,6 +303,33 @@ def build_object_key(
     return f"{workspace_id}/sessions/{session_id}/{filename}"
 
 
+def build_derived_object_key(object_key: str, variant: str, extension: str) -> str:
+    """
+    Build the key of an object derived from another (e.g. a thumbnail).
+
+    Derived objects are stored next to the original, so they stay within
+    its workspace prefix and are removed with it by prefix deletion.
+
+    Args:
+        object_key: Key of the original object
+        variant: Derivative name (e.g. "thumbnail")
+        extension: Extension of the derived object (without dot)
+
+    Returns:
+        S3 object key of the derived object
+
+    Example:
+        >>> build_derived_object_key(
+        ...     "workspaces/1/sessions/2/attachments/3.pdf", "thumbnail", "webp"
+        ... )
+        'workspaces/1/sessions/2/attachments/3.thumbnail.webp'
+    """
+    directory, _, name = object_key.rpartition("/")
+    stem = name.rsplit(".", 1)[0]
+    derived_name = f"{stem}.{variant}.{extension}"
+    return f"{directory}/{derived_name}" if directory else derived_name
+
+
 def generate_secure_filename(
     workspace_id: uuid.UUID,
     session_id: uuid.UUID | None,
@@ -432,6 +472,62 @@ def ensure_bucket_exists(bucket_name: str | None = None) -> None:
             raise S3ClientError(f"Failed to access bucket {bucket}: {e}") from e
 
 
+def _sign_url(
+    http_method: str, object_key: str, expires_in: int, force_download: bool
+) -> str:
+    """Sign a presigned URL (uncached)."""
+    params = {
+        "Bucket": settings.s3_bucket_name,
+        "Key": object_key,
+    }
+
+    # Add response-content-disposition to force download instead of inline display
+    if force_download:
+        # Extract filename from object key
+        filename = object_key.split("/")[-1]
+        params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+
+    return get_s3_client().generate_presigned_url(
+        http_method,
+        Params=params,
+        ExpiresIn=expires_in,
+    )
+
+
+def _cached_download_url(object_key: str, expires_in: int, force_download: bool) -> str:
+    """Presigned GET URL from the per-window cache, signing on miss."""
+    global _presigned_url_cache_window
+
+    window = int(time.time()) // PRESIGNED_URL_CACHE_WINDOW_SECONDS
+    if (
+        window != _presigned_url_cache_window
+        or len(_presigned_url_cache) >= PRESIGNED_URL_CACHE_MAX_ENTRIES
+    ):
+        # URLs of earlier windows are never served again
+        _presigned_url_cache.clear()
+        _presigned_url_cache_window = window
+
+    cache_key = (object_key, expires_in, force_download)
+    url = _presigned_url_cache.get(cache_key)
+    if url is None:
+        url = _sign_url(
+            "get_object",
+            object_key,
+            min(
+                expires_in + PRESIGNED_URL_CACHE_WINDOW_SECONDS,
+                MAX_PRESIGNED_URL_EXPIRATION_SECONDS,
+            ),
+            force_download,
+        )
+        _presigned_url_cache[cache_key] = url
+    return url
+
+
+def clear_presigned_url_cache() -> None:
+    """Drop all cached presigned URLs (e.g. after credential rotation)."""
+    _presigned_url_cache.clear()
+
+
 def generate_presigned_url(
     object_key: str,
     expires_in: int = 900,
@@ -447,6 +543,11 @@ def generate_presigned_url(
     Default expiration: 15 minutes (900 seconds)
     Recommended: Keep expiration short to minimize security risk
 
+    Download (get_object) URLs are cached in process for
+    PRESIGNED_URL_CACHE_WINDOW_SECONDS: repeated requests for the same object
+    return the same URL, which stays valid for at least expires_in seconds
+    (and at most expires_in + PRESIGNED_URL_CACHE_WINDOW_SECONDS).
+
     Args:
         object_key: S3 object key (from build_object_key)
         expires_in: URL expiration in seconds (default: 900 = 15 minutes)
@@ -464,32 +565,75 @@ def generate_presigned_url(
         >>> # URL valid for 15 minutes and forces download
     """
     try:
-        s3_client = get_s3_client()
+        if http_method == "get_object":
+            return _cached_download_url(object_key, expires_in, force_download)
 
-        params = {
-            "Bucket": settings.s3_bucket_name,
-            "Key": object_key,
-        }
+        return _sign_url(http_method, object_key, expires_in, force_download)
 
-        # Add response-content-disposition to force download instead of inline display
-        if force_download:
-            # Extract filename from object key
-            filename = object_key.split("/")[-1]
-            params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+    except (BotoCoreError, ClientError) as e:
+        logger.error(
+            f"Failed to generate presigned URL for {object_key}: {e}",
+            extra={"object_key": object_key, "expires_in": expires_in},
+        )
+        raise S3ClientError(f"Failed to generate presigned URL: {e}") from e
+
+
+def generate_presigned_upload_url(
+    object_key: str,
+    content_type: str,
+    expires_in: int = 900,
+) -> tuple[str, dict[str, str]]:
+    """
+    Generate presigned PUT URL for a direct client upload.
 
-        url = s3_client.generate_presigned_url(
-            http_method,
+    The content type (and, on AWS S3, server-side encryption) is part of the
+    signature, so the client must send exactly the returned headers; the
+    upload is rejected by storage otherwise.
+
+    Args:
+        object_key: S3 object key the client may write
+        content_type: MIME type the client must send
+        expires_in: URL expiration in seconds (default: 900 = 15 minutes)
+
+    Returns:
+        Tuple of (presigned URL, headers the PUT request must include)
+
+    Raises:
+        S3ClientError: If URL generation fails
+
+    Example:
+        >>> url, headers = generate_presigned_upload_url(
+        ...     "quarantine/workspaces/1/uploads/2", "image/jpeg"
+        ... )
+        >>> # PUT url with headers, body = file bytes
+    """
+    params = {
+        "Bucket": settings.s3_bucket_name,
+        "Key": object_key,
+        "ContentType": content_type,
+    }
+    headers = {"Content-Type": content_type}
+
+    # Same encryption policy as upload_file_to_s3 (SSE-S3 on AWS)
+    if not is_minio_endpoint(settings.s3_endpoint_url):
+        params["ServerSideEncryption"] = "AES256"
+        headers["x-amz-server-side-encryption"] = "AES256"
+
+    try:
+        url = get_s3_client().generate_presigned_url(
+            "put_object",
             Params=params,
             ExpiresIn=expires_in,
         )
-        return url
-
     except (BotoCoreError, ClientError) as e:
         logger.error(
-            f"Failed to generate presigned URL for {object_key}: {e}",
-            extra={"object_key": object_key, "expires_in": expires_in},
+            "presigned_upload_url_failed",
+            object_key=object_key,
+            error=str(e),
         )
-        raise S3ClientError(f"Failed to generate presigned URL: {e}") from e
+        raise S3ClientError(f"Failed to generate presigned upload URL: {e}") from e
+
+    return url, headers
 
 
 async def upload_file(
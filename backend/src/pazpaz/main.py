@@ -22,6 +22,7 @@ from pazpaz.api import api_router
 from pazpaz.api.metrics import router as metrics_router
 from pazpaz.core.config import settings
 from pazpaz.core.constants import PHI_FIELDS
+from pazpaz.core.hashing import HashingCapacityError, shutdown_hashing_executor
 from pazpaz.core.logging import (
     bind_context,
     clear_context,
@@ -37,7 +38,13 @@ from pazpaz.middleware.json_depth import JSONDepthValidationMiddleware
 from pazpaz.middleware.rate_limit import IPRateLimitMiddleware
 from pazpaz.middleware.request_size import RequestSizeLimitMiddleware
 from pazpaz.middleware.session_activity import SessionActivityMiddleware
+from pazpaz.monitoring.prometheus import mark_process_dead
 from pazpaz.monitoring.sentry_config import init_sentry
+from pazpaz.monitoring.tenant_metrics import flush_tenant_usage
+from pazpaz.utils.file_processing import (
+    FileProcessingCapacityError,
+    shutdown_file_processing_executor,
+)
 
 
 @asynccontextmanager
@@ -200,7 +207,11 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("application_shutdown", app_name=settings.app_name)
+    await flush_tenant_usage()
     await close_redis()
+    shutdown_hashing_executor()
+    shutdown_file_processing_executor()
+    mark_process_dead()
 
 
 app = FastAPI(
@@ -216,16 +227,21 @@ limiter = Limiter(key_func=get_remote_address)
 app.state.limiter = limiter
 
 # Prometheus HTTP metrics instrumentation (AFTER app initialization)
-# Reuses existing /metrics endpoint (backend/src/pazpaz/api/metrics.py)
+# Exposed by the /metrics endpoint in backend/src/pazpaz/api/metrics.py (not by
+# the instrumentator, whose route would shadow it)
 Instrumentator(
     should_group_status_codes=False,  # Track 200, 201, 404, 500 separately (not 2xx, 4xx)
     should_ignore_untemplated=True,  # Ignore dynamic paths like /api/v1/clients/{uuid}
     should_respect_env_var=True,  # Disable in tests via ENABLE_METRICS=false
-    excluded_handlers=["/metrics", "/health"],  # Don't track monitoring endpoints
+    excluded_handlers=[
+        "/metrics",
+        "/metrics/tenants",
+        "/health",
+    ],  # Don't track monitoring endpoints
     env_var_name="ENABLE_METRICS",
     inprogress_name="http_requests_inprogress",
     inprogress_labels=True,
-).instrument(app).expose(app, include_in_schema=False, endpoint="/metrics")
+).instrument(app)
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -575,6 +591,80 @@ async def database_error_handler(request: Request, exc: DBAPIError):
     )
 
 
+@app.exception_handler(HashingCapacityError)
+async def hashing_capacity_error_handler(request: Request, exc: HashingCapacityError):
+    """
+    Handle a saturated password/backup-code hashing executor.
+
+    A burst of logins is shed with 503 + Retry-After rather than queueing
+    Argon2 work without bound.
+
+    Args:
+        request: FastAPI request object
+        exc: HashingCapacityError
+
+    Returns:
+        JSONResponse with 503 Service Unavailable status
+    """
+    logger = get_logger(__name__)
+
+    request_id = getattr(request.state, "request_id", None) or str(uuid.uuid4())
+
+    logger.warning(
+        "hashing_capacity_exceeded",
+        request_id=request_id,
+        path=request.url.path,
+        method=request.method,
+    )
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "detail": "Authentication service is busy. Please try again shortly.",
+            "request_id": request_id,
+        },
+        headers={"X-Request-ID": request_id, "Retry-After": "1"},
+    )
+
+
+@app.exception_handler(FileProcessingCapacityError)
+async def file_processing_capacity_error_handler(
+    request: Request, exc: FileProcessingCapacityError
+):
+    """
+    Handle a saturated upload validation/sanitization process pool.
+
+    A burst of uploads is shed with 503 + Retry-After rather than queueing
+    image decoding work without bound.
+
+    Args:
+        request: FastAPI request object
+        exc: FileProcessingCapacityError
+
+    Returns:
+        JSONResponse with 503 Service Unavailable status
+    """
+    logger = get_logger(__name__)
+
+    request_id = getattr(request.state, "request_id", None) or str(uuid.uuid4())
+
+    logger.warning(
+        "file_processing_capacity_exceeded",
+        request_id=request_id,
+        path=request.url.path,
+        method=request.method,
+    )
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "detail": "File processing is busy. Please try the upload again shortly.",
+            "request_id": request_id,
+        },
+        headers={"X-Request-ID": request_id, "Retry-After": "2"},
+    )
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """
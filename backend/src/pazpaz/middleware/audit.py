@@ -11,18 +11,22 @@ from prometheus_client import Counter, Histogram
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
 from pazpaz.core.security import decode_access_token
 from pazpaz.db.base import AsyncSessionLocal
 from pazpaz.models.audit_event import AuditAction, ResourceType
+from pazpaz.monitoring.tenant_metrics import record_tenant_usage
 from pazpaz.services.audit_service import create_audit_event
+from pazpaz.services.platform_stats_service import record_workspace_activity
 
 logger = get_logger(__name__)
 
-# Prometheus metrics for audit logging
+# Prometheus metrics for audit logging (per-workspace counts are rolled up
+# by pazpaz.monitoring.tenant_metrics)
 audit_events_total = Counter(
     "audit_events_total",
     "Total audit events created",
-    ["resource_type", "action", "workspace_id"],
+    ["resource_type", "action"],
 )
 
 audit_failures_total = Counter(
@@ -94,6 +98,11 @@ class AuditMiddleware(BaseHTTPMiddleware):
         "/attachments": ResourceType.SESSION_ATTACHMENT,
     }
 
+    # Writes to these resources mark the workspace active (platform stats)
+    ACTIVITY_RESOURCE_TYPES = frozenset(
+        {ResourceType.APPOINTMENT, ResourceType.SESSION, ResourceType.CLIENT}
+    )
+
     # HTTP method to AuditAction mapping
     METHOD_TO_ACTION: dict[str, AuditAction] = {
         "POST": AuditAction.CREATE,
@@ -181,8 +190,30 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 additional_metadata=additional_metadata,
             )
 
+            if (
+                method != "GET"
+                and resource_context["resource_type"] in self.ACTIVITY_RESOURCE_TYPES
+            ):
+                await self._record_workspace_activity(auth_context["workspace_id"])
+
         return response
 
+    async def _record_workspace_activity(self, workspace_id: uuid.UUID) -> None:
+        """
+        Mark the workspace active for platform stats (fail-safe).
+
+        Args:
+            workspace_id: Workspace that performed a write
+        """
+        try:
+            await record_workspace_activity(await get_redis(), workspace_id)
+        except Exception as e:
+            logger.warning(
+                "workspace_activity_record_failed",
+                workspace_id=str(workspace_id),
+                error=str(e),
+            )
+
     def _should_audit_request(self, request: Request) -> bool:
         """
         Determine if request should be audited.
@@ -474,8 +505,8 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 audit_events_total.labels(
                     resource_type=resource_context["resource_type"].value,
                     action=action.value,
-                    workspace_id=str(auth_context["workspace_id"]),
                 ).inc()
+                record_tenant_usage("audit_events", auth_context["workspace_id"])
 
                 logger.debug(
                     "audit_event_logged",
@@ -509,8 +540,10 @@ class AuditMiddleware(BaseHTTPMiddleware):
                         audit_events_total.labels(
                             resource_type=resource_context["resource_type"].value,
                             action=action.value,
-                            workspace_id=str(auth_context["workspace_id"]),
                         ).inc()
+                        record_tenant_usage(
+                            "audit_events", auth_context["workspace_id"]
+                        )
 
                         logger.debug(
                             "audit_event_logged",
@@ -4,6 +4,7 @@ from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
+from pazpaz.core.config import settings
 from pazpaz.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +27,9 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
     - Maximum request size: 20 MB (covers 10 MB file + metadata/form data)
     - File uploads: 10 MB per file (validated separately in file validation)
     - JSON payloads: Covered by same 20 MB limit
+    - POST /transcribe/jobs: TRANSCRIPTION_MAX_UPLOAD_MB plus form overhead
+      (full-session recordings; the endpoint enforces the recording size
+      itself while streaming, also without a Content-Length header)
 
     Performance:
     ------------
@@ -41,6 +45,21 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
 
     MAX_REQUEST_SIZE = 20 * 1024 * 1024  # 20 MB
 
+    # Multipart framing and form fields around an uploaded recording
+    MULTIPART_OVERHEAD_BYTES = 1024 * 1024  # 1 MB
+
+    def max_request_size(self, request: Request) -> int:
+        """Get the body size limit for a request (routes may raise it)."""
+        if (
+            request.method == "POST"
+            and request.url.path == f"{settings.api_v1_prefix}/transcribe/jobs"
+        ):
+            return (
+                settings.transcription_max_upload_mb * 1024 * 1024
+                + self.MULTIPART_OVERHEAD_BYTES
+            )
+        return self.MAX_REQUEST_SIZE
+
     async def dispatch(self, request: Request, call_next):
         """Check Content-Length header before processing request."""
         content_length = request.headers.get("content-length")
@@ -61,8 +80,9 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
                 )
 
             # Reject if exceeds maximum allowed size
-            if content_length_int > self.MAX_REQUEST_SIZE:
-                max_size_mb = self.MAX_REQUEST_SIZE // (1024 * 1024)
+            max_request_size = self.max_request_size(request)
+            if content_length_int > max_request_size:
+                max_size_mb = max_request_size // (1024 * 1024)
                 provided_size_mb = content_length_int / (1024 * 1024)
 
                 logger.warning(
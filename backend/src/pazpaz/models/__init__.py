@@ -5,10 +5,12 @@ from pazpaz.models.appointment_reminder import (
     AppointmentReminderSent,
     ReminderType,
 )
+from pazpaz.models.attachment_blob import AttachmentBlob
 from pazpaz.models.audit_event import AuditAction, AuditEvent, ResourceType
 from pazpaz.models.client import Client
 from pazpaz.models.client_vector import ClientVector
 from pazpaz.models.email_blacklist import EmailBlacklist
+from pazpaz.models.email_outbox import EmailKind, EmailOutbox, EmailOutboxStatus
 from pazpaz.models.google_calendar_token import GoogleCalendarToken
 from pazpaz.models.location import Location
 from pazpaz.models.service import Service
@@ -36,12 +38,16 @@ __all__ = [
     "Location",
     "Session",
     "SessionAttachment",
+    "AttachmentBlob",
     "SessionVector",
     "SessionVersion",
     "AuditEvent",
     "AuditAction",
     "ResourceType",
     "EmailBlacklist",
+    "EmailOutbox",
+    "EmailKind",
+    "EmailOutboxStatus",
     "UserNotificationSettings",
     "GoogleCalendarToken",
 ]
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Computed,
     DateTime,
     Enum,
     ForeignKey,
@@ -18,7 +19,9 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSTZRANGE, Range
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from pazpaz.db.base import Base
@@ -49,6 +52,11 @@ class AppointmentStatus(str, enum.Enum):
     NO_SHOW = "no_show"
 
 
+# Statuses that occupy a time slot (partial GiST index predicate; queries must
+# use the same text for the planner to match the index)
+BLOCKING_STATUS_PREDICATE = "status IN ('SCHEDULED', 'ATTENDED')"
+
+
 class Appointment(Base):
     """
     Appointment represents a scheduled session with a client.
@@ -56,6 +64,12 @@ class Appointment(Base):
     Critical performance requirement: conflict detection queries must
     complete in <150ms p95. Indexes are carefully designed to support
     time-range queries within a workspace.
+
+    Overlap checks use the generated time_range column: the range is
+    half-open ([start, end)), so back-to-back appointments never overlap, and
+    a partial GiST index covers only slot-occupying (SCHEDULED/ATTENDED)
+    appointments. This is an index, not an exclusion constraint, because
+    updates may deliberately keep overlapping appointments ("Keep Both").
     """
 
     __tablename__ = "appointments"
@@ -97,6 +111,12 @@ class Appointment(Base):
         nullable=False,
         comment="End time of the appointment (timezone-aware UTC)",
     )
+    time_range: Mapped[Range[datetime]] = mapped_column(
+        TSTZRANGE,
+        Computed("tstzrange(scheduled_start, scheduled_end, '[)')", persisted=True),
+        deferred=True,
+        comment="[scheduled_start, scheduled_end) for GiST overlap checks",
+    )
     location_type: Mapped[LocationType] = mapped_column(
         Enum(LocationType, native_enum=False, length=50),
         nullable=False,
@@ -212,6 +232,15 @@ class Appointment(Base):
             "scheduled_start",
             "scheduled_end",
         ),
+        # Overlap index for conflict detection (time_range && proposed range)
+        # btree_gist provides the workspace_id equality operator class
+        Index(
+            "ix_appointments_workspace_blocking_time_range",
+            "workspace_id",
+            "time_range",
+            postgresql_using="gist",
+            postgresql_where=text(BLOCKING_STATUS_PREDICATE),
+        ),
         # Index for client timeline view (ordered by appointment time)
         Index(
             "ix_appointments_workspace_client_time",
@@ -0,0 +1,82 @@
+"""AttachmentBlob model - deduplicated attachment file content."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, Integer, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from pazpaz.db.base import Base
+
+if TYPE_CHECKING:
+    from pazpaz.models.workspace import Workspace
+
+
+class AttachmentBlob(Base):
+    """
+    AttachmentBlob is one stored object shared by identical attachments.
+
+    Attachments whose sanitized content is identical (same SHA-256) within a
+    workspace reference the same blob, so a consent form uploaded for many
+    clients is stored, encrypted and counted against the storage quota once.
+
+    reference_count is the number of non-deleted attachments using the blob.
+    The workspace quota includes a blob's size while reference_count > 0.
+    Deduplication never crosses workspaces.
+    """
+
+    __tablename__ = "attachment_blobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    content_sha256: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="Hex SHA-256 of the sanitized file content",
+    )
+    s3_key: Mapped[str] = mapped_column(Text, nullable=False)
+    file_type: Mapped[str] = mapped_column(Text, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    reference_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Non-deleted attachments referencing this blob",
+    )
+    encryption_metadata: Mapped[dict | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="S3 server-side encryption metadata for HIPAA compliance verification",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    # Relationships
+    workspace: Mapped[Workspace] = relationship("Workspace")
+
+    __table_args__ = (
+        # One blob per content per workspace (also the lookup index)
+        UniqueConstraint(
+            "workspace_id",
+            "content_sha256",
+            name="uq_attachment_blobs_workspace_sha256",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AttachmentBlob(id={self.id}, workspace_id={self.workspace_id}, "
+            f"size_bytes={self.size_bytes}, reference_count={self.reference_count})>"
+        )
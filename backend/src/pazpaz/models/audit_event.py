@@ -7,7 +7,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, text
+from sqlalchemy import DDL, DateTime, Enum, ForeignKey, Index, String, Text, event, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -71,6 +71,17 @@ class AuditEvent(Base):
 
     IMPORTANT: This table is append-only. Updates and deletes are prevented
     at the database level to ensure audit trail integrity.
+
+    Partitioning:
+    - Range-partitioned by created_at into monthly partitions
+      (audit_events_yYYYYmMM); the primary key is (id, created_at) because
+      PostgreSQL requires the partition key in unique constraints
+    - Queries bounded by created_at only scan the matching partitions
+    - services/audit_partition_service creates future partitions and
+      detaches, archives (compressed, to object storage) and drops
+      partitions older than the hot retention window
+    - audit_events_default catches rows outside every monthly partition
+      (maintenance keeps it empty by creating partitions ahead of time)
     """
 
     __tablename__ = "audit_events"
@@ -154,10 +165,11 @@ class AuditEvent(Base):
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=text("CURRENT_TIMESTAMP"),
         nullable=False,
         index=True,
-        comment="When the event occurred (immutable)",
+        comment="When the event occurred (immutable, partition key)",
     )
 
     # Relationships
@@ -214,7 +226,8 @@ class AuditEvent(Base):
         {
             "comment": (
                 "Immutable audit trail for HIPAA compliance and security monitoring"
-            )
+            ),
+            "postgresql_partition_by": "RANGE (created_at)",
         },
     )
 
@@ -236,3 +249,15 @@ class AuditEvent(Base):
             ResourceType.PLAN_OF_CARE.value,
         }
         return self.action == AuditAction.READ and self.resource_type in phi_resources
+
+
+# Catch-all partition so inserts never fail if a monthly partition is missing
+# (migrations create it explicitly; this covers metadata.create_all)
+event.listen(
+    AuditEvent.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS audit_events_default "
+        "PARTITION OF audit_events DEFAULT"
+    ),
+)
@@ -0,0 +1,133 @@
+"""Transactional email outbox model - emails queued for background delivery."""
+
+from __future__ import annotations
+
+import enum
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Enum, Index, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from pazpaz.db.base import Base
+from pazpaz.db.types import EncryptedString
+
+
+class EmailKind(str, enum.Enum):
+    """Type of outbox email (selects the message template)."""
+
+    MAGIC_LINK = "magic_link"
+    INVITATION = "invitation"
+
+
+class EmailOutboxStatus(str, enum.Enum):
+    """Delivery state of an outbox email."""
+
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class EmailOutbox(Base):
+    """
+    Email queued by a request handler and delivered by the arq worker.
+
+    Handlers insert a row in the same transaction as the change that triggers
+    the email (magic-link generation, invitation) instead of talking to SMTP
+    inside the request. The drain_email_outbox worker task sends pending rows
+    in batches over one SMTP connection, retrying failures with exponential
+    backoff.
+
+    Deduplication:
+        Rows with a dedupe_key are unique while PENDING. Queuing another
+        email with the same key replaces the pending payload, so repeated
+        magic-link requests before delivery send only the newest link.
+
+    Security:
+        The payload (recipient and link token) is encrypted at rest with
+        EncryptedString; links are single-use and short-lived, but are
+        login credentials until they expire.
+    """
+
+    __tablename__ = "email_outbox"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    kind: Mapped[EmailKind] = mapped_column(
+        Enum(EmailKind, native_enum=False, length=50),
+        nullable=False,
+        comment="Email template (magic_link, invitation)",
+    )
+    payload: Mapped[str] = mapped_column(
+        EncryptedString(4000),
+        nullable=False,
+        comment="Encrypted JSON template arguments (recipient, link)",
+    )
+    dedupe_key: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="Collapses repeated emails while pending (e.g. magic_link:<user>)",
+    )
+    status: Mapped[EmailOutboxStatus] = mapped_column(
+        Enum(EmailOutboxStatus, native_enum=False, length=20),
+        nullable=False,
+        default=EmailOutboxStatus.PENDING,
+        server_default=EmailOutboxStatus.PENDING.name,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Delivery attempts made so far",
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+        comment="Earliest time of the next delivery attempt (retry backoff)",
+    )
+    expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Do not deliver after this time (e.g. magic link expiry)",
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        String(500),
+        nullable=True,
+        comment="Error from the last failed attempt",
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        # Drain query: pending rows that are due, oldest first
+        Index(
+            "idx_email_outbox_pending_due",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # One pending email per dedupe key (ON CONFLICT target)
+        Index(
+            "uq_email_outbox_pending_dedupe_key",
+            "dedupe_key",
+            unique=True,
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        {"comment": "Transactional email outbox drained by the arq worker"},
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmailOutbox(id={self.id}, kind={self.kind.value}, "
+            f"status={self.status.value}, attempts={self.attempts})>"
+        )
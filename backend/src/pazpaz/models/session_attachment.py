@@ -13,6 +13,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from pazpaz.db.base import Base
 
 if TYPE_CHECKING:
+    from pazpaz.models.attachment_blob import AttachmentBlob
     from pazpaz.models.client import Client
     from pazpaz.models.session import Session
     from pazpaz.models.user import User
@@ -30,7 +31,8 @@ class SessionAttachment(Base):
        - Intake forms, consent documents, insurance cards, baseline assessments
 
     Files are stored in MinIO/S3, not in the database. This model stores metadata
-    and references to the files.
+    and references to the files. Identical files within a workspace share one
+    stored object (blob_id, see AttachmentBlob); s3_key is the blob's key.
 
     Security (Week 3):
     - File storage location (s3_key) may need encryption
@@ -70,6 +72,22 @@ class SessionAttachment(Base):
         nullable=False,
         comment="S3/MinIO object key - consider encryption in Week 3",
     )
+    blob_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("attachment_blobs.id"),
+        nullable=True,
+        index=True,
+        comment="Shared stored content (NULL for attachments stored before deduplication)",
+    )
+    thumbnail_s3_key: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Gallery thumbnail object key (NULL until generated)",
+    )
+    preview_s3_key: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Preview image object key, first page for PDFs (NULL until generated)",
+    )
     uploaded_by_user_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
@@ -95,6 +113,7 @@ class SessionAttachment(Base):
     client: Mapped[Client] = relationship("Client")
     workspace: Mapped[Workspace] = relationship("Workspace")
     uploaded_by: Mapped[User | None] = relationship("User")
+    blob: Mapped[AttachmentBlob | None] = relationship("AttachmentBlob")
 
     # Indexes for performance
     __table_args__ = (
@@ -8,7 +8,9 @@ Architecture:
 - Each SOAP field (subjective, objective, assessment, plan) gets its own embedding
 - Embeddings generated via Cohere embed-v4.0 (1536 dimensions)
 - HNSW index for fast similarity search (cosine distance)
+- Keyed lexical tokens (GIN index) for hybrid lexical + vector retrieval
 - Workspace-scoped for multi-tenant isolation
+- client_id denormalized from sessions so client-scoped searches filter in SQL
 
 Security:
 - Embeddings contain semantic meaning (lossy transformation of PHI)
@@ -21,7 +23,8 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, String, func
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from pazpaz.db.base import Base
@@ -42,8 +45,11 @@ class SessionVector(Base):
         id: Primary key (UUID)
         workspace_id: Foreign key to workspaces (multi-tenant isolation)
         session_id: Foreign key to sessions (cascade delete)
+        client_id: Foreign key to clients (denormalized from the session)
         field_name: SOAP field name ('subjective', 'objective', 'assessment', 'plan')
         embedding: Vector embedding (1536 dimensions, Cohere embed-v4.0)
+        lexical_tokens: Keyed HMAC digests of the field's word tokens
+            (see ai/lexical_index.py; never plaintext)
         created_at: Timestamp when embedding was generated
 
     Relationships:
@@ -53,12 +59,15 @@ class SessionVector(Base):
     Indexes:
         - idx_session_vectors_workspace: Workspace isolation (MANDATORY for all queries)
         - idx_session_vectors_session: Session lookup (for deletion cascades)
+        - idx_session_vectors_workspace_client: Client-scoped search
         - idx_session_vectors_embedding: HNSW index for similarity search (cosine distance)
+        - idx_session_vectors_lexical_tokens: GIN index for lexical token overlap
 
     Security Notes:
         - All queries MUST filter by workspace_id (multi-tenant isolation)
         - Embeddings are NOT encrypted (lossy transformation, semantic search requires plaintext)
         - Raw SOAP text remains encrypted in sessions table
+        - Lexical tokens are workspace-salted keyed hashes (blind index)
         - Workspace deletion cascades to vectors (GDPR right to be forgotten)
     """
 
@@ -84,6 +93,12 @@ class SessionVector(Base):
         index=True,
     )
 
+    # Denormalized from sessions.client_id (client-scoped search predicate)
+    client_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("clients.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
     # SOAP field identifier
     field_name: Mapped[str] = mapped_column(
         String(50),
@@ -96,6 +111,14 @@ class SessionVector(Base):
         nullable=False,
     )
 
+    # Keyed lexical index (HMAC digests of SOAP tokens, for hybrid search)
+    lexical_tokens: Mapped[list[str]] = mapped_column(
+        ARRAY(String(16)),
+        nullable=False,
+        default=list,
+        server_default="{}",
+    )
+
     # Metadata
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -123,6 +146,16 @@ class SessionVector(Base):
             "field_name IN ('subjective', 'objective', 'assessment', 'plan')",
             name="ck_session_vectors_field_name",
         ),
+        Index(
+            "idx_session_vectors_workspace_client",
+            "workspace_id",
+            "client_id",
+        ),
+        Index(
+            "idx_session_vectors_lexical_tokens",
+            "lexical_tokens",
+            postgresql_using="gin",
+        ),
     )
 
     def __repr__(self) -> str:
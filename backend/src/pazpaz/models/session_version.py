@@ -6,7 +6,7 @@ import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -30,6 +30,15 @@ class SessionVersion(Base):
     - Version 1: Created when session is finalized (original snapshot)
     - Version 2+: Created before each amendment (preserves previous state)
 
+    Storage (delta compression):
+    - Checkpoint versions (is_checkpoint=True) store the full SOAP snapshot
+      in the encrypted SOAP columns. Version 1 and every
+      SESSION_VERSION_CHECKPOINT_INTERVAL-th version after it are checkpoints.
+    - Other versions store only an encrypted diff against the previous
+      version in `delta` (SOAP columns are NULL).
+    - Use session_version_service to create and materialize versions; rows
+      must not be read as snapshots directly.
+
     Security:
     - All SOAP fields encrypted with AES-256-GCM (same as Session table)
     - Workspace scoping inherited through session relationship
@@ -95,6 +104,20 @@ class SessionVersion(Base):
         comment="ENCRYPTED: Plan (treatment plan) - AES-256-GCM",
     )
 
+    # Delta compression
+    is_checkpoint: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=True,
+        server_default="true",
+        comment="True if SOAP columns hold a full snapshot, False if delta is set",
+    )
+    delta: Mapped[str | None] = mapped_column(
+        EncryptedString(20000),
+        nullable=True,
+        comment="ENCRYPTED: JSON diff against the previous version - AES-256-GCM",
+    )
+
     # Timestamp
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
@@ -130,7 +153,7 @@ class SessionVersion(Base):
         {
             "comment": (
                 "Version history for session notes - tracks amendments "
-                "with encrypted PHI snapshots"
+                "with encrypted PHI snapshots and diffs"
             )
         },
     )
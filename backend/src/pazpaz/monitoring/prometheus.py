@@ -0,0 +1,81 @@
+"""Prometheus exposition for single- and multi-process deployments.
+
+With several uvicorn workers, each process has its own default registry and
+a scrape of /metrics only sees the worker that served it. When the
+PROMETHEUS_MULTIPROC_DIR environment variable is set (before the app is
+imported; the directory must be emptied at deploy/start), prometheus_client
+writes every metric to per-process files in that directory and /metrics
+aggregates all processes sharing it: the uvicorn workers and an arq worker
+running on the same host.
+
+An arq worker in a separate container cannot share that directory; set
+WORKER_METRICS_PORT to serve its metrics on its own port instead.
+
+Usage:
+    payload = generate_metrics()  # in the /metrics endpoint
+    mark_process_dead()  # on process shutdown
+"""
+
+from __future__ import annotations
+
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+from pazpaz.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def multiprocess_enabled() -> bool:
+    """Whether metrics are collected across processes."""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def get_exposition_registry() -> CollectorRegistry:
+    """
+    Get the registry to expose.
+
+    Returns:
+        A registry aggregating all processes in multiprocess mode, otherwise
+        this process's default registry
+    """
+    if not multiprocess_enabled():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def generate_metrics() -> bytes:
+    """Render metrics in Prometheus text format."""
+    return generate_latest(get_exposition_registry())
+
+
+def mark_process_dead() -> None:
+    """Drop this process's live gauges from multiprocess aggregation."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def start_worker_metrics_server(port: int | None) -> None:
+    """
+    Serve metrics over HTTP from a process without a /metrics route.
+
+    Args:
+        port: Port to listen on (None: disabled)
+    """
+    if port is None:
+        return
+    start_http_server(port, registry=get_exposition_registry())
+    logger.info(
+        "worker_metrics_server_started",
+        port=port,
+        multiprocess=multiprocess_enabled(),
+    )
@@ -0,0 +1,193 @@
+"""Per-workspace usage rollups exported separately from the main metrics.
+
+Hot-path Prometheus counters use bounded labels only (no workspace_id), so
+the /metrics payload and Prometheus memory do not grow with the number of
+tenants. Per-tenant detail is kept here instead:
+
+- record_tenant_usage() adds to an in-process buffer (no I/O on the hot
+  path) and schedules a flush on the running event loop
+- the flush writes the buffer to Redis in one pipeline: a sorted set per
+  metric scored by cumulative usage plus a per-metric grand total, so API
+  workers and the arq worker all contribute to the same rollup
+- GET /metrics/tenants exports the top TENANT_METRICS_TOP_K workspaces per
+  metric plus an aggregated workspace_id="other" series, so exported
+  cardinality is bounded regardless of tenant count
+
+Usage:
+    record_tenant_usage("appointments_created", workspace_id)
+
+    payload = await render_tenant_metrics(redis_client)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from prometheus_client import CollectorRegistry, generate_latest
+from prometheus_client.core import CounterMetricFamily
+
+from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+logger = get_logger(__name__)
+
+# Metrics with per-workspace rollups (name -> description)
+TENANT_METRICS: dict[str, str] = {
+    "appointments_created": "Appointments created per workspace",
+    "appointments_cancelled": "Appointments cancelled per workspace",
+    "session_notes_saved": "SOAP session notes saved per workspace",
+    "ai_agent_queries": "AI agent queries per workspace",
+    "ai_agent_rate_limit_hits": "AI agent queries blocked by rate limit per workspace",
+    "audit_events": "Audit events written per workspace",
+}
+
+# Workspaces exported per metric (the rest are summed into "other")
+TENANT_METRICS_TOP_K = 20
+
+# Delay before buffered usage is written to Redis (batches bursts)
+TENANT_METRICS_FLUSH_DELAY_SECONDS = 5.0
+
+# Redis keys: sorted set of workspace usage per metric, hash of totals
+TENANT_USAGE_KEY_PREFIX = "metrics:tenant_usage:"
+TENANT_USAGE_TOTALS_KEY = "metrics:tenant_usage_totals"
+
+_pending: Counter[tuple[str, str]] = Counter()
+_flush_scheduled = False
+_flush_tasks: set[asyncio.Task] = set()
+
+
+def record_tenant_usage(
+    metric: str, workspace_id: uuid.UUID | str, amount: float = 1
+) -> None:
+    """
+    Add per-workspace usage for a metric (buffered; no I/O on this path).
+
+    Args:
+        metric: Key of TENANT_METRICS
+        workspace_id: Workspace the usage belongs to
+        amount: Amount to add
+
+    Raises:
+        ValueError: If metric is not a TENANT_METRICS key
+    """
+    global _flush_scheduled
+
+    if metric not in TENANT_METRICS:
+        raise ValueError(f"Unknown tenant metric: {metric}")
+
+    _pending[(metric, str(workspace_id))] += amount
+
+    if _flush_scheduled:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop (sync context): flushed with the next scheduled flush
+        return
+    _flush_scheduled = True
+    loop.call_later(TENANT_METRICS_FLUSH_DELAY_SECONDS, _start_flush)
+
+
+def _start_flush() -> None:
+    task = asyncio.ensure_future(flush_tenant_usage())
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+
+async def flush_tenant_usage(redis_client: redis.Redis | None = None) -> int:
+    """
+    Write buffered usage to Redis.
+
+    Usage that fails to be written is dropped (metrics are best effort).
+
+    Args:
+        redis_client: Redis client (default: shared client)
+
+    Returns:
+        Number of (metric, workspace) entries written
+    """
+    global _flush_scheduled
+
+    _flush_scheduled = False
+    if not _pending:
+        return 0
+
+    batch = dict(_pending)
+    _pending.clear()
+
+    try:
+        redis_client = redis_client or await get_redis()
+        totals: Counter[str] = Counter()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for (metric, workspace_id), amount in batch.items():
+                pipe.zincrby(TENANT_USAGE_KEY_PREFIX + metric, amount, workspace_id)
+                totals[metric] += amount
+            for metric, amount in totals.items():
+                pipe.hincrbyfloat(TENANT_USAGE_TOTALS_KEY, metric, amount)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(
+            "tenant_usage_flush_failed",
+            entries=len(batch),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return 0
+
+    return len(batch)
+
+
+async def render_tenant_metrics(
+    redis_client: redis.Redis, top_k: int = TENANT_METRICS_TOP_K
+) -> bytes:
+    """
+    Render the per-workspace rollups in Prometheus text format.
+
+    Args:
+        redis_client: Redis client
+        top_k: Workspaces exported per metric
+
+    Returns:
+        Prometheus exposition payload
+    """
+    metrics = list(TENANT_METRICS)
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for metric in metrics:
+            pipe.zrevrange(
+                TENANT_USAGE_KEY_PREFIX + metric, 0, top_k - 1, withscores=True
+            )
+        pipe.hgetall(TENANT_USAGE_TOTALS_KEY)
+        *top_lists, totals = await pipe.execute()
+
+    families = []
+    for metric, top in zip(metrics, top_lists, strict=True):
+        family = CounterMetricFamily(
+            f"tenant_{metric}",
+            TENANT_METRICS[metric],
+            labels=["workspace_id"],
+        )
+        for workspace_id, score in top:
+            family.add_metric([workspace_id], score)
+        other = float(totals.get(metric, 0)) - sum(score for _, score in top)
+        family.add_metric(["other"], max(other, 0.0))
+        families.append(family)
+
+    registry = CollectorRegistry(auto_describe=False)
+    registry.register(_StaticCollector(families))
+    return generate_latest(registry)
+
+
+class _StaticCollector:
+    """Collector yielding pre-built metric families."""
+
+    def __init__(self, families: list[CounterMetricFamily]):
+        self._families = families
+
+    def collect(self):
+        return iter(self._families)
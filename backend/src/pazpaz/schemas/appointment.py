@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic_core import PydanticCustomError
 
-from pazpaz.core.constants import DELETION_REASON_MAX_LENGTH
+from pazpaz.core.constants import (
+    DELETION_REASON_MAX_LENGTH,
+    MAX_CONFLICT_CHECK_INTERVALS,
+)
 from pazpaz.models.appointment import AppointmentStatus, LocationType
 from pazpaz.models.enums import PaymentMethod, PaymentStatus
 
@@ -324,6 +327,116 @@ class ConflictCheckResponse(BaseModel):
     )
 
 
+class ConflictCheckInterval(BaseModel):
+    """A proposed time slot in a batch conflict check."""
+
+    scheduled_start: datetime = Field(
+        ..., description="Start time to check (naive values are taken as UTC)"
+    )
+    scheduled_end: datetime = Field(
+        ..., description="End time to check (naive values are taken as UTC)"
+    )
+
+    @field_validator("scheduled_start", "scheduled_end", mode="before")
+    @classmethod
+    def assume_utc(cls, value):
+        """Treat naive datetimes as UTC so a batch never mixes naive and aware."""
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return value  # Reported by the datetime validation
+        if isinstance(value, datetime) and value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value
+
+    @field_validator("scheduled_end")
+    @classmethod
+    def validate_end_after_start(cls, end: datetime, info) -> datetime:
+        """Validate that scheduled_end is after scheduled_start."""
+        if "scheduled_start" in info.data:
+            start = info.data["scheduled_start"]
+            if end <= start:
+                raise PydanticCustomError(
+                    "value_error",
+                    "scheduled_end must be after scheduled_start",
+                )
+        return end
+
+
+class BatchConflictCheckRequest(BaseModel):
+    """Schema for checking many proposed time slots at once."""
+
+    intervals: list[ConflictCheckInterval] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_CONFLICT_CHECK_INTERVALS,
+        description="Proposed time slots (e.g. a recurring series)",
+    )
+    exclude_appointment_ids: list[uuid.UUID] = Field(
+        default_factory=list,
+        max_length=MAX_CONFLICT_CHECK_INTERVALS,
+        description="Appointments to ignore (those being rescheduled)",
+    )
+
+
+class IntervalConflictResult(BaseModel):
+    """Conflict check result for one proposed time slot."""
+
+    index: int = Field(..., description="Position of the interval in the request")
+    scheduled_start: datetime = Field(..., description="Start time checked")
+    scheduled_end: datetime = Field(..., description="End time checked")
+    has_conflict: bool = Field(
+        ...,
+        description="Whether the slot overlaps an appointment or another interval",
+    )
+    conflicting_appointments: list[ConflictingAppointmentDetail] = Field(
+        default_factory=list,
+        description="Existing appointments overlapping this slot",
+    )
+    overlapping_intervals: list[int] = Field(
+        default_factory=list,
+        description="Indexes of other requested intervals overlapping this slot",
+    )
+
+
+class BatchConflictCheckResponse(BaseModel):
+    """Schema for batch conflict check response."""
+
+    has_conflict: bool = Field(..., description="Whether any interval conflicts")
+    results: list[IntervalConflictResult] = Field(
+        ..., description="Per-interval results, in request order"
+    )
+
+
+class AvailabilityInterval(BaseModel):
+    """A half-open time interval [start, end)."""
+
+    start: datetime = Field(..., description="Interval start (inclusive)")
+    end: datetime = Field(..., description="Interval end (exclusive)")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AvailabilityResponse(BaseModel):
+    """Free/busy availability over a date range (no client details)."""
+
+    start: datetime = Field(..., description="Window start")
+    end: datetime = Field(..., description="Window end")
+    busy: list[AvailabilityInterval] = Field(
+        ..., description="Merged busy intervals (scheduled/attended appointments)"
+    )
+    free: list[AvailabilityInterval] = Field(
+        ..., description="Gaps between busy intervals within the window"
+    )
+    slots: list[AvailabilityInterval] | None = Field(
+        None, description="Open slots of the requested duration (if requested)"
+    )
+    slots_truncated: bool = Field(
+        False, description="Whether slots were cut off at the maximum count"
+    )
+
+
 class SendPaymentRequestBody(BaseModel):
     """Schema for sending payment request to client."""
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class SessionAttachmentResponse(BaseModel):
@@ -39,6 +39,20 @@ class SessionAttachmentResponse(BaseModel):
     is_session_file: bool = Field(
         description="True if attached to specific session, False if client-level"
     )
+    thumbnail_url: str | None = Field(
+        None,
+        description=(
+            "Pre-signed URL of a small WebP thumbnail (list responses only; "
+            "None until generated or for non-image/PDF files)"
+        ),
+    )
+    preview_url: str | None = Field(
+        None,
+        description=(
+            "Pre-signed URL of a larger WebP preview, first page for PDFs "
+            "(list responses only; None until generated)"
+        ),
+    )
 
 
 class SessionAttachmentListResponse(BaseModel):
@@ -48,6 +62,34 @@ class SessionAttachmentListResponse(BaseModel):
     total: int = Field(description="Total number of attachments")
 
 
+class AttachmentDownloadUrl(BaseModel):
+    """Pre-signed URLs of one attachment."""
+
+    attachment_id: uuid.UUID = Field(description="Attachment UUID")
+    file_name: str = Field(description="Sanitized filename")
+    file_type: str = Field(description="MIME type (e.g., image/jpeg)")
+    download_url: str = Field(description="Pre-signed download URL (original)")
+    thumbnail_url: str | None = Field(
+        None, description="Pre-signed thumbnail URL (None until generated)"
+    )
+    preview_url: str | None = Field(
+        None, description="Pre-signed preview URL (None until generated)"
+    )
+
+
+class AttachmentDownloadUrlsResponse(BaseModel):
+    """
+    Response schema for batch download URLs (all attachments of a session or
+    client in one request).
+
+    URLs are valid for at least expires_in_seconds. Within a few minutes,
+    repeated requests return the same URLs, so browsers can cache the files.
+    """
+
+    items: list[AttachmentDownloadUrl] = Field(description="URLs per attachment")
+    expires_in_seconds: int = Field(description="Minimum remaining URL lifetime")
+
+
 class AttachmentRenameRequest(BaseModel):
     """
     Request schema for renaming an attachment.
@@ -96,3 +138,58 @@ class BulkDownloadRequest(BaseModel):
             ]
         ],
     )
+
+
+class AttachmentUploadRequest(BaseModel):
+    """
+    Request schema for starting a direct-to-storage attachment upload.
+
+    Exactly one of session_id (session-level file) or client_id (client-level
+    file) must be given. The declared type and size are enforced when the
+    uploaded file is processed.
+    """
+
+    session_id: uuid.UUID | None = Field(
+        None, description="Session UUID (session-level attachment)"
+    )
+    client_id: uuid.UUID | None = Field(
+        None, description="Client UUID (client-level attachment)"
+    )
+    filename: str = Field(
+        ..., min_length=1, max_length=255, description="Original filename"
+    )
+    content_type: str = Field(..., description="MIME type (e.g., image/jpeg)")
+    size_bytes: int = Field(..., gt=0, description="Exact file size in bytes")
+
+    @model_validator(mode="after")
+    def check_target(self) -> AttachmentUploadRequest:
+        """Require exactly one of session_id and client_id."""
+        if (self.session_id is None) == (self.client_id is None):
+            raise ValueError("Provide exactly one of session_id or client_id")
+        return self
+
+
+class AttachmentUploadResponse(BaseModel):
+    """
+    Response schema for a started direct upload.
+
+    The client must PUT the file body to upload_url with exactly the given
+    headers before expires_in_seconds, then call the complete endpoint.
+    """
+
+    upload_id: uuid.UUID = Field(description="Upload UUID")
+    upload_url: str = Field(description="Pre-signed PUT URL (quarantine)")
+    method: str = Field("PUT", description="HTTP method for upload_url")
+    headers: dict[str, str] = Field(description="Headers the PUT must include")
+    expires_in_seconds: int = Field(description="Seconds until upload_url expires")
+
+
+class AttachmentUploadStatusResponse(BaseModel):
+    """Response schema for the state of a direct upload."""
+
+    upload_id: uuid.UUID = Field(description="Upload UUID")
+    status: str = Field(description="pending, processing, completed or failed")
+    attachment: SessionAttachmentResponse | None = Field(
+        None, description="Created attachment (status completed)"
+    )
+    error: str | None = Field(None, description="Rejection reason (status failed)")
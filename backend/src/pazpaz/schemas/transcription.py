@@ -91,3 +91,41 @@ class CleanupResponse(BaseModel):
             "lower back pain for about two weeks now..."
         ],
     )
+
+
+class TranscriptionJobResponse(BaseModel):
+    """
+    Response schema for a queued long-audio transcription job.
+
+    Used by POST /api/v1/transcribe/jobs endpoint.
+    """
+
+    job_id: str = Field(description="Transcription job ID")
+    status: str = Field(
+        description="Job status (queued, processing, completed, failed)",
+        examples=["queued"],
+    )
+
+
+class TranscriptionJobStatusResponse(TranscriptionJobResponse):
+    """
+    Response schema for the state of a long-audio transcription job.
+
+    Text fields are set once the job is completed; error once it failed.
+
+    Used by GET /api/v1/transcribe/jobs/{job_id} endpoint.
+    """
+
+    completed_segments: int = Field(description="Audio segments transcribed so far")
+    total_segments: int = Field(
+        description="Audio segments in the recording (0 until the audio is analyzed)"
+    )
+    text: str | None = Field(default=None, description="Stitched transcription")
+    cleaned_text: str | None = Field(
+        default=None, description="AI-cleaned transcription (if cleanup requested)"
+    )
+    language: str | None = Field(default=None, description="Detected language")
+    duration_seconds: float | None = Field(
+        default=None, description="Recording duration in seconds"
+    )
+    error: str | None = Field(default=None, description="Failure message")
@@ -0,0 +1,154 @@
+"""Appointment conflict detection for one or many proposed time slots.
+
+Conflicts are found with the generated appointments.time_range column
+(tstzrange [scheduled_start, scheduled_end)) and its partial GiST index
+over SCHEDULED/ATTENDED appointments. Because ranges are half-open,
+back-to-back appointments do not overlap, so no filtering is needed after
+the query.
+
+A batch of N proposed intervals (a recurring series, a multi-appointment
+drag-reschedule) is checked in one query by joining a VALUES list of the
+proposed ranges against the index, instead of N range queries.
+
+Usage:
+    conflicts = await find_conflicts(
+        db,
+        workspace_id,
+        [ProposedInterval(start_1, end_1), ProposedInterval(start_2, end_2)],
+        exclude_appointment_ids=[moved_appointment_id],
+    )
+    # conflicts[i] lists the appointments overlapping interval i
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    and_,
+    column,
+    func,
+    literal_column,
+    select,
+    text,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from pazpaz.models.appointment import BLOCKING_STATUS_PREDICATE, Appointment
+
+
+@dataclass(frozen=True)
+class ProposedInterval:
+    """A time slot to validate, half-open: [scheduled_start, scheduled_end)."""
+
+    scheduled_start: datetime
+    scheduled_end: datetime
+
+
+async def find_conflicts(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    intervals: Sequence[ProposedInterval],
+    exclude_appointment_ids: Sequence[uuid.UUID] = (),
+    load_clients: bool = False,
+) -> list[list[Appointment]]:
+    """
+    Find existing appointments overlapping each proposed interval.
+
+    Only SCHEDULED and ATTENDED appointments cause conflicts. Exact
+    adjacency (one ends when the other starts) is not a conflict.
+
+    Args:
+        db: Database session
+        workspace_id: Workspace to check conflicts in
+        intervals: Proposed time slots
+        exclude_appointment_ids: Appointments to ignore (those being moved)
+        load_clients: Eager-load Appointment.client on the results
+
+    Returns:
+        Conflicting appointments per interval (same order as intervals),
+        ordered by scheduled_start
+    """
+    if not intervals:
+        return []
+
+    proposed = values(
+        column("idx", Integer),
+        column("range_start", DateTime(timezone=True)),
+        column("range_end", DateTime(timezone=True)),
+        name="proposed",
+    ).data(
+        [
+            (index, interval.scheduled_start, interval.scheduled_end)
+            for index, interval in enumerate(intervals)
+        ]
+    )
+
+    query = (
+        select(proposed.c.idx, Appointment)
+        .select_from(proposed)
+        .join(
+            Appointment,
+            and_(
+                Appointment.workspace_id == workspace_id,
+                # Same text as the partial index predicate (see model)
+                text(f"appointments.{BLOCKING_STATUS_PREDICATE}"),
+                Appointment.time_range.op("&&")(
+                    func.tstzrange(
+                        proposed.c.range_start,
+                        proposed.c.range_end,
+                        literal_column("'[)'"),
+                    )
+                ),
+            ),
+        )
+        .order_by(proposed.c.idx, Appointment.scheduled_start)
+    )
+    if exclude_appointment_ids:
+        query = query.where(Appointment.id.not_in(exclude_appointment_ids))
+    if load_clients:
+        query = query.options(selectinload(Appointment.client))
+
+    result = await db.execute(query)
+
+    conflicts: list[list[Appointment]] = [[] for _ in intervals]
+    for index, appointment in result.all():
+        conflicts[index].append(appointment)
+    return conflicts
+
+
+def find_overlapping_intervals(
+    intervals: Sequence[ProposedInterval],
+) -> list[list[int]]:
+    """
+    Find proposed intervals that overlap each other (e.g. within a series).
+
+    Args:
+        intervals: Proposed time slots
+
+    Returns:
+        For each interval, the indexes of other intervals it overlaps
+    """
+    overlaps: list[list[int]] = [[] for _ in intervals]
+    order = sorted(range(len(intervals)), key=lambda i: intervals[i].scheduled_start)
+
+    # Sweep by start time; active holds intervals that may still overlap
+    active: list[int] = []
+    for index in order:
+        start = intervals[index].scheduled_start
+        active = [i for i in active if intervals[i].scheduled_end > start]
+        for other in active:
+            overlaps[index].append(other)
+            overlaps[other].append(index)
+        active.append(index)
+
+    for indexes in overlaps:
+        indexes.sort()
+    return overlaps
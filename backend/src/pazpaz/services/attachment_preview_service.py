@@ -0,0 +1,246 @@
+"""Background thumbnail and preview generation for attachments.
+
+After an image or PDF attachment is uploaded, the upload endpoint enqueues
+the generate_attachment_previews worker task. It downloads the stored
+original, renders a thumbnail and a preview (utils/attachment_previews.py,
+on the file processing pool) and uploads both next to the original with
+server-side encryption verified, like the original itself. The object keys
+are recorded on the attachment.
+
+List endpoints return short-lived presigned URLs for the derived images
+(preview_urls), so galleries load a few KB per tile instead of the original.
+Until the previews exist, or if rendering failed, the URLs are None and
+clients fall back to the download endpoint.
+
+Usage:
+    # Upload endpoint, after the attachment is committed
+    await enqueue_attachment_previews(arq_pool, attachment)
+
+    # List endpoint
+    {**SessionAttachmentResponse.model_validate(att).model_dump(),
+     **preview_urls(att)}
+
+    # Batch download URL endpoints (original, thumbnail and preview)
+    attachment_urls(att, expiration)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+from pazpaz.core.storage import build_derived_object_key, get_s3_client
+from pazpaz.models.session_attachment import SessionAttachment
+from pazpaz.utils.attachment_previews import (
+    PREVIEW_CONTENT_TYPE,
+    PREVIEW_EXTENSION,
+    PREVIEW_VARIANT,
+    PREVIEWABLE_FILE_TYPES,
+    THUMBNAIL_VARIANT,
+    render_attachment_previews,
+)
+from pazpaz.utils.file_processing import run_file_processing
+from pazpaz.utils.file_upload import (
+    generate_presigned_download_url,
+    upload_file_to_s3,
+)
+from pazpaz.utils.file_validation import FileType
+
+if TYPE_CHECKING:
+    from arq.connections import ArqRedis
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+# Presigned thumbnail/preview URLs in list responses
+PREVIEW_URL_EXPIRATION = timedelta(minutes=15)
+
+
+def is_previewable(file_type: str) -> bool:
+    """Return True if previews are generated for this MIME type."""
+    return file_type in {t.value for t in PREVIEWABLE_FILE_TYPES}
+
+
+def preview_job_id(attachment_id: uuid.UUID) -> str:
+    """arq job ID for an attachment's previews (deduplicates enqueues)."""
+    return f"attachment_previews:{attachment_id}"
+
+
+async def enqueue_attachment_previews(
+    arq_pool: ArqRedis, attachment: SessionAttachment
+) -> None:
+    """
+    Enqueue preview generation for a newly uploaded attachment.
+
+    Does nothing for file types without previews, or if the attachment
+    already has previews (shared with identical content). Enqueue failures
+    are logged, not raised: the upload has already succeeded and the
+    gallery falls back to the original.
+
+    Args:
+        arq_pool: arq Redis pool
+        attachment: Committed attachment
+    """
+    if (
+        not is_previewable(attachment.file_type)
+        or attachment.thumbnail_s3_key is not None
+    ):
+        return
+
+    try:
+        await arq_pool.enqueue_job(
+            "generate_attachment_previews",
+            attachment_id=str(attachment.id),
+            workspace_id=str(attachment.workspace_id),
+            _job_id=preview_job_id(attachment.id),
+        )
+    except Exception as e:
+        logger.error(
+            "attachment_previews_enqueue_failed",
+            attachment_id=str(attachment.id),
+            error=str(e),
+            exc_info=True,
+        )
+
+
+def _download_original(s3_key: str) -> bytes:
+    """Download an attachment from object storage."""
+    response = get_s3_client().get_object(Bucket=settings.s3_bucket_name, Key=s3_key)
+    return response["Body"].read()
+
+
+async def create_attachment_previews(
+    db: AsyncSession, attachment_id: uuid.UUID, workspace_id: uuid.UUID
+) -> dict[str, str] | None:
+    """
+    Render and store the thumbnail and preview of an attachment.
+
+    Idempotent: attachments that already have previews are skipped.
+
+    Args:
+        db: Database session
+        attachment_id: Attachment ID
+        workspace_id: Owning workspace (isolation)
+
+    Returns:
+        Object keys by variant, or None if the attachment is missing,
+        deleted, not previewable or already has previews
+
+    Raises:
+        PreviewRenderError: If the attachment cannot be rendered
+        FileProcessingLimitError: If rendering exceeded resource limits
+        S3UploadError: If storing a derived image fails
+    """
+    result = await db.execute(
+        select(SessionAttachment).where(
+            SessionAttachment.id == attachment_id,
+            SessionAttachment.workspace_id == workspace_id,
+            SessionAttachment.deleted_at.is_(None),
+        )
+    )
+    attachment = result.scalar_one_or_none()
+    if (
+        attachment is None
+        or not is_previewable(attachment.file_type)
+        or attachment.thumbnail_s3_key is not None
+    ):
+        return None
+
+    content = await asyncio.to_thread(_download_original, attachment.s3_key)
+    images = await run_file_processing(
+        "preview",
+        render_attachment_previews,
+        content,
+        FileType(attachment.file_type),
+    )
+
+    keys = {}
+    for variant, image in images.items():
+        key = build_derived_object_key(attachment.s3_key, variant, PREVIEW_EXTENSION)
+        await asyncio.to_thread(upload_file_to_s3, image, key, PREVIEW_CONTENT_TYPE)
+        keys[variant] = key
+
+    attachment.thumbnail_s3_key = keys[THUMBNAIL_VARIANT]
+    attachment.preview_s3_key = keys[PREVIEW_VARIANT]
+    await db.commit()
+
+    logger.info(
+        "attachment_previews_created",
+        attachment_id=str(attachment_id),
+        workspace_id=str(workspace_id),
+        file_type=attachment.file_type,
+        original_size=len(content),
+        thumbnail_size=len(images[THUMBNAIL_VARIANT]),
+        preview_size=len(images[PREVIEW_VARIANT]),
+    )
+    return keys
+
+
+def preview_urls(attachment: SessionAttachment) -> dict[str, str | None]:
+    """
+    Presigned URLs of an attachment's thumbnail and preview.
+
+    URLs display inline (no attachment disposition) and expire after
+    PREVIEW_URL_EXPIRATION. Signing is local; no storage request is made.
+
+    Args:
+        attachment: Attachment (workspace access already verified)
+
+    Returns:
+        {"thumbnail_url": ..., "preview_url": ...}; None where not generated
+        (or if signing fails)
+    """
+    urls: dict[str, str | None] = {"thumbnail_url": None, "preview_url": None}
+    for field, key in (
+        ("thumbnail_url", attachment.thumbnail_s3_key),
+        ("preview_url", attachment.preview_s3_key),
+    ):
+        if key is None:
+            continue
+        try:
+            urls[field] = generate_presigned_download_url(
+                s3_key=key,
+                expiration=PREVIEW_URL_EXPIRATION,
+                force_download=False,
+            )
+        except Exception as e:
+            logger.warning(
+                "attachment_preview_url_failed",
+                attachment_id=str(attachment.id),
+                error=str(e),
+            )
+    return urls
+
+
+def attachment_urls(
+    attachment: SessionAttachment, expiration: timedelta
+) -> dict[str, str | None]:
+    """
+    Presigned download URL of an attachment plus its preview URLs.
+
+    Signing is local and cached per time window (core/storage.py), so
+    building URLs for a whole gallery makes no storage requests.
+
+    Args:
+        attachment: Attachment (workspace access already verified)
+        expiration: Download URL expiration
+
+    Returns:
+        {"download_url": ..., "thumbnail_url": ..., "preview_url": ...}
+
+    Raises:
+        S3ClientError: If the download URL cannot be generated
+    """
+    return {
+        "download_url": generate_presigned_download_url(
+            s3_key=attachment.s3_key,
+            expiration=expiration,
+        ),
+        **preview_urls(attachment),
+    }
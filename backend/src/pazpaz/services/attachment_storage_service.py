@@ -0,0 +1,246 @@
+"""Content-addressed storage for attachments.
+
+Identical sanitized files within a workspace (same SHA-256) are stored once:
+attachments reference a shared AttachmentBlob with a reference count. An
+upload of content the workspace already has skips the object upload (and
+its encryption verification) and is not counted against the quota again.
+
+Quota accounting is per blob: a blob's size is reserved when its first
+reference is created and released when its last reference is deleted.
+Attachments created before deduplication (blob_id NULL) are accounted for
+individually, as before.
+
+Lock order: workspace row first (as quota reservation does), then the blob
+row. Concurrent uploads of the same content in a workspace are serialized
+by the workspace lock, so at most one of them creates the blob.
+
+Usage:
+    # Upload: before creating the SessionAttachment row
+    blob, created = await store_attachment_content(
+        db, workspace_id, processed, session_id=session_id, client_id=client_id
+    )
+    attachment = SessionAttachment(..., s3_key=blob.s3_key, blob_id=blob.id)
+    # On commit failure: delete blob.s3_key only if created
+
+    # Delete: with the soft delete, before commit
+    await release_attachment_content(db, attachment)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import TYPE_CHECKING
+
+from prometheus_client import Counter
+from sqlalchemy import select
+
+from pazpaz.core.logging import get_logger
+from pazpaz.core.storage import generate_secure_filename
+from pazpaz.models.attachment_blob import AttachmentBlob
+from pazpaz.models.session_attachment import SessionAttachment
+from pazpaz.models.workspace import Workspace
+from pazpaz.utils.file_upload import upload_file_to_s3
+from pazpaz.utils.storage_quota import (
+    update_workspace_storage,
+    validate_workspace_storage_quota,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from pazpaz.utils.file_sanitization import SanitizedFile
+
+logger = get_logger(__name__)
+
+attachment_deduplicated_total = Counter(
+    "attachment_deduplicated_total",
+    "Attachment uploads served by an existing stored object",
+)
+
+attachment_deduplicated_bytes_total = Counter(
+    "attachment_deduplicated_bytes_total",
+    "Bytes not uploaded because identical content was already stored",
+)
+
+
+async def _lock_workspace(db: AsyncSession, workspace_id: uuid.UUID) -> None:
+    """Lock the workspace row (serializes blob changes within a workspace)."""
+    result = await db.execute(
+        select(Workspace.id).where(Workspace.id == workspace_id).with_for_update()
+    )
+    if result.scalar_one_or_none() is None:
+        raise ValueError(f"Workspace {workspace_id} not found")
+
+
+async def store_attachment_content(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    processed: SanitizedFile,
+    session_id: uuid.UUID | None = None,
+    client_id: uuid.UUID | None = None,
+) -> tuple[AttachmentBlob, bool]:
+    """
+    Reference stored content for a new attachment, uploading it if new.
+
+    Reserves quota for new content (or for a blob whose references were
+    all deleted). Does not commit: the caller adds the attachment and
+    commits, or rolls back to release the reference and the quota.
+
+    Args:
+        db: Database session (must be in active transaction)
+        workspace_id: Workspace UUID
+        processed: Validated, sanitized upload
+        session_id: Session UUID (key prefix for new content)
+        client_id: Client UUID (key prefix for new client-level content)
+
+    Returns:
+        Tuple of (blob, created). created is True if the object was uploaded
+        by this call; the caller must delete it if the commit fails.
+
+    Raises:
+        StorageQuotaExceededError: If the workspace quota would be exceeded
+        ValueError: If the workspace does not exist
+        Exception: If the object upload fails (caller must roll back)
+    """
+    await _lock_workspace(db, workspace_id)
+
+    result = await db.execute(
+        select(AttachmentBlob)
+        .where(
+            AttachmentBlob.workspace_id == workspace_id,
+            AttachmentBlob.content_sha256 == processed.content_sha256,
+        )
+        .with_for_update()
+    )
+    blob = result.scalar_one_or_none()
+
+    if blob is not None:
+        if blob.reference_count == 0:
+            await validate_workspace_storage_quota(
+                workspace_id=workspace_id,
+                new_file_size=blob.size_bytes,
+                db=db,
+            )
+        blob.reference_count += 1
+
+        attachment_deduplicated_total.inc()
+        attachment_deduplicated_bytes_total.inc(blob.size_bytes)
+        logger.info(
+            "attachment_content_deduplicated",
+            workspace_id=str(workspace_id),
+            blob_id=str(blob.id),
+            size_bytes=blob.size_bytes,
+            reference_count=blob.reference_count,
+        )
+        return blob, False
+
+    await validate_workspace_storage_quota(
+        workspace_id=workspace_id,
+        new_file_size=len(processed.content),
+        db=db,
+    )
+
+    s3_key = generate_secure_filename(
+        workspace_id=workspace_id,
+        session_id=session_id,
+        file_type=processed.file_type,
+        client_id=client_id,
+    )
+    upload_result = await asyncio.to_thread(
+        upload_file_to_s3,
+        file_content=processed.content,
+        s3_key=s3_key,
+        content_type=processed.file_type.value,
+    )
+
+    blob = AttachmentBlob(
+        workspace_id=workspace_id,
+        content_sha256=processed.content_sha256,
+        s3_key=s3_key,
+        file_type=processed.file_type.value,
+        size_bytes=len(processed.content),
+        reference_count=1,
+        encryption_metadata=upload_result.get("encryption_metadata"),
+    )
+    db.add(blob)
+    await db.flush()
+    return blob, True
+
+
+async def release_attachment_content(
+    db: AsyncSession, attachment: SessionAttachment
+) -> int:
+    """
+    Release a deleted attachment's stored content.
+
+    Decrements the blob's reference count and releases its quota when the
+    last reference goes. The object itself is kept, like soft-deleted
+    attachments, and is reused if the content is uploaded again. Does not
+    commit: call in the transaction that soft-deletes the attachment.
+
+    Args:
+        db: Database session (must be in active transaction)
+        attachment: Attachment being deleted
+
+    Returns:
+        Bytes released from the workspace quota (0 if still referenced)
+
+    Raises:
+        ValueError: If the workspace does not exist
+    """
+    await _lock_workspace(db, attachment.workspace_id)
+
+    if attachment.blob_id is None:
+        # Stored before deduplication: accounted for individually
+        released = attachment.file_size_bytes
+    else:
+        result = await db.execute(
+            select(AttachmentBlob)
+            .where(AttachmentBlob.id == attachment.blob_id)
+            .with_for_update()
+        )
+        blob = result.scalar_one()
+        blob.reference_count = max(blob.reference_count - 1, 0)
+        released = blob.size_bytes if blob.reference_count == 0 else 0
+
+    if released:
+        await update_workspace_storage(
+            workspace_id=attachment.workspace_id,
+            bytes_delta=-released,
+            db=db,
+        )
+    return released
+
+
+async def copy_existing_previews(
+    db: AsyncSession, attachment: SessionAttachment
+) -> bool:
+    """
+    Reuse the thumbnail and preview of another attachment with the same blob.
+
+    Derived images are keyed by the stored object, so attachments sharing a
+    blob share them too; rendering them again is unnecessary.
+
+    Args:
+        db: Database session
+        attachment: New attachment referencing an existing blob (not committed)
+
+    Returns:
+        True if previews were copied (no preview generation needed)
+    """
+    if attachment.blob_id is None:
+        return False
+    result = await db.execute(
+        select(SessionAttachment.thumbnail_s3_key, SessionAttachment.preview_s3_key)
+        .where(
+            SessionAttachment.blob_id == attachment.blob_id,
+            SessionAttachment.thumbnail_s3_key.is_not(None),
+        )
+        .limit(1)
+    )
+    row = result.first()
+    if row is None:
+        return False
+    attachment.thumbnail_s3_key, attachment.preview_s3_key = row
+    return True
@@ -0,0 +1,514 @@
+"""Direct-to-storage attachment uploads with background processing.
+
+Instead of streaming file bytes through the API, clients upload in two
+phases:
+
+1. POST /attachments/uploads declares the file (name, type, size). The API
+   checks what it can without the bytes (size, extension/type whitelist,
+   access to the session or client) and returns a presigned PUT URL for a
+   quarantine key. The client uploads directly to object storage.
+2. POST /attachments/uploads/{upload_id}/complete enqueues the
+   process_attachment_upload worker task, which downloads the quarantined
+   object, runs the same validation, malware scan and sanitization as
+   multipart uploads (process_upload), stores the sanitized file under its
+   final key (or reuses identical stored content, see
+   attachment_storage_service), creates the attachment row and deletes the
+   quarantined object.
+
+Nothing outside the quarantine prefix is writable with the presigned URL,
+and nothing under it is ever served to users. Files rejected by processing
+are deleted; uploads that are never completed expire by bucket lifecycle
+rule (scripts/create_storage_buckets.py).
+
+Upload state lives in Redis (direct_upload:<upload_id>, expires after
+ATTACHMENT_UPLOAD_TTL_SECONDS); clients poll GET
+/attachments/uploads/{upload_id} for the outcome.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from botocore.exceptions import ClientError
+from redis.exceptions import WatchError
+from sqlalchemy import func, select
+
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+from pazpaz.core.storage import generate_presigned_upload_url, get_s3_client
+from pazpaz.models.session_attachment import SessionAttachment
+from pazpaz.services.attachment_preview_service import enqueue_attachment_previews
+from pazpaz.services.attachment_storage_service import (
+    copy_existing_previews,
+    store_attachment_content,
+)
+from pazpaz.utils.file_processing import process_upload
+from pazpaz.utils.file_sanitization import SanitizationError
+from pazpaz.utils.file_upload import delete_file_from_s3
+from pazpaz.utils.file_validation import (
+    MAX_FILE_SIZE_BYTES,
+    FileSizeExceededError,
+    FileType,
+    FileValidationError,
+    UnsupportedFileTypeError,
+    validate_extension,
+    validate_file_size,
+    validate_mime_extension_match,
+    validate_total_attachments_size,
+)
+from pazpaz.utils.malware_scanner import MalwareDetectedError
+from pazpaz.utils.storage_quota import StorageQuotaExceededError
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+    from arq.connections import ArqRedis
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from pazpaz.utils.file_sanitization import SanitizedFile
+
+logger = get_logger(__name__)
+
+# Total size of all attachments of one client (client-level uploads)
+CLIENT_ATTACHMENTS_MAX_TOTAL_BYTES = 100 * 1024 * 1024
+
+# Presigned upload URLs expire after 15 minutes; upload state after an hour
+UPLOAD_URL_EXPIRATION_SECONDS = 15 * 60
+ATTACHMENT_UPLOAD_TTL_SECONDS = 60 * 60
+
+QUARANTINE_PREFIX = "quarantine"
+ATTACHMENT_UPLOAD_KEY = "direct_upload:{upload_id}"
+
+# Optimistic-transaction retries for concurrent upload state changes
+MAX_UPDATE_RETRIES = 5
+
+
+class AttachmentUploadStatus(str, enum.Enum):
+    """Lifecycle of a direct upload."""
+
+    PENDING = "pending"  # URL issued, waiting for the client
+    PROCESSING = "processing"  # Completed by the client, queued/processing
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+TERMINAL_STATUSES = {AttachmentUploadStatus.COMPLETED, AttachmentUploadStatus.FAILED}
+
+
+class AttachmentUploadRejectedError(Exception):
+    """Raised when an uploaded object is missing or does not match its declaration."""
+
+
+@dataclass(frozen=True)
+class AttachmentUpload:
+    """State of a direct upload."""
+
+    id: str
+    workspace_id: uuid.UUID
+    user_id: uuid.UUID
+    client_id: uuid.UUID
+    session_id: uuid.UUID | None
+    filename: str
+    content_type: str
+    size_bytes: int
+    object_key: str
+    status: AttachmentUploadStatus
+    attachment_id: uuid.UUID | None
+    error: str | None
+
+
+def quarantine_object_key(workspace_id: uuid.UUID, upload_id: str) -> str:
+    """Quarantine key a direct upload is written to."""
+    return f"{QUARANTINE_PREFIX}/workspaces/{workspace_id}/{upload_id}"
+
+
+async def create_attachment_upload(
+    redis_client: redis.Redis,
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+    client_id: uuid.UUID,
+    session_id: uuid.UUID | None,
+    filename: str,
+    content_type: str,
+    size_bytes: int,
+) -> tuple[AttachmentUpload, str, dict[str, str]]:
+    """
+    Register a direct upload and presign its quarantine PUT URL.
+
+    Only the declaration is checked here; the content is validated after
+    upload. Access to the session/client must be verified by the caller.
+
+    Args:
+        redis_client: Redis client
+        workspace_id: Workspace UUID
+        user_id: Uploading user
+        client_id: Client the attachment belongs to
+        session_id: Session UUID (None for client-level files)
+        filename: Original filename
+        content_type: Declared MIME type
+        size_bytes: Declared file size
+
+    Returns:
+        Tuple of (upload, presigned PUT URL, headers the PUT must include)
+
+    Raises:
+        FileSizeExceededError: If the declared size exceeds the limit
+        UnsupportedFileTypeError: If the extension or type is not allowed
+        MimeTypeMismatchError: If type and extension do not match
+    """
+    validate_file_size(size_bytes)
+    extension = validate_extension(filename)
+    try:
+        file_type = FileType(content_type)
+    except ValueError as e:
+        raise UnsupportedFileTypeError(f"MIME type {content_type} not allowed") from e
+    validate_mime_extension_match(file_type, extension)
+
+    upload_id = str(uuid.uuid4())
+    object_key = quarantine_object_key(workspace_id, upload_id)
+    url, headers = generate_presigned_upload_url(
+        object_key, file_type.value, expires_in=UPLOAD_URL_EXPIRATION_SECONDS
+    )
+
+    key = ATTACHMENT_UPLOAD_KEY.format(upload_id=upload_id)
+    mapping = {
+        "workspace_id": str(workspace_id),
+        "user_id": str(user_id),
+        "client_id": str(client_id),
+        "filename": filename,
+        "content_type": file_type.value,
+        "size_bytes": str(size_bytes),
+        "object_key": object_key,
+        "status": AttachmentUploadStatus.PENDING.value,
+    }
+    if session_id is not None:
+        mapping["session_id"] = str(session_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, ATTACHMENT_UPLOAD_TTL_SECONDS)
+        await pipe.execute()
+
+    logger.info(
+        "attachment_upload_created",
+        upload_id=upload_id,
+        workspace_id=str(workspace_id),
+        client_id=str(client_id),
+        session_id=str(session_id) if session_id else None,
+        file_type=file_type.value,
+        size_bytes=size_bytes,
+    )
+    upload = await get_attachment_upload(redis_client, upload_id)
+    return upload, url, headers
+
+
+async def get_attachment_upload(
+    redis_client: redis.Redis, upload_id: str, workspace_id: uuid.UUID | None = None
+) -> AttachmentUpload | None:
+    """
+    Load a direct upload.
+
+    Args:
+        redis_client: Redis client
+        upload_id: Upload ID
+        workspace_id: If given, uploads of other workspaces are treated as missing
+
+    Returns:
+        Upload, or None if it does not exist (or expired)
+    """
+    data = await redis_client.hgetall(ATTACHMENT_UPLOAD_KEY.format(upload_id=upload_id))
+    if not data:
+        return None
+    if workspace_id is not None and data["workspace_id"] != str(workspace_id):
+        return None
+
+    return AttachmentUpload(
+        id=upload_id,
+        workspace_id=uuid.UUID(data["workspace_id"]),
+        user_id=uuid.UUID(data["user_id"]),
+        client_id=uuid.UUID(data["client_id"]),
+        session_id=uuid.UUID(data["session_id"]) if "session_id" in data else None,
+        filename=data["filename"],
+        content_type=data["content_type"],
+        size_bytes=int(data["size_bytes"]),
+        object_key=data["object_key"],
+        status=AttachmentUploadStatus(data["status"]),
+        attachment_id=(
+            uuid.UUID(data["attachment_id"]) if "attachment_id" in data else None
+        ),
+        error=data.get("error"),
+    )
+
+
+async def submit_attachment_upload(redis_client: redis.Redis, upload_id: str) -> bool:
+    """
+    Mark an upload as completed by the client (pending -> processing).
+
+    Args:
+        redis_client: Redis client
+        upload_id: Upload ID
+
+    Returns:
+        True if this call submitted the upload, False if it was already
+        submitted (processing must be enqueued only once) or has expired
+    """
+    key = ATTACHMENT_UPLOAD_KEY.format(upload_id=upload_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        for attempt in range(MAX_UPDATE_RETRIES):
+            try:
+                await pipe.watch(key)
+                if not await pipe.exists(key) or await pipe.hexists(key, "submitted"):
+                    await pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.hset(
+                    key,
+                    mapping={
+                        "submitted": "1",
+                        "status": AttachmentUploadStatus.PROCESSING.value,
+                    },
+                )
+                pipe.expire(key, ATTACHMENT_UPLOAD_TTL_SECONDS)
+                await pipe.execute()
+                return True
+            except WatchError:
+                # Concurrent completion call; re-check on the new state
+                if attempt == MAX_UPDATE_RETRIES - 1:
+                    raise
+
+    raise AssertionError("unreachable")
+
+
+async def _update_upload(
+    redis_client: redis.Redis, upload_id: str, **fields: str
+) -> bool:
+    """
+    Update upload fields.
+
+    Only updates an upload that still exists (an expired upload would
+    otherwise be recreated as a partial hash without owner or TTL), and
+    renews its TTL.
+
+    Returns:
+        True if the upload was updated, False if it no longer exists
+    """
+    key = ATTACHMENT_UPLOAD_KEY.format(upload_id=upload_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        for attempt in range(MAX_UPDATE_RETRIES):
+            try:
+                await pipe.watch(key)
+                if not await pipe.exists(key):
+                    await pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, ATTACHMENT_UPLOAD_TTL_SECONDS)
+                await pipe.execute()
+                return True
+            except WatchError:
+                if attempt == MAX_UPDATE_RETRIES - 1:
+                    raise
+
+    raise AssertionError("unreachable")
+
+
+def read_quarantined_upload(s3_client: Any, upload: AttachmentUpload) -> bytes:
+    """
+    Download a quarantined upload, checking it against its declaration.
+
+    Args:
+        s3_client: boto3 S3 client (or compatible)
+        upload: Upload
+
+    Returns:
+        Uploaded bytes
+
+    Raises:
+        AttachmentUploadRejectedError: If nothing was uploaded or the object
+            is larger than allowed
+    """
+    bucket = settings.s3_bucket_name
+    try:
+        head = s3_client.head_object(Bucket=bucket, Key=upload.object_key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            raise AttachmentUploadRejectedError("File was not uploaded") from e
+        raise
+
+    # Checked before download: the presigned PUT does not bound the size
+    size = head["ContentLength"]
+    if size > MAX_FILE_SIZE_BYTES or size != upload.size_bytes:
+        raise AttachmentUploadRejectedError(
+            f"Uploaded file size {size} bytes does not match declared size "
+            f"{upload.size_bytes} bytes (maximum {MAX_FILE_SIZE_BYTES} bytes)"
+        )
+
+    response = s3_client.get_object(Bucket=bucket, Key=upload.object_key)
+    return response["Body"].read()
+
+
+async def _existing_attachments_size(db: AsyncSession, upload: AttachmentUpload) -> int:
+    """Total size of the session's (or client's) current attachments."""
+    scope = (
+        SessionAttachment.session_id == upload.session_id
+        if upload.session_id is not None
+        else SessionAttachment.client_id == upload.client_id
+    )
+    result = await db.execute(
+        select(func.coalesce(func.sum(SessionAttachment.file_size_bytes), 0)).where(
+            scope,
+            SessionAttachment.workspace_id == upload.workspace_id,
+            SessionAttachment.deleted_at.is_(None),
+        )
+    )
+    return result.scalar_one()
+
+
+async def _store_attachment(
+    db: AsyncSession, upload: AttachmentUpload, processed: SanitizedFile
+) -> SessionAttachment:
+    """Store a processed upload (deduplicated) and create its row."""
+    existing_total_size = await _existing_attachments_size(db, upload)
+    if upload.session_id is not None:
+        validate_total_attachments_size(existing_total_size, len(processed.content))
+    elif (
+        existing_total_size + len(processed.content)
+        > CLIENT_ATTACHMENTS_MAX_TOTAL_BYTES
+    ):
+        raise FileSizeExceededError(
+            f"Total client attachments would exceed "
+            f"{CLIENT_ATTACHMENTS_MAX_TOTAL_BYTES // (1024 * 1024)} MB limit"
+        )
+
+    # Reserves quota for new content (workspace row locked until commit)
+    try:
+        blob, blob_created = await store_attachment_content(
+            db,
+            upload.workspace_id,
+            processed,
+            session_id=upload.session_id,
+            client_id=upload.client_id,
+        )
+    except Exception:
+        await db.rollback()
+        raise
+
+    attachment = SessionAttachment(
+        session_id=upload.session_id,
+        client_id=upload.client_id,
+        workspace_id=upload.workspace_id,
+        file_name=processed.filename,
+        file_type=processed.file_type.value,
+        file_size_bytes=len(processed.content),
+        s3_key=blob.s3_key,
+        blob_id=blob.id,
+        uploaded_by_user_id=upload.user_id,
+        encryption_metadata=blob.encryption_metadata,
+    )
+    if not blob_created:
+        await copy_existing_previews(db, attachment)
+    db.add(attachment)
+    try:
+        await db.commit()
+        await db.refresh(attachment)
+    except Exception:
+        await db.rollback()
+        if blob_created:
+            await asyncio.to_thread(delete_file_from_s3, blob.s3_key)
+        raise
+    return attachment
+
+
+async def finalize_attachment_upload(
+    redis_client: redis.Redis,
+    db: AsyncSession,
+    upload_id: str,
+    arq_pool: ArqRedis | None = None,
+    s3_client: Any = None,
+) -> AttachmentUpload | None:
+    """
+    Validate, scan, sanitize and promote a quarantined upload.
+
+    Rejected files (invalid, infected, over quota, not uploaded) fail the
+    upload and are deleted. Other errors (storage, scanner or database
+    unavailable) propagate so the worker retries; the upload then stays
+    "processing". Idempotent for finished uploads.
+
+    Args:
+        redis_client: Redis client
+        db: Database session
+        upload_id: Upload ID
+        arq_pool: If given, preview generation is enqueued for the attachment
+        s3_client: S3 client (default: get_s3_client())
+
+    Returns:
+        Finished upload, or None if it does not exist (or expired)
+    """
+    upload = await get_attachment_upload(redis_client, upload_id)
+    if upload is None or upload.status in TERMINAL_STATUSES:
+        return upload
+
+    s3_client = s3_client or get_s3_client()
+    try:
+        content = await asyncio.to_thread(read_quarantined_upload, s3_client, upload)
+        processed = await process_upload(upload.filename, content)
+        attachment = await _store_attachment(db, upload, processed)
+
+    except (
+        AttachmentUploadRejectedError,
+        FileValidationError,
+        MalwareDetectedError,
+        SanitizationError,
+        StorageQuotaExceededError,
+    ) as e:
+        await db.rollback()
+        logger.warning(
+            "attachment_upload_rejected",
+            upload_id=upload_id,
+            workspace_id=str(upload.workspace_id),
+            reason=str(e),
+            error_type=type(e).__name__,
+        )
+        await _update_upload(
+            redis_client,
+            upload_id,
+            status=AttachmentUploadStatus.FAILED.value,
+            error=str(e),
+        )
+        await asyncio.to_thread(
+            s3_client.delete_object,
+            Bucket=settings.s3_bucket_name,
+            Key=upload.object_key,
+        )
+        return await get_attachment_upload(redis_client, upload_id)
+
+    await _update_upload(
+        redis_client,
+        upload_id,
+        status=AttachmentUploadStatus.COMPLETED.value,
+        attachment_id=str(attachment.id),
+    )
+    try:
+        await asyncio.to_thread(
+            s3_client.delete_object,
+            Bucket=settings.s3_bucket_name,
+            Key=upload.object_key,
+        )
+    except Exception as e:
+        # Expires by lifecycle rule; never served from quarantine
+        logger.warning("quarantine_cleanup_failed", upload_id=upload_id, error=str(e))
+
+    if arq_pool is not None:
+        await enqueue_attachment_previews(arq_pool, attachment)
+
+    logger.info(
+        "attachment_upload_finalized",
+        upload_id=upload_id,
+        attachment_id=str(attachment.id),
+        workspace_id=str(upload.workspace_id),
+        file_type=attachment.file_type,
+        file_size=attachment.file_size_bytes,
+    )
+    return await get_attachment_upload(redis_client, upload_id)
@@ -0,0 +1,350 @@
+"""Monthly partition maintenance and archival for audit_events.
+
+audit_events is range-partitioned by created_at into monthly partitions
+named audit_events_yYYYYmMM. run_audit_partition_maintenance() (daily worker
+job, also at worker startup):
+
+1. Creates partitions for the current month and AUDIT_PARTITION_MONTHS_AHEAD
+   months ahead, so inserts never land in the default partition.
+2. Detaches partitions that ended more than settings.audit_hot_retention_months
+   ago. Detached tables keep their rows; they are just no longer scanned.
+3. Archives each detached partition: rows are streamed in created_at order
+   as gzip-compressed JSON lines to object storage (SSE encrypted, Object
+   Lock retention; required in production), the upload is verified (size and SHA-256), and
+   only then is the table dropped. A failed archive leaves the detached table
+   in place and is retried on the next run, so audit rows are never dropped
+   without a verified archive copy.
+
+Archive layout:
+    s3://<bucket>/audit-archive/<year>/audit_events_yYYYYmMM.jsonl.gz
+    metadata: row-count, sha256, partition-start, partition-end
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import text
+
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+from pazpaz.core.storage import get_s3_client
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+# Partitions created ahead of the current month
+AUDIT_PARTITION_MONTHS_AHEAD = 3
+
+# Object key prefix of archived partitions
+AUDIT_ARCHIVE_PREFIX = "audit-archive"
+
+_PARTITION_NAME = re.compile(r"^audit_events_y(\d{4})m(\d{2})$")
+
+
+class AuditArchiveError(Exception):
+    """Raised when an archived partition cannot be verified."""
+
+
+def month_start(value: date | datetime) -> date:
+    """First day of the (UTC) month containing value."""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return date(value.year, value.month, 1)
+
+
+def utc_bound(month: date) -> str:
+    """
+    Partition bound literal for midnight UTC on a month start.
+
+    Explicit offset: a plain date literal would be interpreted in the
+    session TimeZone, shifting partition boundaries with the server setting.
+    """
+    return f"{month.isoformat()} 00:00:00+00"
+
+
+def add_months(month: date, months: int) -> date:
+    """Shift a month-start date by a number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+@dataclass(frozen=True)
+class AuditPartition:
+    """A monthly audit_events partition covering [start, end)."""
+
+    start: date
+
+    @property
+    def end(self) -> date:
+        """Exclusive upper bound (first day of the next month)."""
+        return add_months(self.start, 1)
+
+    @property
+    def name(self) -> str:
+        """Partition table name."""
+        return f"audit_events_y{self.start.year:04d}m{self.start.month:02d}"
+
+    @property
+    def archive_key(self) -> str:
+        """Object key of the archived partition."""
+        return f"{AUDIT_ARCHIVE_PREFIX}/{self.start.year:04d}/{self.name}.jsonl.gz"
+
+    @classmethod
+    def from_name(cls, name: str) -> AuditPartition | None:
+        """Parse a partition table name (None if not a monthly partition)."""
+        match = _PARTITION_NAME.match(name)
+        if not match:
+            return None
+        return cls(date(int(match.group(1)), int(match.group(2)), 1))
+
+
+async def list_partitions(
+    db: AsyncSession,
+) -> tuple[list[AuditPartition], list[AuditPartition]]:
+    """
+    List monthly partition tables.
+
+    Args:
+        db: Database session
+
+    Returns:
+        (attached partitions, detached partition tables awaiting archival),
+        each ordered by month
+    """
+    result = await db.execute(
+        text(
+            "SELECT c.relname, c.relispartition FROM pg_class c "
+            "WHERE c.relkind IN ('r', 'p') "
+            "AND c.relname ~ '^audit_events_y[0-9]{4}m[0-9]{2}$' "
+            "AND pg_table_is_visible(c.oid)"
+        )
+    )
+
+    attached: list[AuditPartition] = []
+    detached: list[AuditPartition] = []
+    for name, is_partition in result.all():
+        partition = AuditPartition.from_name(name)
+        if partition is not None:
+            (attached if is_partition else detached).append(partition)
+
+    return (
+        sorted(attached, key=lambda p: p.start),
+        sorted(detached, key=lambda p: p.start),
+    )
+
+
+async def ensure_partitions(
+    db: AsyncSession,
+    now: datetime,
+    months_ahead: int = AUDIT_PARTITION_MONTHS_AHEAD,
+) -> list[str]:
+    """
+    Create missing partitions for the current and upcoming months (caller commits).
+
+    Args:
+        db: Database session
+        now: Current time
+        months_ahead: Months after the current one to create
+
+    Returns:
+        Names of created partitions
+    """
+    attached, _ = await list_partitions(db)
+    existing = {partition.start for partition in attached}
+
+    created = []
+    current = month_start(now)
+    for offset in range(months_ahead + 1):
+        partition = AuditPartition(add_months(current, offset))
+        if partition.start in existing:
+            continue
+        await db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition.name} "
+                f"PARTITION OF audit_events FOR VALUES "
+                f"FROM ('{utc_bound(partition.start)}') "
+                f"TO ('{utc_bound(partition.end)}')"
+            )
+        )
+        created.append(partition.name)
+
+    return created
+
+
+async def export_partition(
+    db: AsyncSession, partition: AuditPartition, path: str
+) -> tuple[int, str]:
+    """
+    Stream a partition's rows to a gzip-compressed JSON lines file.
+
+    Args:
+        db: Database session
+        partition: Partition (attached or detached) to export
+        path: Output file path
+
+    Returns:
+        (row count, SHA-256 hex digest of the compressed file)
+    """
+    rows = 0
+    result = await db.stream(
+        text(
+            f"SELECT row_to_json(t)::text FROM {partition.name} t "
+            "ORDER BY t.created_at, t.id"
+        )
+    )
+    with gzip.open(path, "wt", encoding="utf-8") as archive:
+        async for (line,) in result:
+            archive.write(line)
+            archive.write("\n")
+            rows += 1
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as archive:
+        for chunk in iter(lambda: archive.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    return rows, digest.hexdigest()
+
+
+def upload_archive(
+    partition: AuditPartition, path: str, rows: int, sha256: str
+) -> None:
+    """
+    Upload an exported partition and verify the stored object (blocking).
+
+    Args:
+        partition: Archived partition
+        path: Exported file path
+        rows: Row count of the export
+        sha256: SHA-256 of the exported file
+
+    Raises:
+        AuditArchiveError: If the stored object does not match the export
+    """
+    s3_client = get_s3_client()
+    bucket = settings.audit_archive_bucket or settings.s3_bucket_name
+
+    extra_args: dict[str, Any] = {
+        "ContentType": "application/gzip",
+        "ServerSideEncryption": "AES256",
+        "Metadata": {
+            "row-count": str(rows),
+            "sha256": sha256,
+            "partition-start": partition.start.isoformat(),
+            "partition-end": partition.end.isoformat(),
+        },
+    }
+    if settings.audit_archive_object_lock:
+        retain_until = add_months(
+            partition.end, 12 * settings.audit_archive_retention_years
+        )
+        extra_args["ObjectLockMode"] = "COMPLIANCE"
+        extra_args["ObjectLockRetainUntilDate"] = datetime(
+            retain_until.year, retain_until.month, retain_until.day, tzinfo=UTC
+        )
+
+    s3_client.upload_file(path, bucket, partition.archive_key, ExtraArgs=extra_args)
+
+    head = s3_client.head_object(Bucket=bucket, Key=partition.archive_key)
+    if (
+        head.get("ContentLength") != os.path.getsize(path)
+        or head.get("Metadata", {}).get("sha256") != sha256
+    ):
+        raise AuditArchiveError(
+            f"Archived object {partition.archive_key} does not match export"
+        )
+
+
+async def archive_partition(db: AsyncSession, partition: AuditPartition) -> int:
+    """
+    Archive a detached partition to object storage and drop it.
+
+    The table is only dropped after the upload is verified.
+
+    Args:
+        db: Database session
+        partition: Detached partition
+
+    Returns:
+        Number of archived rows
+    """
+    with tempfile.TemporaryDirectory(prefix="audit-archive-") as directory:
+        path = os.path.join(directory, f"{partition.name}.jsonl.gz")
+        rows, sha256 = await export_partition(db, partition, path)
+        await asyncio.to_thread(upload_archive, partition, path, rows, sha256)
+
+    await db.execute(text(f"DROP TABLE {partition.name}"))
+    await db.commit()
+
+    logger.info(
+        "audit_partition_archived",
+        partition=partition.name,
+        rows=rows,
+        archive_key=partition.archive_key,
+    )
+    return rows
+
+
+async def run_audit_partition_maintenance(
+    db: AsyncSession, now: datetime | None = None
+) -> dict[str, int]:
+    """
+    Create upcoming partitions, detach aged ones and archive detached ones.
+
+    Args:
+        db: Database session
+        now: Current time (default: now)
+
+    Returns:
+        Counts of created, detached, archived and failed partitions and
+        archived rows
+    """
+    now = now or datetime.now(UTC)
+    stats = {"created": 0, "detached": 0, "archived": 0, "failed": 0, "rows": 0}
+
+    created = await ensure_partitions(db, now)
+    await db.commit()
+    stats["created"] = len(created)
+
+    cutoff = add_months(month_start(now), -settings.audit_hot_retention_months)
+    attached, detached = await list_partitions(db)
+
+    for partition in attached:
+        if partition.end > cutoff:
+            break
+        await db.execute(
+            text(f"ALTER TABLE audit_events DETACH PARTITION {partition.name}")
+        )
+        await db.commit()
+        detached.append(partition)
+        stats["detached"] += 1
+        logger.info("audit_partition_detached", partition=partition.name)
+
+    for partition in detached:
+        try:
+            stats["rows"] += await archive_partition(db, partition)
+            stats["archived"] += 1
+        except Exception as e:
+            # Table stays detached; the next run retries the archive
+            await db.rollback()
+            stats["failed"] += 1
+            logger.error(
+                "audit_partition_archive_failed",
+                partition=partition.name,
+                error=str(e),
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+
+    return stats
@@ -20,7 +20,7 @@ from pazpaz.core.rate_limiting import check_rate_limit_redis
 from pazpaz.core.security import create_access_token
 from pazpaz.models.user import User
 from pazpaz.models.workspace import WorkspaceStatus
-from pazpaz.services.email_service import send_magic_link_email
+from pazpaz.services.email_outbox_service import queue_magic_link_email
 
 logger = get_logger(__name__)
 
@@ -160,7 +160,11 @@ async def request_magic_link(
     request_ip: str,
 ) -> None:
     """
-    Generate and send magic link to user email with audit logging.
+    Generate magic link and queue the login email, with audit logging.
+
+    The email is written to the email outbox in this transaction and sent by
+    the arq worker, so the request does not wait on SMTP. Callers should
+    call notify_email_outbox() afterwards for immediate delivery.
 
     Security features:
     - Rate limiting: 3 requests per hour per IP
@@ -406,8 +410,14 @@ async def request_magic_link(
         expiry_seconds=MAGIC_LINK_EXPIRY_SECONDS,
     )
 
-    # Send magic link email
-    await send_magic_link_email(user.email, token)
+    # Queue magic link email (delivered by the arq worker, not inline SMTP)
+    await queue_magic_link_email(
+        db,
+        user_id=user.id,
+        email=user.email,
+        token=token,
+        expires_in=MAGIC_LINK_EXPIRY_SECONDS,
+    )
 
     # Log successful magic link generation
     from pazpaz.models.audit_event import AuditAction, ResourceType
@@ -435,6 +445,9 @@ async def request_magic_link(
             exc_info=True,
         )
 
+    # Commit outbox email and audit event together
+    await db.commit()
+
     logger.info(
         "magic_link_generated",
         email=email,
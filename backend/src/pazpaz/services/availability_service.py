@@ -0,0 +1,167 @@
+"""Free/busy availability for calendar views.
+
+Builds merged busy intervals and open slots for a workspace (optionally a
+single location) over a date range from a compact projection of
+appointment times:
+
+- one query selecting only (scheduled_start, scheduled_end) of
+  SCHEDULED/ATTENDED appointments overlapping the window, served by the
+  partial GiST index on appointments.time_range
+- no ORM objects, no client join, so no PHI is loaded or decrypted
+- overlapping and back-to-back appointments are merged in memory (the rows
+  arrive ordered by start, so the merge is a single pass)
+
+Usage:
+    busy = await get_busy_intervals(db, workspace_id, week_start, week_end)
+    free = get_free_intervals(busy, week_start, week_end)
+    slots = get_open_slots(free, timedelta(minutes=60))
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.models.appointment import BLOCKING_STATUS_PREDICATE, Appointment
+
+# Longest window one availability request may cover
+MAX_AVAILABILITY_WINDOW = timedelta(days=62)
+
+# Cap on open slots returned (e.g. 15-minute steps over a month)
+MAX_OPEN_SLOTS = 3000
+
+
+@dataclass(frozen=True)
+class TimeInterval:
+    """Half-open time interval [start, end)."""
+
+    start: datetime
+    end: datetime
+
+
+def merge_intervals(intervals: Iterable[TimeInterval]) -> list[TimeInterval]:
+    """
+    Merge overlapping and touching intervals.
+
+    Args:
+        intervals: Intervals in any order
+
+    Returns:
+        Disjoint intervals ordered by start
+    """
+    merged: list[TimeInterval] = []
+    for interval in sorted(intervals, key=lambda interval: interval.start):
+        if merged and interval.start <= merged[-1].end:
+            if interval.end > merged[-1].end:
+                merged[-1] = TimeInterval(merged[-1].start, interval.end)
+        else:
+            merged.append(interval)
+    return merged
+
+
+async def get_busy_intervals(
+    db: AsyncSession,
+    workspace_id: uuid.UUID,
+    start: datetime,
+    end: datetime,
+    location_id: uuid.UUID | None = None,
+) -> list[TimeInterval]:
+    """
+    Get merged busy intervals in a window, clipped to the window.
+
+    Only SCHEDULED and ATTENDED appointments make time busy.
+
+    Args:
+        db: Database session
+        workspace_id: Workspace to compute availability for
+        start: Window start (inclusive)
+        end: Window end (exclusive)
+        location_id: Only count appointments at this saved location
+
+    Returns:
+        Disjoint busy intervals ordered by start
+    """
+    query = (
+        select(Appointment.scheduled_start, Appointment.scheduled_end)
+        .where(
+            Appointment.workspace_id == workspace_id,
+            # Same text as the partial index predicate (see model)
+            text(f"appointments.{BLOCKING_STATUS_PREDICATE}"),
+            Appointment.time_range.op("&&")(
+                func.tstzrange(start, end, literal_column("'[)'"))
+            ),
+        )
+        .order_by(Appointment.scheduled_start)
+    )
+    if location_id is not None:
+        query = query.where(Appointment.location_id == location_id)
+
+    result = await db.execute(query)
+
+    return merge_intervals(
+        TimeInterval(max(row_start, start), min(row_end, end))
+        for row_start, row_end in result.all()
+    )
+
+
+def get_free_intervals(
+    busy: list[TimeInterval], start: datetime, end: datetime
+) -> list[TimeInterval]:
+    """
+    Get the gaps between busy intervals in a window.
+
+    Args:
+        busy: Disjoint busy intervals ordered by start (within the window)
+        start: Window start
+        end: Window end
+
+    Returns:
+        Free intervals ordered by start
+    """
+    free: list[TimeInterval] = []
+    cursor = start
+    for interval in busy:
+        if interval.start > cursor:
+            free.append(TimeInterval(cursor, interval.start))
+        cursor = max(cursor, interval.end)
+    if cursor < end:
+        free.append(TimeInterval(cursor, end))
+    return free
+
+
+def get_open_slots(
+    free: list[TimeInterval],
+    duration: timedelta,
+    step: timedelta | None = None,
+    limit: int = MAX_OPEN_SLOTS,
+) -> list[TimeInterval]:
+    """
+    Split free intervals into bookable slots of a fixed duration.
+
+    Slots start at the beginning of each free interval and every `step`
+    after it.
+
+    Args:
+        free: Free intervals ordered by start
+        duration: Slot length
+        step: Distance between slot starts (default: duration)
+        limit: Maximum slots to return
+
+    Returns:
+        Slots ordered by start (at most `limit`)
+    """
+    step = step or duration
+    slots: list[TimeInterval] = []
+    for interval in free:
+        slot_start = interval.start
+        while slot_start + duration <= interval.end:
+            if len(slots) >= limit:
+                return slots
+            slots.append(TimeInterval(slot_start, slot_start + duration))
+            slot_start += step
+    return slots
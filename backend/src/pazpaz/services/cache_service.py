@@ -1,14 +1,59 @@
-"""AI cache management service for invalidation."""
+"""
+AI cache management service for invalidation.
+
+Cache entries are registered in per-workspace and per-client tag sets when
+they are written, so invalidation deletes exactly the members of one tag set
+instead of SCANning the whole Redis keyspace:
+
+    ai:tag:{workspace_id}:workspace          - every AI cache key in workspace
+    ai:tag:{workspace_id}:client:{client_id} - keys scoped to one client
+
+Invalidation cost is O(entries for that tag), independent of total cache size.
+Tag sets carry the same TTL as the entries they track, so they disappear once
+all of their members have expired.
+"""
 
 import uuid
+from collections.abc import Iterable
 
 from redis.asyncio import Redis
 
 from pazpaz.ai.metrics import ai_agent_cache_invalidations_total
+from pazpaz.ai.semantic_cache import get_semantic_cache_key
 from pazpaz.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Keys passed to a single DEL command when clearing a large tag
+DELETE_BATCH_SIZE = 500
+
+
+def get_workspace_tag_key(workspace_id: uuid.UUID) -> str:
+    """
+    Generate Redis key for the tag set tracking all cache keys in a workspace.
+
+    Args:
+        workspace_id: Workspace ID
+
+    Returns:
+        Redis key in format: ai:tag:{workspace_id}:workspace
+    """
+    return f"ai:tag:{workspace_id}:workspace"
+
+
+def get_client_tag_key(workspace_id: uuid.UUID, client_id: uuid.UUID) -> str:
+    """
+    Generate Redis key for the tag set tracking cache keys scoped to a client.
+
+    Args:
+        workspace_id: Workspace ID
+        client_id: Client ID
+
+    Returns:
+        Redis key in format: ai:tag:{workspace_id}:client:{client_id}
+    """
+    return f"ai:tag:{workspace_id}:client:{client_id}"
+
 
 class AICacheService:
     """Service for managing AI agent cache invalidation."""
@@ -16,6 +61,50 @@ class AICacheService:
     def __init__(self, redis: Redis):
         self.redis = redis
 
+    async def tag_keys(
+        self,
+        workspace_id: uuid.UUID,
+        client_id: uuid.UUID | None,
+        keys: Iterable[str],
+        ttl_seconds: int,
+    ) -> None:
+        """
+        Register cache keys in the workspace (and client) tag sets.
+
+        Call this BEFORE writing the cache entries: if the entry write fails
+        afterwards, the tag only points at a missing key (harmless), whereas
+        an untagged entry could not be invalidated until it expires.
+
+        Args:
+            workspace_id: Workspace the entries belong to
+            client_id: Client scope of the entries (None for workspace-wide)
+            keys: Redis keys being written
+            ttl_seconds: Longest TTL among the entries (the tag TTL is
+                extended to it, never shortened)
+
+        Raises:
+            redis.RedisError: If Redis is unavailable (callers should skip
+                caching the entries in that case)
+
+        Example:
+            >>> await cache_service.tag_keys(workspace_id, client_id, [key], 300)
+            >>> await redis.setex(key, 300, value)
+        """
+        keys = list(keys)
+        tag_keys = [get_workspace_tag_key(workspace_id)]
+        if client_id:
+            tag_keys.append(get_client_tag_key(workspace_id, client_id))
+
+        pipe = self.redis.pipeline()
+        for tag_key in tag_keys:
+            pipe.sadd(tag_key, *keys)
+            # Only ever extend the tag TTL: a shorter-lived entry must not
+            # expire the tag while longer-lived tagged entries still exist.
+            # NX sets it on a new set (GT treats "no TTL" as infinite).
+            pipe.expire(tag_key, ttl_seconds, nx=True)
+            pipe.expire(tag_key, ttl_seconds, gt=True)
+        await pipe.execute()
+
     async def invalidate_client_queries(
         self,
         workspace_id: uuid.UUID,
@@ -24,6 +113,11 @@ class AICacheService:
         """
         Invalidate all cached queries for a specific client.
 
+        Clears the client's L1 query results and its semantic cache scope.
+        The workspace-wide semantic scope is cleared as well, since
+        workspace-wide answers may cite this client's sessions and a
+        paraphrased query would otherwise keep serving the stale answer.
+
         Args:
             workspace_id: The workspace ID
             client_id: The client ID whose queries should be invalidated
@@ -31,13 +125,12 @@ class AICacheService:
         Returns:
             Number of cache keys deleted
         """
-        pattern = f"ai:query:{workspace_id}:*:{client_id}"
-        deleted = await self._delete_pattern(pattern)
+        deleted = await self._delete_tagged(get_client_tag_key(workspace_id, client_id))
+        deleted += await self._delete_keys(get_semantic_cache_key(workspace_id))
 
         if deleted > 0:
             ai_agent_cache_invalidations_total.labels(
-                workspace_id=str(workspace_id),
-                reason="client_data_changed",
+                reason="client_data_changed"
             ).inc()
 
             logger.info(
@@ -62,13 +155,11 @@ class AICacheService:
         Returns:
             Number of cache keys deleted
         """
-        pattern = f"ai:query:{workspace_id}:*"
-        deleted = await self._delete_pattern(pattern)
+        deleted = await self._delete_tagged(get_workspace_tag_key(workspace_id))
 
         if deleted > 0:
             ai_agent_cache_invalidations_total.labels(
-                workspace_id=str(workspace_id),
-                reason="workspace_data_changed",
+                reason="workspace_data_changed"
             ).inc()
 
             logger.info(
@@ -79,34 +170,59 @@ class AICacheService:
 
         return deleted
 
-    async def _delete_pattern(self, pattern: str) -> int:
+    async def _delete_tagged(self, tag_key: str) -> int:
         """
-        Delete all Redis keys matching pattern.
+        Delete every key registered under a tag, then the tag itself.
+
+        The tag's members are read and the tag is removed in one MULTI/EXEC
+        transaction, so keys tagged concurrently land in a fresh tag set
+        instead of being dropped from tracking.
 
         Args:
-            pattern: Redis key pattern (supports * wildcard)
+            tag_key: Redis key of the tag set
 
         Returns:
-            Number of keys deleted
+            Number of cache keys deleted (members that already expired
+            are not counted)
         """
-        deleted = 0
-        cursor = 0
-
         try:
-            while True:
-                cursor, keys = await self.redis.scan(cursor, match=pattern, count=100)
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.smembers(tag_key)
+            pipe.delete(tag_key)
+            members, _ = await pipe.execute()
+
+            members = list(members)
+            deleted = 0
+            for start in range(0, len(members), DELETE_BATCH_SIZE):
+                deleted += await self.redis.delete(
+                    *members[start : start + DELETE_BATCH_SIZE]
+                )
+            return deleted
+
+        except Exception as e:
+            logger.warning(
+                "cache_invalidation_error",
+                tag_key=tag_key,
+                error=str(e),
+            )
+            return 0
 
-                if keys:
-                    deleted += await self.redis.delete(*keys)
+    async def _delete_keys(self, *keys: str) -> int:
+        """
+        Delete specific Redis keys (no SCAN needed).
 
-                if cursor == 0:
-                    break
+        Args:
+            keys: Redis keys to delete
 
+        Returns:
+            Number of keys deleted
+        """
+        try:
+            return await self.redis.delete(*keys)
         except Exception as e:
             logger.warning(
                 "cache_invalidation_error",
-                pattern=pattern,
+                keys_count=len(keys),
                 error=str(e),
             )
-
-        return deleted
+            return 0
@@ -0,0 +1,536 @@
+"""Write-behind buffer for session draft autosave.
+
+The autosave endpoint (PATCH /sessions/{id}/draft) fires up to once per
+second while a therapist types. Committing every save rewrites the encrypted
+SOAP row, bumps version and generates WAL for text that is overwritten a
+second later. Instead, saves are coalesced in Redis and written to
+PostgreSQL:
+
+- on a periodic cadence: the save that finds the buffer older than
+  DRAFT_FLUSH_INTERVAL_SECONDS flushes it inline (bounds unflushed work)
+- on idle: the flush_idle_session_drafts worker task flushes drafts with
+  no save for DRAFT_IDLE_FLUSH_SECONDS
+- before any other write to the session (update, finalize, unfinalize,
+  delete), via flush_buffered_draft() in the same transaction
+
+Every buffered save still increments version, so responses report the same
+version sequence as direct writes. The buffer records the database version
+it was based on; if the row changed underneath (a write that did not go
+through the buffer), the stale buffer is discarded instead of overwriting.
+A flush leaves the row between the buffer's base_version and version until
+clear() rebases the buffer; saves in that window continue the buffer.
+
+Reads overlay the buffered draft (BufferedDraft.response_overlay), so
+clients always see their latest save.
+
+Security:
+    Buffered drafts contain PHI and are encrypted with the application
+    encryption key (encrypt_field_versioned) before they reach Redis.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from redis.exceptions import WatchError
+
+from pazpaz.core.logging import get_logger
+from pazpaz.utils.encryption import decrypt_field_versioned, encrypt_field_versioned
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+    from pazpaz.models.session import Session
+
+logger = get_logger(__name__)
+
+# Fields the autosave endpoint may change
+DRAFT_FIELDS = ("subjective", "objective", "assessment", "plan", "duration_minutes")
+
+# Max age of unflushed buffered changes before a save flushes inline
+DRAFT_FLUSH_INTERVAL_SECONDS = 30
+
+# Drafts idle for this long are flushed by the worker
+DRAFT_IDLE_FLUSH_SECONDS = 10
+
+# Safety expiry for buffers (normally flushed within seconds)
+DRAFT_BUFFER_TTL_SECONDS = 24 * 60 * 60
+
+# Sorted set of buffered drafts scored by last save time (for idle flush)
+DIRTY_DRAFTS_KEY = "session_drafts:dirty"
+
+# Optimistic-transaction retries for concurrent saves
+MAX_WATCH_RETRIES = 5
+
+
+def get_draft_buffer_key(session_id: uuid.UUID) -> str:
+    """
+    Get the Redis key for a session's buffered draft.
+
+    Args:
+        session_id: Session UUID
+
+    Returns:
+        Redis key (e.g., "session_draft:<session_id>")
+    """
+    return f"session_draft:{session_id}"
+
+
+@dataclass
+class BufferedDraft:
+    """
+    Draft changes buffered in Redis, not yet written to PostgreSQL.
+
+    Attributes:
+        session_id: Session the draft belongs to
+        workspace_id: Workspace of the session
+        fields: Changed draft fields (subset of DRAFT_FIELDS)
+        version: Version reported to clients for the latest save
+        base_version: Database version the buffer was started from
+        first_buffered_at: Unix time of the oldest unflushed save
+        last_saved_at: Time of the latest save (draft_last_saved_at)
+    """
+
+    session_id: uuid.UUID
+    workspace_id: uuid.UUID
+    fields: dict[str, Any]
+    version: int
+    base_version: int
+    first_buffered_at: float
+    last_saved_at: datetime
+
+    def to_json(self) -> str:
+        """Serialize for storage."""
+        data = asdict(self)
+        data["session_id"] = str(self.session_id)
+        data["workspace_id"] = str(self.workspace_id)
+        data["last_saved_at"] = self.last_saved_at.isoformat()
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> BufferedDraft:
+        """Deserialize from storage."""
+        data = json.loads(raw)
+        data["session_id"] = uuid.UUID(data["session_id"])
+        data["workspace_id"] = uuid.UUID(data["workspace_id"])
+        data["last_saved_at"] = datetime.fromisoformat(data["last_saved_at"])
+        return cls(**data)
+
+    def response_overlay(self, is_finalized: bool) -> dict[str, Any]:
+        """
+        Fields to overlay on a SessionResponse built from the database row.
+
+        Args:
+            is_finalized: Whether the session is finalized (amendment drafts
+                keep is_draft unchanged)
+
+        Returns:
+            Dict of response field overrides
+        """
+        overlay = {
+            **self.fields,
+            "version": self.version,
+            "draft_last_saved_at": self.last_saved_at,
+        }
+        if not is_finalized:
+            overlay["is_draft"] = True
+        return overlay
+
+
+def apply_buffered_draft(session: Session, draft: BufferedDraft) -> bool:
+    """
+    Apply a buffered draft to the ORM session row (caller commits).
+
+    Args:
+        session: Session row loaded in the current transaction
+        draft: Buffered draft for the session
+
+    Returns:
+        True if applied; False if the buffer is stale (the row's version moved
+        on without the buffer) and must be discarded
+    """
+    if session.version != draft.base_version:
+        logger.warning(
+            "session_draft_buffer_stale",
+            session_id=str(session.id),
+            db_version=session.version,
+            base_version=draft.base_version,
+        )
+        return False
+
+    for field, value in draft.fields.items():
+        setattr(session, field, value)
+
+    session.draft_last_saved_at = draft.last_saved_at
+    session.version = draft.version
+    if session.finalized_at is None:
+        session.is_draft = True
+
+    return True
+
+
+class SessionDraftBuffer:
+    """
+    Redis-backed write-behind buffer for session drafts.
+
+    Example:
+        >>> buffer = SessionDraftBuffer(redis_client)
+        >>> draft, flush_due = await buffer.save(session, {"subjective": "..."})
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        """
+        Initialize the buffer.
+
+        Args:
+            redis_client: Redis client
+        """
+        self.redis = redis_client
+
+    @staticmethod
+    def _encode(draft: BufferedDraft) -> str:
+        return encrypt_field_versioned(draft.to_json())
+
+    @staticmethod
+    def _decode(raw: str | None) -> BufferedDraft | None:
+        if raw is None:
+            return None
+        return BufferedDraft.from_json(decrypt_field_versioned(raw))
+
+    async def get(self, session_id: uuid.UUID) -> BufferedDraft | None:
+        """
+        Get the buffered draft for a session.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            BufferedDraft, or None if nothing is buffered
+        """
+        return self._decode(await self.redis.get(get_draft_buffer_key(session_id)))
+
+    async def get_many(
+        self, session_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, BufferedDraft]:
+        """
+        Get buffered drafts for several sessions in one round trip.
+
+        Args:
+            session_ids: Session UUIDs
+
+        Returns:
+            Dict of session_id to BufferedDraft (only sessions with a buffer)
+        """
+        if not session_ids:
+            return {}
+
+        raw_values = await self.redis.mget(
+            [get_draft_buffer_key(session_id) for session_id in session_ids]
+        )
+        drafts = {}
+        for session_id, raw in zip(session_ids, raw_values, strict=True):
+            draft = self._decode(raw)
+            if draft is not None:
+                drafts[session_id] = draft
+        return drafts
+
+    async def save(
+        self, session: Session, update_data: dict[str, Any]
+    ) -> tuple[BufferedDraft, bool]:
+        """
+        Merge an autosave into the buffer.
+
+        An existing buffer is always continued on its own base_version, even
+        if the row was flushed (its version is then between base_version and
+        the buffer's version) or the caller read the row before a flush.
+        Restarting it would drop buffered fields that the flush did not
+        write and report a lower version. clear() rebases it after a flush.
+
+        Args:
+            session: Session row (read FOR UPDATE, so no flush can commit
+                between the read and the save)
+            update_data: Draft fields from the request
+
+        Returns:
+            Tuple of (buffered draft, flush_due) - flush_due is True when the
+            oldest unflushed save is older than DRAFT_FLUSH_INTERVAL_SECONDS
+
+        Raises:
+            WatchError: If concurrent saves kept conflicting
+        """
+        key = get_draft_buffer_key(session.id)
+        member = f"{session.workspace_id}:{session.id}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for attempt in range(MAX_WATCH_RETRIES):
+                try:
+                    await pipe.watch(key)
+                    existing = self._decode(await pipe.get(key))
+
+                    now = time.time()
+                    if existing is not None and existing.version < session.version:
+                        # The row moved past every buffered save (a write that
+                        # did not go through the buffer); the buffer is stale
+                        existing = None
+
+                    if existing is None:
+                        # Start a new buffer on top of the database row
+                        existing = BufferedDraft(
+                            session_id=session.id,
+                            workspace_id=session.workspace_id,
+                            fields={},
+                            version=session.version,
+                            base_version=session.version,
+                            first_buffered_at=now,
+                            last_saved_at=datetime.now(UTC),
+                        )
+
+                    draft = BufferedDraft(
+                        session_id=session.id,
+                        workspace_id=session.workspace_id,
+                        fields={**existing.fields, **update_data},
+                        version=existing.version + 1,
+                        base_version=existing.base_version,
+                        first_buffered_at=existing.first_buffered_at,
+                        last_saved_at=datetime.now(UTC),
+                    )
+
+                    pipe.multi()
+                    pipe.set(key, self._encode(draft), ex=DRAFT_BUFFER_TTL_SECONDS)
+                    pipe.zadd(DIRTY_DRAFTS_KEY, {member: now})
+                    await pipe.execute()
+
+                    flush_due = (
+                        now - draft.first_buffered_at >= DRAFT_FLUSH_INTERVAL_SECONDS
+                    )
+                    return draft, flush_due
+
+                except WatchError:
+                    if attempt == MAX_WATCH_RETRIES - 1:
+                        raise
+                    continue
+
+        raise AssertionError("unreachable")
+
+    async def clear(self, draft: BufferedDraft) -> bool:
+        """
+        Remove a buffered draft after it was written to PostgreSQL.
+
+        Only removes the buffer if no newer save arrived meanwhile (compared
+        by version); a newer save stays buffered for the next flush.
+
+        Args:
+            draft: The draft that was flushed
+
+        Returns:
+            True if the buffer was removed
+
+        Raises:
+            WatchError: If concurrent saves kept conflicting
+        """
+        key = get_draft_buffer_key(draft.session_id)
+        member = f"{draft.workspace_id}:{draft.session_id}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for attempt in range(MAX_WATCH_RETRIES):
+                try:
+                    await pipe.watch(key)
+                    current = self._decode(await pipe.get(key))
+                    if current is not None and current.version != draft.version:
+                        # Newer save arrived; rebase it on the flushed version
+                        current.base_version = draft.version
+                        current.first_buffered_at = time.time()
+                        pipe.multi()
+                        pipe.set(
+                            key, self._encode(current), ex=DRAFT_BUFFER_TTL_SECONDS
+                        )
+                        await pipe.execute()
+                        return False
+
+                    pipe.multi()
+                    pipe.delete(key)
+                    pipe.zrem(DIRTY_DRAFTS_KEY, member)
+                    await pipe.execute()
+                    return True
+
+                except WatchError:
+                    # Concurrent save; retry so the buffer is rebased (a
+                    # buffer left on the old base would be discarded as stale)
+                    if attempt == MAX_WATCH_RETRIES - 1:
+                        raise
+                    continue
+
+        raise AssertionError("unreachable")
+
+    async def discard(
+        self,
+        session_id: uuid.UUID,
+        workspace_id: uuid.UUID,
+        draft: BufferedDraft | None,
+    ) -> bool:
+        """
+        Drop a session's buffered draft without writing it.
+
+        Only drops the buffer the caller looked at (compared by version, as
+        in clear()): a save buffered since then is kept. Pass None if no
+        buffer was found; only the dirty marker is then removed, unless a
+        save has buffered a draft meanwhile.
+
+        Args:
+            session_id: Session UUID
+            workspace_id: Workspace UUID
+            draft: The stale draft being discarded (None if none was found)
+
+        Returns:
+            True if the buffer (or leftover dirty marker) was removed
+
+        Raises:
+            WatchError: If concurrent saves kept conflicting
+        """
+        key = get_draft_buffer_key(session_id)
+        member = f"{workspace_id}:{session_id}"
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for attempt in range(MAX_WATCH_RETRIES):
+                try:
+                    await pipe.watch(key)
+                    current = self._decode(await pipe.get(key))
+                    if current is not None and (
+                        draft is None or current.version != draft.version
+                    ):
+                        # Newer save arrived; it is flushed or rebased later
+                        await pipe.unwatch()
+                        return False
+
+                    pipe.multi()
+                    pipe.delete(key)
+                    pipe.zrem(DIRTY_DRAFTS_KEY, member)
+                    await pipe.execute()
+                    return True
+
+                except WatchError:
+                    if attempt == MAX_WATCH_RETRIES - 1:
+                        raise
+                    continue
+
+        raise AssertionError("unreachable")
+
+    async def get_idle(
+        self, idle_seconds: int = DRAFT_IDLE_FLUSH_SECONDS, limit: int = 100
+    ) -> list[tuple[uuid.UUID, uuid.UUID]]:
+        """
+        List drafts with no save for idle_seconds.
+
+        Args:
+            idle_seconds: Minimum time since the last save
+            limit: Maximum drafts to return
+
+        Returns:
+            List of (workspace_id, session_id)
+        """
+        members = await self.redis.zrangebyscore(
+            DIRTY_DRAFTS_KEY, "-inf", time.time() - idle_seconds, start=0, num=limit
+        )
+        idle = []
+        for member in members:
+            workspace_id, session_id = member.split(":", 1)
+            idle.append((uuid.UUID(workspace_id), uuid.UUID(session_id)))
+        return idle
+
+
+async def flush_buffered_draft(
+    redis_client: redis.Redis | None, session: Session
+) -> BufferedDraft | None:
+    """
+    Apply a session's buffered draft before another write (caller commits).
+
+    Call before modifying a session so the write builds on the latest draft,
+    then call clear_flushed_draft() after commit. Best-effort: if Redis is
+    unavailable the write proceeds on the database state.
+
+    Args:
+        redis_client: Redis client (None if unavailable)
+        session: Session row loaded in the current transaction
+
+    Returns:
+        The applied draft (pass to clear_flushed_draft), or None
+    """
+    if redis_client is None:
+        return None
+
+    buffer = SessionDraftBuffer(redis_client)
+    try:
+        draft = await buffer.get(session.id)
+        if draft is None:
+            return None
+        if not apply_buffered_draft(session, draft):
+            await buffer.discard(session.id, session.workspace_id, draft)
+            return None
+        return draft
+    except Exception as e:
+        logger.warning(
+            "session_draft_buffer_flush_failed",
+            session_id=str(session.id),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return None
+
+
+async def clear_flushed_draft(
+    redis_client: redis.Redis | None, draft: BufferedDraft | None
+) -> None:
+    """
+    Remove a draft buffer after its contents were committed.
+
+    Args:
+        redis_client: Redis client (None if unavailable)
+        draft: Draft returned by flush_buffered_draft (None is a no-op)
+    """
+    if redis_client is None or draft is None:
+        return
+
+    try:
+        await SessionDraftBuffer(redis_client).clear(draft)
+    except Exception as e:
+        # Leftover buffer is stale (base_version mismatch) and gets discarded
+        logger.warning(
+            "session_draft_buffer_clear_failed",
+            session_id=str(draft.session_id),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+async def get_buffered_drafts(
+    redis_client: redis.Redis | None, session_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, BufferedDraft]:
+    """
+    Get buffered drafts to overlay on read responses.
+
+    Best-effort: returns no drafts if Redis is unavailable.
+
+    Args:
+        redis_client: Redis client (None if unavailable)
+        session_ids: Sessions being returned
+
+    Returns:
+        Dict of session_id to BufferedDraft
+    """
+    if redis_client is None:
+        return {}
+
+    try:
+        return await SessionDraftBuffer(redis_client).get_many(session_ids)
+    except Exception as e:
+        logger.warning(
+            "session_draft_buffer_read_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return {}
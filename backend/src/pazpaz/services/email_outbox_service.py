@@ -0,0 +1,294 @@
+"""Transactional email outbox: queue emails in a request, deliver in the worker.
+
+Request handlers call queue_magic_link_email() / queue_invitation_email(),
+which insert an EmailOutbox row in the caller's transaction (no commit, no
+SMTP). The email is therefore only sent if the triggering change commits, and
+request latency no longer includes an SMTP session.
+
+Delivery:
+    drain_email_outbox (arq worker task) calls deliver_pending_emails(), which
+    claims due rows with FOR UPDATE SKIP LOCKED (concurrent drains never send
+    the same row), sends the batch over one SMTP connection, and reschedules
+    failures with exponential backoff. Handlers enqueue the drain task right
+    after commit for fast delivery; a cron run every minute picks up anything
+    missed (e.g. if enqueueing failed).
+
+Usage:
+    await queue_magic_link_email(db, user.id, user.email, token, expires_in=600)
+    await db.commit()
+    await notify_email_outbox(arq_pool)
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+from email.message import EmailMessage
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.core.logging import get_logger
+from pazpaz.models.email_outbox import EmailKind, EmailOutbox, EmailOutboxStatus
+from pazpaz.services.email_service import (
+    build_invitation_message,
+    build_magic_link_message,
+    send_email_batch,
+)
+
+if TYPE_CHECKING:
+    from arq.connections import ArqRedis
+
+logger = get_logger(__name__)
+
+# Emails claimed and sent per drain run (one SMTP connection per batch)
+OUTBOX_BATCH_SIZE = 50
+
+# Delivery attempts before an email is marked FAILED
+OUTBOX_MAX_ATTEMPTS = 5
+
+# Retry backoff: base * 2^(attempts - 1), capped
+OUTBOX_RETRY_BASE_SECONDS = 30
+OUTBOX_RETRY_MAX_SECONDS = 30 * 60
+
+# arq task that drains the outbox
+DRAIN_TASK_NAME = "drain_email_outbox"
+
+
+async def queue_email(
+    db: AsyncSession,
+    kind: EmailKind,
+    payload: dict[str, Any],
+    dedupe_key: str | None = None,
+    expires_in: int | None = None,
+) -> None:
+    """
+    Insert an email into the outbox within the caller's transaction.
+
+    Does not commit. If dedupe_key matches a pending email, that email's
+    payload is replaced instead (only the newest version is delivered).
+
+    Args:
+        db: Database session (caller commits)
+        kind: Email template
+        payload: Template arguments (encrypted at rest)
+        dedupe_key: Optional key collapsing repeated pending emails
+        expires_in: Seconds after which the email is no longer worth sending
+    """
+    now = datetime.now(UTC)
+    expires_at = now + timedelta(seconds=expires_in) if expires_in else None
+
+    stmt = insert(EmailOutbox).values(
+        id=uuid.uuid4(),
+        kind=kind,
+        payload=json.dumps(payload),
+        dedupe_key=dedupe_key,
+        status=EmailOutboxStatus.PENDING,
+        attempts=0,
+        next_attempt_at=now,
+        expires_at=expires_at,
+        created_at=now,
+    )
+    if dedupe_key is not None:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EmailOutbox.dedupe_key],
+            # Must match the partial unique index predicate
+            index_where=text("status = 'PENDING'"),
+            set_={
+                "payload": stmt.excluded.payload,
+                "attempts": 0,
+                "next_attempt_at": stmt.excluded.next_attempt_at,
+                "expires_at": stmt.excluded.expires_at,
+                "last_error": None,
+            },
+        )
+
+    await db.execute(stmt)
+
+    logger.info("email_queued", kind=kind.value, deduplicated=dedupe_key is not None)
+
+
+async def queue_magic_link_email(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    email: str,
+    token: str,
+    expires_in: int,
+) -> None:
+    """
+    Queue a magic link email (newest link wins while undelivered).
+
+    Args:
+        db: Database session (caller commits)
+        user_id: Recipient user ID (dedupe key)
+        email: Recipient email address
+        token: Magic link token
+        expires_in: Token lifetime in seconds (expired links are not sent)
+    """
+    await queue_email(
+        db,
+        EmailKind.MAGIC_LINK,
+        {"email": email, "token": token},
+        dedupe_key=f"magic_link:{user_id}",
+        expires_in=expires_in,
+    )
+
+
+async def queue_invitation_email(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    email: str,
+    invitation_url: str,
+) -> None:
+    """
+    Queue a therapist invitation email (newest invitation wins).
+
+    Args:
+        db: Database session (caller commits)
+        user_id: Invited user ID (dedupe key)
+        email: Recipient email address
+        invitation_url: Full invitation URL with token
+    """
+    await queue_email(
+        db,
+        EmailKind.INVITATION,
+        {"email": email, "invitation_url": invitation_url},
+        dedupe_key=f"invitation:{user_id}",
+    )
+
+
+async def notify_email_outbox(arq_pool: ArqRedis) -> None:
+    """
+    Ask the worker to drain the outbox now (call after commit).
+
+    Best-effort: if enqueueing fails, the scheduled drain delivers the email
+    within a minute.
+
+    Args:
+        arq_pool: arq Redis pool
+    """
+    try:
+        await arq_pool.enqueue_job(DRAIN_TASK_NAME)
+    except Exception as e:
+        logger.warning(
+            "email_outbox_notify_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+def build_outbox_message(kind: EmailKind, payload: dict[str, Any]) -> EmailMessage:
+    """
+    Render an outbox email from its template arguments.
+
+    Args:
+        kind: Email template
+        payload: Template arguments stored with the email
+
+    Returns:
+        EmailMessage ready to send
+    """
+    if kind == EmailKind.MAGIC_LINK:
+        return build_magic_link_message(payload["email"], payload["token"])
+    if kind == EmailKind.INVITATION:
+        return build_invitation_message(payload["email"], payload["invitation_url"])
+    raise ValueError(f"Unknown email kind: {kind}")
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    """
+    Backoff before the next attempt after `attempts` failed attempts.
+
+    Args:
+        attempts: Failed attempts so far (>= 1)
+
+    Returns:
+        Delay before retrying
+    """
+    seconds = OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, OUTBOX_RETRY_MAX_SECONDS))
+
+
+async def deliver_pending_emails(
+    db: AsyncSession,
+    batch_size: int = OUTBOX_BATCH_SIZE,
+) -> dict[str, int]:
+    """
+    Send one batch of due outbox emails and record the outcome.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED, so concurrent drains
+    split the work instead of double-sending. Commits when done.
+
+    Args:
+        db: Database session
+        batch_size: Maximum emails to send in this run
+
+    Returns:
+        Counts of sent, retried, failed and expired emails
+    """
+    now = datetime.now(UTC)
+    result = await db.execute(
+        select(EmailOutbox)
+        .where(
+            EmailOutbox.status == EmailOutboxStatus.PENDING,
+            EmailOutbox.next_attempt_at <= now,
+        )
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    rows = list(result.scalars().all())
+
+    stats = {"sent": 0, "retried": 0, "failed": 0, "expired": 0}
+    if not rows:
+        return stats
+
+    deliverable: list[EmailOutbox] = []
+    messages: list[EmailMessage] = []
+    for row in rows:
+        if row.expires_at is not None and row.expires_at <= now:
+            row.status = EmailOutboxStatus.FAILED
+            row.last_error = "expired before delivery"
+            stats["expired"] += 1
+            continue
+        try:
+            messages.append(build_outbox_message(row.kind, json.loads(row.payload)))
+            deliverable.append(row)
+        except Exception as e:
+            row.status = EmailOutboxStatus.FAILED
+            row.last_error = f"render failed: {type(e).__name__}"
+            stats["failed"] += 1
+
+    errors = await send_email_batch(messages)
+
+    sent_at = datetime.now(UTC)
+    for row, error in zip(deliverable, errors, strict=True):
+        row.attempts += 1
+        if error is None:
+            row.status = EmailOutboxStatus.SENT
+            row.sent_at = sent_at
+            row.last_error = None
+            stats["sent"] += 1
+        elif row.attempts >= OUTBOX_MAX_ATTEMPTS:
+            row.status = EmailOutboxStatus.FAILED
+            row.last_error = str(error)[:500]
+            stats["failed"] += 1
+            logger.error(
+                "email_outbox_delivery_failed",
+                email_id=str(row.id),
+                kind=row.kind.value,
+                attempts=row.attempts,
+                error=str(error),
+            )
+        else:
+            row.next_attempt_at = sent_at + get_retry_delay(row.attempts)
+            row.last_error = str(error)[:500]
+            stats["retried"] += 1
+
+    await db.commit()
+
+    logger.info("email_outbox_batch_processed", batch_size=len(rows), **stats)
+    return stats
@@ -51,22 +51,23 @@ def _convert_to_workspace_timezone(
         return utc_datetime
 
 
-async def send_magic_link_email(email: str, token: str) -> None:
-    """
-    Send magic link email to user.
+def get_magic_link_url(token: str) -> str:
+    """Build the frontend magic link URL for a login token."""
+    return f"{settings.frontend_url}/auth/verify?token={token}"
 
-    Sends email via SMTP (MailHog in development, production SMTP in prod).
+
+def build_magic_link_message(email: str, token: str) -> EmailMessage:
+    """
+    Build the magic link login email.
 
     Args:
         email: Recipient email address
         token: Magic link token
 
-    Raises:
-        Exception: If email sending fails
+    Returns:
+        EmailMessage ready to send
     """
-    # Construct magic link URL
-    base_url = settings.frontend_url
-    magic_link = f"{base_url}/auth/verify?token={token}"
+    magic_link = get_magic_link_url(token)
 
     # Create email message
     message = EmailMessage()
@@ -130,6 +131,27 @@ PazPaz - Practice Management for Independent Therapists
         subtype="html",
     )
 
+    return message
+
+
+async def send_magic_link_email(email: str, token: str) -> None:
+    """
+    Send magic link email to user.
+
+    Sends email via SMTP (MailHog in development, production SMTP in prod).
+    Request handlers queue magic links in the email outbox instead
+    (services/email_outbox_service.py); this sends immediately.
+
+    Args:
+        email: Recipient email address
+        token: Magic link token
+
+    Raises:
+        Exception: If email sending fails
+    """
+    message = build_magic_link_message(email, token)
+    magic_link = get_magic_link_url(token)
+
     # Send via SMTP
     try:
         async with aiosmtplib.SMTP(
@@ -170,18 +192,16 @@ PazPaz - Practice Management for Independent Therapists
         raise
 
 
-async def send_invitation_email(email: str, invitation_url: str) -> None:
+def build_invitation_message(email: str, invitation_url: str) -> EmailMessage:
     """
-    Send invitation email to new therapist.
-
-    Sends email via SMTP (MailHog in development, production SMTP in prod).
+    Build the therapist invitation email.
 
     Args:
         email: Recipient email address
         invitation_url: Full invitation URL with token
 
-    Raises:
-        Exception: If email sending fails
+    Returns:
+        EmailMessage ready to send
     """
     # Create email message
     message = EmailMessage()
@@ -208,6 +228,26 @@ If you didn't expect this invitation, you can safely ignore this email.
 PazPaz - Practice Management for Independent Therapists
 """)
 
+    return message
+
+
+async def send_invitation_email(email: str, invitation_url: str) -> None:
+    """
+    Send invitation email to new therapist.
+
+    Sends email via SMTP (MailHog in development, production SMTP in prod).
+    Invitation handlers queue the email in the email outbox instead
+    (services/email_outbox_service.py); this sends immediately.
+
+    Args:
+        email: Recipient email address
+        invitation_url: Full invitation URL with token
+
+    Raises:
+        Exception: If email sending fails
+    """
+    message = build_invitation_message(email, invitation_url)
+
     # Send via SMTP
     try:
         async with aiosmtplib.SMTP(
@@ -248,6 +288,56 @@ PazPaz - Practice Management for Independent Therapists
         raise
 
 
+async def send_email_batch(
+    messages: list[EmailMessage],
+) -> list[Exception | None]:
+    """
+    Send several emails over a single SMTP connection.
+
+    Per-message failures do not abort the batch; a failure to connect or
+    authenticate fails every message.
+
+    Args:
+        messages: Messages to send
+
+    Returns:
+        One entry per message: None if sent, otherwise the exception raised
+    """
+    if not messages:
+        return []
+
+    results: list[Exception | None] = []
+    try:
+        async with aiosmtplib.SMTP(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+        ) as smtp:
+            # Authenticate if credentials provided (not needed for MailHog)
+            if settings.smtp_user:
+                await smtp.login(settings.smtp_user, settings.smtp_password)
+
+            for message in messages:
+                try:
+                    await smtp.send_message(message)
+                    results.append(None)
+                except aiosmtplib.SMTPException as e:
+                    results.append(e)
+
+    except Exception as e:
+        logger.error(
+            "failed_to_send_email_batch",
+            batch_size=len(messages),
+            error=str(e),
+            smtp_host=settings.smtp_host,
+            smtp_port=settings.smtp_port,
+            exc_info=True,
+        )
+        # Messages not attempted before the connection failed
+        results.extend([e] * (len(messages) - len(results)))
+
+    return results
+
+
 async def send_welcome_email(email: str, full_name: str) -> None:
     """
     Send welcome email to new user.
@@ -8,6 +8,7 @@ from datetime import UTC, datetime
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pazpaz.core.config import settings
 from pazpaz.core.invitation_tokens import (
     generate_invitation_token,
     is_invitation_expired,
@@ -16,10 +17,16 @@ from pazpaz.core.invitation_tokens import (
 from pazpaz.core.logging import get_logger
 from pazpaz.models.user import User, UserRole
 from pazpaz.models.workspace import Workspace
+from pazpaz.services.email_outbox_service import queue_invitation_email
 
 logger = get_logger(__name__)
 
 
+def get_invitation_url(token: str) -> str:
+    """Build the frontend invitation acceptance URL for a token."""
+    return f"{settings.frontend_url}/accept-invitation?token={token}"
+
+
 # Custom Exceptions
 class InvalidInvitationTokenError(Exception):
     """Raised when invitation token is invalid or does not match stored hash."""
@@ -69,7 +76,7 @@ class PlatformOnboardingService:
 
     This service handles the complete onboarding flow:
     1. Platform admin creates workspace + therapist account
-    2. Generates invitation token (sent via email)
+    2. Generates invitation token (emailed via the email outbox)
     3. Therapist accepts invitation to activate account
     4. Optional: Resend invitation if not accepted
 
@@ -93,7 +100,8 @@ class PlatformOnboardingService:
 
         This is the primary method for platform admin to onboard new therapists.
         It creates a new workspace, creates an owner user for that workspace,
-        and generates an invitation token that must be sent via email.
+        generates an invitation token and queues the invitation email in the
+        email outbox (same transaction; delivered by the arq worker).
 
         Flow:
         1. Validate inputs (workspace name, email, full name)
@@ -101,8 +109,9 @@ class PlatformOnboardingService:
         3. Create workspace
         4. Generate invitation token
         5. Create user with invitation metadata
-        6. Commit transaction
-        7. Return workspace, user, and token (for email sending)
+        6. Queue invitation email in the outbox
+        7. Commit transaction
+        8. Return workspace, user, and token
 
         Args:
             db: Database session (async)
@@ -114,7 +123,7 @@ class PlatformOnboardingService:
             Tuple of (workspace, user, invitation_token):
             - workspace: Created Workspace instance
             - user: Created User instance (inactive, pending invitation acceptance)
-            - invitation_token: Token to send in email magic link (256-bit)
+            - invitation_token: Invitation token (256-bit, already queued by email)
 
         Raises:
             DuplicateEmailError: If email already exists in database
@@ -134,8 +143,8 @@ class PlatformOnboardingService:
                 therapist_full_name="Dr. Jane Smith",
             )
 
-            # Send token via email (not handled by this service)
-            await send_invitation_email(user.email, token)
+            # Invitation email is queued; wake the outbox drain
+            await notify_email_outbox(arq_pool)
             ```
 
         Security:
@@ -227,6 +236,14 @@ class PlatformOnboardingService:
             )
             db.add(notification_settings)
 
+            # Queue invitation email (committed with the user, sent by worker)
+            await queue_invitation_email(
+                db,
+                user_id=user.id,
+                email=user.email,
+                invitation_url=get_invitation_url(token),
+            )
+
             # Commit transaction
             await db.commit()
             await db.refresh(workspace)
@@ -445,8 +462,9 @@ class PlatformOnboardingService:
         2. Validate user exists and is not already active
         3. Generate new invitation token
         4. Update user with new token hash and timestamp
-        5. Commit transaction
-        6. Return new token (for email sending)
+        5. Queue invitation email in the outbox (replaces an unsent one)
+        6. Commit transaction
+        7. Return new token
 
         Args:
             db: Database session (async)
@@ -464,8 +482,8 @@ class PlatformOnboardingService:
             service = PlatformOnboardingService()
             try:
                 new_token = await service.resend_invitation(db, user_id)
-                # Send new token via email
-                await send_invitation_email(user.email, new_token)
+                # Invitation email is queued; wake the outbox drain
+                await notify_email_outbox(arq_pool)
             except UserAlreadyActiveError:
                 # Show error: user already active
                 pass
@@ -496,6 +514,14 @@ class PlatformOnboardingService:
             user.invitation_token_hash = token_hash
             user.invited_at = datetime.now(UTC)
 
+            # Queue invitation email with the new token
+            await queue_invitation_email(
+                db,
+                user_id=user.id,
+                email=user.email,
+                invitation_url=get_invitation_url(token),
+            )
+
             await db.commit()
 
             logger.info(
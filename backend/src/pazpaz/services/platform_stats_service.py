@@ -0,0 +1,191 @@
+"""Platform-wide statistics maintained outside the request path.
+
+The platform admin dashboard (GET /platform-admin/metrics) and Prometheus
+(GET /metrics) both read a snapshot stored in Redis instead of counting
+rows on every request or scrape:
+
+- Workspace activity is recorded on write: the audit middleware adds the
+  workspace to a sorted set scored by time after every successful create,
+  update or delete of an appointment, session or client. Active workspaces
+  in the last 24 hours is counted by trimming entries older than the window
+  (ZREMRANGEBYSCORE) and taking ZCARD, so the set stays bounded.
+- Totals (workspaces, active users, pending invitations, blacklisted
+  emails) are rolled up every minute into a Redis hash by the
+  rollup_platform_stats worker task, which calls refresh_platform_stats().
+
+Reading a snapshot is one HGETALL, independent of data size. The admin
+dashboard computes and stores the snapshot itself when none exists (e.g.
+before the worker first runs); /metrics never queries the database.
+
+Usage:
+    await record_workspace_activity(redis_client, workspace_id)
+
+    stats = await load_platform_stats(redis_client)
+    if stats is None:
+        stats = await refresh_platform_stats(db, redis_client)
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import asdict, dataclass, fields
+from typing import TYPE_CHECKING
+
+from sqlalchemy import and_, func, select
+
+from pazpaz.core.logging import get_logger
+from pazpaz.models.email_blacklist import EmailBlacklist
+from pazpaz.models.user import User
+from pazpaz.models.workspace import Workspace, WorkspaceStatus
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+# Hash holding the latest platform stats snapshot
+PLATFORM_STATS_KEY = "platform:stats"
+
+# Snapshot expiry (refreshed every minute; expires if the worker stops, so
+# the dashboard falls back to live counts instead of stale ones)
+PLATFORM_STATS_TTL_SECONDS = 10 * 60
+
+# Sorted set of workspace IDs scored by last write activity (unix time)
+WORKSPACE_ACTIVITY_KEY = "platform:workspace_activity"
+
+# Window for "active workspaces"
+ACTIVE_WORKSPACE_WINDOW_SECONDS = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class PlatformStats:
+    """Snapshot of platform-wide counts."""
+
+    total_workspaces: int
+    active_users: int
+    pending_invitations: int
+    blacklisted_users: int
+    active_workspaces_24h: int
+    computed_at: float
+
+
+async def record_workspace_activity(
+    redis_client: redis.Redis,
+    workspace_id: uuid.UUID,
+    now: float | None = None,
+) -> None:
+    """
+    Mark a workspace as active now.
+
+    Args:
+        redis_client: Redis client
+        workspace_id: Workspace that performed a write
+        now: Unix time of the activity (default: now)
+    """
+    await redis_client.zadd(
+        WORKSPACE_ACTIVITY_KEY, {str(workspace_id): now or time.time()}
+    )
+
+
+async def count_active_workspaces(
+    redis_client: redis.Redis, now: float | None = None
+) -> int:
+    """
+    Count workspaces with write activity in the last 24 hours.
+
+    Also drops entries older than the window, keeping the set bounded by
+    the number of recently active workspaces.
+
+    Args:
+        redis_client: Redis client
+        now: Current unix time (default: now)
+
+    Returns:
+        Number of active workspaces
+    """
+    cutoff = (now or time.time()) - ACTIVE_WORKSPACE_WINDOW_SECONDS
+    await redis_client.zremrangebyscore(WORKSPACE_ACTIVITY_KEY, "-inf", f"({cutoff}")
+    return await redis_client.zcard(WORKSPACE_ACTIVITY_KEY)
+
+
+async def refresh_platform_stats(
+    db: AsyncSession, redis_client: redis.Redis
+) -> PlatformStats:
+    """
+    Compute platform totals and store them as the current snapshot.
+
+    Args:
+        db: Database session
+        redis_client: Redis client
+
+    Returns:
+        The stored snapshot
+    """
+    counts = (
+        await db.execute(
+            select(
+                select(func.count(Workspace.id))
+                .where(Workspace.status != WorkspaceStatus.DELETED)
+                .scalar_subquery(),
+                select(func.count(User.id))
+                .where(User.is_active == True)  # noqa: E712
+                .scalar_subquery(),
+                select(func.count(User.id))
+                .where(
+                    and_(
+                        User.is_active == False,  # noqa: E712
+                        User.invitation_token_hash.is_not(None),
+                    )
+                )
+                .scalar_subquery(),
+                select(func.count(EmailBlacklist.id)).scalar_subquery(),
+            )
+        )
+    ).one()
+
+    stats = PlatformStats(
+        total_workspaces=counts[0] or 0,
+        active_users=counts[1] or 0,
+        pending_invitations=counts[2] or 0,
+        blacklisted_users=counts[3] or 0,
+        active_workspaces_24h=await count_active_workspaces(redis_client),
+        computed_at=time.time(),
+    )
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            PLATFORM_STATS_KEY,
+            mapping={key: str(value) for key, value in asdict(stats).items()},
+        )
+        pipe.expire(PLATFORM_STATS_KEY, PLATFORM_STATS_TTL_SECONDS)
+        await pipe.execute()
+
+    return stats
+
+
+async def load_platform_stats(redis_client: redis.Redis) -> PlatformStats | None:
+    """
+    Load the current snapshot.
+
+    Args:
+        redis_client: Redis client
+
+    Returns:
+        Snapshot, or None if none is stored (or it is incomplete)
+    """
+    data = await redis_client.hgetall(PLATFORM_STATS_KEY)
+    try:
+        return PlatformStats(
+            **{
+                field.name: (
+                    float(data[field.name])
+                    if field.name == "computed_at"
+                    else int(data[field.name])
+                )
+                for field in fields(PlatformStats)
+            }
+        )
+    except (KeyError, ValueError):
+        return None
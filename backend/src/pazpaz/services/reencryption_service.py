@@ -0,0 +1,807 @@
+"""Parallel, resumable re-encryption of EncryptedString columns after key rotation.
+
+Our 90-day key rotation policy means every PHI field is re-encrypted each
+quarter. This engine replaces the record-at-a-time ORM loop with:
+
+- discovery: every EncryptedString column in the ORM metadata (clients,
+  sessions, session_versions, tokens, ...) is covered automatically
+- keyset-chunked scans: rows are read in primary-key order (`id > last_id`),
+  selecting only rows with a field not yet on the target key version, and
+  raw BYTEA values are read without ORM decryption
+- partitioning: each table's UUID key space is split into ranges processed
+  by parallel worker processes (ProcessPoolExecutor, one engine per task)
+- batched writes: one `UPDATE ... FROM (VALUES ...)` per column per chunk;
+  the row is only updated if the ciphertext is unchanged since it was read,
+  so concurrent application writes are never overwritten
+- checkpoint/resume: each partition records its last processed key in a
+  checkpoint file after every chunk; rerunning resumes where it stopped
+- throttling: per-worker row rate limit, pause between chunks and a short
+  lock_timeout so live traffic always wins lock conflicts (chunks retry)
+- progress: per-chunk structured logs and an incremental per-table report
+  of ciphertexts by key version (iter_version_counts)
+
+Usage:
+    See scripts/re_encrypt_old_data.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+from pazpaz.db.base import Base, _get_engine_connect_args
+from pazpaz.db.types import EncryptedString
+from pazpaz.utils.encryption import (
+    decrypt_field,
+    encrypt_field,
+    get_current_key_version,
+    get_key_for_version,
+)
+
+logger = get_logger(__name__)
+
+# Rows read per chunk (one transaction, one UPDATE per changed column)
+DEFAULT_CHUNK_SIZE = 500
+
+# Key-range partitions per table per worker (smaller tasks balance better)
+PARTITIONS_PER_WORKER = 4
+
+# Lock wait before a chunk yields to live traffic and retries
+CHUNK_LOCK_TIMEOUT = "2s"
+CHUNK_MAX_RETRIES = 5
+
+# Label for ciphertexts without a version prefix
+LEGACY_VERSION = "legacy"
+
+_UUID_SPACE = 2**128
+
+
+class ReEncryptionError(Exception):
+    """Raised when re-encryption cannot proceed."""
+
+
+@dataclass(frozen=True)
+class EncryptedTable:
+    """A table with EncryptedString columns."""
+
+    name: str
+    primary_key: str
+    columns: tuple[str, ...]
+
+    def raw_table(self) -> sa.TableClause:
+        """Lightweight table whose encrypted columns read as raw bytes."""
+        return sa.table(
+            self.name,
+            sa.column(self.primary_key, UUID(as_uuid=True)),
+            *(sa.column(name, sa.LargeBinary) for name in self.columns),
+        )
+
+
+@dataclass(frozen=True)
+class PartitionTask:
+    """A primary-key range of one table, processed by one worker."""
+
+    table: EncryptedTable
+    index: int
+    lower: uuid.UUID | None
+    upper: uuid.UUID | None
+
+    @property
+    def task_id(self) -> str:
+        """Stable identifier used for checkpoints."""
+        return f"{self.table.name}.{self.index:03d}"
+
+
+@dataclass
+class PartitionProgress:
+    """Checkpointed progress of a partition."""
+
+    task_id: str
+    target_version: str
+    last_pk: str | None = None
+    scanned: int = 0
+    updated: int = 0
+    done: bool = False
+
+
+@dataclass(frozen=True)
+class ReEncryptionOptions:
+    """Settings shared by all partition workers."""
+
+    target_version: str
+    from_version: str | None = None
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    max_rows_per_second: float | None = None
+    pause_seconds: float = 0.0
+    checkpoint_dir: str | None = None
+    dry_run: bool = False
+
+
+@dataclass
+class ReEncryptionReport:
+    """Totals of a re-encryption run."""
+
+    scanned: int = 0
+    updated: int = 0
+    failed_tasks: list[str] = field(default_factory=list)
+    tables: dict[str, dict[str, int]] = field(default_factory=dict)
+
+
+def discover_encrypted_tables(
+    metadata: sa.MetaData | None = None,
+) -> list[EncryptedTable]:
+    """
+    Find every table with EncryptedString columns.
+
+    Args:
+        metadata: SQLAlchemy metadata (default: application models)
+
+    Returns:
+        Tables sorted by name
+    """
+    metadata = metadata or Base.metadata
+
+    tables = []
+    for table in metadata.sorted_tables:
+        columns = tuple(
+            column.name
+            for column in table.columns
+            if isinstance(column.type, EncryptedString)
+        )
+        if not columns:
+            continue
+
+        primary_key = list(table.primary_key.columns)
+        if len(primary_key) != 1:
+            logger.warning("reencryption_table_skipped_composite_pk", table=table.name)
+            continue
+
+        tables.append(EncryptedTable(table.name, primary_key[0].name, columns))
+
+    return sorted(tables, key=lambda table: table.name)
+
+
+def partition_key_space(
+    partitions: int,
+) -> list[tuple[uuid.UUID | None, uuid.UUID | None]]:
+    """
+    Split the UUID key space into contiguous ranges.
+
+    Primary keys are random UUIDs, so equal ranges hold similar row counts.
+
+    Args:
+        partitions: Number of ranges
+
+    Returns:
+        (lower, upper) bounds; lower is inclusive, upper exclusive, None is
+        unbounded
+    """
+    bounds: list[uuid.UUID | None] = [
+        uuid.UUID(int=_UUID_SPACE * i // partitions) for i in range(1, partitions)
+    ]
+    return list(zip([None, *bounds], [*bounds, None], strict=True))
+
+
+def build_tasks(tables: list[EncryptedTable], partitions: int) -> list[PartitionTask]:
+    """
+    Create partition tasks for all tables.
+
+    Args:
+        tables: Tables to process
+        partitions: Key-range partitions per table
+
+    Returns:
+        Tasks, largest-first ordering is left to the executor
+    """
+    return [
+        PartitionTask(table, index, lower, upper)
+        for table in tables
+        for index, (lower, upper) in enumerate(partition_key_space(partitions))
+    ]
+
+
+def detect_encryption_version(ciphertext: bytes | None) -> str | None:
+    """
+    Detect the encryption key version from ciphertext format.
+
+    Mirrors EncryptedString: a prefix like b"v2:" within the first 10 bytes
+    marks versioned ciphertext; anything else is legacy.
+
+    Args:
+        ciphertext: Encrypted bytes (may have version prefix)
+
+    Returns:
+        Version string (e.g., "v1", "v2") or None if legacy format
+
+    Example:
+        >>> detect_encryption_version(b"v2:encrypted_data")
+        'v2'
+        >>> detect_encryption_version(b"legacy_encrypted_data")
+        None
+    """
+    if not ciphertext or b":" not in ciphertext[:10]:
+        return None
+
+    try:
+        return ciphertext[: ciphertext.index(b":")].decode("ascii")
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def reencrypt_value(
+    raw: bytes,
+    target_version: str,
+    target_key: bytes,
+    from_version: str | None = None,
+) -> bytes | None:
+    """
+    Re-encrypt one stored ciphertext with the target key.
+
+    Args:
+        raw: Stored ciphertext (versioned or legacy)
+        target_version: Key version to encrypt with
+        target_key: Key for target_version
+        from_version: Only re-encrypt this version ("legacy" for unversioned)
+
+    Returns:
+        New ciphertext, or None if raw is skipped (already on target_version
+        or not on from_version)
+    """
+    version = detect_encryption_version(raw)
+    if version == target_version:
+        return None
+    if from_version is not None and (version or LEGACY_VERSION) != from_version:
+        return None
+
+    if version is None:
+        plaintext = decrypt_field(raw, settings.encryption_key)
+    else:
+        plaintext = decrypt_field(raw[len(version) + 1 :], get_key_for_version(version))
+
+    return f"{target_version}:".encode() + encrypt_field(plaintext, target_key)
+
+
+def build_batch_update(
+    table: EncryptedTable, column: str, rows: list[tuple[uuid.UUID, bytes, bytes]]
+) -> sa.Update:
+    """
+    Build `UPDATE ... FROM (VALUES ...)` for one column of a chunk.
+
+    Rows are only updated if the stored ciphertext still equals the value
+    that was read, so concurrent application writes win.
+
+    Args:
+        table: Table being processed
+        column: Encrypted column to update
+        rows: (primary key, old ciphertext, new ciphertext)
+
+    Returns:
+        Update statement
+    """
+    raw = table.raw_table()
+    values = sa.values(
+        sa.column("pk", UUID(as_uuid=True)),
+        sa.column("old_value", sa.LargeBinary),
+        sa.column("new_value", sa.LargeBinary),
+        name="reencrypted",
+    ).data(rows)
+
+    return (
+        sa.update(raw)
+        .where(
+            raw.c[table.primary_key] == values.c.pk,
+            raw.c[column] == values.c.old_value,
+        )
+        .values({column: values.c.new_value})
+    )
+
+
+def _needs_reencryption(raw: sa.TableClause, column: str, target_version: str):
+    prefix = f"{target_version}:".encode()
+    return sa.and_(
+        raw.c[column].is_not(None),
+        sa.func.substring(raw.c[column], 1, len(prefix)) != prefix,
+    )
+
+
+def _key_range(raw: sa.TableClause, table: EncryptedTable, task: PartitionTask):
+    pk = raw.c[table.primary_key]
+    conditions = []
+    if task.lower is not None:
+        conditions.append(pk >= task.lower)
+    if task.upper is not None:
+        conditions.append(pk < task.upper)
+    return conditions
+
+
+class CheckpointStore:
+    """
+    Per-partition progress files (one JSON file per task, atomic replace).
+
+    Attributes:
+        directory: Directory holding checkpoint files
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding checkpoint files (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, task_id: str) -> Path:
+        return self.directory / f"{task_id}.json"
+
+    def load(self, task_id: str, target_version: str) -> PartitionProgress:
+        """
+        Load progress for a task.
+
+        Checkpoints written for a different target version are ignored (a new
+        rotation starts over).
+
+        Args:
+            task_id: Partition task ID
+            target_version: Key version of the current run
+
+        Returns:
+            Saved progress, or fresh progress
+        """
+        path = self._path(task_id)
+        if path.exists():
+            progress = PartitionProgress(**json.loads(path.read_text()))
+            if progress.target_version == target_version:
+                return progress
+        return PartitionProgress(task_id=task_id, target_version=target_version)
+
+    def save(self, progress: PartitionProgress) -> None:
+        """
+        Persist progress atomically.
+
+        Args:
+            progress: Progress to save
+        """
+        path = self._path(progress.task_id)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(asdict(progress)))
+        os.replace(tmp_path, path)
+
+
+class Throttle:
+    """
+    Limits a worker's row rate to protect live traffic.
+
+    Attributes:
+        max_rows_per_second: Row budget (None = unlimited)
+        pause_seconds: Fixed pause after every chunk
+    """
+
+    def __init__(self, max_rows_per_second: float | None, pause_seconds: float = 0.0):
+        """
+        Initialize the throttle.
+
+        Args:
+            max_rows_per_second: Row budget (None = unlimited)
+            pause_seconds: Fixed pause after every chunk
+        """
+        self.max_rows_per_second = max_rows_per_second
+        self.pause_seconds = pause_seconds
+        self._started = time.monotonic()
+        self._rows = 0
+
+    def delay_for(self, rows: int) -> float:
+        """
+        Seconds to wait after processing `rows` more rows.
+
+        Args:
+            rows: Rows processed by the last chunk
+
+        Returns:
+            Delay in seconds
+        """
+        self._rows += rows
+        delay = self.pause_seconds
+        if self.max_rows_per_second:
+            expected = self._rows / self.max_rows_per_second
+            elapsed = time.monotonic() - self._started
+            delay = max(delay, expected - elapsed)
+        return delay
+
+    async def wait(self, rows: int) -> None:
+        """Sleep as required after processing `rows` rows."""
+        delay = self.delay_for(rows)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def reencrypt_chunk(
+    db: AsyncSession,
+    task: PartitionTask,
+    options: ReEncryptionOptions,
+    target_key: bytes,
+    after_pk: uuid.UUID | None,
+) -> tuple[uuid.UUID | None, int, int]:
+    """
+    Re-encrypt the next chunk of a partition (one transaction).
+
+    Args:
+        db: Database session
+        task: Partition being processed
+        options: Run options
+        target_key: Key for options.target_version
+        after_pk: Last primary key already processed (None = start)
+
+    Returns:
+        (last primary key in chunk or None when finished, rows scanned,
+        fields updated)
+    """
+    table = task.table
+    raw = table.raw_table()
+    pk = raw.c[table.primary_key]
+
+    conditions = _key_range(raw, table, task)
+    if after_pk is not None:
+        conditions.append(pk > after_pk)
+    conditions.append(
+        sa.or_(
+            *(
+                _needs_reencryption(raw, column, options.target_version)
+                for column in table.columns
+            )
+        )
+    )
+
+    await db.execute(sa.text(f"SET LOCAL lock_timeout = '{CHUNK_LOCK_TIMEOUT}'"))
+    result = await db.execute(
+        sa.select(pk, *(raw.c[column] for column in table.columns))
+        .where(*conditions)
+        .order_by(pk)
+        .limit(options.chunk_size)
+    )
+    rows = result.all()
+    if not rows:
+        return None, 0, 0
+
+    updates: dict[str, list[tuple[uuid.UUID, bytes, bytes]]] = {
+        column: [] for column in table.columns
+    }
+    for row in rows:
+        for index, column in enumerate(table.columns, start=1):
+            value = row[index]
+            if value is None:
+                continue
+            new_value = reencrypt_value(
+                value, options.target_version, target_key, options.from_version
+            )
+            if new_value is not None:
+                updates[column].append((row[0], value, new_value))
+
+    updated = sum(len(column_rows) for column_rows in updates.values())
+    if not options.dry_run:
+        for column, column_rows in updates.items():
+            if column_rows:
+                await db.execute(build_batch_update(table, column, column_rows))
+        await db.commit()
+    else:
+        await db.rollback()
+
+    return rows[-1][0], len(rows), updated
+
+
+def _is_lock_timeout(error: DBAPIError) -> bool:
+    return getattr(error.orig, "sqlstate", None) == "55P03" or (
+        "lock timeout" in str(error.orig).lower()
+    )
+
+
+async def _run_partition(
+    task: PartitionTask, options: ReEncryptionOptions
+) -> PartitionProgress:
+    store = CheckpointStore(options.checkpoint_dir) if options.checkpoint_dir else None
+    progress = (
+        store.load(task.task_id, options.target_version)
+        if store
+        else PartitionProgress(task.task_id, options.target_version)
+    )
+    if progress.done:
+        return progress
+
+    target_key = get_key_for_version(options.target_version)
+    throttle = Throttle(options.max_rows_per_second, options.pause_seconds)
+
+    # Fresh engine per task: each task runs on its own event loop
+    connect_args = _get_engine_connect_args()
+    connect_args["server_settings"]["application_name"] = "pazpaz_reencryption"
+    engine = create_async_engine(
+        settings.database_url,
+        poolclass=NullPool,
+        connect_args=connect_args,
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    try:
+        after_pk = uuid.UUID(progress.last_pk) if progress.last_pk else None
+        retries = 0
+        while True:
+            chunk_start = time.monotonic()
+            try:
+                async with session_factory() as db:
+                    last_pk, scanned, updated = await reencrypt_chunk(
+                        db, task, options, target_key, after_pk
+                    )
+            except DBAPIError as e:
+                if not _is_lock_timeout(e) or retries >= CHUNK_MAX_RETRIES:
+                    raise
+                retries += 1
+                logger.info(
+                    "reencryption_chunk_yielded_to_live_traffic",
+                    task_id=task.task_id,
+                    retry=retries,
+                )
+                await asyncio.sleep(2**retries * 0.1)
+                continue
+
+            retries = 0
+            if last_pk is None:
+                break
+
+            after_pk = last_pk
+            progress.last_pk = str(last_pk)
+            progress.scanned += scanned
+            progress.updated += updated
+            if store and not options.dry_run:
+                store.save(progress)
+
+            logger.info(
+                "reencryption_chunk_completed",
+                task_id=task.task_id,
+                scanned=progress.scanned,
+                updated=progress.updated,
+                rows_per_second=round(
+                    scanned / max(time.monotonic() - chunk_start, 1e-6)
+                ),
+            )
+            await throttle.wait(scanned)
+
+        progress.done = True
+        if store and not options.dry_run:
+            store.save(progress)
+        return progress
+
+    finally:
+        await engine.dispose()
+
+
+def _init_worker(load_keys: Callable[[], None] | None) -> None:
+    """Process initializer: populate the key registry in the worker."""
+    if load_keys is not None:
+        load_keys()
+
+
+def run_partition_task(
+    task: PartitionTask, options: ReEncryptionOptions
+) -> PartitionProgress:
+    """
+    Process one partition to completion (runs in a worker process).
+
+    Args:
+        task: Partition to process
+        options: Run options
+
+    Returns:
+        Final progress of the partition
+    """
+    return asyncio.run(_run_partition(task, options))
+
+
+def run_reencryption(
+    options: ReEncryptionOptions,
+    workers: int = 4,
+    tables: list[EncryptedTable] | None = None,
+    load_keys: Callable[[], None] | None = None,
+    on_progress: Callable[[PartitionProgress], None] | None = None,
+) -> ReEncryptionReport:
+    """
+    Re-encrypt all EncryptedString columns in parallel worker processes.
+
+    Args:
+        options: Run options (target version, chunking, throttling, resume)
+        workers: Worker processes
+        tables: Tables to process (default: all discovered)
+        load_keys: Picklable callable that loads the key registry in each
+            worker (e.g. functools.partial(load_all_encryption_keys, ...))
+        on_progress: Called in the parent as each partition finishes
+
+    Returns:
+        Totals, per-table counts and failed partitions
+    """
+    tables = tables if tables is not None else discover_encrypted_tables()
+    tasks = build_tasks(tables, max(workers * PARTITIONS_PER_WORKER, 1))
+    report = ReEncryptionReport(
+        tables={table.name: {"scanned": 0, "updated": 0} for table in tables}
+    )
+
+    logger.info(
+        "reencryption_started",
+        target_version=options.target_version,
+        tables=[table.name for table in tables],
+        tasks=len(tasks),
+        workers=workers,
+        dry_run=options.dry_run,
+    )
+
+    # spawn: workers must not inherit the parent's event loop or DB connections
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(load_keys,),
+    ) as executor:
+        futures = {
+            executor.submit(run_partition_task, task, options): task for task in tasks
+        }
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                progress = future.result()
+            except Exception as e:
+                report.failed_tasks.append(task.task_id)
+                logger.error(
+                    "reencryption_task_failed",
+                    task_id=task.task_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                continue
+
+            report.scanned += progress.scanned
+            report.updated += progress.updated
+            report.tables[task.table.name]["scanned"] += progress.scanned
+            report.tables[task.table.name]["updated"] += progress.updated
+            if on_progress:
+                on_progress(progress)
+
+    logger.info(
+        "reencryption_finished",
+        scanned=report.scanned,
+        updated=report.updated,
+        failed_tasks=len(report.failed_tasks),
+    )
+    return report
+
+
+async def iter_version_counts(
+    db: AsyncSession,
+    table: EncryptedTable,
+    chunk_size: int = 5000,
+) -> AsyncIterator[tuple[int, Counter[str]]]:
+    """
+    Count ciphertexts by key version, one keyset chunk at a time.
+
+    Yields cumulative counts after each chunk so callers can report progress
+    on large tables instead of waiting for one full-table scan.
+
+    Args:
+        db: Database session
+        table: Table to count
+        chunk_size: Rows per chunk
+
+    Yields:
+        (rows scanned so far, counts by version - "legacy" for unversioned)
+    """
+    raw = table.raw_table()
+    pk = raw.c[table.primary_key]
+    counts: Counter[str] = Counter()
+    scanned = 0
+    after_pk = None
+
+    while True:
+        query = (
+            sa.select(
+                pk,
+                *(sa.func.substring(raw.c[column], 1, 10) for column in table.columns),
+            )
+            .order_by(pk)
+            .limit(chunk_size)
+        )
+        if after_pk is not None:
+            query = query.where(pk > after_pk)
+
+        rows = (await db.execute(query)).all()
+        if not rows:
+            return
+
+        for row in rows:
+            for prefix in row[1:]:
+                if prefix is not None:
+                    counts[detect_encryption_version(prefix) or LEGACY_VERSION] += 1
+
+        scanned += len(rows)
+        after_pk = rows[-1][0]
+        yield scanned, counts
+
+
+async def count_records_by_version(
+    db: AsyncSession,
+    tables: list[EncryptedTable] | None = None,
+    on_progress: Callable[[str, int, Counter[str]], None] | None = None,
+) -> dict[str, dict[str, int]]:
+    """
+    Count encrypted fields by key version for every encrypted table.
+
+    Args:
+        db: Database session
+        tables: Tables to count (default: all discovered)
+        on_progress: Called after each chunk with (table, rows scanned,
+            cumulative counts)
+
+    Returns:
+        {table: {version: field count}}, e.g. {"sessions": {"v1": 450, "v2": 120}}
+    """
+    tables = tables if tables is not None else discover_encrypted_tables()
+
+    report: dict[str, dict[str, int]] = {}
+    for table in tables:
+        counts: Counter[str] = Counter()
+        async for scanned, counts in iter_version_counts(db, table):
+            if on_progress:
+                on_progress(table.name, scanned, counts)
+        report[table.name] = dict(counts)
+
+    return report
+
+
+def get_target_version() -> str:
+    """
+    Get the key version data is re-encrypted to (the current key).
+
+    Returns:
+        Current key version
+
+    Raises:
+        ReEncryptionError: If no current key is registered
+    """
+    try:
+        return get_current_key_version()
+    except ValueError as e:
+        raise ReEncryptionError(str(e)) from e
+
+
+def summarize(report: dict[str, dict[str, int]], target_version: str) -> dict[str, Any]:
+    """
+    Summarize a version count report.
+
+    Args:
+        report: Output of count_records_by_version()
+        target_version: Version data should be on
+
+    Returns:
+        Total fields, fields on target version and percent complete
+    """
+    total = sum(sum(counts.values()) for counts in report.values())
+    current = sum(counts.get(target_version, 0) for counts in report.values())
+    return {
+        "total_fields": total,
+        "current_fields": current,
+        "percent_complete": round(current / total * 100, 2) if total else 100.0,
+    }
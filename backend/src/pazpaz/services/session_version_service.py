@@ -0,0 +1,396 @@
+"""Delta-compressed session version history.
+
+Amendments to finalized session notes create a SessionVersion preserving the
+previous state. Most amendments change a sentence or two, so storing four
+full encrypted SOAP snapshots per amendment wastes storage and makes the
+history endpoint decrypt every snapshot ever written.
+
+Versions are stored as:
+- checkpoints: full SOAP snapshot (version 1 and every
+  SESSION_VERSION_CHECKPOINT_INTERVAL-th version after it, or whenever the
+  diff would not be smaller than the snapshot)
+- deltas: encrypted JSON diff against the previous version
+
+Any version is materialized from the nearest checkpoint at or below it plus
+at most SESSION_VERSION_CHECKPOINT_INTERVAL - 1 deltas, so reads only
+decrypt the rows needed for the versions they return.
+
+Delta format (JSON object keyed by changed SOAP field):
+    {"subjective": [[0, 120], [-1, 5], [1, "new text"]], "plan": null}
+
+    Each field maps to a list of edit operations applied to the previous
+    text, or null if the field was cleared. Operations: [0, n] keeps n
+    characters, [-1, n] deletes n characters, [1, text] inserts text.
+    Unchanged fields are omitted.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import func, select
+
+from pazpaz.core.logging import get_logger
+from pazpaz.models.session_version import SessionVersion
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from pazpaz.models.session import Session
+
+logger = get_logger(__name__)
+
+# SOAP fields captured in each version
+SOAP_FIELDS = ("subjective", "objective", "assessment", "plan")
+
+# Full snapshot every N versions (bounds deltas applied per read)
+SESSION_VERSION_CHECKPOINT_INTERVAL = 10
+
+# Diff granularity: words and the whitespace between them
+_TOKEN_PATTERN = re.compile(r"\s+|[^\s]+")
+
+type TextOps = list[list[Any]]
+type Snapshot = dict[str, str | None]
+
+
+@dataclass
+class MaterializedVersion:
+    """
+    A session version with its full SOAP snapshot reconstructed.
+
+    Attributes mirror SessionVersion (validated by SessionVersionResponse).
+    """
+
+    id: uuid.UUID
+    session_id: uuid.UUID
+    version_number: int
+    subjective: str | None
+    objective: str | None
+    assessment: str | None
+    plan: str | None
+    created_at: datetime
+    created_by_user_id: uuid.UUID
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """SOAP fields as a dict."""
+        return {field: getattr(self, field) for field in SOAP_FIELDS}
+
+
+def compute_text_delta(old: str, new: str) -> TextOps:
+    """
+    Compute edit operations turning old into new (word granularity).
+
+    Args:
+        old: Previous text
+        new: New text
+
+    Returns:
+        Edit operations (see module docstring)
+    """
+    old_tokens = _TOKEN_PATTERN.findall(old)
+    new_tokens = _TOKEN_PATTERN.findall(new)
+    matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+
+    ops: TextOps = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([0, sum(len(token) for token in old_tokens[i1:i2])])
+            continue
+        if tag in ("delete", "replace"):
+            ops.append([-1, sum(len(token) for token in old_tokens[i1:i2])])
+        if tag in ("insert", "replace"):
+            ops.append([1, "".join(new_tokens[j1:j2])])
+    return ops
+
+
+def apply_text_delta(old: str, ops: TextOps) -> str:
+    """
+    Apply edit operations from compute_text_delta().
+
+    Args:
+        old: Previous text
+        ops: Edit operations
+
+    Returns:
+        New text
+
+    Raises:
+        ValueError: If the operations do not match the previous text
+    """
+    parts = []
+    position = 0
+    for op, value in ops:
+        if op == 0:
+            parts.append(old[position : position + value])
+            position += value
+        elif op == -1:
+            position += value
+        elif op == 1:
+            parts.append(value)
+        else:
+            raise ValueError(f"Unknown delta operation: {op}")
+
+    if position != len(old):
+        raise ValueError("Delta does not match previous version text")
+    return "".join(parts)
+
+
+def compute_delta(old: Snapshot, new: Snapshot) -> dict[str, TextOps | None]:
+    """
+    Diff two SOAP snapshots.
+
+    Args:
+        old: Previous version snapshot
+        new: New version snapshot
+
+    Returns:
+        Delta keyed by changed field (None means the field was cleared)
+    """
+    delta: dict[str, TextOps | None] = {}
+    for field in SOAP_FIELDS:
+        if old.get(field) == new.get(field):
+            continue
+        if new.get(field) is None:
+            delta[field] = None
+        else:
+            delta[field] = compute_text_delta(old.get(field) or "", new[field])
+    return delta
+
+
+def apply_delta(base: Snapshot, delta: dict[str, TextOps | None]) -> Snapshot:
+    """
+    Apply a delta from compute_delta() to a snapshot.
+
+    Args:
+        base: Previous version snapshot
+        delta: Delta against base
+
+    Returns:
+        New version snapshot
+    """
+    result = dict(base)
+    for field, ops in delta.items():
+        result[field] = (
+            None if ops is None else apply_text_delta(base.get(field) or "", ops)
+        )
+    return result
+
+
+def _is_checkpoint_number(version_number: int) -> bool:
+    return (version_number - 1) % SESSION_VERSION_CHECKPOINT_INTERVAL == 0
+
+
+def _encode_row(
+    row: SessionVersion, snapshot: Snapshot, previous: Snapshot | None
+) -> None:
+    """Store snapshot on row as a checkpoint or as a delta against previous."""
+    encoded_delta = None
+    if previous is not None and not _is_checkpoint_number(row.version_number):
+        encoded_delta = json.dumps(
+            compute_delta(previous, snapshot), separators=(",", ":")
+        )
+        snapshot_size = sum(len(value or "") for value in snapshot.values())
+        if len(encoded_delta) >= snapshot_size:
+            # Mostly rewritten: a full snapshot is smaller and cheaper to read
+            encoded_delta = None
+
+    row.is_checkpoint = encoded_delta is None
+    row.delta = encoded_delta
+    for field in SOAP_FIELDS:
+        setattr(row, field, snapshot[field] if row.is_checkpoint else None)
+
+
+async def materialize_versions(
+    db: AsyncSession,
+    session_id: uuid.UUID,
+    from_version: int | None = None,
+    to_version: int | None = None,
+) -> list[MaterializedVersion]:
+    """
+    Reconstruct a range of versions of a session.
+
+    Loads (and decrypts) only the versions in the range plus the deltas
+    between the nearest checkpoint and the start of the range.
+
+    Args:
+        db: Database session
+        session_id: Session UUID
+        from_version: First version to return (default: 1)
+        to_version: Last version to return (default: latest)
+
+    Returns:
+        Versions in the range, ascending by version_number
+
+    Raises:
+        ValueError: If the stored history is inconsistent (missing checkpoint
+            or a delta that does not apply)
+    """
+    from_version = from_version or 1
+
+    checkpoint_number = await db.scalar(
+        select(func.max(SessionVersion.version_number)).where(
+            SessionVersion.session_id == session_id,
+            SessionVersion.is_checkpoint.is_(True),
+            SessionVersion.version_number <= from_version,
+        )
+    )
+    if checkpoint_number is None:
+        checkpoint_number = from_version
+
+    query = (
+        select(SessionVersion)
+        .where(
+            SessionVersion.session_id == session_id,
+            SessionVersion.version_number >= checkpoint_number,
+        )
+        .order_by(SessionVersion.version_number)
+    )
+    if to_version is not None:
+        query = query.where(SessionVersion.version_number <= to_version)
+
+    rows = (await db.execute(query)).scalars().all()
+
+    versions: list[MaterializedVersion] = []
+    snapshot: Snapshot | None = None
+    for row in rows:
+        if row.is_checkpoint:
+            snapshot = {field: getattr(row, field) for field in SOAP_FIELDS}
+        elif snapshot is None:
+            raise ValueError(
+                f"Session {session_id} version {row.version_number} has no "
+                "preceding checkpoint"
+            )
+        else:
+            snapshot = apply_delta(snapshot, json.loads(row.delta))
+
+        if row.version_number >= from_version:
+            versions.append(
+                MaterializedVersion(
+                    id=row.id,
+                    session_id=row.session_id,
+                    version_number=row.version_number,
+                    created_at=row.created_at,
+                    created_by_user_id=row.created_by_user_id,
+                    **snapshot,
+                )
+            )
+
+    return versions
+
+
+async def get_session_version(
+    db: AsyncSession, session_id: uuid.UUID, version_number: int
+) -> MaterializedVersion | None:
+    """
+    Reconstruct a single version of a session.
+
+    Args:
+        db: Database session
+        session_id: Session UUID
+        version_number: Version to reconstruct
+
+    Returns:
+        The version, or None if it does not exist
+    """
+    versions = await materialize_versions(
+        db, session_id, from_version=version_number, to_version=version_number
+    )
+    return versions[0] if versions else None
+
+
+async def add_session_version(
+    db: AsyncSession,
+    session: Session,
+    version_number: int,
+    created_by_user_id: uuid.UUID,
+    created_at: datetime | None = None,
+) -> SessionVersion:
+    """
+    Record the session's current SOAP fields as a new version (caller commits).
+
+    Stored as a delta against the previous version unless version_number is a
+    checkpoint position or the diff is not smaller than the snapshot.
+
+    Args:
+        db: Database session
+        session: Session whose current SOAP fields are snapshotted
+        version_number: Number of the new version
+        created_by_user_id: User who finalized or amended
+        created_at: Version timestamp (default: now)
+
+    Returns:
+        The added SessionVersion row
+    """
+    snapshot = {field: getattr(session, field) for field in SOAP_FIELDS}
+
+    previous = None
+    if not _is_checkpoint_number(version_number):
+        previous_version = await get_session_version(db, session.id, version_number - 1)
+        if previous_version is not None:
+            previous = previous_version.snapshot
+
+    version = SessionVersion(
+        session_id=session.id,
+        version_number=version_number,
+        created_at=created_at or datetime.now(UTC),
+        created_by_user_id=created_by_user_id,
+    )
+    _encode_row(version, snapshot, previous)
+    db.add(version)
+
+    logger.debug(
+        "session_version_added",
+        session_id=str(session.id),
+        version_number=version_number,
+        is_checkpoint=version.is_checkpoint,
+    )
+    return version
+
+
+async def compact_session_versions(
+    db: AsyncSession, session_id: uuid.UUID, expand: bool = False
+) -> int:
+    """
+    Re-encode a session's history as checkpoints and deltas (caller commits).
+
+    Used to convert history written before delta compression; with
+    expand=True, converts every version back to a full snapshot instead.
+
+    Args:
+        db: Database session
+        session_id: Session UUID
+        expand: Store every version as a full snapshot
+
+    Returns:
+        Number of rows whose encoding changed
+    """
+    versions = await materialize_versions(db, session_id)
+    rows = {
+        row.version_number: row
+        for row in (
+            await db.execute(
+                select(SessionVersion).where(SessionVersion.session_id == session_id)
+            )
+        )
+        .scalars()
+        .all()
+    }
+
+    changed = 0
+    previous: Snapshot | None = None
+    for version in versions:
+        row = rows[version.version_number]
+        was_checkpoint = row.is_checkpoint
+        _encode_row(row, version.snapshot, None if expand else previous)
+        if row.is_checkpoint != was_checkpoint:
+            changed += 1
+        previous = version.snapshot
+
+    return changed
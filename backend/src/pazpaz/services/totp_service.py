@@ -5,7 +5,7 @@ Implements TOTP per RFC 6238 with 6-digit codes, 30-second intervals.
 
 Security Features:
 - TOTP secrets encrypted at rest with AES-256-GCM
-- Backup codes hashed with Argon2id
+- Backup codes hashed with Argon2id (on the bounded hashing executor)
 - Single-use backup codes
 - Audit logging for all 2FA operations
 - Defense against brute force attacks
@@ -46,6 +46,7 @@ from passlib.hash import argon2
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from pazpaz.core.hashing import run_hashing
 from pazpaz.models.user import User
 
 logger = structlog.get_logger(__name__)
@@ -264,6 +265,7 @@ async def enroll_totp(
 
     Raises:
         ValueError: If 2FA already enabled or user not found
+        HashingCapacityError: If the hashing executor is at capacity
 
     Security:
         - TOTP secret stored encrypted (AES-256-GCM)
@@ -299,7 +301,9 @@ async def enroll_totp(
 
     # Generate backup codes
     backup_codes = generate_backup_codes(count=8)
-    hashed_codes = hash_backup_codes(backup_codes)
+    hashed_codes = await run_hashing(
+        "backup_code_hash", hash_backup_codes, backup_codes
+    )
 
     # Store secret and hashed backup codes (not yet enabled)
     user.totp_secret = secret
@@ -443,9 +447,14 @@ async def verify_totp_or_backup(
     Returns:
         bool: True if valid
 
+    Raises:
+        HashingCapacityError: If backup codes must be checked and the hashing
+            executor is at capacity
+
     Security:
         - Tries TOTP code first (most common case)
-        - Falls back to backup codes if TOTP fails
+        - Falls back to backup codes if TOTP fails (Argon2id verification
+          runs on the hashing executor, off the event loop)
         - Single-use backup codes (deleted after use)
         - Audit logging for successful verification
 
@@ -468,7 +477,9 @@ async def verify_totp_or_backup(
     # Try backup codes
     if user.totp_backup_codes:
         hashed_codes = json.loads(user.totp_backup_codes)
-        is_valid, matched_hash = verify_backup_code(code, hashed_codes)
+        is_valid, matched_hash = await run_hashing(
+            "backup_code_verify", verify_backup_code, code, hashed_codes
+        )
 
         if is_valid:
             # Remove used backup code
@@ -0,0 +1,452 @@
+"""Asynchronous transcription jobs for long recordings.
+
+POST /transcribe/jobs stages the upload in object storage and enqueues the
+transcribe_audio_job worker task; the request returns immediately with a
+job ID. The worker splits the recording at pauses, transcribes the segments
+concurrently (transcription_pipeline), optionally runs AI cleanup, and
+stores the result on the job. Clients follow progress over server-sent
+events (GET /transcribe/jobs/{job_id}/events) or poll the job.
+
+Storage:
+- Audio: object quarantine/transcriptions/<workspace_id>/<job_id>
+  (transcription_audio_object_key), encrypted at rest (SSE) and streamed
+  in multipart parts, never held in memory. The worker downloads it to a
+  temporary file for ffmpeg and deletes the object; recordings that are
+  never processed expire with the quarantine lifecycle rule
+  (scripts/create_storage_buckets.py). Recordings are kept out of Redis,
+  which is memory-bounded and shared with sessions, rate limits and queues.
+- transcription:job:<job_id>: hash with owner, status and progress,
+  expiring after TRANSCRIPTION_JOB_TTL_SECONDS; the
+  transcript is stored encrypted (encrypt_field_versioned). Updates never
+  recreate an expired job and renew its TTL.
+- transcription:job:<job_id>:events: pub/sub channel notified on every
+  change, so event streams do not poll.
+
+Usage:
+    audio_key = transcription_audio_object_key(workspace_id, job_id)
+    size = await asyncio.to_thread(
+        store_job_audio, s3_client, audio_key, upload.file, max_bytes
+    )
+    await create_transcription_job(redis_client, job_id, audio_key=audio_key, ...)
+
+    async for event, data in stream_job_events(redis_client, job_id):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import os
+import tempfile
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from botocore.exceptions import ClientError
+from redis.exceptions import WatchError
+
+from pazpaz.ai.transcription_cleanup import cleanup_transcription
+from pazpaz.ai.transcription_pipeline import transcribe_recording
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+from pazpaz.services.attachment_upload_service import QUARANTINE_PREFIX
+from pazpaz.utils.encryption import decrypt_field_versioned, encrypt_field_versioned
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+    from pazpaz.ai.providers.base import TranscriptionProvider
+
+logger = get_logger(__name__)
+
+# Jobs and results expire after an hour (staged audio: quarantine lifecycle)
+TRANSCRIPTION_JOB_TTL_SECONDS = 60 * 60
+
+# Seconds an event stream waits for a notification before re-reading the job
+TRANSCRIPTION_EVENTS_IDLE_SECONDS = 15.0
+
+TRANSCRIPTION_JOB_KEY = "transcription:job:{job_id}"
+TRANSCRIPTION_EVENTS_CHANNEL = "transcription:job:{job_id}:events"
+
+# Optimistic-transaction retries for concurrent job updates (progress)
+MAX_UPDATE_RETRIES = 5
+
+
+class TranscriptionJobStatus(str, enum.Enum):
+    """Lifecycle of a transcription job."""
+
+    QUEUED = "queued"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+TERMINAL_STATUSES = {TranscriptionJobStatus.COMPLETED, TranscriptionJobStatus.FAILED}
+
+
+class TranscriptionUploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the size limit."""
+
+
+@dataclass(frozen=True)
+class TranscriptionJob:
+    """State of a transcription job (transcripts decrypted)."""
+
+    id: str
+    workspace_id: uuid.UUID
+    user_id: uuid.UUID
+    field_name: str
+    status: TranscriptionJobStatus
+    completed_segments: int
+    total_segments: int
+    text: str | None
+    cleaned_text: str | None
+    language: str | None
+    duration_seconds: float | None
+    error: str | None
+
+    def event(self) -> tuple[str, dict[str, Any]]:
+        """Server-sent event describing the current state."""
+        if self.status == TranscriptionJobStatus.COMPLETED:
+            return "done", {
+                "text": self.text,
+                "cleaned_text": self.cleaned_text,
+                "language": self.language,
+                "duration_seconds": self.duration_seconds,
+            }
+        if self.status == TranscriptionJobStatus.FAILED:
+            return "error", {"message": self.error}
+        return "progress", {
+            "status": self.status.value,
+            "completed_segments": self.completed_segments,
+            "total_segments": self.total_segments,
+        }
+
+
+def transcription_audio_object_key(workspace_id: uuid.UUID, job_id: str) -> str:
+    """Quarantine key a job's recording is staged under until it is processed."""
+    return f"{QUARANTINE_PREFIX}/transcriptions/{workspace_id}/{job_id}"
+
+
+def store_job_audio(
+    s3_client: Any,
+    object_key: str,
+    audio: BinaryIO,
+    max_bytes: int,
+) -> int:
+    """
+    Stage an upload in object storage without holding it in memory.
+
+    Synchronous (boto3): run in a thread. The file is streamed in multipart
+    parts and encrypted at rest (SSE): the recording is PHI.
+
+    Args:
+        s3_client: boto3 S3 client (or compatible)
+        object_key: Key from transcription_audio_object_key()
+        audio: Seekable upload file (UploadFile.file, spooled to disk)
+        max_bytes: Size limit
+
+    Returns:
+        Upload size in bytes
+
+    Raises:
+        TranscriptionUploadTooLargeError: If the upload exceeds max_bytes
+            (nothing is stored)
+    """
+    size = audio.seek(0, os.SEEK_END)
+    if size > max_bytes:
+        raise TranscriptionUploadTooLargeError(f"Upload exceeds {max_bytes} bytes")
+    audio.seek(0)
+
+    s3_client.upload_fileobj(
+        audio,
+        settings.s3_bucket_name,
+        object_key,
+        ExtraArgs={
+            "ContentType": "application/octet-stream",
+            "ServerSideEncryption": "AES256",
+        },
+    )
+    return size
+
+
+def _download_job_audio(s3_client: Any, object_key: str, path: str) -> bool:
+    """
+    Download a staged recording to a file and delete the object.
+
+    Returns:
+        True if downloaded, False if the object does not exist (expired)
+    """
+    bucket = settings.s3_bucket_name
+    try:
+        s3_client.download_file(bucket, object_key, path)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+    s3_client.delete_object(Bucket=bucket, Key=object_key)
+    return True
+
+
+async def create_transcription_job(
+    redis_client: redis.Redis,
+    job_id: str,
+    workspace_id: uuid.UUID,
+    user_id: uuid.UUID,
+    field_name: str,
+    filename: str,
+    cleanup: bool,
+    audio_key: str,
+) -> None:
+    """
+    Register a queued job (audio must already be stored).
+
+    Args:
+        redis_client: Redis client
+        job_id: Job ID
+        workspace_id: Owning workspace
+        user_id: Requesting user
+        field_name: SOAP field being dictated
+        filename: Original file name (format hint for ffmpeg)
+        cleanup: Whether to run AI cleanup on the transcript
+        audio_key: Object key of the staged recording
+    """
+    key = TRANSCRIPTION_JOB_KEY.format(job_id=job_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            key,
+            mapping={
+                "workspace_id": str(workspace_id),
+                "user_id": str(user_id),
+                "field_name": field_name,
+                "filename": filename,
+                "cleanup": "1" if cleanup else "0",
+                "audio_key": audio_key,
+                "status": TranscriptionJobStatus.QUEUED.value,
+                "completed_segments": "0",
+                "total_segments": "0",
+            },
+        )
+        pipe.expire(key, TRANSCRIPTION_JOB_TTL_SECONDS)
+        await pipe.execute()
+
+
+async def get_transcription_job(
+    redis_client: redis.Redis, job_id: str, workspace_id: uuid.UUID | None = None
+) -> TranscriptionJob | None:
+    """
+    Load a job.
+
+    Args:
+        redis_client: Redis client
+        job_id: Job ID
+        workspace_id: If given, jobs of other workspaces are treated as missing
+
+    Returns:
+        Job, or None if it does not exist (or expired)
+    """
+    data = await redis_client.hgetall(TRANSCRIPTION_JOB_KEY.format(job_id=job_id))
+    if not data:
+        return None
+    if workspace_id is not None and data["workspace_id"] != str(workspace_id):
+        return None
+
+    return TranscriptionJob(
+        id=job_id,
+        workspace_id=uuid.UUID(data["workspace_id"]),
+        user_id=uuid.UUID(data["user_id"]),
+        field_name=data["field_name"],
+        status=TranscriptionJobStatus(data["status"]),
+        completed_segments=int(data["completed_segments"]),
+        total_segments=int(data["total_segments"]),
+        text=decrypt_field_versioned(data.get("text")),
+        cleaned_text=decrypt_field_versioned(data.get("cleaned_text")),
+        language=data.get("language"),
+        duration_seconds=(
+            float(data["duration_seconds"]) if "duration_seconds" in data else None
+        ),
+        error=data.get("error"),
+    )
+
+
+async def _update_job(redis_client: redis.Redis, job_id: str, **fields: str) -> bool:
+    """
+    Update job fields and notify event streams.
+
+    Only updates a job that still exists (an expired job would otherwise be
+    recreated as a partial hash without owner or TTL), and renews its TTL.
+
+    Returns:
+        True if the job was updated, False if it no longer exists
+    """
+    key = TRANSCRIPTION_JOB_KEY.format(job_id=job_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        for attempt in range(MAX_UPDATE_RETRIES):
+            try:
+                await pipe.watch(key)
+                if not await pipe.exists(key):
+                    await pipe.unwatch()
+                    return False
+                pipe.multi()
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, TRANSCRIPTION_JOB_TTL_SECONDS)
+                await pipe.execute()
+                break
+            except WatchError:
+                # Concurrent progress update; retry on the new state
+                if attempt == MAX_UPDATE_RETRIES - 1:
+                    raise
+
+    await redis_client.publish(
+        TRANSCRIPTION_EVENTS_CHANNEL.format(job_id=job_id), fields.get("status", "")
+    )
+    return True
+
+
+async def run_transcription_job(
+    redis_client: redis.Redis,
+    s3_client: Any,
+    job_id: str,
+    provider: TranscriptionProvider,
+    max_concurrency: int,
+) -> TranscriptionJob | None:
+    """
+    Transcribe a queued job's audio and store the result.
+
+    The staged recording is downloaded to a temporary file (ffmpeg reads it
+    from disk) and deleted from object storage before transcription starts.
+
+    Args:
+        redis_client: Redis client
+        s3_client: boto3 S3 client (or compatible)
+        job_id: Job ID
+        provider: Transcription provider
+        max_concurrency: Maximum segments transcribed at once
+
+    Returns:
+        Finished job, or None if the job or its audio no longer exists
+
+    Raises:
+        Exception: Transcription failure (after marking the job failed)
+    """
+    job = await redis_client.hgetall(TRANSCRIPTION_JOB_KEY.format(job_id=job_id))
+    if not job:
+        # The staged recording expires with the quarantine lifecycle rule
+        logger.warning("transcription_job_missing", job_id=job_id)
+        return None
+
+    async def report_progress(completed: int, total: int) -> None:
+        await _update_job(
+            redis_client,
+            job_id,
+            status=TranscriptionJobStatus.PROCESSING.value,
+            completed_segments=str(completed),
+            total_segments=str(total),
+        )
+
+    try:
+        _, extension = os.path.splitext(job.get("filename", ""))
+        with tempfile.TemporaryDirectory(prefix="transcription-") as directory:
+            path = os.path.join(directory, f"recording{extension.lower()[:10]}")
+            if not await asyncio.to_thread(
+                _download_job_audio, s3_client, job["audio_key"], path
+            ):
+                logger.warning("transcription_audio_missing", job_id=job_id)
+                await _update_job(
+                    redis_client,
+                    job_id,
+                    status=TranscriptionJobStatus.FAILED.value,
+                    error=(
+                        "Recording expired before it was processed. "
+                        "Please upload again."
+                    ),
+                )
+                return None
+
+            await _update_job(
+                redis_client, job_id, status=TranscriptionJobStatus.PROCESSING.value
+            )
+            result = await transcribe_recording(
+                path, provider, max_concurrency, on_progress=report_progress
+            )
+
+        fields = {
+            "status": TranscriptionJobStatus.COMPLETED.value,
+            "text": encrypt_field_versioned(result.text),
+            "language": result.language,
+            "duration_seconds": str(result.duration_seconds),
+        }
+        if job.get("cleanup") == "1" and result.text:
+            cleaned_text = await cleanup_transcription(
+                raw_text=result.text,
+                field_name=job["field_name"],
+                language=result.language,
+            )
+            fields["cleaned_text"] = encrypt_field_versioned(cleaned_text)
+
+        await _update_job(redis_client, job_id, **fields)
+
+    except Exception:
+        await _update_job(
+            redis_client,
+            job_id,
+            status=TranscriptionJobStatus.FAILED.value,
+            error="Transcription failed. Please try again or type manually.",
+        )
+        raise
+
+    logger.info(
+        "transcription_job_completed",
+        job_id=job_id,
+        workspace_id=job["workspace_id"],
+        field_name=job["field_name"],
+        audio_duration=result.duration_seconds,
+        transcription_length=len(result.text),
+        detected_language=result.language,
+    )
+    return await get_transcription_job(redis_client, job_id)
+
+
+async def stream_job_events(
+    redis_client: redis.Redis, job_id: str
+) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """
+    Yield job events until the job finishes.
+
+    The current state is emitted first; afterwards an event is emitted on
+    every change. Ends after a "done" or "error" event.
+
+    Args:
+        redis_client: Redis client
+        job_id: Job ID (ownership must be checked by the caller)
+
+    Yields:
+        (event name, data) pairs: "progress", "done" or "error"
+    """
+    pubsub = redis_client.pubsub()
+    await pubsub.subscribe(TRANSCRIPTION_EVENTS_CHANNEL.format(job_id=job_id))
+    try:
+        last_event = None
+        while True:
+            job = await get_transcription_job(redis_client, job_id)
+            if job is None:
+                yield "error", {"message": "Transcription job not found or expired."}
+                return
+
+            event = job.event()
+            if event != last_event:
+                yield event
+                last_event = event
+            if job.status in TERMINAL_STATUSES:
+                return
+
+            # Wait for a change notification (or re-read after idling)
+            await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=TRANSCRIPTION_EVENTS_IDLE_SECONDS,
+            )
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
@@ -0,0 +1,155 @@
+"""Render thumbnails and previews of image and PDF attachments.
+
+Galleries would otherwise load full originals (multi-MB phone photos and
+PDFs) just to show small tiles. Each previewable attachment gets two small
+WebP images, stored next to the original:
+
+- thumbnail: at most THUMBNAIL_MAX_DIMENSION px on the long side (tiles)
+- preview: at most PREVIEW_MAX_DIMENSION px on the long side (lightbox);
+  for PDFs, the first page
+
+PDF pages are rasterized with pdftoppm (poppler-utils, installed in the
+backend image). Rendering is CPU-bound and runs on the file processing
+pool (utils/file_processing.py), so its memory and time limits apply.
+
+Usage:
+    images = await run_file_processing(
+        "preview", render_attachment_previews, content, FileType.JPEG
+    )
+    images[THUMBNAIL_VARIANT]  # WebP bytes
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import tempfile
+
+from PIL import Image
+
+from pazpaz.core.logging import get_logger
+from pazpaz.utils.file_validation import FileType
+
+logger = get_logger(__name__)
+
+PDFTOPPM_BINARY = "pdftoppm"
+PDFTOPPM_TIMEOUT_SECONDS = 20
+
+THUMBNAIL_VARIANT = "thumbnail"
+PREVIEW_VARIANT = "preview"
+
+# Long-side size of each derived image, in pixels
+THUMBNAIL_MAX_DIMENSION = 320
+PREVIEW_MAX_DIMENSION = 1280
+
+PREVIEW_FORMAT = "WEBP"
+PREVIEW_EXTENSION = "webp"
+PREVIEW_CONTENT_TYPE = FileType.WEBP.value
+PREVIEW_QUALITY = 80
+
+PREVIEWABLE_FILE_TYPES = frozenset(
+    {FileType.JPEG, FileType.PNG, FileType.WEBP, FileType.PDF}
+)
+
+
+class PreviewRenderError(Exception):
+    """Raised when an attachment cannot be rendered."""
+
+
+def _encode(img: Image.Image, max_dimension: int) -> bytes:
+    """Downscale a copy of an image and encode it as WebP."""
+    resized = img.copy()
+    resized.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    output = io.BytesIO()
+    resized.save(output, format=PREVIEW_FORMAT, quality=PREVIEW_QUALITY, method=4)
+    return output.getvalue()
+
+
+def _render_pdf_first_page(content: bytes) -> Image.Image:
+    """Rasterize the first page of a PDF at preview size."""
+    with tempfile.TemporaryDirectory(prefix="attachment-preview-") as directory:
+        pdf_path = os.path.join(directory, "document.pdf")
+        output_prefix = os.path.join(directory, "page")
+        with open(pdf_path, "wb") as pdf:
+            pdf.write(content)
+
+        try:
+            subprocess.run(
+                [
+                    PDFTOPPM_BINARY,
+                    "-f",
+                    "1",
+                    "-l",
+                    "1",
+                    "-singlefile",
+                    "-scale-to",
+                    str(PREVIEW_MAX_DIMENSION),
+                    "-png",
+                    pdf_path,
+                    output_prefix,
+                ],
+                capture_output=True,
+                check=True,
+                timeout=PDFTOPPM_TIMEOUT_SECONDS,
+            )
+        except FileNotFoundError as e:
+            raise PreviewRenderError("pdftoppm is not installed") from e
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode("utf-8", errors="replace")
+            raise PreviewRenderError(
+                f"pdftoppm exited with {e.returncode}: {stderr[-500:]}"
+            ) from e
+        except subprocess.TimeoutExpired as e:
+            raise PreviewRenderError("pdftoppm timed out") from e
+
+        with Image.open(f"{output_prefix}.png") as page:
+            page.load()
+            return page
+
+
+def render_attachment_previews(content: bytes, file_type: FileType) -> dict[str, bytes]:
+    """
+    Render the thumbnail and preview of an attachment.
+
+    Args:
+        content: Stored (sanitized) attachment bytes
+        file_type: Attachment type, one of PREVIEWABLE_FILE_TYPES
+
+    Returns:
+        WebP bytes keyed by variant (THUMBNAIL_VARIANT, PREVIEW_VARIANT)
+
+    Raises:
+        PreviewRenderError: If the attachment cannot be rendered
+    """
+    if file_type not in PREVIEWABLE_FILE_TYPES:
+        raise PreviewRenderError(f"No previews for {file_type.value}")
+
+    try:
+        if file_type == FileType.PDF:
+            img = _render_pdf_first_page(content)
+        else:
+            img = Image.open(io.BytesIO(content))
+            # JPEG: decode at reduced scale directly (much less work and memory)
+            img.draft("RGB", (PREVIEW_MAX_DIMENSION, PREVIEW_MAX_DIMENSION))
+
+        with img:
+            if img.mode not in ("RGB", "RGBA"):
+                has_alpha = "A" in img.getbands() or "transparency" in img.info
+                img = img.convert("RGBA" if has_alpha else "RGB")
+            preview = _encode(img, PREVIEW_MAX_DIMENSION)
+            thumbnail = _encode(img, THUMBNAIL_MAX_DIMENSION)
+
+    except PreviewRenderError:
+        raise
+    except Exception as e:
+        raise PreviewRenderError(f"Failed to render {file_type.value}: {e}") from e
+
+    logger.debug(
+        "attachment_previews_rendered",
+        file_type=file_type.value,
+        original_size=len(content),
+        preview_size=len(preview),
+        thumbnail_size=len(thumbnail),
+    )
+    return {THUMBNAIL_VARIANT: thumbnail, PREVIEW_VARIANT: preview}
@@ -0,0 +1,361 @@
+"""Process pool for CPU-bound upload validation and sanitization.
+
+Decoding a large phone photo and re-encoding it without metadata takes
+hundreds of milliseconds of pure CPU (PIL holds the GIL for much of it), so
+running it in an upload handler stalls every other request on the worker.
+Uploads are instead validated and sanitized in a small dedicated process
+pool (see validate_and_sanitize_file, which decodes each upload once).
+
+Limits:
+- file_processing_max_workers caps concurrent jobs (one per worker process)
+- file_processing_max_pending caps queued + running jobs; beyond it new jobs
+  are rejected with FileProcessingCapacityError (503) instead of queueing
+  unboundedly
+- file_processing_memory_limit_mb caps each worker's address space
+  (RLIMIT_AS): an oversized decode fails with MemoryError in the worker
+  instead of exhausting the host
+- file_processing_timeout_seconds caps each job: an alarm interrupts the job
+  in the worker, and a CPU-time rlimit kills the worker if it is stuck in C
+  code the alarm cannot interrupt (the pool is then replaced)
+
+Jobs hitting a limit raise FileProcessingLimitError, a FileContentError, so
+upload handlers reject the file (422) like any other unprocessable content.
+
+Example:
+    >>> processed = await process_upload(file.filename, file_content)
+    >>> processed.file_type, processed.filename, len(processed.content)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import resource
+import signal
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+from pazpaz.utils.file_sanitization import SanitizedFile, validate_and_sanitize_file
+from pazpaz.utils.file_validation import FileContentError
+
+logger = get_logger(__name__)
+
+# Worker processes are recycled after this many jobs (bounds fragmentation)
+MAX_TASKS_PER_CHILD = 200
+
+# Extra CPU seconds before the kernel kills a worker that ignored the alarm
+CPU_LIMIT_GRACE_SECONDS = 2
+
+# Extra wall-clock seconds the API waits beyond the job time limit
+RESULT_GRACE_SECONDS = 5.0
+
+# Prometheus metrics for the file processing pool
+file_processing_pending_jobs = Gauge(
+    "file_processing_pending_jobs",
+    "File processing jobs queued or running in the process pool",
+    multiprocess_mode="livesum",
+)
+
+file_processing_rejected_total = Counter(
+    "file_processing_rejected_total",
+    "File processing jobs rejected because the pool was at capacity",
+    ["operation"],
+)
+
+file_processing_failures_total = Counter(
+    "file_processing_failures_total",
+    "File processing jobs stopped by a resource limit",
+    ["operation", "reason"],  # reason: limit, timeout, crashed
+)
+
+file_processing_duration_seconds = Histogram(
+    "file_processing_duration_seconds",
+    "Time from submission to completion of a file processing job (queue + work)",
+    ["operation"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0],
+)
+
+
+class FileProcessingCapacityError(Exception):
+    """Raised when the file processing pool has no capacity for another job."""
+
+
+class FileProcessingLimitError(FileContentError):
+    """Raised when a file exceeds the memory or time limit while processed."""
+
+
+def _raise_time_limit(signum, frame) -> None:
+    """SIGALRM handler in workers: abort the running job."""
+    raise FileProcessingLimitError("File took too long to process")
+
+
+def _init_worker(memory_limit_bytes: int) -> None:
+    """Apply per-process limits when a worker starts."""
+    if memory_limit_bytes > 0:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    signal.signal(signal.SIGALRM, _raise_time_limit)
+
+
+def _run_limited[T](time_limit: float, func: Callable[..., T], *args) -> T:
+    """
+    Run a job in a worker under a time limit (executes in the worker).
+
+    Args:
+        time_limit: Seconds the job may run
+        func: Job function
+        *args: Arguments passed to func
+
+    Returns:
+        Result of func(*args)
+
+    Raises:
+        FileProcessingLimitError: If the job runs out of time or memory
+    """
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_limit = math.ceil(usage.ru_utime + usage.ru_stime + time_limit)
+    cpu_limit += CPU_LIMIT_GRACE_SECONDS
+    if hard != resource.RLIM_INFINITY:
+        cpu_limit = min(cpu_limit, hard)
+
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, hard))
+    signal.setitimer(signal.ITIMER_REAL, time_limit)
+    try:
+        return func(*args)
+    except MemoryError as e:
+        raise FileProcessingLimitError("File is too large to process") from e
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+class FileProcessingExecutor:
+    """
+    Process pool for CPU-heavy file work with admission and resource limits.
+
+    Attributes:
+        max_workers: Number of worker processes
+        max_pending: Max jobs queued or running before rejecting new ones
+        memory_limit_bytes: Address space limit per worker (0 = unlimited)
+        timeout_seconds: Time limit per job
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        memory_limit_bytes: int,
+        timeout_seconds: float,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of worker processes
+            max_pending: Max jobs queued or running before rejecting new ones
+            memory_limit_bytes: Address space limit per worker (0 = unlimited)
+            timeout_seconds: Time limit per job
+        """
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self.memory_limit_bytes = memory_limit_bytes
+        self.timeout_seconds = timeout_seconds
+        self._pending = 0
+        self._pool = self._create_pool()
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        # forkserver: workers are not forked from the (threaded) API process
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_init_worker,
+            initargs=(self.memory_limit_bytes,),
+            max_tasks_per_child=MAX_TASKS_PER_CHILD,
+        )
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a broken pool (once, even if several jobs saw it break)."""
+        if self._pool is broken:
+            self._pool = self._create_pool()
+            broken.shutdown(wait=False, cancel_futures=True)
+            logger.warning("file_processing_pool_replaced")
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running."""
+        return self._pending
+
+    async def run[T](self, operation: str, func: Callable[..., T], *args) -> T:
+        """
+        Run a function in the pool without blocking the event loop.
+
+        Args:
+            operation: Operation name for metrics and logs
+            func: Module-level (picklable) synchronous function
+            *args: Picklable arguments passed to func
+
+        Returns:
+            Result of func(*args)
+
+        Raises:
+            FileProcessingCapacityError: If max_pending jobs are already
+                queued/running
+            FileProcessingLimitError: If the job exceeded a resource limit
+        """
+        if self._pending >= self.max_pending:
+            file_processing_rejected_total.labels(operation=operation).inc()
+            logger.warning(
+                "file_processing_pool_at_capacity",
+                operation=operation,
+                pending=self._pending,
+                max_pending=self.max_pending,
+            )
+            raise FileProcessingCapacityError(
+                f"File processing pool at capacity ({self.max_pending} jobs)"
+            )
+
+        self._pending += 1
+        file_processing_pending_jobs.inc()
+        start_time = time.perf_counter()
+        pool = self._pool
+        try:
+            future = pool.submit(_run_limited, self.timeout_seconds, func, *args)
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                self.timeout_seconds + RESULT_GRACE_SECONDS,
+            )
+
+        except FileProcessingLimitError:
+            file_processing_failures_total.labels(
+                operation=operation, reason="limit"
+            ).inc()
+            raise
+
+        except TimeoutError as e:
+            file_processing_failures_total.labels(
+                operation=operation, reason="timeout"
+            ).inc()
+            logger.warning(
+                "file_processing_timeout",
+                operation=operation,
+                timeout_seconds=self.timeout_seconds,
+            )
+            raise FileProcessingLimitError("File took too long to process") from e
+
+        except BrokenProcessPool as e:
+            # Worker killed (CPU limit) or crashed; in-flight jobs are lost
+            file_processing_failures_total.labels(
+                operation=operation, reason="crashed"
+            ).inc()
+            logger.warning("file_processing_worker_died", operation=operation)
+            self._replace_pool(pool)
+            raise FileProcessingLimitError(
+                "File could not be processed within resource limits"
+            ) from e
+
+        finally:
+            self._pending -= 1
+            file_processing_pending_jobs.dec()
+            file_processing_duration_seconds.labels(operation=operation).observe(
+                time.perf_counter() - start_time
+            )
+
+    def shutdown(self) -> None:
+        """Stop the pool, cancelling queued jobs."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+# Global file processing executor instance
+_file_processing_executor: FileProcessingExecutor | None = None
+
+
+def get_file_processing_executor() -> FileProcessingExecutor:
+    """
+    Get the process-wide file processing executor, creating it on first use.
+
+    Returns:
+        FileProcessingExecutor sized from settings
+    """
+    global _file_processing_executor
+
+    if _file_processing_executor is None:
+        _file_processing_executor = FileProcessingExecutor(
+            max_workers=settings.file_processing_max_workers,
+            max_pending=settings.file_processing_max_pending,
+            memory_limit_bytes=settings.file_processing_memory_limit_mb * 1024 * 1024,
+            timeout_seconds=settings.file_processing_timeout_seconds,
+        )
+        logger.info(
+            "file_processing_executor_started",
+            max_workers=_file_processing_executor.max_workers,
+            max_pending=_file_processing_executor.max_pending,
+            memory_limit_mb=settings.file_processing_memory_limit_mb,
+            timeout_seconds=_file_processing_executor.timeout_seconds,
+        )
+
+    return _file_processing_executor
+
+
+async def run_file_processing[T](operation: str, func: Callable[..., T], *args) -> T:
+    """
+    Run a function on the shared file processing pool.
+
+    Args:
+        operation: Operation name for metrics and logs
+        func: Module-level (picklable) synchronous function
+        *args: Picklable arguments passed to func
+
+    Returns:
+        Result of func(*args)
+
+    Raises:
+        FileProcessingCapacityError: If the pool is at capacity
+        FileProcessingLimitError: If the job exceeded a resource limit
+    """
+    return await get_file_processing_executor().run(operation, func, *args)
+
+
+async def process_upload(
+    filename: str, file_content: bytes, strip_metadata: bool = True
+) -> SanitizedFile:
+    """
+    Validate and sanitize an upload on the file processing pool.
+
+    Runs validate_and_sanitize_file() (type detection, content validation,
+    malware scan, metadata stripping, filename sanitization) in a worker.
+
+    Args:
+        filename: Original filename
+        file_content: Raw file bytes
+        strip_metadata: Whether to strip metadata (default: True)
+
+    Returns:
+        SanitizedFile with validated type, sanitized bytes and safe filename
+
+    Raises:
+        FileValidationError: If validation fails (FileProcessingLimitError if
+            the file exceeded the memory or time limit)
+        MalwareDetectedError: If file contains malware
+        ScannerUnavailableError: If ClamAV unavailable (production/staging only)
+        SanitizationError: If sanitization fails
+        FileProcessingCapacityError: If the pool is at capacity
+    """
+    return await run_file_processing(
+        "upload", validate_and_sanitize_file, filename, file_content, strip_metadata
+    )
+
+
+def shutdown_file_processing_executor() -> None:
+    """Shut down the shared file processing executor (application shutdown)."""
+    global _file_processing_executor
+
+    if _file_processing_executor is not None:
+        _file_processing_executor.shutdown()
+        _file_processing_executor = None
@@ -23,13 +23,19 @@ Privacy concerns with metadata:
 
 from __future__ import annotations
 
+import hashlib
 import io
+from dataclasses import dataclass
 
 from PIL import Image
 from pypdf import PdfReader, PdfWriter
 
 from pazpaz.core.logging import get_logger
-from pazpaz.utils.file_validation import FILE_TYPE_TO_PIL_FORMAT, FileType
+from pazpaz.utils.file_validation import (
+    FILE_TYPE_TO_PIL_FORMAT,
+    FileType,
+    validate_and_decode_file,
+)
 
 logger = get_logger(__name__)
 
@@ -93,17 +99,53 @@ def strip_exif_metadata(
         )
         return file_content
 
+    try:
+        img = Image.open(io.BytesIO(file_content))
+    except Exception as e:
+        logger.error(
+            "exif_stripping_failed",
+            filename=filename,
+            file_type=file_type.value,
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise SanitizationError(f"Failed to strip metadata from {filename}: {e}") from e
+
+    with img:
+        return reencode_image(img, file_type, filename, len(file_content))
+
+
+def reencode_image(
+    img: Image.Image, file_type: FileType, filename: str, original_size: int
+) -> bytes:
+    """
+    Re-encode an opened image without its metadata.
+
+    Shared by strip_exif_metadata() and the single-decode upload path
+    (validate_and_sanitize_file), which passes the image already decoded by
+    validation.
+
+    Args:
+        img: Opened (or loaded) PIL image
+        file_type: Validated FileType (JPEG, PNG, or WEBP)
+        filename: Original filename (for logging)
+        original_size: Size of the uploaded file in bytes (for logging)
+
+    Returns:
+        Sanitized file bytes without metadata
+
+    Raises:
+        SanitizationError: If re-encoding fails
+    """
     try:
         logger.info(
             "exif_stripping_started",
             filename=filename,
             file_type=file_type.value,
-            original_size=len(file_content),
+            original_size=original_size,
         )
 
-        # Open image
-        img = Image.open(io.BytesIO(file_content))
-
         # Check if image has EXIF data (for logging)
         has_exif = hasattr(img, "_getexif") and img._getexif() is not None
         if has_exif:
@@ -150,7 +192,6 @@ def strip_exif_metadata(
         sanitized_bytes = output.getvalue()
 
         # Log size comparison
-        original_size = len(file_content)
         sanitized_size = len(sanitized_bytes)
         size_reduction = original_size - sanitized_size
         reduction_percent = (
@@ -219,17 +260,49 @@ def strip_pdf_metadata(file_content: bytes, filename: str) -> bytes:
         )
         ```
     """
+    try:
+        reader = PdfReader(io.BytesIO(file_content))
+    except Exception as e:
+        logger.error(
+            "pdf_metadata_stripping_failed",
+            filename=filename,
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise SanitizationError(
+            f"Failed to strip PDF metadata from {filename}: {e}"
+        ) from e
+
+    return rewrite_pdf(reader, filename, len(file_content))
+
+
+def rewrite_pdf(reader: PdfReader, filename: str, original_size: int) -> bytes:
+    """
+    Write a parsed PDF's pages to a new PDF without metadata.
+
+    Shared by strip_pdf_metadata() and the single-decode upload path
+    (validate_and_sanitize_file), which passes the reader already parsed by
+    validation.
+
+    Args:
+        reader: Parsed PDF
+        filename: Original filename (for logging)
+        original_size: Size of the uploaded file in bytes (for logging)
+
+    Returns:
+        Sanitized PDF bytes without metadata
+
+    Raises:
+        SanitizationError: If PDF processing fails
+    """
     try:
         logger.info(
             "pdf_metadata_stripping_started",
             filename=filename,
-            original_size=len(file_content),
+            original_size=original_size,
         )
 
-        # Read PDF
-        pdf_input = io.BytesIO(file_content)
-        reader = PdfReader(pdf_input)
-
         # Log metadata before stripping (for audit purposes)
         metadata_before = reader.metadata
         if metadata_before:
@@ -260,7 +333,6 @@ def strip_pdf_metadata(file_content: bytes, filename: str) -> bytes:
         sanitized_bytes = output.getvalue()
 
         # Log size comparison
-        original_size = len(file_content)
         sanitized_size = len(sanitized_bytes)
         size_reduction = original_size - sanitized_size
         reduction_percent = (
@@ -443,3 +515,62 @@ def prepare_file_for_storage(
     )
 
     return sanitized_content, safe_filename
+
+
+@dataclass(frozen=True)
+class SanitizedFile:
+    """Validated and sanitized upload, ready for storage."""
+
+    file_type: FileType
+    content: bytes
+    filename: str
+    content_sha256: str  # Hex digest of content (deduplication key)
+
+
+def validate_and_sanitize_file(
+    filename: str, file_content: bytes, strip_metadata: bool = True
+) -> SanitizedFile:
+    """
+    Validate and sanitize an upload, decoding its content once.
+
+    Equivalent to validate_file() followed by prepare_file_for_storage(),
+    but the image decoded (or PDF parsed) during validation is re-encoded
+    directly. CPU-bound: API handlers run it on the file processing pool
+    (utils/file_processing.py), not on the event loop.
+
+    Args:
+        filename: Original filename
+        file_content: Raw file bytes
+        strip_metadata: Whether to strip metadata (default: True)
+
+    Returns:
+        SanitizedFile with validated type, sanitized bytes, safe filename
+        and content SHA-256
+
+    Raises:
+        FileValidationError: If any validation layer fails
+        MalwareDetectedError: If file contains malware
+        ScannerUnavailableError: If ClamAV unavailable (production/staging only)
+        SanitizationError: If sanitization fails
+    """
+    file_type, decoded = validate_and_decode_file(filename, file_content)
+    safe_filename = sanitize_filename(filename)
+
+    if not strip_metadata:
+        sanitized_content = file_content
+    elif isinstance(decoded, Image.Image):
+        with decoded:
+            sanitized_content = reencode_image(
+                decoded, file_type, filename, len(file_content)
+            )
+    elif isinstance(decoded, PdfReader):
+        sanitized_content = rewrite_pdf(decoded, filename, len(file_content))
+    else:
+        sanitized_content = strip_exif_metadata(file_content, file_type, filename)
+
+    return SanitizedFile(
+        file_type=file_type,
+        content=sanitized_content,
+        filename=safe_filename,
+        content_sha256=hashlib.sha256(sanitized_content).hexdigest(),
+    )
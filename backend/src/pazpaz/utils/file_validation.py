@@ -416,22 +416,26 @@ def detect_polyglot_patterns(file_content: bytes) -> None:
     logger.debug("polyglot_detection_passed", file_size=len(file_content))
 
 
-def validate_image_content(file_content: bytes, mime_type: FileType) -> None:
+def open_validated_image(file_content: bytes, mime_type: FileType) -> Image.Image:
     """
-    Validate image file can be parsed safely by PIL.
+    Decode an image once, validating it on the way.
 
-    Ensures file is actually a valid image and not malicious content.
+    The returned (fully loaded) image can be re-encoded directly by
+    sanitization, so an upload is decoded a single time.
 
     Security Enhancements:
     - Basic polyglot detection (when ClamAV unavailable)
     - Format validation against declared MIME type
-    - Dimension sanity checks
+    - Dimension sanity checks (before pixel data is decoded)
     - Decompression bomb prevention
 
     Args:
         file_content: Raw file bytes
         mime_type: Detected MIME type
 
+    Returns:
+        Loaded PIL image
+
     Raises:
         FileContentError: If image cannot be parsed or is corrupted
     """
@@ -440,13 +444,7 @@ def validate_image_content(file_content: bytes, mime_type: FileType) -> None:
         # This catches images with embedded scripts (PHP, HTML, shell)
         detect_polyglot_patterns(file_content)
 
-        # Open image with PIL
-        img = Image.open(io.BytesIO(file_content))
-
-        # Verify image can be loaded (triggers decompression)
-        img.verify()
-
-        # Re-open after verify() (verify closes the file)
+        # Open image with PIL (reads the header only)
         img = Image.open(io.BytesIO(file_content))
 
         # Check image format matches MIME type
@@ -485,12 +483,16 @@ def validate_image_content(file_content: bytes, mime_type: FileType) -> None:
                 f"Maximum {max_pixels} pixels"
             )
 
+        # Decode pixel data (fails on corrupted or truncated data)
+        img.load()
+
         logger.debug(
             "image_content_validated",
             format=img.format,
             size=img.size,
             mode=img.mode,
         )
+        return img
 
     except FileContentError:
         # Re-raise our own exceptions
@@ -505,15 +507,36 @@ def validate_image_content(file_content: bytes, mime_type: FileType) -> None:
         raise FileContentError(f"Invalid or corrupted image file: {e}") from e
 
 
-def validate_pdf_content(file_content: bytes) -> None:
+def validate_image_content(file_content: bytes, mime_type: FileType) -> None:
     """
-    Validate PDF file can be parsed safely by pypdf.
+    Validate image file can be parsed safely by PIL.
 
-    Ensures file is actually a valid PDF and not malicious content.
+    Ensures file is actually a valid image and not malicious content.
+    See open_validated_image() for the checks performed.
+
+    Args:
+        file_content: Raw file bytes
+        mime_type: Detected MIME type
+
+    Raises:
+        FileContentError: If image cannot be parsed or is corrupted
+    """
+    open_validated_image(file_content, mime_type).close()
+
+
+def open_validated_pdf(file_content: bytes) -> PdfReader:
+    """
+    Parse a PDF once, validating it on the way.
+
+    The returned reader can be rewritten directly by sanitization, so an
+    upload is parsed a single time.
 
     Args:
         file_content: Raw file bytes
 
+    Returns:
+        PdfReader over file_content
+
     Raises:
         FileContentError: If PDF cannot be parsed or is corrupted
     """
@@ -550,6 +573,7 @@ def validate_pdf_content(file_content: bytes) -> None:
             "pdf_content_validated",
             page_count=len(pdf_reader.pages),
         )
+        return pdf_reader
 
     except FileContentError:
         # Re-raise our own exceptions
@@ -563,6 +587,21 @@ def validate_pdf_content(file_content: bytes) -> None:
         raise FileContentError(f"Invalid or corrupted PDF file: {e}") from e
 
 
+def validate_pdf_content(file_content: bytes) -> None:
+    """
+    Validate PDF file can be parsed safely by pypdf.
+
+    Ensures file is actually a valid PDF and not malicious content.
+
+    Args:
+        file_content: Raw file bytes
+
+    Raises:
+        FileContentError: If PDF cannot be parsed or is corrupted
+    """
+    open_validated_pdf(file_content)
+
+
 def validate_audio_content(file_content: bytes, mime_type: FileType) -> None:
     """
     Validate audio file metadata and duration.
@@ -663,41 +702,27 @@ def validate_audio_content(file_content: bytes, mime_type: FileType) -> None:
         raise FileContentError(f"Invalid or corrupted audio file: {e}") from e
 
 
-def validate_file(filename: str, file_content: bytes) -> FileType:
+def validate_and_decode_file(
+    filename: str, file_content: bytes
+) -> tuple[FileType, Image.Image | PdfReader | None]:
     """
-    Comprehensive file validation with quadruple-validation approach.
+    Run all validation layers of validate_file() and keep the decoded content.
 
-    Validation layers (all must pass):
-    1. Extension validation (whitelist-based)
-    2. MIME type detection (reads file header)
-    3. MIME/extension match validation (prevents type confusion)
-    4. Content validation (format-specific parsing)
-    5. Malware scanning (ClamAV antivirus)
+    Images are returned fully loaded and PDFs parsed, so sanitization can
+    reuse them instead of decoding the upload a second time.
 
     Args:
         filename: Original filename from upload
         file_content: Raw file bytes
 
     Returns:
-        Validated FileType
+        Tuple of (validated FileType, decoded image / PDF reader, or None
+        for audio)
 
     Raises:
         FileValidationError: If any validation layer fails
         MalwareDetectedError: If file contains malware
         ScannerUnavailableError: If ClamAV unavailable (production/staging only)
-
-    Example:
-        ```python
-        try:
-            file_type = validate_file("photo.jpg", file_bytes)
-            # File passed all validation checks including malware scan
-        except FileValidationError as e:
-            # Handle validation failure
-            logger.warning("file_rejected", reason=str(e))
-        except MalwareDetectedError as e:
-            # Handle malware detection
-            logger.error("malware_detected", reason=str(e))
-        ```
     """
     logger.info("file_validation_started", filename=filename)
 
@@ -714,10 +739,11 @@ def validate_file(filename: str, file_content: bytes) -> FileType:
     validate_mime_extension_match(detected_mime, extension)
 
     # 5. Validate file content (format-specific)
+    decoded: Image.Image | PdfReader | None = None
     if detected_mime in (FileType.JPEG, FileType.PNG, FileType.WEBP):
-        validate_image_content(file_content, detected_mime)
+        decoded = open_validated_image(file_content, detected_mime)
     elif detected_mime == FileType.PDF:
-        validate_pdf_content(file_content)
+        decoded = open_validated_pdf(file_content)
     elif detected_mime in (
         FileType.MP3,
         FileType.M4A,
@@ -739,4 +765,46 @@ def validate_file(filename: str, file_content: bytes) -> FileType:
         size_bytes=len(file_content),
     )
 
-    return detected_mime
+    return detected_mime, decoded
+
+
+def validate_file(filename: str, file_content: bytes) -> FileType:
+    """
+    Comprehensive file validation with quadruple-validation approach.
+
+    Validation layers (all must pass):
+    1. Extension validation (whitelist-based)
+    2. MIME type detection (reads file header)
+    3. MIME/extension match validation (prevents type confusion)
+    4. Content validation (format-specific parsing)
+    5. Malware scanning (ClamAV antivirus)
+
+    Args:
+        filename: Original filename from upload
+        file_content: Raw file bytes
+
+    Returns:
+        Validated FileType
+
+    Raises:
+        FileValidationError: If any validation layer fails
+        MalwareDetectedError: If file contains malware
+        ScannerUnavailableError: If ClamAV unavailable (production/staging only)
+
+    Example:
+        ```python
+        try:
+            file_type = validate_file("photo.jpg", file_bytes)
+            # File passed all validation checks including malware scan
+        except FileValidationError as e:
+            # Handle validation failure
+            logger.warning("file_rejected", reason=str(e))
+        except MalwareDetectedError as e:
+            # Handle malware detection
+            logger.error("malware_detected", reason=str(e))
+        ```
+    """
+    file_type, decoded = validate_and_decode_file(filename, file_content)
+    if isinstance(decoded, Image.Image):
+        decoded.close()
+    return file_type
@@ -6,6 +6,8 @@ of SOAP note fields using Cohere API and storing them in pgvector.
 
 Tasks:
     - generate_session_embeddings: Generate embeddings for a session's SOAP fields
+    - generate_client_embeddings: Generate embeddings for a client's profile fields
+    - warm_query_embedding_cache: Pre-embed frequent clinical queries (scheduled)
 
 Architecture:
     - Async task execution via arq + Redis
@@ -30,9 +32,12 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
+from pazpaz.ai.embedding_warmup import warm_query_embeddings
 from pazpaz.ai.embeddings import get_embedding_service
 from pazpaz.ai.vector_store import get_vector_store
+from pazpaz.core.config import settings
 from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
 from pazpaz.db.base import AsyncSessionLocal
 from pazpaz.models.client import Client
 from pazpaz.models.session import Session
@@ -188,6 +193,8 @@ async def generate_session_embeddings(
                 workspace_id=workspace_uuid,
                 session_id=session_uuid,
                 embeddings=embeddings,
+                texts=non_empty_fields,
+                client_id=session.client_id,
             )
 
             # Commit transaction
@@ -411,3 +418,42 @@ async def generate_client_embeddings(
         # Propagate exception → arq will retry the job
         # (up to max_tries configured in WorkerSettings)
         raise
+
+
+async def warm_query_embedding_cache(ctx: dict[str, Any]) -> dict[str, Any]:
+    """
+    Pre-embed frequent clinical queries into the query embedding cache.
+
+    Scheduled every 30 minutes (and at worker startup) so common agent
+    queries keep hitting the 1 hour embedding cache instead of Cohere.
+    Only texts missing from Redis are embedded, so steady-state runs make
+    no API calls.
+
+    Args:
+        ctx: arq worker context (unused, but required by arq signature)
+
+    Returns:
+        dict: Task execution summary
+            - embedded: Number of texts newly embedded per language
+            - status: "success" or "skipped"
+
+    Raises:
+        Exception: Propagated to arq (next scheduled run retries)
+    """
+    if not settings.ai_agent_enabled or not settings.ai_embedding_warmup_enabled:
+        return {"embedded": {}, "status": "skipped"}
+
+    try:
+        redis_client = await get_redis()
+        embedded = await warm_query_embeddings(redis_client)
+
+        return {"embedded": embedded, "status": "success"}
+
+    except Exception as e:
+        logger.error(
+            "warm_query_embedding_cache_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise
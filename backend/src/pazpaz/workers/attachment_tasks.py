@@ -0,0 +1,141 @@
+"""
+Background tasks for attachment uploads, thumbnails and previews.
+
+Tasks:
+    - generate_attachment_previews: Render an uploaded image/PDF attachment's
+      thumbnail and preview and store them next to the original
+    - process_attachment_upload: Validate, scan, sanitize and promote a
+      direct (presigned) upload from quarantine; see
+      services/attachment_upload_service.py
+
+Usage:
+    Enqueued by the session and client attachment upload endpoints after
+    the attachment is committed:
+
+        await arq_pool.enqueue_job(
+            "generate_attachment_previews",
+            attachment_id=str(attachment.id),
+            workspace_id=str(workspace_id),
+            _job_id=preview_job_id(attachment.id),
+        )
+
+    Failures are retried by arq (e.g. storage unavailable); attachments that
+    cannot be rendered simply keep no previews.
+
+    process_attachment_upload is enqueued by
+    POST /attachments/uploads/{upload_id}/complete.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
+from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.services.attachment_preview_service import create_attachment_previews
+from pazpaz.services.attachment_upload_service import finalize_attachment_upload
+from pazpaz.utils.attachment_previews import PreviewRenderError
+from pazpaz.utils.file_processing import FileProcessingLimitError
+
+logger = get_logger(__name__)
+
+
+async def generate_attachment_previews(
+    ctx: dict[str, Any],
+    attachment_id: str,
+    workspace_id: str,
+) -> dict[str, Any]:
+    """
+    Generate the thumbnail and preview of an attachment.
+
+    Args:
+        ctx: arq worker context (unused, but required by arq signature)
+        attachment_id: UUID string of the attachment
+        workspace_id: UUID string of the workspace (for multi-tenant isolation)
+
+    Returns:
+        dict: attachment_id and status ("created", "skipped" or "unrenderable")
+
+    Raises:
+        Exception: Storage/database errors, propagated to arq for retry
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            keys = await create_attachment_previews(
+                db, uuid.UUID(attachment_id), uuid.UUID(workspace_id)
+            )
+
+    except (PreviewRenderError, FileProcessingLimitError) as e:
+        # Retrying cannot help; the gallery falls back to the original
+        logger.warning(
+            "attachment_previews_unrenderable",
+            attachment_id=attachment_id,
+            workspace_id=workspace_id,
+            error=str(e),
+        )
+        return {"attachment_id": attachment_id, "status": "unrenderable"}
+
+    except Exception as e:
+        logger.error(
+            "generate_attachment_previews_failed",
+            attachment_id=attachment_id,
+            workspace_id=workspace_id,
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise
+
+    return {
+        "attachment_id": attachment_id,
+        "status": "skipped" if keys is None else "created",
+    }
+
+
+async def process_attachment_upload(
+    ctx: dict[str, Any],
+    upload_id: str,
+) -> dict[str, Any]:
+    """
+    Promote a direct upload from quarantine to an attachment.
+
+    Rejected files fail the upload (reported to the polling client) and are
+    deleted; infrastructure errors propagate so arq retries.
+
+    Args:
+        ctx: arq worker context (its Redis pool enqueues preview generation)
+        upload_id: Upload ID
+
+    Returns:
+        dict: upload_id, status and attachment_id (if created)
+
+    Raises:
+        Exception: Storage/scanner/database errors, propagated to arq for retry
+    """
+    redis_client = await get_redis()
+    try:
+        async with AsyncSessionLocal() as db:
+            upload = await finalize_attachment_upload(
+                redis_client, db, upload_id, arq_pool=ctx.get("redis")
+            )
+    except Exception as e:
+        logger.error(
+            "process_attachment_upload_failed",
+            upload_id=upload_id,
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise
+
+    if upload is None:
+        logger.warning("attachment_upload_expired", upload_id=upload_id)
+        return {"upload_id": upload_id, "status": "expired"}
+
+    return {
+        "upload_id": upload_id,
+        "status": upload.status.value,
+        "attachment_id": str(upload.attachment_id) if upload.attachment_id else None,
+    }
@@ -0,0 +1,54 @@
+"""
+Background tasks for audit log partition maintenance.
+
+Tasks:
+    - maintain_audit_partitions: Create upcoming monthly audit_events
+      partitions, detach partitions past the hot retention window, and
+      archive detached partitions to object storage
+
+Usage:
+    Scheduled daily and at worker startup (see scheduler.WorkerSettings.cron_jobs).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pazpaz.core.logging import get_logger
+from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.services.audit_partition_service import run_audit_partition_maintenance
+
+logger = get_logger(__name__)
+
+
+async def maintain_audit_partitions(ctx: dict[str, Any]) -> dict[str, int]:
+    """
+    Run audit_events partition maintenance.
+
+    Safe to run repeatedly: partitions are created only if missing, and
+    archives of detached partitions that failed earlier are retried.
+
+    Args:
+        ctx: arq worker context (unused, but required by arq signature)
+
+    Returns:
+        dict: Counts of created, detached, archived and failed partitions
+
+    Raises:
+        Exception: Propagated to arq (next run retries)
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            stats = await run_audit_partition_maintenance(db)
+
+        logger.info("audit_partitions_maintained", **stats)
+        return stats
+
+    except Exception as e:
+        logger.error(
+            "maintain_audit_partitions_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise
@@ -0,0 +1,101 @@
+"""
+Background tasks for session draft autosave.
+
+Tasks:
+    - flush_idle_session_drafts: Write autosaved drafts buffered in Redis to
+      PostgreSQL once the therapist stops typing
+
+Usage:
+    Scheduled by the worker (see scheduler.WorkerSettings.cron_jobs); the
+    autosave endpoint only writes to the Redis buffer:
+
+        draft, flush_due = await SessionDraftBuffer(redis_client).save(
+            session, update_data
+        )
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
+from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.models.session import Session
+from pazpaz.services.draft_buffer_service import (
+    SessionDraftBuffer,
+    apply_buffered_draft,
+)
+
+logger = get_logger(__name__)
+
+# Drafts flushed per run (one short transaction each)
+MAX_DRAFTS_PER_RUN = 200
+
+
+async def flush_idle_session_drafts(ctx: dict[str, Any]) -> dict[str, int]:
+    """
+    Write idle buffered drafts to the database.
+
+    Each draft is read and written in its own transaction, under the
+    session row lock; the buffer is only removed if no newer autosave
+    arrived meanwhile (that save is flushed on a later run). Drafts of
+    sessions that no longer exist or were changed by another write are
+    discarded.
+
+    Args:
+        ctx: arq worker context (unused, but required by arq signature)
+
+    Returns:
+        dict: Counts of flushed and discarded drafts
+
+    Raises:
+        Exception: Propagated to arq (buffers stay in Redis for the next run)
+    """
+    stats = {"flushed": 0, "discarded": 0}
+
+    try:
+        buffer = SessionDraftBuffer(await get_redis())
+        idle = await buffer.get_idle(limit=MAX_DRAFTS_PER_RUN)
+
+        for workspace_id, session_id in idle:
+            async with AsyncSessionLocal() as db:
+                session = await db.get(Session, session_id, with_for_update=True)
+
+                # Read the buffer under the row lock: autosaves lock the row
+                # too, so no save is buffered between this read and commit
+                draft = await buffer.get(session_id)
+                if draft is None:
+                    # Expired or cleared by a request; drop the dirty marker
+                    await buffer.discard(session_id, workspace_id, None)
+                    continue
+
+                if (
+                    session is None
+                    or session.workspace_id != workspace_id
+                    or session.deleted_at is not None
+                    or not apply_buffered_draft(session, draft)
+                ):
+                    # Conditional: a save buffered meanwhile is kept
+                    if await buffer.discard(session_id, workspace_id, draft):
+                        stats["discarded"] += 1
+                    continue
+
+                await db.commit()
+
+            await buffer.clear(draft)
+            stats["flushed"] += 1
+
+        if idle:
+            logger.info("session_drafts_flushed", **stats)
+
+        return stats
+
+    except Exception as e:
+        logger.error(
+            "flush_idle_session_drafts_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise
@@ -0,0 +1,69 @@
+"""
+Background tasks for transactional email delivery.
+
+Tasks:
+    - drain_email_outbox: Send due emails from the email outbox (on demand
+      after a handler queues an email, and every minute as a backstop)
+
+Usage:
+    Handlers queue the email in their transaction and then enqueue the drain:
+
+        await queue_magic_link_email(db, user.id, user.email, token, 600)
+        await db.commit()
+        await notify_email_outbox(arq_pool)
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pazpaz.core.logging import get_logger
+from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.services.email_outbox_service import deliver_pending_emails
+
+logger = get_logger(__name__)
+
+# Batches per run before yielding (bounds a single job's runtime)
+MAX_BATCHES_PER_RUN = 10
+
+
+async def drain_email_outbox(ctx: dict[str, Any]) -> dict[str, Any]:
+    """
+    Deliver pending outbox emails in batches.
+
+    Concurrent runs are safe: rows are claimed with SKIP LOCKED. Failed
+    sends are retried by later runs with backoff, not by arq.
+
+    Args:
+        ctx: arq worker context (unused, but required by arq signature)
+
+    Returns:
+        dict: Totals of sent, retried, failed and expired emails
+
+    Raises:
+        Exception: Propagated to arq (next run retries pending emails)
+    """
+    totals = {"sent": 0, "retried": 0, "failed": 0, "expired": 0}
+
+    try:
+        for _ in range(MAX_BATCHES_PER_RUN):
+            async with AsyncSessionLocal() as db:
+                stats = await deliver_pending_emails(db)
+
+            for key, value in stats.items():
+                totals[key] += value
+
+            # Stop when the outbox has no more due emails
+            if not any(stats.values()):
+                break
+
+        return totals
+
+    except Exception as e:
+        logger.error(
+            "drain_email_outbox_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise
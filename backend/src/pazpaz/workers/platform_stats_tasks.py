@@ -0,0 +1,55 @@
+"""
+Background tasks for platform-wide statistics.
+
+Tasks:
+    - rollup_platform_stats: Recompute platform totals (workspaces, users,
+      invitations, blacklist) and active workspaces into the Redis snapshot
+      read by the platform admin dashboard and /metrics
+
+Usage:
+    Scheduled every minute and at worker startup (see
+    scheduler.WorkerSettings.cron_jobs).
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
+from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.services.platform_stats_service import refresh_platform_stats
+
+logger = get_logger(__name__)
+
+
+async def rollup_platform_stats(ctx: dict[str, Any]) -> dict[str, Any]:
+    """
+    Refresh the platform stats snapshot.
+
+    Args:
+        ctx: arq worker context (unused, but required by arq signature)
+
+    Returns:
+        dict: The stored snapshot
+
+    Raises:
+        Exception: Propagated to arq (the previous snapshot stays until it
+            expires)
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            stats = await refresh_platform_stats(db, await get_redis())
+
+        logger.debug("platform_stats_rolled_up", **asdict(stats))
+        return asdict(stats)
+
+    except Exception as e:
+        logger.error(
+            "rollup_platform_stats_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise
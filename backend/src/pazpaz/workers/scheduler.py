@@ -6,6 +6,11 @@ worker for scheduled notification tasks. The worker handles:
     - Session notes reminders (daily, at user-specified times)
     - Daily appointment digests (morning summaries)
     - Appointment reminders (15min, 30min, 1hr, 2hr, 24hr before appointments)
+    - Email outbox delivery (magic links, invitations queued by API handlers)
+    - Session draft flush (autosaves buffered in Redis written to PostgreSQL)
+    - Long-audio transcription jobs (chunked, concurrent Whisper requests)
+    - Attachment thumbnails and previews (after image/PDF uploads)
+    - Direct (presigned) attachment uploads: validation and promotion
 
 The worker runs scheduled jobs using cron-like syntax and connects to Redis
 for job queue management. All jobs are initially empty and will be implemented
@@ -38,10 +43,14 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from arq import func
 from arq.connections import RedisSettings
 
+from pazpaz.core.config import settings
 from pazpaz.core.logging import get_logger
 from pazpaz.db.base import AsyncSessionLocal
+from pazpaz.monitoring.prometheus import mark_process_dead, start_worker_metrics_server
+from pazpaz.monitoring.tenant_metrics import flush_tenant_usage
 from pazpaz.services.email_service import (
     send_appointment_reminder,
     send_daily_digest,
@@ -63,19 +72,31 @@ from pazpaz.services.reminder_tracking_service import (
     mark_reminder_sent,
     was_reminder_sent,
 )
+from pazpaz.utils.file_processing import shutdown_file_processing_executor
 from pazpaz.workers.ai_tasks import (
     generate_client_embeddings,
     generate_session_embeddings,
+    warm_query_embedding_cache,
 )
+from pazpaz.workers.attachment_tasks import (
+    generate_attachment_previews,
+    process_attachment_upload,
+)
+from pazpaz.workers.audit_tasks import maintain_audit_partitions
+from pazpaz.workers.draft_tasks import flush_idle_session_drafts
+from pazpaz.workers.email_tasks import drain_email_outbox
 from pazpaz.workers.google_calendar_tasks import sync_appointment_to_google_calendar
+from pazpaz.workers.platform_stats_tasks import rollup_platform_stats
 from pazpaz.workers.settings import (
     HEALTH_CHECK_INTERVAL,
     JOB_TIMEOUT,
     MAX_JOBS,
     MAX_TRIES,
     QUEUE_NAME,
+    TRANSCRIPTION_JOB_TIMEOUT,
     get_redis_settings,
 )
+from pazpaz.workers.transcription_tasks import transcribe_audio_job
 
 if TYPE_CHECKING:
     from arq.cron import CronJob
@@ -695,6 +716,9 @@ async def startup(ctx: dict) -> None:
         )
         raise
 
+    # Metrics: shared PROMETHEUS_MULTIPROC_DIR and/or a dedicated port
+    start_worker_metrics_server(settings.worker_metrics_port)
+
     logger.info("arq_worker_startup_complete")
 
 
@@ -724,6 +748,10 @@ async def shutdown(ctx: dict) -> None:
             exc_info=True,
         )
 
+    await flush_tenant_usage()
+    shutdown_file_processing_executor()
+    mark_process_dead()
+
     logger.info("arq_worker_shutdown_complete")
 
 
@@ -793,6 +821,15 @@ class WorkerSettings:
         sync_appointment_to_google_calendar,
         generate_session_embeddings,
         generate_client_embeddings,
+        drain_email_outbox,
+        generate_attachment_previews,
+        process_attachment_upload,
+        # Long recordings; audio is consumed on start, so never retried
+        func(
+            transcribe_audio_job,
+            timeout=TRANSCRIPTION_JOB_TIMEOUT,
+            max_tries=1,
+        ),
     ]
 
     # Scheduled Tasks (Cron Jobs)
@@ -944,6 +981,40 @@ class WorkerSettings:
             minute={0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55},
             run_at_startup=False,
         ),
+        # Query embedding cache warm-up - every 30 minutes and at startup
+        # Refreshes common query embeddings before the 1 hour cache TTL expires
+        cron(
+            warm_query_embedding_cache,
+            minute={0, 30},
+            run_at_startup=True,
+        ),
+        # Email outbox backstop - every minute (unspecified minute) and at startup
+        # Handlers also enqueue drain_email_outbox right after queuing an email
+        cron(
+            drain_email_outbox,
+            run_at_startup=True,
+        ),
+        # Idle session draft flush - every 15 seconds and at startup
+        # Autosaves are buffered in Redis; drafts idle for 10s are written
+        cron(
+            flush_idle_session_drafts,
+            second={0, 15, 30, 45},
+            run_at_startup=True,
+        ),
+        # Audit log partitions - daily at 03:17 UTC and at startup
+        # Creates upcoming monthly partitions; archives and drops aged ones
+        cron(
+            maintain_audit_partitions,
+            hour={3},
+            minute={17},
+            run_at_startup=True,
+        ),
+        # Platform stats snapshot - every minute and at startup
+        # Read by the platform admin dashboard and /metrics (no COUNTs on scrape)
+        cron(
+            rollup_platform_stats,
+            run_at_startup=True,
+        ),
     ]
 
     # Lifecycle Hooks
@@ -33,6 +33,9 @@ MAX_TRIES = 3
 RETRY_DELAY = 60
 """Base delay (seconds) between retry attempts (uses exponential backoff)."""
 
+TRANSCRIPTION_JOB_TIMEOUT = 30 * 60
+"""Maximum time (seconds) for one long-audio transcription job."""
+
 
 def get_redis_settings() -> dict:
     """
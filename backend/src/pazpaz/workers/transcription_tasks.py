@@ -0,0 +1,71 @@
+"""
+Background tasks for long-audio transcription.
+
+Tasks:
+    - transcribe_audio_job: Split an uploaded recording at pauses, transcribe
+      the segments concurrently, stitch (and optionally clean up) the text,
+      and publish progress to the job's event stream
+
+Usage:
+    Enqueued by POST /api/v1/transcribe/jobs after the upload is stored:
+
+        await arq_pool.enqueue_job("transcribe_audio_job", job_id=job_id)
+
+    Not retried: the staged audio is deleted when the job starts, and the
+    client sees the failure on the job's event stream instead.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pazpaz.ai.providers import get_transcription_provider
+from pazpaz.core.config import settings
+from pazpaz.core.logging import get_logger
+from pazpaz.core.redis import get_redis
+from pazpaz.core.storage import get_s3_client
+from pazpaz.services.transcription_job_service import run_transcription_job
+
+logger = get_logger(__name__)
+
+
+async def transcribe_audio_job(ctx: dict[str, Any], job_id: str) -> dict[str, Any]:
+    """
+    Transcribe a queued recording.
+
+    Args:
+        ctx: arq worker context (unused, but required by arq signature)
+        job_id: Transcription job ID
+
+    Returns:
+        dict: job_id, status and segment count (no transcript text)
+
+    Raises:
+        Exception: Propagated to arq after the job is marked failed
+    """
+    try:
+        job = await run_transcription_job(
+            await get_redis(),
+            get_s3_client(),
+            job_id,
+            get_transcription_provider(),
+            max_concurrency=settings.transcription_max_concurrency,
+        )
+
+        if job is None:
+            return {"job_id": job_id, "status": "missing"}
+        return {
+            "job_id": job_id,
+            "status": job.status.value,
+            "segments": job.total_segments,
+        }
+
+    except Exception as e:
+        logger.error(
+            "transcribe_audio_job_failed",
+            job_id=job_id,
+            error=str(e),
+            error_type=type(e).__name__,
+            exc_info=True,
+        )
+        raise
@@ -338,6 +338,9 @@ async def test_db_engine():
         # Install citext extension for case-insensitive email comparisons
         await conn.execute(text("CREATE EXTENSION IF NOT EXISTS citext;"))
 
+        # Install btree_gist for the appointment time-range GiST index
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist;"))
+
         # Create encryption functions (used in performance tests)
         await conn.execute(
             text("""
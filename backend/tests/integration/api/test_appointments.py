@@ -1115,6 +1115,260 @@ class TestConflictCheck:
         assert data["has_conflict"] is True
 
 
+class TestBatchConflictCheck:
+    """Test POST /appointments/conflicts (many proposed intervals at once)."""
+
+    async def test_batch_conflict_check_reports_per_interval(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+        test_user_ws1: User,
+        sample_appointment_ws1: Appointment,
+        redis_client,
+    ):
+        """Each interval reports its own conflicts; back-to-back is allowed."""
+        csrf_token = await add_csrf_to_client(
+            client, workspace_1.id, test_user_ws1.id, redis_client
+        )
+        headers = get_auth_headers(workspace_1.id, csrf_cookie=csrf_token)
+        headers["X-CSRF-Token"] = csrf_token
+
+        start = sample_appointment_ws1.scheduled_start
+        end = sample_appointment_ws1.scheduled_end
+        duration = end - start
+
+        response = await client.post(
+            "/api/v1/appointments/conflicts",
+            headers=headers,
+            json={
+                "intervals": [
+                    # Overlaps the existing appointment
+                    {
+                        "scheduled_start": (start + timedelta(minutes=30)).isoformat(),
+                        "scheduled_end": (end + timedelta(minutes=30)).isoformat(),
+                    },
+                    # Back-to-back with the existing appointment
+                    {
+                        "scheduled_start": end.isoformat(),
+                        "scheduled_end": (end + duration).isoformat(),
+                    },
+                    # Same slot one week later (free)
+                    {
+                        "scheduled_start": (start + timedelta(days=7)).isoformat(),
+                        "scheduled_end": (end + timedelta(days=7)).isoformat(),
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["has_conflict"] is True
+        results = data["results"]
+        assert [result["index"] for result in results] == [0, 1, 2]
+        assert results[0]["has_conflict"] is True
+        assert results[0]["conflicting_appointments"][0]["id"] == str(
+            sample_appointment_ws1.id
+        )
+        assert results[0]["conflicting_appointments"][0]["client_initials"]
+        # Intervals 0 and 1 overlap each other within the request
+        assert results[1]["conflicting_appointments"] == []
+        assert results[1]["overlapping_intervals"] == [0]
+        assert results[2]["has_conflict"] is False
+
+    async def test_batch_conflict_check_excludes_moved_appointments(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+        test_user_ws1: User,
+        sample_appointment_ws1: Appointment,
+        redis_client,
+    ):
+        """Appointments being rescheduled do not conflict with themselves."""
+        csrf_token = await add_csrf_to_client(
+            client, workspace_1.id, test_user_ws1.id, redis_client
+        )
+        headers = get_auth_headers(workspace_1.id, csrf_cookie=csrf_token)
+        headers["X-CSRF-Token"] = csrf_token
+
+        response = await client.post(
+            "/api/v1/appointments/conflicts",
+            headers=headers,
+            json={
+                "intervals": [
+                    {
+                        "scheduled_start": (
+                            sample_appointment_ws1.scheduled_start
+                            + timedelta(minutes=15)
+                        ).isoformat(),
+                        "scheduled_end": (
+                            sample_appointment_ws1.scheduled_end + timedelta(minutes=15)
+                        ).isoformat(),
+                    }
+                ],
+                "exclude_appointment_ids": [str(sample_appointment_ws1.id)],
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["has_conflict"] is False
+
+    async def test_batch_conflict_check_validates_intervals(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+        test_user_ws1: User,
+        redis_client,
+    ):
+        """Invalid intervals and empty batches are rejected."""
+        csrf_token = await add_csrf_to_client(
+            client, workspace_1.id, test_user_ws1.id, redis_client
+        )
+        headers = get_auth_headers(workspace_1.id, csrf_cookie=csrf_token)
+        headers["X-CSRF-Token"] = csrf_token
+        start = datetime.now(UTC) + timedelta(days=1)
+
+        response = await client.post(
+            "/api/v1/appointments/conflicts",
+            headers=headers,
+            json={
+                "intervals": [
+                    {
+                        "scheduled_start": start.isoformat(),
+                        "scheduled_end": start.isoformat(),
+                    }
+                ]
+            },
+        )
+        assert response.status_code == 422
+
+        response = await client.post(
+            "/api/v1/appointments/conflicts",
+            headers=headers,
+            json={"intervals": []},
+        )
+        assert response.status_code == 422
+
+
+class TestAvailability:
+    """Test GET /appointments/availability (free/busy)."""
+
+    async def test_availability_merges_busy_and_returns_slots(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+        sample_client_ws1: Client,
+        test_user_ws1: User,
+        redis_client,
+    ):
+        """Busy intervals are merged; free gaps and open slots are returned."""
+        csrf_token = await add_csrf_to_client(
+            client, workspace_1.id, test_user_ws1.id, redis_client
+        )
+        headers = get_auth_headers(workspace_1.id, csrf_cookie=csrf_token)
+        headers["X-CSRF-Token"] = csrf_token
+        day = datetime.now(UTC).replace(
+            hour=8, minute=0, second=0, microsecond=0
+        ) + timedelta(days=1)
+
+        # 09:00-10:00 and back-to-back 10:00-11:00 (merged), 13:00-14:00
+        for start_hour, end_hour in [(9, 10), (10, 11), (13, 14)]:
+            response = await client.post(
+                "/api/v1/appointments",
+                headers=headers,
+                json={
+                    "client_id": str(sample_client_ws1.id),
+                    "scheduled_start": day.replace(hour=start_hour).isoformat(),
+                    "scheduled_end": day.replace(hour=end_hour).isoformat(),
+                    "location_type": "clinic",
+                },
+            )
+            assert response.status_code == 201
+
+        response = await client.get(
+            "/api/v1/appointments/availability",
+            headers=headers,
+            params={
+                "start_date": day.isoformat(),
+                "end_date": day.replace(hour=16).isoformat(),
+                "slot_minutes": 60,
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+
+        def hours(intervals):
+            return [
+                (
+                    datetime.fromisoformat(interval["start"]).hour,
+                    datetime.fromisoformat(interval["end"]).hour,
+                )
+                for interval in intervals
+            ]
+
+        assert hours(data["busy"]) == [(9, 11), (13, 14)]
+        assert hours(data["free"]) == [(8, 9), (11, 13), (14, 16)]
+        assert hours(data["slots"]) == [(8, 9), (11, 12), (12, 13), (14, 15), (15, 16)]
+        assert data["slots_truncated"] is False
+
+    async def test_availability_treats_naive_dates_as_utc(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+        sample_appointment_ws1: Appointment,
+    ):
+        """Window bounds without an offset are UTC (not a 500)."""
+        start = sample_appointment_ws1.scheduled_start.astimezone(UTC)
+
+        response = await client.get(
+            "/api/v1/appointments/availability",
+            headers=get_auth_headers(workspace_1.id),
+            params={
+                "start_date": (start - timedelta(hours=1))
+                .replace(tzinfo=None)
+                .isoformat(),
+                "end_date": (start + timedelta(hours=3))
+                .replace(tzinfo=None)
+                .isoformat(),
+            },
+        )
+
+        assert response.status_code == 200
+        busy = response.json()["busy"]
+        assert len(busy) == 1
+        assert datetime.fromisoformat(busy[0]["start"]) == start
+
+    async def test_availability_validates_window(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+    ):
+        """Empty or overly long windows are rejected."""
+        headers = get_auth_headers(workspace_1.id)
+        start = datetime.now(UTC)
+
+        response = await client.get(
+            "/api/v1/appointments/availability",
+            headers=headers,
+            params={
+                "start_date": start.isoformat(),
+                "end_date": start.isoformat(),
+            },
+        )
+        assert response.status_code == 422
+
+        response = await client.get(
+            "/api/v1/appointments/availability",
+            headers=headers,
+            params={
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(days=90)).isoformat(),
+            },
+        )
+        assert response.status_code == 422
+
+
 class TestAppointmentStatusTransitions:
     """Test appointment status transition validation."""
 
@@ -0,0 +1,100 @@
+"""Test audit event listing API endpoint."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.models.audit_event import AuditAction, AuditEvent, ResourceType
+from pazpaz.models.user import User
+from pazpaz.models.workspace import Workspace
+from tests.conftest import get_auth_headers
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def client_events(
+    db_session: AsyncSession, workspace_1: Workspace, test_user_ws1: User
+) -> uuid.UUID:
+    """Create a recent and a 400-day-old read of the same client."""
+    resource_id = uuid.uuid4()
+    for age in (timedelta(days=1), timedelta(days=400)):
+        db_session.add(
+            AuditEvent(
+                workspace_id=workspace_1.id,
+                user_id=test_user_ws1.id,
+                event_type="client.read",
+                action=AuditAction.READ,
+                resource_type=ResourceType.CLIENT,
+                resource_id=resource_id,
+                created_at=datetime.now(UTC) - age,
+            )
+        )
+    await db_session.commit()
+    return resource_id
+
+
+class TestListAuditEventsWindow:
+    """Test the time window of GET /api/v1/audit-events."""
+
+    async def test_lists_all_events_without_window(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+        test_user_ws1: User,
+        client_events: uuid.UUID,
+    ):
+        """Without start_date or recent_days, older events are still listed."""
+        response = await client.get(
+            "/api/v1/audit-events",
+            params={"resource_id": str(client_events)},
+            headers=get_auth_headers(workspace_1.id),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
+    async def test_recent_days_limits_window(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+        test_user_ws1: User,
+        client_events: uuid.UUID,
+    ):
+        """recent_days lists only events from the last N days."""
+        response = await client.get(
+            "/api/v1/audit-events",
+            params={"resource_id": str(client_events), "recent_days": 90},
+            headers=get_auth_headers(workspace_1.id),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
+    async def test_start_date_takes_precedence(
+        self,
+        client: AsyncClient,
+        workspace_1: Workspace,
+        test_user_ws1: User,
+        client_events: uuid.UUID,
+    ):
+        """An explicit start_date overrides recent_days."""
+        start_date = datetime.now(UTC) - timedelta(days=500)
+
+        response = await client.get(
+            "/api/v1/audit-events",
+            params={
+                "resource_id": str(client_events),
+                "recent_days": 90,
+                "start_date": start_date.isoformat(),
+            },
+            headers=get_auth_headers(workspace_1.id),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
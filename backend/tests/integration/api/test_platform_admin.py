@@ -756,6 +756,36 @@ class TestListWorkspaces:
         owner_emails = [w["owner_email"] for w in data["workspaces"]]
         assert regular_user.email in owner_emails
 
+    async def test_list_workspaces_paginates(
+        self,
+        client: AsyncClient,
+        platform_admin_user: User,
+        workspace_1: Workspace,
+        test_workspace_2: Workspace,
+    ):
+        """Workspaces are returned one page at a time with a total count."""
+        headers = get_auth_headers(
+            workspace_id=platform_admin_user.workspace_id,
+            user_id=platform_admin_user.id,
+            email=platform_admin_user.email,
+        )
+
+        first = await client.get(
+            "/api/v1/platform-admin/workspaces?page=1&page_size=1", headers=headers
+        )
+        second = await client.get(
+            "/api/v1/platform-admin/workspaces?page=2&page_size=1", headers=headers
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        first_data = first.json()
+        assert len(first_data["workspaces"]) == 1
+        assert first_data["total"] >= 2
+        assert first_data["total_pages"] == first_data["total"]
+        assert "storage_used_bytes" in first_data["workspaces"][0]
+        assert first_data["workspaces"][0]["id"] != second.json()["workspaces"][0]["id"]
+
 
 class TestSuspendWorkspace:
     """Test POST /platform-admin/workspaces/{id}/suspend."""
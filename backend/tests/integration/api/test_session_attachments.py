@@ -4,6 +4,7 @@ This test suite covers all CRUD operations for file attachments:
 - POST /api/v1/sessions/{session_id}/attachments (upload with rate limiting)
 - GET /api/v1/sessions/{session_id}/attachments (list)
 - GET /api/v1/sessions/{session_id}/attachments/{id}/download (presigned URL)
+- GET /api/v1/sessions/{session_id}/attachments/download-urls (batch URLs)
 - DELETE /api/v1/sessions/{session_id}/attachments/{id} (soft delete)
 
 Test Coverage:
@@ -1140,6 +1141,56 @@ class TestDownloadAttachment:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestBatchDownloadUrls:
+    """Tests for GET /api/v1/sessions/{session_id}/attachments/download-urls."""
+
+    async def test_batch_returns_url_per_attachment(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_session,
+        mock_s3_client,
+    ):
+        """Test one request returns URLs for all non-deleted attachments."""
+        for i in range(3):
+            db_session.add(
+                SessionAttachment(
+                    session_id=test_session.id,
+                    client_id=test_session.client_id,
+                    workspace_id=test_session.workspace_id,
+                    file_name=f"photo{i}.jpg",
+                    file_type="image/jpeg",
+                    file_size_bytes=1024,
+                    s3_key=f"workspaces/{test_session.workspace_id}/sessions/{test_session.id}/attachments/{uuid.uuid4()}.jpg",
+                    uploaded_by_user_id=test_session.created_by_user_id,
+                    deleted_at=datetime.now(UTC) if i == 2 else None,
+                )
+            )
+        await db_session.commit()
+
+        response = await authenticated_client.get(
+            f"/api/v1/sessions/{test_session.id}/attachments/download-urls"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["expires_in_seconds"] == 900
+        assert len(data["items"]) == 2
+        assert all(item["download_url"] for item in data["items"])
+
+    async def test_batch_requires_workspace_access(
+        self,
+        authenticated_client: AsyncClient,
+        test_session2,  # Session in workspace 2
+    ):
+        """Test cannot get URLs for a session in a different workspace."""
+        response = await authenticated_client.get(
+            f"/api/v1/sessions/{test_session2.id}/attachments/download-urls"
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestDeleteAttachment:
     """Tests for DELETE /api/v1/sessions/{session_id}/attachments/{id} endpoint."""
 
@@ -1373,6 +1373,43 @@ class TestSaveDraft:
         # CSRF middleware runs before auth for PATCH
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    async def test_save_draft_buffered_until_next_write(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_session,
+    ):
+        """Test autosave is buffered, visible on read, and written on finalize."""
+        original_version = test_session.version
+        payload = {"subjective": "Buffered autosave"}
+
+        response = await authenticated_client.patch(
+            f"/api/v1/sessions/{test_session.id}/draft",
+            json=payload,
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        # Database row is not written by the autosave itself
+        await db_session.refresh(test_session)
+        assert test_session.version == original_version
+
+        # Reads see the buffered draft
+        response = await authenticated_client.get(f"/api/v1/sessions/{test_session.id}")
+        data = response.json()
+        assert data["subjective"] == payload["subjective"]
+        assert data["version"] == original_version + 1
+
+        # Finalize writes the buffered draft first
+        response = await authenticated_client.post(
+            f"/api/v1/sessions/{test_session.id}/finalize",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["subjective"] == payload["subjective"]
+
+        await db_session.refresh(test_session)
+        assert test_session.subjective == payload["subjective"]
+        assert test_session.version == original_version + 2
+
 
 class TestFinalizeSession:
     """Tests for POST /api/v1/sessions/{id}/finalize endpoint."""
@@ -1840,6 +1877,72 @@ class TestUnfinalizeSession:
         assert test_session.amended_at is None
 
 
+class TestSessionVersionHistory:
+    """Tests for delta-compressed version history endpoints."""
+
+    async def test_versions_reconstructed_from_deltas(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_session,
+    ):
+        """Test amendments are stored as deltas and reconstructed on read."""
+        from pazpaz.models.session_version import SessionVersion
+
+        original_subjective = test_session.subjective
+
+        response = await authenticated_client.post(
+            f"/api/v1/sessions/{test_session.id}/finalize",
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        for text in ("First amendment", "Second amendment"):
+            response = await authenticated_client.put(
+                f"/api/v1/sessions/{test_session.id}",
+                json={"subjective": text},
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        # Version 1 is a full checkpoint, later versions are diffs
+        result = await db_session.execute(
+            select(SessionVersion)
+            .where(SessionVersion.session_id == test_session.id)
+            .order_by(SessionVersion.version_number)
+        )
+        versions = result.scalars().all()
+        assert [v.is_checkpoint for v in versions] == [True, False, False]
+        assert versions[2].subjective is None
+
+        # History is materialized newest first
+        response = await authenticated_client.get(
+            f"/api/v1/sessions/{test_session.id}/versions"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [v["version_number"] for v in data] == [3, 2, 1]
+        assert data[0]["subjective"] == "First amendment"
+        assert data[1]["subjective"] == original_subjective
+        assert data[0]["plan"] == test_session.plan
+
+        # Limit returns only the most recent versions
+        response = await authenticated_client.get(
+            f"/api/v1/sessions/{test_session.id}/versions?limit=1"
+        )
+        assert [v["version_number"] for v in response.json()] == [3]
+
+        # Single version reconstruction
+        response = await authenticated_client.get(
+            f"/api/v1/sessions/{test_session.id}/versions/3"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["subjective"] == "First amendment"
+
+        response = await authenticated_client.get(
+            f"/api/v1/sessions/{test_session.id}/versions/4"
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestDeleteFinalizedSession:
     """Tests for deletion of finalized sessions (allowed for therapist flexibility)."""
 
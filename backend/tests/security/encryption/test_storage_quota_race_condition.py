@@ -441,7 +441,9 @@ class TestUploadEndpointIntegration:
         initial_usage = test_workspace.storage_used_bytes
 
         # Mock S3 upload to succeed
-        with patch("pazpaz.api.session_attachments.upload_file_to_s3") as mock_upload:
+        with patch(
+            "pazpaz.services.attachment_storage_service.upload_file_to_s3"
+        ) as mock_upload:
             mock_upload.return_value = {"bucket": "test-bucket", "key": "test-key"}
 
             # Upload file
@@ -476,7 +478,9 @@ class TestUploadEndpointIntegration:
         initial_usage = test_workspace.storage_used_bytes
 
         # Mock S3 upload to fail
-        with patch("pazpaz.api.session_attachments.upload_file_to_s3") as mock_upload:
+        with patch(
+            "pazpaz.services.attachment_storage_service.upload_file_to_s3"
+        ) as mock_upload:
             mock_upload.side_effect = RuntimeError("S3 upload failed")
 
             # Attempt upload
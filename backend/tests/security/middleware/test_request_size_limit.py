@@ -168,6 +168,50 @@ class TestRequestSizeLimitMiddleware:
 class TestFileUploadWithSizeLimit:
     """Test that file uploads work correctly with size limits."""
 
+    @pytest.mark.asyncio
+    async def test_25mb_transcription_recording_not_rejected(
+        self, client_with_csrf: AsyncClient
+    ):
+        """Test that full-session recordings use the transcription upload limit."""
+        response = await client_with_csrf.post(
+            "/api/v1/transcribe/jobs",
+            files={"audio": ("session.webm", b"\x00" * (25 * 1024 * 1024))},
+            data={"field_name": "subjective"},
+        )
+
+        # Not rejected for size (may fail for other reasons, but not 413)
+        assert response.status_code != status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    @pytest.mark.asyncio
+    async def test_transcription_recording_over_its_limit_rejected(
+        self, client_with_csrf: AsyncClient
+    ):
+        """Test that the transcription route still has a Content-Length limit."""
+        response = await client_with_csrf.post(
+            "/api/v1/transcribe/jobs",
+            content=b"",
+            headers={
+                "Content-Type": "multipart/form-data; boundary=x",
+                "Content-Length": str(202 * 1024 * 1024),
+            },
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert "201 MB" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_25mb_request_to_other_routes_rejected(
+        self, client_with_csrf: AsyncClient
+    ):
+        """Test that the raised limit applies to the transcription route only."""
+        response = await client_with_csrf.post(
+            "/api/v1/transcribe",
+            files={"audio": ("note.webm", b"\x00" * (25 * 1024 * 1024))},
+            data={"field_name": "subjective"},
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
     @pytest.mark.asyncio
     async def test_10mb_file_upload_works(
         self,
@@ -0,0 +1,107 @@
+"""Load benchmark for tag-based AI cache invalidation.
+
+Seeds Redis with 1M tagged AI cache keys (spread across many workspaces and
+clients) and verifies that invalidating one client's queries stays fast,
+independent of total cache size. A SCAN-based invalidation over the same
+keyspace is timed once for comparison.
+
+Run with: pytest -m performance tests/test_ai_cache_performance.py -v -s
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+import uuid
+
+import pytest
+
+from pazpaz.services.cache_service import (
+    AICacheService,
+    get_client_tag_key,
+    get_workspace_tag_key,
+)
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.performance]
+
+TOTAL_CACHED_KEYS = 1_000_000
+WORKSPACES = 1_000
+CLIENTS_PER_WORKSPACE = 50
+SEED_BATCH_SIZE = 10_000
+KEYS_PER_TARGET_CLIENT = 10
+NUM_ITERATIONS = 50
+
+# Tag invalidation must not depend on keyspace size
+INVALIDATION_P95_TARGET_MS = 10
+
+
+async def seed_tagged_keys(redis_client, total: int) -> None:
+    """
+    Seed Redis with tagged AI query cache keys.
+
+    Args:
+        redis_client: Redis client
+        total: Number of cache keys to create
+    """
+    workspace_ids = [uuid.uuid4() for _ in range(WORKSPACES)]
+    client_ids = [uuid.uuid4() for _ in range(CLIENTS_PER_WORKSPACE)]
+
+    for batch_start in range(0, total, SEED_BATCH_SIZE):
+        pipe = redis_client.pipeline(transaction=False)
+        for i in range(batch_start, min(batch_start + SEED_BATCH_SIZE, total)):
+            workspace_id = workspace_ids[i % WORKSPACES]
+            client_id = client_ids[(i // WORKSPACES) % CLIENTS_PER_WORKSPACE]
+            key = f"ai:query:{workspace_id}:{i:016x}:{client_id}"
+            pipe.set(key, '{"answer": "cached"}', ex=600)
+            pipe.sadd(get_workspace_tag_key(workspace_id), key)
+            pipe.sadd(get_client_tag_key(workspace_id, client_id), key)
+        await pipe.execute()
+
+
+async def test_client_invalidation_with_1m_cached_keys(redis_client):
+    """Benchmark invalidate_client_queries with 1M keys in Redis."""
+    await seed_tagged_keys(redis_client, TOTAL_CACHED_KEYS)
+    assert await redis_client.dbsize() >= TOTAL_CACHED_KEYS
+
+    cache_service = AICacheService(redis_client)
+    workspace_id = uuid.uuid4()
+    client_id = uuid.uuid4()
+
+    timings_ms = []
+    for iteration in range(NUM_ITERATIONS):
+        keys = [
+            f"ai:query:{workspace_id}:{iteration:08x}{n:08x}:{client_id}"
+            for n in range(KEYS_PER_TARGET_CLIENT)
+        ]
+        await cache_service.tag_keys(workspace_id, client_id, keys, 300)
+        for key in keys:
+            await redis_client.set(key, '{"answer": "cached"}', ex=300)
+
+        start = time.perf_counter()
+        deleted = await cache_service.invalidate_client_queries(
+            workspace_id=workspace_id, client_id=client_id
+        )
+        timings_ms.append((time.perf_counter() - start) * 1000)
+
+        assert deleted == KEYS_PER_TARGET_CLIENT
+
+    p95 = statistics.quantiles(timings_ms, n=20)[-1]
+
+    # Reference: pattern SCAN over the whole keyspace (what tags replace)
+    scan_start = time.perf_counter()
+    cursor = 0
+    while True:
+        cursor, _ = await redis_client.scan(
+            cursor, match=f"ai:query:{workspace_id}:*:{client_id}", count=100
+        )
+        if cursor == 0:
+            break
+    scan_ms = (time.perf_counter() - scan_start) * 1000
+
+    print(
+        f"\nTag invalidation ({TOTAL_CACHED_KEYS:,} keys): "
+        f"mean={statistics.mean(timings_ms):.2f}ms p95={p95:.2f}ms"
+        f"\nSCAN invalidation (reference): {scan_ms:.0f}ms"
+    )
+
+    assert p95 < INVALIDATION_P95_TARGET_MS
@@ -0,0 +1,188 @@
+"""Unit tests for streaming responses in ClinicalAgent."""
+
+import json
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.ai.agent import (
+    ClinicalAgent,
+    StreamingOutputFilter,
+    get_query_cache_key,
+)
+from pazpaz.ai.retrieval import SessionContext
+
+
+def _content_delta(text: str) -> SimpleNamespace:
+    """Build a Cohere v2 content-delta stream event."""
+    return SimpleNamespace(
+        type="content-delta",
+        delta=SimpleNamespace(
+            message=SimpleNamespace(content=SimpleNamespace(text=text))
+        ),
+    )
+
+
+def _mock_chat_stream(chunks: list[str]):
+    """Build a chat_stream replacement yielding the given text chunks."""
+
+    async def chat_stream(**kwargs):
+        for chunk in chunks:
+            yield _content_delta(chunk)
+        yield SimpleNamespace(type="message-end", delta=SimpleNamespace(usage=None))
+
+    return MagicMock(side_effect=chat_stream)
+
+
+class TestStreamingOutputFilter:
+    """Test incremental output filtering."""
+
+    def test_matches_buffered_filter_output(self):
+        """Test that streamed output equals _filter_output on the full text."""
+        text = "The patient reported pain. Contact: 050-1234567 or a@b.com today"
+        chunks = [
+            "The pat",
+            "ient reported pa",
+            "in. Contact: 050-12",
+            "34567 or a@",
+            "b.com today",
+        ]
+
+        output_filter = StreamingOutputFilter(max_tokens=500)
+        emitted = "".join(output_filter.feed(chunk) for chunk in chunks)
+        emitted += output_filter.flush()
+
+        agent = ClinicalAgent.__new__(ClinicalAgent)
+        assert emitted == agent._filter_output(text, max_tokens=500)
+        assert "[PHONE]" in emitted
+        assert "[EMAIL]" in emitted
+        assert output_filter.text == emitted
+
+    def test_holds_back_partial_words(self):
+        """Test that no text is emitted until a word boundary is reached."""
+        output_filter = StreamingOutputFilter()
+
+        assert output_filter.feed("Hel") == ""
+        assert output_filter.feed("lo") == ""
+        assert output_filter.feed(" wor") == "Hello"
+        assert output_filter.flush() == " wor"
+
+    def test_truncates_at_word_limit(self):
+        """Test that output stops with '...' once max_tokens is reached."""
+        output_filter = StreamingOutputFilter(max_tokens=3)
+
+        output_filter.feed("one two three four five ")
+        output_filter.feed("six seven")
+        output_filter.flush()
+
+        assert output_filter.truncated is True
+        assert output_filter.text == "one two three..."
+
+
+@pytest.mark.asyncio
+class TestClinicalAgentQueryStream:
+    """Test suite for ClinicalAgent.query_stream()."""
+
+    @pytest.fixture
+    def session_context(self):
+        """A single retrieved session context."""
+        return SessionContext(
+            session_id=uuid.uuid4(),
+            client_id=uuid.uuid4(),
+            client_name="John Doe",
+            session_date=datetime(2025, 1, 1, 10, 0, tzinfo=UTC),
+            subjective="Lower back pain",
+            objective=None,
+            assessment=None,
+            plan=None,
+            similarity_score=0.8,
+            weighted_score=0.5,
+            matched_field="subjective",
+        )
+
+    @pytest.fixture
+    def agent(self, redis_client, session_context):
+        """ClinicalAgent with mocked retrieval and Redis L1 cache."""
+        agent = ClinicalAgent(
+            db=MagicMock(spec=AsyncSession),
+            cohere_api_key="test-api-key",
+            redis=redis_client,
+        )
+        agent.retrieval_service = MagicMock()
+        agent.retrieval_service.retrieve_relevant_sessions = AsyncMock(
+            return_value=([session_context], [])
+        )
+        agent.cohere_client = MagicMock()
+        agent.cohere_client.chat_stream = _mock_chat_stream(
+            ["Based on ", "session notes, ", "pain improved."]
+        )
+        return agent
+
+    async def test_stream_emits_citations_before_tokens(self, agent, session_context):
+        """Test event order: citations, tokens, done."""
+        events = [
+            event
+            async for event in agent.query_stream(
+                workspace_id=uuid.uuid4(),
+                query="How is the lower back?",
+            )
+        ]
+
+        assert events[0].event == "citations"
+        assert events[0].data["citations"][0].session_id == session_context.session_id
+        assert events[-1].event == "done"
+        assert events[-1].data["cached"] is False
+
+        answer = "".join(e.data["text"] for e in events if e.event == "token")
+        assert answer == "Based on session notes, pain improved."
+
+    async def test_completed_stream_populates_l1_cache(self, agent, redis_client):
+        """Test that a finished stream is cached and replayed on the next call."""
+        workspace_id = uuid.uuid4()
+        query = "How is the lower back?"
+
+        _ = [
+            e async for e in agent.query_stream(workspace_id=workspace_id, query=query)
+        ]
+
+        cached = await redis_client.get(get_query_cache_key(workspace_id, query, None))
+        assert json.loads(cached)["answer"] == "Based on session notes, pain improved."
+
+        # Second call is served from cache without calling the LLM
+        agent.cohere_client.chat_stream.reset_mock()
+        events = [
+            e async for e in agent.query_stream(workspace_id=workspace_id, query=query)
+        ]
+
+        agent.cohere_client.chat_stream.assert_not_called()
+        assert events[-1].data["cached"] is True
+        assert [e.data["text"] for e in events if e.event == "token"] == [
+            "Based on session notes, pain improved."
+        ]
+
+    async def test_stream_failure_emits_error_and_skips_cache(
+        self, agent, redis_client
+    ):
+        """Test that an LLM failure yields an error event and nothing is cached."""
+
+        async def failing_stream(**kwargs):
+            yield _content_delta("Partial ")
+            raise RuntimeError("connection reset")
+
+        agent.cohere_client.chat_stream = MagicMock(side_effect=failing_stream)
+        workspace_id = uuid.uuid4()
+        query = "How is the lower back?"
+
+        events = [
+            e async for e in agent.query_stream(workspace_id=workspace_id, query=query)
+        ]
+
+        assert events[-1].event == "error"
+        assert (
+            await redis_client.get(get_query_cache_key(workspace_id, query, None))
+            is None
+        )
@@ -0,0 +1,109 @@
+"""Unit tests for client-scoped vector search in retrieve_client_history."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.ai.retrieval import RetrievalService
+from pazpaz.ai.vector_store import VectorStore
+
+
+def _compiled_sql(db: MagicMock) -> str:
+    """Render the statement passed to db.execute() as PostgreSQL SQL."""
+    statement = db.execute.await_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def db():
+    """AsyncSession mock returning no rows."""
+    session = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.all.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+@pytest.mark.asyncio
+class TestVectorStoreClientPredicate:
+    """Test that the client predicate is part of the SQL query."""
+
+    async def test_search_similar_filters_client_in_sql(self, db):
+        """Test that search_similar adds a client_id predicate."""
+        await VectorStore(db).search_similar(
+            workspace_id=uuid.uuid4(),
+            query_embedding=[0.1] * 1536,
+            client_id=uuid.uuid4(),
+        )
+
+        assert "session_vectors.client_id =" in _compiled_sql(db)
+
+    async def test_search_similar_without_client_is_workspace_wide(self, db):
+        """Test that omitting client_id keeps the workspace-wide search."""
+        await VectorStore(db).search_similar(
+            workspace_id=uuid.uuid4(),
+            query_embedding=[0.1] * 1536,
+        )
+
+        sql = _compiled_sql(db)
+        assert "session_vectors.workspace_id =" in sql
+        assert "session_vectors.client_id =" not in sql
+
+    async def test_search_similar_clients_filters_client_in_sql(self, db):
+        """Test that search_similar_clients adds a client_id predicate."""
+        await VectorStore(db).search_similar_clients(
+            workspace_id=uuid.uuid4(),
+            query_embedding=[0.1] * 1536,
+            client_id=uuid.uuid4(),
+        )
+
+        assert "client_vectors.client_id =" in _compiled_sql(db)
+
+    async def test_search_lexical_filters_client_in_sql(self, db):
+        """Test that search_lexical adds a client_id predicate."""
+        await VectorStore(db).search_lexical(
+            workspace_id=uuid.uuid4(),
+            query_embedding=[0.1] * 1536,
+            query_tokens=["0123456789abcdef"],
+            client_id=uuid.uuid4(),
+        )
+
+        assert "session_vectors.client_id =" in _compiled_sql(db)
+
+
+@pytest.mark.asyncio
+class TestRetrieveClientHistory:
+    """Test that client history retrieval is scoped inside the search."""
+
+    async def test_client_id_passed_to_vector_searches(self, db):
+        """Test that both searches receive the client and the exact limit."""
+        workspace_id = uuid.uuid4()
+        client_id = uuid.uuid4()
+
+        retrieval = RetrievalService(db)
+        retrieval.vector_store = MagicMock()
+        retrieval.vector_store.search_similar = AsyncMock(return_value=[])
+        retrieval.vector_store.search_lexical = AsyncMock(return_value=[])
+        retrieval.vector_store.search_similar_clients = AsyncMock(return_value=[])
+
+        sessions, clients = await retrieval.retrieve_client_history(
+            workspace_id=workspace_id,
+            client_id=client_id,
+            query="How did the shoulder pain progress?",
+            limit=5,
+            query_embedding=[0.1] * 1536,
+        )
+
+        assert sessions == []
+        assert clients == []
+
+        for search in (
+            retrieval.vector_store.search_similar,
+            retrieval.vector_store.search_lexical,
+            retrieval.vector_store.search_similar_clients,
+        ):
+            assert search.await_args.kwargs["client_id"] == client_id
+            assert search.await_args.kwargs["workspace_id"] == workspace_id
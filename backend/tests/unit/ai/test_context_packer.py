@@ -0,0 +1,156 @@
+"""Unit tests for token-budgeted context packing."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from pazpaz.ai.context_packer import (
+    CONTEXT_OVERHEAD_TOKENS,
+    OMITTED_MARKER,
+    estimate_tokens,
+    extract_relevant_sentences,
+    pack_contexts,
+)
+from pazpaz.ai.retrieval import ClientContext, SessionContext
+
+LONG_NOTE = " ".join(
+    f"Sentence {i} about routine posture observations." for i in range(40)
+)
+
+
+def _session(
+    similarity: float = 0.8,
+    days_ago: int = 1,
+    matched_field: str = "subjective",
+    **fields: str,
+) -> SessionContext:
+    """Build a session context with the given SOAP fields."""
+    return SessionContext(
+        session_id=uuid.uuid4(),
+        client_id=uuid.uuid4(),
+        client_name="Test Client",
+        session_date=datetime.now(UTC) - timedelta(days=days_ago),
+        subjective=fields.get("subjective"),
+        objective=fields.get("objective"),
+        assessment=fields.get("assessment"),
+        plan=fields.get("plan"),
+        similarity_score=similarity,
+        weighted_score=similarity,
+        matched_field=matched_field,
+    )
+
+
+class TestEstimateTokens:
+    """Test suite for token estimation."""
+
+    def test_empty_text(self):
+        """Test that empty text costs nothing."""
+        assert estimate_tokens(None) == 0
+        assert estimate_tokens("") == 0
+
+    def test_hebrew_counts_denser_than_english(self):
+        """Test that Hebrew text is estimated at more tokens per character."""
+        assert estimate_tokens("כאב" * 10) > estimate_tokens("abc" * 10)
+
+
+class TestExtractRelevantSentences:
+    """Test suite for query-relevant sentence extraction."""
+
+    def test_keeps_matching_sentences_in_order(self):
+        """Test that sentences mentioning the query terms are kept."""
+        text = (
+            "Patient slept well. Knee pain worse on stairs. "
+            "Weather was cold. Knee swelling reduced after ice."
+        )
+
+        result = extract_relevant_sentences(text, {"knee"}, max_tokens=16)
+
+        assert result == "Knee pain worse on stairs. Knee swelling reduced after ice."
+
+    def test_budget_below_minimum_returns_none(self):
+        """Test that tiny budgets produce no snippet."""
+        assert extract_relevant_sentences(LONG_NOTE, {"posture"}, 3) is None
+
+    def test_truncates_single_oversized_sentence(self):
+        """Test that one sentence longer than the budget is truncated."""
+        result = extract_relevant_sentences("word " * 200, set(), max_tokens=20)
+
+        assert result.endswith("...")
+        assert estimate_tokens(result) <= 20
+
+
+class TestPackContexts:
+    """Test suite for pack_contexts."""
+
+    def test_contexts_within_budget_unchanged(self):
+        """Test that small contexts are returned as-is."""
+        sessions = [_session(subjective="Lower back pain.")]
+
+        packed = pack_contexts(sessions, [], "back pain", budget_tokens=1000)
+
+        assert packed.session_contexts == sessions
+        assert packed.tokens_saved == 0
+
+    def test_packed_contexts_fit_budget(self):
+        """Test that oversized contexts are trimmed to the budget."""
+        sessions = [
+            _session(subjective=LONG_NOTE, objective=LONG_NOTE, plan=LONG_NOTE)
+            for _ in range(3)
+        ]
+
+        packed = pack_contexts(sessions, [], "posture", budget_tokens=600)
+
+        assert packed.packed_tokens <= 600
+        assert packed.tokens_saved > 0
+        assert packed.original_tokens > 600
+        used = sum(
+            estimate_tokens(getattr(context, field))
+            for context in packed.session_contexts
+            for field in ("subjective", "objective", "assessment", "plan")
+            if getattr(context, field) != OMITTED_MARKER
+        ) + CONTEXT_OVERHEAD_TOKENS * len(packed.session_contexts)
+        assert used <= 600
+
+    def test_recent_relevant_context_kept_first(self):
+        """Test that temporal weighting decides which session survives."""
+        old = _session(similarity=0.8, days_ago=180, subjective=LONG_NOTE)
+        recent = _session(similarity=0.8, days_ago=2, subjective=LONG_NOTE)
+        budget = estimate_tokens(LONG_NOTE) + CONTEXT_OVERHEAD_TOKENS + 10
+
+        packed = pack_contexts([old, recent], [], "posture", budget_tokens=budget)
+
+        assert [c.session_id for c in packed.session_contexts] == [recent.session_id]
+        assert packed.session_contexts[0].subjective == LONG_NOTE
+
+    def test_unselected_fields_marked_omitted(self):
+        """Test that dropped fields are marked rather than shown as missing."""
+        context = _session(
+            matched_field="plan",
+            subjective=LONG_NOTE,
+            plan="Continue ice and stretching.",
+        )
+        budget = CONTEXT_OVERHEAD_TOKENS + 10
+
+        packed = pack_contexts([context], [], "ice", budget_tokens=budget)
+
+        result = packed.session_contexts[0]
+        assert result.plan == "Continue ice and stretching."
+        assert result.subjective == OMITTED_MARKER
+        assert result.objective is None
+
+    def test_client_contexts_packed(self):
+        """Test that client profile fields take part in packing."""
+        client = ClientContext(
+            client_id=uuid.uuid4(),
+            client_name="Test Client",
+            medical_history=LONG_NOTE,
+            notes=None,
+            similarity_score=0.9,
+            matched_field="medical_history",
+        )
+
+        packed = pack_contexts([], [client], "posture", budget_tokens=200)
+
+        assert len(packed.client_contexts) == 1
+        assert estimate_tokens(packed.client_contexts[0].medical_history) < (
+            estimate_tokens(LONG_NOTE)
+        )
@@ -1,12 +1,31 @@
 """Unit tests for L2 embedding cache in EmbeddingService."""
 
-import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from redis.asyncio import Redis
 
-from pazpaz.ai.embeddings import EmbeddingService, get_embedding_cache_key
+from pazpaz.ai import embeddings
+from pazpaz.ai.embedding_warmup import get_warmup_texts
+from pazpaz.ai.embeddings import (
+    EMBEDDING_CACHE_TTL_SECONDS,
+    EmbeddingLRUCache,
+    EmbeddingService,
+    decode_cached_embedding,
+    encode_cached_embedding,
+    get_embedding_cache_key,
+)
+
+MODEL = "embed-multilingual-v4.0"
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_lru():
+    """Isolate tests from the process-wide embedding LRU."""
+    embeddings._embedding_lru.clear()
+    yield
+    embeddings._embedding_lru.clear()
 
 
 class TestEmbeddingCacheKey:
@@ -34,6 +53,79 @@ class TestEmbeddingCacheKey:
         # Should generate same key after normalization
         assert key1 == key2
 
+    def test_get_embedding_cache_key_includes_input_type(self):
+        """Test that query and document embeddings never share a key."""
+        text = "Patient reports lower back pain"
+
+        assert get_embedding_cache_key(text, "search_query") != (
+            get_embedding_cache_key(text, "search_document")
+        )
+
+
+class TestEmbeddingEncoding:
+    """Test packed float32 cache encoding."""
+
+    def test_round_trip_preserves_float32_values(self):
+        """Test that encode/decode returns the float32-rounded vector."""
+        embedding = [0.5, -0.25, 0.125] * 512
+
+        value = encode_cached_embedding(embedding, MODEL)
+
+        assert decode_cached_embedding(value, MODEL) == embedding
+        assert decode_cached_embedding(value.encode(), MODEL) == embedding
+
+    def test_encoding_is_compact(self):
+        """Test that a 1536-dim vector encodes to ~8 KB (vs ~30 KB JSON)."""
+        value = encode_cached_embedding([0.123456789] * 1536, MODEL)
+
+        assert len(value) < 8300
+
+    def test_model_or_version_mismatch_is_a_miss(self):
+        """Test that entries from another model or format are ignored."""
+        value = encode_cached_embedding([0.5] * 4, MODEL)
+
+        assert decode_cached_embedding(value, "embed-v4.0") is None
+        assert decode_cached_embedding('{"embedding": [0.5]}', MODEL) is None
+
+
+class TestEmbeddingLRUCache:
+    """Test the in-process LRU."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted at capacity."""
+        cache = EmbeddingLRUCache(max_entries=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")  # "a" becomes most recently used
+        cache.put("c", [3.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert cache.get("c") == [3.0]
+        assert len(cache) == 2
+
+
+class TestWarmupTexts:
+    """Test warm-up text selection."""
+
+    def test_includes_raw_and_expanded_queries(self):
+        """Test that both forms the agent may embed are warmed."""
+        texts = get_warmup_texts("en")
+
+        assert "Has the pain improved?" in texts
+        assert any(
+            t.startswith("Has the pain improved? ") and "relief" in t for t in texts
+        )
+        assert "manual therapy" in texts  # query_expansion term
+        assert len(texts) == len(set(texts))
+
+    def test_hebrew_texts(self):
+        """Test that Hebrew queries and expansion terms are included."""
+        texts = get_warmup_texts("he")
+
+        assert "האם הכאב השתפר?" in texts
+        assert "פיזיותרפיה" in texts
+
     def test_get_embedding_cache_key_different_texts_different_keys(self):
         """Test that different texts generate different cache keys."""
         text1 = "Patient reports lower back pain"
@@ -53,10 +145,14 @@ class TestEmbeddingServiceL2Cache:
     def mock_cohere_client(self):
         """Mock Cohere client for embedding generation."""
         mock_client = MagicMock()
-        mock_response = MagicMock()
-        # Simulate Cohere v2 response structure
-        mock_response.embeddings = [[0.1] * 1536]  # 1536-dim embedding
-        mock_client.embed = AsyncMock(return_value=mock_response)
+
+        # Simulate Cohere v2 response structure (one embedding per text)
+        async def embed(texts, **kwargs):
+            return SimpleNamespace(
+                embeddings=SimpleNamespace(float=[[0.5] * 1536 for _ in texts])
+            )
+
+        mock_client.embed = AsyncMock(side_effect=embed)
         return mock_client
 
     @pytest.fixture
@@ -79,7 +175,7 @@ class TestEmbeddingServiceL2Cache:
     ):
         """Test that cache miss generates embedding and stores in cache."""
         # Replace Cohere client with mock
-        embedding_service_with_cache.cohere_client = mock_cohere_client
+        embedding_service_with_cache.client = mock_cohere_client
 
         text = "Patient reports lower back pain"
         cache_key = get_embedding_cache_key(text)
@@ -92,19 +188,19 @@ class TestEmbeddingServiceL2Cache:
 
         # Verify embedding was generated
         assert len(embedding) == 1536
-        assert embedding == [0.1] * 1536
+        assert embedding == [0.5] * 1536
 
         # Verify Cohere API was called
         mock_cohere_client.embed.assert_called_once()
 
-        # Verify result was cached
+        # Verify result was cached (packed float32)
         cached_value = await redis_client.get(cache_key)
         assert cached_value is not None
-
-        cached_data = json.loads(cached_value)
-        assert cached_data["embedding"] == embedding
-        assert cached_data["model"] == "embed-multilingual-v4.0"
-        assert cached_data["cache_version"] == "v1"
+        assert cached_value.startswith("v2:")
+        assert (
+            decode_cached_embedding(cached_value, embedding_service_with_cache.model)
+            == embedding
+        )
 
         # Verify TTL is set (1 hour = 3600 seconds)
         ttl = await redis_client.ttl(cache_key)
@@ -118,20 +214,15 @@ class TestEmbeddingServiceL2Cache:
     ):
         """Test that cache hit returns cached embedding without calling API."""
         # Replace Cohere client with mock
-        embedding_service_with_cache.cohere_client = mock_cohere_client
+        embedding_service_with_cache.client = mock_cohere_client
 
         text = "Patient reports shoulder pain"
         cache_key = get_embedding_cache_key(text)
 
         # Pre-populate cache
-        cached_embedding = [0.5] * 1536
-        cache_value = json.dumps(
-            {
-                "embedding": cached_embedding,
-                "model": "embed-multilingual-v4.0",
-                "created_at": 1234567890,
-                "cache_version": "v1",
-            }
+        cached_embedding = [0.25] * 1536
+        cache_value = encode_cached_embedding(
+            cached_embedding, embedding_service_with_cache.model
         )
         await redis_client.setex(cache_key, 3600, cache_value)
 
@@ -152,20 +243,15 @@ class TestEmbeddingServiceL2Cache:
     ):
         """Test that use_cache=False always calls API."""
         # Replace Cohere client with mock
-        embedding_service_with_cache.cohere_client = mock_cohere_client
+        embedding_service_with_cache.client = mock_cohere_client
 
         text = "Patient reports knee pain"
         cache_key = get_embedding_cache_key(text)
 
         # Pre-populate cache
-        cached_embedding = [0.5] * 1536
-        cache_value = json.dumps(
-            {
-                "embedding": cached_embedding,
-                "model": "embed-multilingual-v4.0",
-                "created_at": 1234567890,
-                "cache_version": "v1",
-            }
+        cached_embedding = [0.25] * 1536
+        cache_value = encode_cached_embedding(
+            cached_embedding, embedding_service_with_cache.model
         )
         await redis_client.setex(cache_key, 3600, cache_value)
 
@@ -173,7 +259,7 @@ class TestEmbeddingServiceL2Cache:
         embedding = await embedding_service_with_cache.embed_text(text, use_cache=False)
 
         # Verify API embedding was returned (not cached)
-        assert embedding == [0.1] * 1536  # Mock returns [0.1] * 1536
+        assert embedding == [0.5] * 1536  # Mock returns [0.5] * 1536
 
         # Verify Cohere API WAS called despite cache
         mock_cohere_client.embed.assert_called_once()
@@ -189,7 +275,7 @@ class TestEmbeddingServiceL2Cache:
             input_type="search_document",
             redis=None,  # No Redis
         )
-        service.cohere_client = mock_cohere_client
+        service.client = mock_cohere_client
 
         text = "Patient reports elbow pain"
 
@@ -197,7 +283,7 @@ class TestEmbeddingServiceL2Cache:
         embedding = await service.embed_text(text)
 
         # Verify embedding was generated
-        assert embedding == [0.1] * 1536
+        assert embedding == [0.5] * 1536
 
         # Verify Cohere API was called
         mock_cohere_client.embed.assert_called_once()
@@ -208,7 +294,7 @@ class TestEmbeddingServiceL2Cache:
         mock_cohere_client,
     ):
         """Test that empty text returns zero vector without caching."""
-        embedding_service_with_cache.cohere_client = mock_cohere_client
+        embedding_service_with_cache.client = mock_cohere_client
 
         # Test empty string
         embedding = await embedding_service_with_cache.embed_text("")
@@ -236,7 +322,7 @@ class TestEmbeddingServiceL2Cache:
             input_type="search_document",
             redis=mock_redis,
         )
-        service.cohere_client = mock_cohere_client
+        service.client = mock_cohere_client
 
         text = "Patient reports wrist pain"
 
@@ -244,7 +330,83 @@ class TestEmbeddingServiceL2Cache:
         embedding = await service.embed_text(text)
 
         # Verify embedding was generated
-        assert embedding == [0.1] * 1536
+        assert embedding == [0.5] * 1536
 
         # Verify Cohere API was called
         mock_cohere_client.embed.assert_called_once()
+
+    async def test_lru_serves_repeat_queries_without_redis_round_trip(
+        self,
+        embedding_service_with_cache,
+        redis_client,
+        mock_cohere_client,
+    ):
+        """Test that the in-process LRU answers before Redis is consulted."""
+        embedding_service_with_cache.client = mock_cohere_client
+        text = "Patient reports hip pain"
+
+        first = await embedding_service_with_cache.embed_text(text)
+
+        # Redis is no longer reachable - the LRU must still serve the embedding
+        embedding_service_with_cache.redis = AsyncMock(spec=Redis)
+        embedding_service_with_cache.redis.get = AsyncMock(
+            side_effect=Exception("Redis connection error")
+        )
+        second = await embedding_service_with_cache.embed_text(text)
+
+        assert second == first
+        embedding_service_with_cache.redis.get.assert_not_called()
+        mock_cohere_client.embed.assert_called_once()
+
+    async def test_warm_cache_embeds_only_missing_texts_in_one_batch(
+        self,
+        redis_client,
+        mock_cohere_client,
+    ):
+        """Test that warm_cache skips cached texts and batches the rest."""
+        service = EmbeddingService(
+            api_key="test-api-key",
+            input_type="search_query",
+            redis=redis_client,
+        )
+        service.client = mock_cohere_client
+        await redis_client.set(
+            get_embedding_cache_key("back pain", "search_query"),
+            encode_cached_embedding([0.25] * 1536, service.model),
+        )
+
+        embedded = await service.warm_cache(["back pain", "neck pain", "hip pain"])
+
+        assert embedded == 2
+        mock_cohere_client.embed.assert_called_once()
+        assert mock_cohere_client.embed.call_args.kwargs["texts"] == [
+            "neck pain",
+            "hip pain",
+        ]
+
+        # Warmed texts are served from cache afterwards
+        assert await service.embed_text("neck pain") == [0.5] * 1536
+        mock_cohere_client.embed.assert_called_once()
+
+    async def test_warm_cache_refreshes_ttl_of_cached_texts(
+        self,
+        redis_client,
+        mock_cohere_client,
+    ):
+        """Test that warm_cache renews the TTL of entries it does not re-embed."""
+        service = EmbeddingService(
+            api_key="test-api-key",
+            input_type="search_query",
+            redis=redis_client,
+        )
+        service.client = mock_cohere_client
+        cache_key = get_embedding_cache_key("back pain", "search_query")
+        await redis_client.setex(
+            cache_key, 60, encode_cached_embedding([0.25] * 1536, service.model)
+        )
+
+        embedded = await service.warm_cache(["back pain"])
+
+        assert embedded == 0
+        mock_cohere_client.embed.assert_not_called()
+        assert await redis_client.ttl(cache_key) > EMBEDDING_CACHE_TTL_SECONDS - 5
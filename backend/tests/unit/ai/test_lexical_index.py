@@ -0,0 +1,169 @@
+"""Unit tests for the keyed lexical index and hybrid rank fusion."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.ai.lexical_index import (
+    TOKEN_HASH_LENGTH,
+    build_lexical_tokens,
+    hash_tokens,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+from pazpaz.ai.retrieval import RetrievalService
+from pazpaz.ai.search_config import SearchConfig, get_search_config, set_search_config
+
+
+class TestTokenize:
+    """Test suite for lexical tokenization."""
+
+    def test_lowercases_and_drops_stopwords(self):
+        """Test that tokens are normalized and stopwords removed."""
+        assert tokenize("The pain in the Lower Back") == ["pain", "lower", "back"]
+
+    def test_keeps_clinical_abbreviations(self):
+        """Test that short alphanumeric terms like L5 survive tokenization."""
+        assert tokenize("L5-S1 radiculopathy, TMJ") == [
+            "l5",
+            "s1",
+            "radiculopathy",
+            "tmj",
+        ]
+
+    def test_deduplicates_in_order(self):
+        """Test that repeated tokens are emitted once, first-seen order."""
+        assert tokenize("pain, more pain, less pain") == ["pain", "more", "less"]
+
+    def test_hebrew_prefix_variant(self):
+        """Test that prefixed Hebrew words also emit the bare word."""
+        tokens = tokenize("כאבים בגב התחתון")
+        assert "בגב" in tokens
+        assert "גב" in tokens
+
+    def test_empty_text(self):
+        """Test that empty or missing text yields no tokens."""
+        assert tokenize(None) == []
+        assert tokenize("") == []
+        assert tokenize("a I") == []
+
+
+class TestHashTokens:
+    """Test suite for keyed token hashing."""
+
+    def test_hashes_are_deterministic_and_truncated(self):
+        """Test that the same token hashes identically within a workspace."""
+        workspace_id = uuid.uuid4()
+        first = hash_tokens(["ibuprofen"], workspace_id)
+        second = hash_tokens(["ibuprofen"], workspace_id)
+
+        assert first == second
+        assert len(first[0]) == TOKEN_HASH_LENGTH
+
+    def test_hashes_are_workspace_salted(self):
+        """Test that identical tokens hash differently across workspaces."""
+        assert hash_tokens(["ibuprofen"], uuid.uuid4()) != hash_tokens(
+            ["ibuprofen"], uuid.uuid4()
+        )
+
+    def test_plaintext_not_in_tokens(self):
+        """Test that stored tokens never contain the plaintext word."""
+        tokens = build_lexical_tokens("sciatica", uuid.uuid4())
+        assert tokens
+        assert all("sciatica" not in token for token in tokens)
+
+
+class TestReciprocalRankFusion:
+    """Test suite for Reciprocal Rank Fusion."""
+
+    def test_items_in_both_rankings_win(self):
+        """Test that items ranked by both retrievers rise to the top."""
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "d"]])
+        assert fused[0][0] == "c"
+        assert {item for item, _ in fused} == {"a", "b", "c", "d"}
+
+    def test_scores_follow_formula(self):
+        """Test that scores equal sum(1 / (k + rank))."""
+        fused = dict(reciprocal_rank_fusion([["a"], ["b", "a"]], k=10))
+        assert fused["a"] == pytest.approx(1 / 11 + 1 / 12)
+        assert fused["b"] == pytest.approx(1 / 11)
+
+    def test_ties_keep_first_seen_order(self):
+        """Test that equally scored items keep their first-seen order."""
+        fused = reciprocal_rank_fusion([["a"], ["b"]])
+        assert [item for item, _ in fused] == ["a", "b"]
+
+
+def _vector(field_name: str = "subjective") -> MagicMock:
+    """Build a SessionVector stand-in."""
+    vector = MagicMock()
+    vector.id = uuid.uuid4()
+    vector.session_id = uuid.uuid4()
+    vector.field_name = field_name
+    return vector
+
+
+@pytest.mark.asyncio
+class TestHybridSessionSearch:
+    """Test suite for RetrievalService hybrid lexical + vector search."""
+
+    @pytest.fixture
+    def retrieval(self):
+        """RetrievalService with a mocked vector store."""
+        service = RetrievalService(MagicMock(spec=AsyncSession))
+        service.vector_store = MagicMock()
+        return service
+
+    @pytest.fixture(autouse=True)
+    def restore_search_config(self):
+        """Restore the global search config after each test."""
+        original = get_search_config()
+        yield
+        set_search_config(original)
+
+    async def test_lexical_hit_fused_into_results(self, retrieval):
+        """Test that an exact-term match missed by vector search is returned."""
+        semantic_only = [_vector() for _ in range(3)]
+        exact_term = _vector("plan")
+        retrieval.vector_store.search_similar = AsyncMock(
+            return_value=[(vector, 0.6) for vector in semantic_only]
+        )
+        retrieval.vector_store.search_lexical = AsyncMock(
+            return_value=[(exact_term, 0.2, 1), (semantic_only[2], 0.6, 1)]
+        )
+
+        results = await retrieval._search_session_vectors(
+            workspace_id=uuid.uuid4(),
+            query="gabapentin dosage",
+            query_embedding=[0.1] * 1536,
+            limit=3,
+            field_filter=None,
+            min_similarity=0.3,
+        )
+
+        result_ids = [vector.id for vector, _ in results]
+        assert result_ids[0] == semantic_only[2].id
+        assert exact_term.id in result_ids
+        assert len(results) == 3
+        assert retrieval.vector_store.search_similar.await_args.kwargs["limit"] == 6
+
+    async def test_hybrid_disabled_uses_vector_search_only(self, retrieval):
+        """Test that disabling hybrid search skips the lexical query."""
+        set_search_config(SearchConfig(hybrid_search_enabled=False))
+        vector = _vector()
+        retrieval.vector_store.search_similar = AsyncMock(return_value=[(vector, 0.8)])
+        retrieval.vector_store.search_lexical = AsyncMock()
+
+        results = await retrieval._search_session_vectors(
+            workspace_id=uuid.uuid4(),
+            query="gabapentin dosage",
+            query_embedding=[0.1] * 1536,
+            limit=5,
+            field_filter=None,
+            min_similarity=0.3,
+        )
+
+        assert results == [(vector, 0.8)]
+        retrieval.vector_store.search_lexical.assert_not_awaited()
@@ -0,0 +1,171 @@
+"""Unit tests for the semantic (embedding-similarity) query cache."""
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.ai.agent import ClinicalAgent
+from pazpaz.ai.retrieval import SessionContext
+from pazpaz.ai.semantic_cache import SemanticQueryCache, get_semantic_cache_key
+from pazpaz.services.cache_service import AICacheService
+
+
+def _payload(answer: str = "Cached answer", language: str = "en") -> dict:
+    """Build a cached agent response payload."""
+    return {
+        "answer": answer,
+        "citations": [],
+        "language": language,
+        "retrieved_count": 1,
+    }
+
+
+def _session_context() -> SessionContext:
+    """Build a single retrieved session context."""
+    return SessionContext(
+        session_id=uuid.uuid4(),
+        client_id=uuid.uuid4(),
+        client_name="John Doe",
+        session_date=datetime(2025, 1, 1, 10, 0, tzinfo=UTC),
+        subjective="Lower back pain",
+        objective=None,
+        assessment=None,
+        plan=None,
+        similarity_score=0.8,
+        weighted_score=0.5,
+        matched_field="subjective",
+    )
+
+
+@pytest.mark.asyncio
+class TestSemanticQueryCache:
+    """Test suite for SemanticQueryCache lookup/store."""
+
+    @pytest.fixture
+    def cache(self, redis_client):
+        """Semantic cache with a 0.9 similarity threshold."""
+        return SemanticQueryCache(
+            redis_client, similarity_threshold=0.9, ttl_seconds=300, max_entries=3
+        )
+
+    async def test_near_duplicate_embedding_hits(self, cache):
+        """Test that a similar embedding returns the cached payload."""
+        workspace_id = uuid.uuid4()
+        await cache.store(workspace_id, None, "hash1", [1.0, 0.0, 0.0], _payload())
+
+        hit = await cache.lookup(workspace_id, None, [0.98, 0.1, 0.0], "en")
+
+        assert hit is not None
+        assert hit.payload["answer"] == "Cached answer"
+        assert hit.similarity > 0.9
+
+    async def test_dissimilar_embedding_misses(self, cache):
+        """Test that an embedding below the threshold misses."""
+        workspace_id = uuid.uuid4()
+        await cache.store(workspace_id, None, "hash1", [1.0, 0.0, 0.0], _payload())
+
+        assert await cache.lookup(workspace_id, None, [0.5, 0.5, 0.5], "en") is None
+
+    async def test_scopes_are_isolated(self, cache):
+        """Test that workspace and client scopes never share entries."""
+        workspace_id = uuid.uuid4()
+        client_id = uuid.uuid4()
+        await cache.store(workspace_id, client_id, "hash1", [1.0, 0.0], _payload())
+
+        assert await cache.lookup(workspace_id, None, [1.0, 0.0], "en") is None
+        assert await cache.lookup(uuid.uuid4(), client_id, [1.0, 0.0], "en") is None
+        assert await cache.lookup(workspace_id, uuid.uuid4(), [1.0, 0.0], "en") is None
+        assert await cache.lookup(workspace_id, client_id, [1.0, 0.0], "en")
+
+    async def test_language_mismatch_misses(self, cache):
+        """Test that a Hebrew query never returns a cached English answer."""
+        workspace_id = uuid.uuid4()
+        await cache.store(workspace_id, None, "hash1", [1.0, 0.0], _payload())
+
+        assert await cache.lookup(workspace_id, None, [1.0, 0.0], "he") is None
+
+    async def test_scope_is_bounded(self, cache, redis_client):
+        """Test that the oldest entries are evicted beyond max_entries."""
+        workspace_id = uuid.uuid4()
+        for i in range(5):
+            await cache.store(workspace_id, None, f"hash{i}", [1.0, i], _payload())
+
+        key = get_semantic_cache_key(workspace_id)
+        assert await redis_client.hlen(key) == 3
+        assert 0 < await redis_client.ttl(key) <= 300
+
+
+@pytest.mark.asyncio
+class TestClinicalAgentSemanticCache:
+    """Test suite for the semantic cache tier in ClinicalAgent.query()."""
+
+    @pytest.fixture
+    def agent(self, redis_client):
+        """ClinicalAgent with mocked retrieval, embeddings and synthesis."""
+        agent = ClinicalAgent(
+            db=MagicMock(spec=AsyncSession),
+            cohere_api_key="test-api-key",
+            redis=redis_client,
+        )
+        agent.retrieval_service = MagicMock()
+        agent.retrieval_service.embedding_service.embed_text = AsyncMock(
+            side_effect=lambda text: (
+                [1.0, 0.0, 0.0] if "back" in text.lower() else [0.0, 1.0, 0.0]
+            )
+        )
+        agent.retrieval_service.retrieve_relevant_sessions = AsyncMock(
+            return_value=([_session_context()], [])
+        )
+        agent._format_context = MagicMock(return_value="context")
+        agent._extract_citations = MagicMock(return_value=[])
+        agent._synthesize_answer = AsyncMock(return_value="Massage twice a week.")
+        return agent
+
+    async def test_paraphrased_query_served_from_semantic_cache(self, agent):
+        """Test that a paraphrase skips retrieval and LLM synthesis."""
+        workspace_id = uuid.uuid4()
+
+        first = await agent.query(
+            workspace_id=workspace_id,
+            query="What was the treatment for back pain?",
+        )
+        second = await agent.query(
+            workspace_id=workspace_id,
+            query="back pain treatments?",
+        )
+
+        assert second.answer == first.answer == "Massage twice a week."
+        assert agent._synthesize_answer.await_count == 1
+        assert agent.retrieval_service.retrieve_relevant_sessions.await_count == 1
+
+    async def test_unrelated_query_misses(self, agent):
+        """Test that an unrelated query runs the full pipeline."""
+        workspace_id = uuid.uuid4()
+
+        await agent.query(workspace_id=workspace_id, query="Back pain treatment?")
+        await agent.query(workspace_id=workspace_id, query="Neck stiffness?")
+
+        assert agent._synthesize_answer.await_count == 2
+
+    async def test_client_invalidation_clears_semantic_tier(self, agent, redis_client):
+        """Test that AICacheService invalidation drops semantic entries."""
+        workspace_id = uuid.uuid4()
+        client_id = uuid.uuid4()
+        agent.retrieval_service.retrieve_client_history = AsyncMock(
+            return_value=([_session_context()], [])
+        )
+
+        await agent.query(
+            workspace_id=workspace_id, query="Back pain plan?", client_id=client_id
+        )
+        await AICacheService(redis_client).invalidate_client_queries(
+            workspace_id=workspace_id, client_id=client_id
+        )
+        await agent.query(
+            workspace_id=workspace_id, query="Plan for back pain?", client_id=client_id
+        )
+
+        assert agent._synthesize_answer.await_count == 2
@@ -0,0 +1,118 @@
+"""Unit tests for chunked, concurrent transcription of long recordings."""
+
+import asyncio
+
+import pytest
+
+from pazpaz.ai.audio_chunking import AudioSegment, parse_silencedetect, plan_segments
+from pazpaz.ai.providers.base import TranscriptionProvider, TranscriptionResult
+from pazpaz.ai.providers.whisper import TranscriptionError
+from pazpaz.ai.transcription_pipeline import transcribe_segments
+
+
+class FakeTranscriptionProvider(TranscriptionProvider):
+    """Local provider: "transcribes" audio by decoding it as text."""
+
+    def __init__(self, delay: float = 0.01, fail_on: str | None = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def max_upload_bytes(self) -> int:
+        return 25 * 1024 * 1024
+
+    async def transcribe(self, audio: bytes, filename: str) -> TranscriptionResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if filename == self.fail_on:
+                raise TranscriptionError("provider unavailable")
+            language, text = audio.decode().split(":", 1)
+            return TranscriptionResult(
+                text=text, language=language, duration_seconds=0.0
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def test_plan_segments_cuts_at_pauses_near_target():
+    silences = [(100.0, 101.0), (239.0, 241.0), (400.0, 402.0), (700.0, 701.0)]
+
+    segments = plan_segments(
+        900.0, silences, target_seconds=240, min_seconds=120, max_seconds=360
+    )
+
+    # Each cut is the pause midpoint closest to start + 240s among pauses
+    # 120-360s after start; the 100s pause is too early to be used
+    assert [(s.start, s.end) for s in segments] == [
+        (0.0, 240.0),
+        (240.0, 401.0),
+        (401.0, 700.5),
+        (700.5, 900.0),
+    ]
+    assert [s.filename for s in segments][0] == "segment-000.ogg"
+
+
+def test_plan_segments_hard_cut_without_pauses():
+    segments = plan_segments(800.0, [], max_seconds=360)
+
+    assert [(s.start, s.end) for s in segments] == [
+        (0.0, 360.0),
+        (360.0, 720.0),
+        (720.0, 800.0),
+    ]
+
+
+def test_parse_silencedetect_output():
+    output = "\n".join(
+        [
+            "  Duration: N/A, start: 0.000000, bitrate: N/A",
+            "[silencedetect @ 0x1] silence_start: 12.5",
+            "[silencedetect @ 0x1] silence_end: 13.75 | silence_duration: 1.25",
+            "size=N/A time=00:00:20.00 bitrate=N/A speed= 900x",
+            "[silencedetect @ 0x1] silence_start: 44.1",
+            "size=N/A time=00:00:45.32 bitrate=N/A speed= 900x",
+        ]
+    )
+
+    duration, silences = parse_silencedetect(output)
+
+    assert duration == pytest.approx(45.32)
+    assert silences == [(12.5, 13.75)]  # Trailing silence has no end
+
+
+async def test_segments_transcribed_concurrently_and_stitched_in_order():
+    segments = [AudioSegment(i, i * 60.0, (i + 1) * 60.0) for i in range(6)]
+    provider = FakeTranscriptionProvider()
+    progress: list[tuple[int, int]] = []
+
+    async def read_segment(segment: AudioSegment) -> bytes:
+        language = "en" if segment.index == 5 else "he"
+        return f"{language}: part {segment.index} ".encode()
+
+    async def on_progress(completed: int, total: int) -> None:
+        progress.append((completed, total))
+
+    result = await transcribe_segments(
+        provider, segments, read_segment, max_concurrency=2, on_progress=on_progress
+    )
+
+    assert result.text == "part 0 part 1 part 2 part 3 part 4 part 5"
+    assert result.language == "he"
+    assert result.duration_seconds == 360.0
+    assert provider.max_in_flight == 2
+    assert progress == [(n, 6) for n in range(1, 7)]
+
+
+async def test_segment_failure_fails_whole_transcription():
+    segments = [AudioSegment(i, i * 60.0, (i + 1) * 60.0) for i in range(4)]
+    provider = FakeTranscriptionProvider(fail_on="segment-002.ogg")
+
+    async def read_segment(segment: AudioSegment) -> bytes:
+        return b"he:text"
+
+    with pytest.raises(TranscriptionError):
+        await transcribe_segments(provider, segments, read_segment, max_concurrency=4)
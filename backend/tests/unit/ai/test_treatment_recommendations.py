@@ -7,6 +7,7 @@ This test suite validates:
 4. Integration with existing RAG pipeline
 """
 
+import uuid
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,10 +15,15 @@ import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from pazpaz.ai.agent import get_clinical_agent
+from pazpaz.ai.agent import RetrievedContext, get_clinical_agent
+from pazpaz.ai.treatment_recommender import (
+    TreatmentRecommender,
+    get_treatment_context_cache_key,
+)
 from pazpaz.models.client import Client
 from pazpaz.models.session import Session
 from pazpaz.models.workspace import Workspace
+from pazpaz.services.cache_service import AICacheService
 
 
 class TestTherapyTypeDetection:
@@ -464,3 +470,126 @@ class TestPromptIntegration:
 
         # Should default to generic
         assert "clinical treatment planning" in prompt.lower()
+
+
+class TestRecommendationContextReuse:
+    """Test that recommendations reuse retrieval without a second LLM call."""
+
+    LLM_RESPONSE = """
+Recommendation 1:
+Title: Manual Therapy
+Description: **Treatment Protocol:** Apply **myofascial release** to upper trapezius.
+"""
+
+    @pytest.fixture
+    def agent(self, redis_client):
+        """ClinicalAgent stand-in exposing the retrieve/synthesize stages."""
+        agent = MagicMock()
+        agent.redis = redis_client
+        agent.query = AsyncMock()
+        agent.retrieve_context = AsyncMock(
+            return_value=RetrievedContext(
+                language="en",
+                session_contexts=[MagicMock()],
+                client_contexts=[],
+                formatted_context="=== Relevant Treatment Session Notes ===\nS: neck pain",
+            )
+        )
+        agent._synthesize_answer_with_retry = AsyncMock(
+            return_value=(self.LLM_RESPONSE, 120, 0.5)
+        )
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_single_llm_call_with_formatted_context(self, agent):
+        """Should build the prompt from retrieved context, not an agent answer."""
+        response = await TreatmentRecommender(agent).recommend_treatment_plan(
+            workspace_id=uuid.uuid4(),
+            subjective="Neck tension",
+            objective="Trigger points in upper trap",
+            assessment="Myofascial pain",
+            client_id=uuid.uuid4(),
+        )
+
+        agent.query.assert_not_awaited()
+        agent._synthesize_answer_with_retry.assert_awaited_once()
+        user_prompt = agent._synthesize_answer_with_retry.await_args.kwargs[
+            "user_prompt"
+        ]
+        assert "S: neck pain" in user_prompt
+        assert response.retrieved_count == 1
+        assert response.recommendations[0].evidence_type == "hybrid"
+
+    @pytest.mark.asyncio
+    async def test_context_cached_per_client(self, agent, redis_client):
+        """Should retrieve once per client and S/O/A, and store it encrypted."""
+        recommender = TreatmentRecommender(agent)
+        workspace_id = uuid.uuid4()
+        client_id = uuid.uuid4()
+        soa = {
+            "subjective": "Neck tension",
+            "objective": "Trigger points in upper trap",
+            "assessment": "Myofascial pain",
+        }
+
+        await recommender.recommend_treatment_plan(
+            workspace_id=workspace_id, client_id=client_id, **soa
+        )
+        response = await recommender.recommend_treatment_plan(
+            workspace_id=workspace_id, client_id=client_id, **soa
+        )
+
+        assert agent.retrieve_context.await_count == 1
+        assert agent._synthesize_answer_with_retry.await_count == 2
+        assert response.retrieved_count == 1
+
+        cache_key = get_treatment_context_cache_key(
+            workspace_id,
+            client_id,
+            f"{soa['subjective']} {soa['objective']} {soa['assessment']}",
+        )
+        cached = await redis_client.get(cache_key)
+        assert cached is not None
+        assert "neck pain" not in cached
+
+    @pytest.mark.asyncio
+    async def test_cached_context_invalidated_with_client(self, agent, redis_client):
+        """Should drop cached context when the client's AI cache is invalidated."""
+        recommender = TreatmentRecommender(agent)
+        workspace_id = uuid.uuid4()
+        client_id = uuid.uuid4()
+
+        await recommender.recommend_treatment_plan(
+            workspace_id=workspace_id,
+            subjective="Neck tension",
+            objective="Trigger points",
+            assessment="Myofascial pain",
+            client_id=client_id,
+        )
+        await AICacheService(redis_client).invalidate_client_queries(
+            workspace_id=workspace_id, client_id=client_id
+        )
+        await recommender.recommend_treatment_plan(
+            workspace_id=workspace_id,
+            subjective="Neck tension",
+            objective="Trigger points",
+            assessment="Myofascial pain",
+            client_id=client_id,
+        )
+
+        assert agent.retrieve_context.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retrieval_failure_falls_back_to_guidelines(self, agent):
+        """Should still recommend (from guidelines) when retrieval fails."""
+        agent.retrieve_context.side_effect = RuntimeError("vector store down")
+
+        response = await TreatmentRecommender(agent).recommend_treatment_plan(
+            workspace_id=uuid.uuid4(),
+            subjective="Neck tension",
+            objective="Trigger points",
+            assessment="Myofascial pain",
+        )
+
+        assert response.retrieved_count == 0
+        assert response.recommendations[0].evidence_type == "clinical_guidelines"
@@ -77,6 +77,12 @@ def mock_db():
     return db
 
 
+@pytest.fixture
+def mock_arq_pool():
+    """Create mock arq pool (email outbox notification)."""
+    return AsyncMock()
+
+
 # ============================================================================
 # Authentication Tests
 # ============================================================================
@@ -139,7 +145,7 @@ async def test_get_pending_invitations_requires_platform_admin(
 
 
 @pytest.mark.asyncio
-async def test_invite_therapist_success(mock_db, mock_platform_admin):
+async def test_invite_therapist_success(mock_db, mock_platform_admin, mock_arq_pool):
     """Test successful therapist invitation.
 
     Validates:
@@ -182,6 +188,7 @@ async def test_invite_therapist_success(mock_db, mock_platform_admin):
             request_data=request_data,
             db=mock_db,
             admin=mock_platform_admin,
+            arq_pool=mock_arq_pool,
         )
 
         # Verify service was called correctly
@@ -201,7 +208,9 @@ async def test_invite_therapist_success(mock_db, mock_platform_admin):
 
 
 @pytest.mark.asyncio
-async def test_invite_therapist_duplicate_email(mock_db, mock_platform_admin):
+async def test_invite_therapist_duplicate_email(
+    mock_db, mock_platform_admin, mock_arq_pool
+):
     """Test invitation with duplicate email returns 400.
 
     Validates:
@@ -230,6 +239,7 @@ async def test_invite_therapist_duplicate_email(mock_db, mock_platform_admin):
                 request_data=request_data,
                 db=mock_db,
                 admin=mock_platform_admin,
+                arq_pool=mock_arq_pool,
             )
 
         # Verify HTTP 400 Bad Request
@@ -292,7 +302,9 @@ async def test_invite_therapist_empty_full_name():
 
 
 @pytest.mark.asyncio
-async def test_invite_therapist_value_error(mock_db, mock_platform_admin):
+async def test_invite_therapist_value_error(
+    mock_db, mock_platform_admin, mock_arq_pool
+):
     """Test invitation with ValueError from service returns 422."""
     request_data = InviteTherapistRequest(
         workspace_name="Test Workspace",
@@ -315,6 +327,7 @@ async def test_invite_therapist_value_error(mock_db, mock_platform_admin):
                 request_data=request_data,
                 db=mock_db,
                 admin=mock_platform_admin,
+                arq_pool=mock_arq_pool,
             )
 
         # Verify HTTP 422 Unprocessable Entity
@@ -327,7 +340,7 @@ async def test_invite_therapist_value_error(mock_db, mock_platform_admin):
 
 
 @pytest.mark.asyncio
-async def test_resend_invitation_success(mock_db, mock_platform_admin):
+async def test_resend_invitation_success(mock_db, mock_platform_admin, mock_arq_pool):
     """Test successful invitation resend.
 
     Validates:
@@ -351,6 +364,7 @@ async def test_resend_invitation_success(mock_db, mock_platform_admin):
             user_id=user_id,
             db=mock_db,
             admin=mock_platform_admin,
+            arq_pool=mock_arq_pool,
         )
 
         # Verify service was called correctly
@@ -366,7 +380,9 @@ async def test_resend_invitation_success(mock_db, mock_platform_admin):
 
 
 @pytest.mark.asyncio
-async def test_resend_invitation_user_not_found(mock_db, mock_platform_admin):
+async def test_resend_invitation_user_not_found(
+    mock_db, mock_platform_admin, mock_arq_pool
+):
     """Test resend invitation for non-existent user returns 404.
 
     Validates:
@@ -391,6 +407,7 @@ async def test_resend_invitation_user_not_found(mock_db, mock_platform_admin):
                 user_id=user_id,
                 db=mock_db,
                 admin=mock_platform_admin,
+                arq_pool=mock_arq_pool,
             )
 
         # Verify HTTP 404 Not Found
@@ -399,7 +416,9 @@ async def test_resend_invitation_user_not_found(mock_db, mock_platform_admin):
 
 
 @pytest.mark.asyncio
-async def test_resend_invitation_already_active(mock_db, mock_platform_admin):
+async def test_resend_invitation_already_active(
+    mock_db, mock_platform_admin, mock_arq_pool
+):
     """Test resend invitation for already active user returns 400.
 
     Validates:
@@ -424,6 +443,7 @@ async def test_resend_invitation_already_active(mock_db, mock_platform_admin):
                 user_id=user_id,
                 db=mock_db,
                 admin=mock_platform_admin,
+                arq_pool=mock_arq_pool,
             )
 
         # Verify HTTP 400 Bad Request
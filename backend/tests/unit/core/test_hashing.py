@@ -0,0 +1,67 @@
+"""Unit tests for the bounded Argon2 hashing executor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from pazpaz.core.hashing import HashingCapacityError, HashingExecutor
+from pazpaz.services.totp_service import hash_backup_codes, verify_backup_code
+
+
+@pytest.fixture
+def executor():
+    """Small hashing executor, shut down after the test."""
+    pool = HashingExecutor(max_workers=1, max_pending=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+class TestHashingExecutor:
+    """Test suite for HashingExecutor."""
+
+    async def test_runs_off_event_loop_thread(self, executor):
+        """Test that hashing runs on a pool thread, not the loop thread."""
+        loop_thread = threading.get_ident()
+
+        thread_id = await executor.run("test", threading.get_ident)
+
+        assert thread_id != loop_thread
+
+    async def test_backup_code_round_trip(self, executor):
+        """Test that backup codes hash and verify through the executor."""
+        hashed = await executor.run("hash", hash_backup_codes, ["ABC12345"])
+
+        is_valid, matched = await executor.run(
+            "verify", verify_backup_code, "ABC12345", hashed
+        )
+
+        assert is_valid is True
+        assert matched == hashed[0]
+
+    async def test_rejects_jobs_beyond_max_pending(self, executor):
+        """Test that the admission limit rejects instead of queueing."""
+        release = threading.Event()
+        blocked = [
+            asyncio.create_task(executor.run("test", release.wait)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(HashingCapacityError):
+            await executor.run("test", lambda: None)
+
+        release.set()
+        await asyncio.gather(*blocked)
+        assert executor.pending == 0
+
+    async def test_pending_released_on_error(self, executor):
+        """Test that a failing job frees its admission slot."""
+
+        def fail():
+            raise ValueError("bad hash")
+
+        with pytest.raises(ValueError):
+            await executor.run("test", fail)
+
+        assert executor.pending == 0
@@ -0,0 +1,67 @@
+"""Unit tests for the in-process presigned URL cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pazpaz.core import storage
+from pazpaz.core.storage import (
+    PRESIGNED_URL_CACHE_WINDOW_SECONDS,
+    clear_presigned_url_cache,
+    generate_presigned_url,
+)
+
+
+@pytest.fixture
+def s3_client():
+    """S3 client whose URLs record the call number."""
+    client = MagicMock()
+    client.generate_presigned_url.side_effect = lambda method, Params, ExpiresIn: (  # noqa: N803
+        f"https://s3/{Params['Key']}?n={client.generate_presigned_url.call_count}"
+    )
+    clear_presigned_url_cache()
+    with patch("pazpaz.core.storage.get_s3_client", return_value=client):
+        yield client
+    clear_presigned_url_cache()
+
+
+def test_download_urls_signed_once_per_window(s3_client):
+    """Test that repeated requests reuse the URL and extend its lifetime."""
+    with patch.object(storage.time, "time", return_value=1_000_000):
+        first = generate_presigned_url("a.jpg", expires_in=900)
+        assert generate_presigned_url("a.jpg", expires_in=900) == first
+        assert generate_presigned_url("b.jpg", expires_in=900) != first
+
+    assert s3_client.generate_presigned_url.call_count == 2
+    _, kwargs = s3_client.generate_presigned_url.call_args
+    assert kwargs["ExpiresIn"] == 900 + PRESIGNED_URL_CACHE_WINDOW_SECONDS
+
+
+def test_cache_keyed_by_expiry_and_disposition(s3_client):
+    """Test that different expirations and dispositions are signed separately."""
+    urls = {
+        generate_presigned_url("a.jpg", expires_in=900),
+        generate_presigned_url("a.jpg", expires_in=3600),
+        generate_presigned_url("a.jpg", expires_in=900, force_download=False),
+    }
+
+    assert len(urls) == 3
+
+
+def test_new_window_resigns(s3_client):
+    """Test that URLs are re-signed once the window has passed."""
+    with patch.object(storage.time, "time", return_value=1_000_000):
+        first = generate_presigned_url("a.jpg")
+    with patch.object(
+        storage.time,
+        "time",
+        return_value=1_000_000 + PRESIGNED_URL_CACHE_WINDOW_SECONDS,
+    ):
+        assert generate_presigned_url("a.jpg") != first
+
+
+def test_upload_urls_not_cached(s3_client):
+    """Test that non-download URLs are always signed fresh."""
+    first = generate_presigned_url("a.jpg", http_method="put_object")
+
+    assert generate_presigned_url("a.jpg", http_method="put_object") != first
@@ -0,0 +1,60 @@
+"""Unit tests for per-workspace metric rollups."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from pazpaz.monitoring import tenant_metrics
+from pazpaz.monitoring.tenant_metrics import (
+    flush_tenant_usage,
+    record_tenant_usage,
+    render_tenant_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_pending():
+    tenant_metrics._pending.clear()
+    yield
+    tenant_metrics._pending.clear()
+
+
+@pytest.mark.asyncio
+async def test_buffered_usage_is_flushed_in_one_batch(redis_client):
+    workspace_id = uuid.uuid4()
+
+    record_tenant_usage("appointments_created", workspace_id)
+    record_tenant_usage("appointments_created", workspace_id)
+
+    assert await flush_tenant_usage(redis_client) == 1
+    score = await redis_client.zscore(
+        tenant_metrics.TENANT_USAGE_KEY_PREFIX + "appointments_created",
+        str(workspace_id),
+    )
+    assert score == 2
+
+
+@pytest.mark.asyncio
+async def test_export_is_bounded_to_top_k_plus_other(redis_client):
+    workspaces = [uuid.uuid4() for _ in range(5)]
+    for count, workspace_id in enumerate(workspaces, start=1):
+        record_tenant_usage("ai_agent_queries", workspace_id, amount=count)
+    await flush_tenant_usage(redis_client)
+
+    payload = (await render_tenant_metrics(redis_client, top_k=2)).decode()
+
+    lines = [
+        line
+        for line in payload.splitlines()
+        if line.startswith("tenant_ai_agent_queries_total{")
+    ]
+    assert len(lines) == 3
+    assert f'workspace_id="{workspaces[4]}"' in payload
+    assert 'tenant_ai_agent_queries_total{workspace_id="other"} 6.0' in payload
+
+
+def test_unknown_metric_is_rejected():
+    with pytest.raises(ValueError):
+        record_tenant_usage("not_a_metric", uuid.uuid4())
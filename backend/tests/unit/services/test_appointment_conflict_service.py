@@ -0,0 +1,101 @@
+"""Unit tests for batch appointment conflict detection."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from pazpaz.schemas.appointment import BatchConflictCheckRequest
+from pazpaz.services.appointment_conflict_service import (
+    ProposedInterval,
+    find_conflicts,
+    find_overlapping_intervals,
+)
+
+BASE = datetime(2026, 3, 2, 9, 0, tzinfo=UTC)
+
+
+def slot(start_hours: float, end_hours: float) -> ProposedInterval:
+    return ProposedInterval(
+        BASE + timedelta(hours=start_hours), BASE + timedelta(hours=end_hours)
+    )
+
+
+def test_find_overlapping_intervals():
+    intervals = [slot(0, 1), slot(1, 2), slot(0.5, 1.5), slot(5, 6), slot(0, 6)]
+
+    assert find_overlapping_intervals(intervals) == [
+        [2, 4],
+        [2, 4],
+        [0, 1, 4],
+        [4],
+        [0, 1, 2, 3],
+    ]
+
+
+def test_find_overlapping_intervals_back_to_back_series():
+    weekly = [slot(24 * 7 * week, 24 * 7 * week + 1) for week in range(10)]
+    back_to_back = [slot(hour, hour + 1) for hour in range(8)]
+
+    assert all(not overlaps for overlaps in find_overlapping_intervals(weekly))
+    assert all(not overlaps for overlaps in find_overlapping_intervals(back_to_back))
+
+
+def test_mixed_naive_and_aware_batch_is_normalized_to_utc():
+    request = BatchConflictCheckRequest.model_validate(
+        {
+            "intervals": [
+                {
+                    "scheduled_start": "2026-03-02T09:00:00",
+                    "scheduled_end": "2026-03-02T10:00:00",
+                },
+                {
+                    "scheduled_start": "2026-03-02T09:30:00+00:00",
+                    "scheduled_end": datetime(2026, 3, 2, 11, 0),
+                },
+            ]
+        }
+    )
+
+    intervals = [
+        ProposedInterval(interval.scheduled_start, interval.scheduled_end)
+        for interval in request.intervals
+    ]
+    assert all(
+        value.tzinfo is not None
+        for interval in intervals
+        for value in (interval.scheduled_start, interval.scheduled_end)
+    )
+    assert intervals[0].scheduled_start == BASE
+    assert find_overlapping_intervals(intervals) == [[1], [0]]
+
+
+async def test_find_conflicts_single_query_for_batch():
+    statements = []
+
+    class FakeResult:
+        def all(self):
+            return []
+
+    class FakeSession:
+        async def execute(self, statement):
+            statements.append(statement)
+            return FakeResult()
+
+    intervals = [slot(week * 168, week * 168 + 1) for week in range(52)]
+    conflicts = await find_conflicts(
+        FakeSession(), uuid.uuid4(), intervals, exclude_appointment_ids=[uuid.uuid4()]
+    )
+
+    assert conflicts == [[] for _ in intervals]
+    assert len(statements) == 1
+    sql = str(statements[0].compile(dialect=asyncpg.dialect()))
+    assert "FROM (VALUES" in sql
+    assert "appointments.time_range && tstzrange(" in sql
+    assert "appointments.status IN ('SCHEDULED', 'ATTENDED')" in sql
+
+
+async def test_find_conflicts_empty_batch_skips_query():
+    assert await find_conflicts(None, uuid.uuid4(), []) == []
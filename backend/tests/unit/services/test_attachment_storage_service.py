@@ -0,0 +1,154 @@
+"""Unit tests for content-addressed attachment storage."""
+
+from __future__ import annotations
+
+import hashlib
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.models.client import Client
+from pazpaz.models.session_attachment import SessionAttachment
+from pazpaz.models.workspace import Workspace
+from pazpaz.services.attachment_storage_service import (
+    release_attachment_content,
+    store_attachment_content,
+)
+from pazpaz.utils.file_sanitization import SanitizedFile
+from pazpaz.utils.file_validation import FileType
+
+pytestmark = pytest.mark.asyncio
+
+CONSENT_FORM = b"%PDF-1.4 consent form"
+
+
+def _processed(content: bytes = CONSENT_FORM) -> SanitizedFile:
+    return SanitizedFile(
+        file_type=FileType.PDF,
+        content=content,
+        filename="consent.pdf",
+        content_sha256=hashlib.sha256(content).hexdigest(),
+    )
+
+
+@pytest.fixture
+def mock_upload():
+    """Mock S3 upload (content is never actually stored)."""
+    with patch(
+        "pazpaz.services.attachment_storage_service.upload_file_to_s3"
+    ) as upload:
+        upload.return_value = {"encryption_metadata": {"algorithm": "AES256"}}
+        yield upload
+
+
+async def _attach(
+    db: AsyncSession, workspace: Workspace, client: Client, content: bytes
+) -> tuple[SessionAttachment, bool]:
+    processed = _processed(content)
+    blob, created = await store_attachment_content(
+        db, workspace.id, processed, client_id=client.id
+    )
+    attachment = SessionAttachment(
+        client_id=client.id,
+        workspace_id=workspace.id,
+        file_name=processed.filename,
+        file_type=processed.file_type.value,
+        file_size_bytes=len(content),
+        s3_key=blob.s3_key,
+        blob_id=blob.id,
+    )
+    db.add(attachment)
+    await db.commit()
+    return attachment, created
+
+
+async def test_identical_content_stored_and_counted_once(
+    db_session: AsyncSession,
+    workspace_1: Workspace,
+    sample_client_ws1: Client,
+    mock_upload,
+):
+    """Test that a repeated document reuses the stored object and quota."""
+    initial_usage = workspace_1.storage_used_bytes
+
+    first, first_created = await _attach(
+        db_session, workspace_1, sample_client_ws1, CONSENT_FORM
+    )
+    second, second_created = await _attach(
+        db_session, workspace_1, sample_client_ws1, CONSENT_FORM
+    )
+
+    assert (first_created, second_created) == (True, False)
+    assert mock_upload.call_count == 1
+    assert first.s3_key == second.s3_key
+    assert first.blob_id == second.blob_id
+
+    await db_session.refresh(workspace_1)
+    assert workspace_1.storage_used_bytes == initial_usage + len(CONSENT_FORM)
+
+
+async def test_quota_released_with_last_reference(
+    db_session: AsyncSession,
+    workspace_1: Workspace,
+    sample_client_ws1: Client,
+    mock_upload,
+):
+    """Test that deleting releases quota only when no attachment uses the blob."""
+    initial_usage = workspace_1.storage_used_bytes
+    first, _ = await _attach(db_session, workspace_1, sample_client_ws1, CONSENT_FORM)
+    second, _ = await _attach(db_session, workspace_1, sample_client_ws1, CONSENT_FORM)
+
+    assert await release_attachment_content(db_session, first) == 0
+    await db_session.commit()
+    assert await release_attachment_content(db_session, second) == len(CONSENT_FORM)
+    await db_session.commit()
+
+    await db_session.refresh(workspace_1)
+    assert workspace_1.storage_used_bytes == initial_usage
+
+    # Uploading the content again reuses the object and reserves quota again
+    _, created = await _attach(db_session, workspace_1, sample_client_ws1, CONSENT_FORM)
+    assert created is False
+    assert mock_upload.call_count == 1
+    await db_session.refresh(workspace_1)
+    assert workspace_1.storage_used_bytes == initial_usage + len(CONSENT_FORM)
+
+
+async def test_different_content_not_shared(
+    db_session: AsyncSession,
+    workspace_1: Workspace,
+    sample_client_ws1: Client,
+    mock_upload,
+):
+    """Test that different files get their own objects."""
+    first, _ = await _attach(db_session, workspace_1, sample_client_ws1, b"%PDF a")
+    second, _ = await _attach(db_session, workspace_1, sample_client_ws1, b"%PDF b")
+
+    assert first.blob_id != second.blob_id
+    assert mock_upload.call_count == 2
+
+
+async def test_legacy_attachment_releases_own_size(
+    db_session: AsyncSession,
+    workspace_1: Workspace,
+    sample_client_ws1: Client,
+):
+    """Test that attachments stored before deduplication release their size."""
+    workspace_1.storage_used_bytes = 5000
+    attachment = SessionAttachment(
+        client_id=sample_client_ws1.id,
+        workspace_id=workspace_1.id,
+        file_name="old.pdf",
+        file_type="application/pdf",
+        file_size_bytes=1200,
+        s3_key="workspaces/w/clients/c/attachments/old.pdf",
+    )
+    db_session.add(attachment)
+    await db_session.commit()
+
+    assert await release_attachment_content(db_session, attachment) == 1200
+    await db_session.commit()
+
+    await db_session.refresh(workspace_1)
+    assert workspace_1.storage_used_bytes == 3800
@@ -0,0 +1,184 @@
+"""Unit tests for direct-to-storage attachment uploads."""
+
+import io
+import uuid
+
+import pytest
+from botocore.exceptions import ClientError
+
+from pazpaz.services.attachment_upload_service import (
+    ATTACHMENT_UPLOAD_KEY,
+    ATTACHMENT_UPLOAD_TTL_SECONDS,
+    QUARANTINE_PREFIX,
+    AttachmentUploadRejectedError,
+    AttachmentUploadStatus,
+    _update_upload,
+    create_attachment_upload,
+    finalize_attachment_upload,
+    get_attachment_upload,
+    read_quarantined_upload,
+    submit_attachment_upload,
+)
+from pazpaz.utils.file_validation import (
+    MAX_FILE_SIZE_BYTES,
+    FileSizeExceededError,
+    UnsupportedFileTypeError,
+)
+
+pytestmark = pytest.mark.asyncio
+
+WORKSPACE_ID = uuid.uuid4()
+
+
+class FakeS3Client:
+    """In-memory stand-in for the S3 object API used by the upload service."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+
+    def _get(self, key: str) -> bytes:
+        if key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return self.objects[key]
+
+    def head_object(self, Bucket, Key):  # noqa: N803
+        return {"ContentLength": len(self._get(Key))}
+
+    def get_object(self, Bucket, Key):  # noqa: N803
+        return {"Body": io.BytesIO(self._get(Key))}
+
+    def delete_object(self, Bucket, Key):  # noqa: N803
+        self.objects.pop(Key, None)
+
+
+class FakeDB:
+    """Session stand-in; rejected uploads never reach the database."""
+
+    def __init__(self):
+        self.rolled_back = False
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+async def _create_upload(redis_client, filename="scan.jpg", size_bytes=1024):
+    upload, url, headers = await create_attachment_upload(
+        redis_client,
+        workspace_id=WORKSPACE_ID,
+        user_id=uuid.uuid4(),
+        client_id=uuid.uuid4(),
+        session_id=uuid.uuid4(),
+        filename=filename,
+        content_type="image/jpeg",
+        size_bytes=size_bytes,
+    )
+    return upload, url, headers
+
+
+async def test_create_upload_presigns_quarantine_key(redis_client):
+    """Test that an upload is registered as pending with a quarantine URL."""
+    upload, url, headers = await _create_upload(redis_client)
+
+    assert upload.status == AttachmentUploadStatus.PENDING
+    assert upload.object_key.startswith(f"{QUARANTINE_PREFIX}/workspaces/")
+    assert upload.object_key.split("/", 1)[1] in url
+    assert headers["Content-Type"] == "image/jpeg"
+
+    assert await get_attachment_upload(redis_client, upload.id, WORKSPACE_ID)
+    # Other workspaces cannot see it
+    assert await get_attachment_upload(redis_client, upload.id, uuid.uuid4()) is None
+
+
+async def test_create_upload_rejects_invalid_declaration(redis_client):
+    """Test that disallowed types and oversized declarations are refused."""
+    with pytest.raises(UnsupportedFileTypeError):
+        await _create_upload(redis_client, filename="payload.exe")
+
+    with pytest.raises(FileSizeExceededError):
+        await _create_upload(redis_client, size_bytes=MAX_FILE_SIZE_BYTES + 1)
+
+
+async def test_submit_is_idempotent(redis_client):
+    """Test that only the first completion call enqueues processing."""
+    upload, _, _ = await _create_upload(redis_client)
+
+    assert await submit_attachment_upload(redis_client, upload.id) is True
+    assert await submit_attachment_upload(redis_client, upload.id) is False
+
+    upload = await get_attachment_upload(redis_client, upload.id)
+    assert upload.status == AttachmentUploadStatus.PROCESSING
+
+
+async def test_expired_upload_is_not_recreated(redis_client):
+    """Test that state changes after expiry do not leave a partial hash."""
+    upload, _, _ = await _create_upload(redis_client)
+    key = ATTACHMENT_UPLOAD_KEY.format(upload_id=upload.id)
+    await redis_client.delete(key)
+
+    assert await submit_attachment_upload(redis_client, upload.id) is False
+    assert (
+        await _update_upload(
+            redis_client, upload.id, status=AttachmentUploadStatus.FAILED.value
+        )
+        is False
+    )
+    assert not await redis_client.exists(key)
+    assert await get_attachment_upload(redis_client, upload.id) is None
+
+
+async def test_state_changes_renew_ttl(redis_client):
+    """Test that submitting and updating an upload renew its expiry."""
+    upload, _, _ = await _create_upload(redis_client)
+    key = ATTACHMENT_UPLOAD_KEY.format(upload_id=upload.id)
+
+    await redis_client.expire(key, 5)
+    await submit_attachment_upload(redis_client, upload.id)
+    assert await redis_client.ttl(key) > ATTACHMENT_UPLOAD_TTL_SECONDS - 5
+
+    await redis_client.expire(key, 5)
+    await _update_upload(
+        redis_client, upload.id, status=AttachmentUploadStatus.COMPLETED.value
+    )
+    assert await redis_client.ttl(key) > ATTACHMENT_UPLOAD_TTL_SECONDS - 5
+
+
+async def test_read_quarantined_upload_checks_declaration(redis_client):
+    """Test that missing and size-mismatched objects are rejected."""
+    upload, _, _ = await _create_upload(redis_client, size_bytes=4)
+    s3_client = FakeS3Client()
+
+    with pytest.raises(AttachmentUploadRejectedError, match="not uploaded"):
+        read_quarantined_upload(s3_client, upload)
+
+    s3_client.objects[upload.object_key] = b"much larger than declared"
+    with pytest.raises(AttachmentUploadRejectedError, match="declared size"):
+        read_quarantined_upload(s3_client, upload)
+
+    s3_client.objects[upload.object_key] = b"data"
+    assert read_quarantined_upload(s3_client, upload) == b"data"
+
+
+async def test_finalize_rejects_invalid_content(redis_client):
+    """Test that a file failing validation fails the upload and is deleted."""
+    content = b"not actually a jpeg"
+    upload, _, _ = await _create_upload(redis_client, size_bytes=len(content))
+    await submit_attachment_upload(redis_client, upload.id)
+    s3_client = FakeS3Client()
+    s3_client.objects[upload.object_key] = content
+    db = FakeDB()
+
+    result = await finalize_attachment_upload(
+        redis_client, db, upload.id, s3_client=s3_client
+    )
+
+    assert result.status == AttachmentUploadStatus.FAILED
+    assert result.error
+    assert result.attachment_id is None
+    assert db.rolled_back
+    assert upload.object_key not in s3_client.objects
+
+    # Finished uploads are not processed again
+    again = await finalize_attachment_upload(
+        redis_client, db, upload.id, s3_client=s3_client
+    )
+    assert again == result
@@ -0,0 +1,96 @@
+"""Unit tests for audit_events partition maintenance helpers."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from pazpaz.models.audit_event import AuditEvent
+from pazpaz.services.audit_partition_service import (
+    AuditArchiveError,
+    AuditPartition,
+    add_months,
+    month_start,
+    upload_archive,
+    utc_bound,
+)
+
+
+class TestPartitionNaming:
+    """Partition names, bounds and archive keys."""
+
+    def test_month_bounds_and_name(self):
+        partition = AuditPartition(month_start(datetime(2025, 12, 31, 23, tzinfo=UTC)))
+
+        assert partition.name == "audit_events_y2025m12"
+        assert partition.start == date(2025, 12, 1)
+        assert partition.end == date(2026, 1, 1)
+        assert (
+            partition.archive_key == "audit-archive/2025/audit_events_y2025m12.jsonl.gz"
+        )
+
+    def test_from_name_round_trip(self):
+        assert AuditPartition.from_name("audit_events_y2024m02") == AuditPartition(
+            date(2024, 2, 1)
+        )
+        assert AuditPartition.from_name("audit_events_default") is None
+        assert AuditPartition.from_name("audit_events_y2024m02_old") is None
+
+    def test_bounds_are_utc(self):
+        # 01:30 on Jan 1 in UTC+3 is still December in UTC
+        local = datetime(2026, 1, 1, 1, 30, tzinfo=timezone(timedelta(hours=3)))
+
+        assert month_start(local) == date(2025, 12, 1)
+        assert utc_bound(date(2025, 12, 1)) == "2025-12-01 00:00:00+00"
+
+    def test_add_months_crosses_years(self):
+        assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 1), -13) == date(2023, 12, 1)
+
+
+class TestModelDDL:
+    """The model emits a range-partitioned table."""
+
+    def test_partitioned_by_created_at_with_composite_key(self):
+        ddl = str(
+            CreateTable(AuditEvent.__table__).compile(dialect=postgresql.dialect())
+        )
+
+        assert "PARTITION BY RANGE (created_at)" in ddl
+        assert "PRIMARY KEY (id, created_at)" in ddl
+
+
+class TestUploadArchive:
+    """Archives are verified after upload."""
+
+    def _upload(self, tmp_path, head):
+        path = tmp_path / "partition.jsonl.gz"
+        path.write_bytes(b"0123456789")
+        s3_client = MagicMock()
+        s3_client.head_object.return_value = head
+
+        with patch(
+            "pazpaz.services.audit_partition_service.get_s3_client",
+            return_value=s3_client,
+        ):
+            upload_archive(AuditPartition(date(2024, 5, 1)), str(path), 3, "abc")
+        return s3_client
+
+    def test_uploads_encrypted_with_metadata(self, tmp_path):
+        s3_client = self._upload(
+            tmp_path, {"ContentLength": 10, "Metadata": {"sha256": "abc"}}
+        )
+
+        _, _, key = s3_client.upload_file.call_args.args
+        extra_args = s3_client.upload_file.call_args.kwargs["ExtraArgs"]
+        assert key == "audit-archive/2024/audit_events_y2024m05.jsonl.gz"
+        assert extra_args["ServerSideEncryption"] == "AES256"
+        assert extra_args["Metadata"]["row-count"] == "3"
+
+    def test_mismatched_object_raises(self, tmp_path):
+        with pytest.raises(AuditArchiveError):
+            self._upload(tmp_path, {"ContentLength": 9, "Metadata": {"sha256": "abc"}})
@@ -0,0 +1,87 @@
+"""Unit tests for free/busy availability."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from pazpaz.services.availability_service import (
+    TimeInterval,
+    get_busy_intervals,
+    get_free_intervals,
+    get_open_slots,
+    merge_intervals,
+)
+
+DAY = datetime(2026, 3, 2, 8, 0, tzinfo=UTC)
+
+
+def at(hours: float) -> datetime:
+    return DAY + timedelta(hours=hours)
+
+
+def interval(start_hours: float, end_hours: float) -> TimeInterval:
+    return TimeInterval(at(start_hours), at(end_hours))
+
+
+def test_merge_intervals_merges_overlapping_and_touching():
+    merged = merge_intervals(
+        [interval(3, 4), interval(0, 1), interval(1, 2), interval(0.5, 1.5)]
+    )
+
+    assert merged == [interval(0, 2), interval(3, 4)]
+
+
+def test_merge_intervals_contained_interval():
+    assert merge_intervals([interval(0, 5), interval(1, 2)]) == [interval(0, 5)]
+
+
+def test_get_free_intervals():
+    busy = [interval(1, 2), interval(4, 5)]
+
+    assert get_free_intervals(busy, at(0), at(8)) == [
+        interval(0, 1),
+        interval(2, 4),
+        interval(5, 8),
+    ]
+    assert get_free_intervals([interval(0, 8)], at(0), at(8)) == []
+
+
+def test_get_open_slots_with_step_and_limit():
+    free = [interval(0, 2), interval(3, 3.5)]
+
+    assert get_open_slots(free, timedelta(hours=1)) == [
+        interval(0, 1),
+        interval(1, 2),
+    ]
+    assert get_open_slots(free, timedelta(minutes=30), timedelta(minutes=45)) == [
+        interval(0, 0.5),
+        interval(0.75, 1.25),
+        interval(1.5, 2),
+        interval(3, 3.5),
+    ]
+    assert len(get_open_slots(free, timedelta(minutes=30), limit=2)) == 2
+
+
+async def test_get_busy_intervals_clips_to_window_without_phi_columns():
+    statements = []
+
+    class FakeResult:
+        def all(self):
+            return [(at(-1), at(1)), (at(1), at(2)), (at(7), at(9))]
+
+    class FakeSession:
+        async def execute(self, statement):
+            statements.append(statement)
+            return FakeResult()
+
+    busy = await get_busy_intervals(FakeSession(), uuid.uuid4(), at(0), at(8))
+
+    assert busy == [interval(0, 2), interval(7, 8)]
+    sql = str(statements[0].compile(dialect=asyncpg.dialect()))
+    assert sql.startswith(
+        "SELECT appointments.scheduled_start, appointments.scheduled_end \nFROM"
+    )
+    assert "JOIN" not in sql
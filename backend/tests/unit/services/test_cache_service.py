@@ -1,11 +1,16 @@
 """Unit tests for AICacheService."""
 
 import uuid
+from unittest.mock import AsyncMock
 
 import pytest
 from redis.asyncio import Redis
 
-from pazpaz.services.cache_service import AICacheService
+from pazpaz.services.cache_service import (
+    AICacheService,
+    get_client_tag_key,
+    get_workspace_tag_key,
+)
 
 
 @pytest.mark.asyncio
@@ -28,8 +33,10 @@ class TestAICacheService:
         return uuid.uuid4()
 
     @pytest.fixture
-    async def seed_cache_keys(self, redis_client, test_workspace_id, test_client_id):
-        """Seed Redis with test cache keys."""
+    async def seed_cache_keys(
+        self, cache_service, redis_client, test_workspace_id, test_client_id
+    ):
+        """Seed Redis with tagged test cache keys."""
         # Create client-specific keys
         client_keys = [
             f"ai:query:{test_workspace_id}:hash1:{test_client_id}",
@@ -49,7 +56,13 @@ class TestAICacheService:
             f"ai:query:{other_workspace_id}:hash6",
         ]
 
-        # Set all keys
+        # Tag and set all keys
+        await cache_service.tag_keys(
+            test_workspace_id, test_client_id, client_keys, 300
+        )
+        await cache_service.tag_keys(test_workspace_id, None, workspace_keys, 300)
+        await cache_service.tag_keys(other_workspace_id, None, other_keys, 300)
+
         all_keys = client_keys + workspace_keys + other_keys
         for key in all_keys:
             await redis_client.set(key, '{"answer": "test"}')
@@ -174,25 +187,30 @@ class TestAICacheService:
 
         await invalid_redis.aclose()
 
-    async def test_cache_key_pattern_correctness(
+    async def test_cache_key_tag_correctness(
         self,
         redis_client,
         test_workspace_id,
         test_client_id,
     ):
-        """Test that cache key pattern matching works correctly."""
+        """Test that only keys tagged with the client are invalidated."""
         # Create keys with specific patterns
         key1 = f"ai:query:{test_workspace_id}:abc123:{test_client_id}"
         key2 = f"ai:query:{test_workspace_id}:def456:{test_client_id}"
         key3 = f"ai:query:{test_workspace_id}:ghi789"  # No client_id
 
+        # Create service
+        cache_service = AICacheService(redis_client)
+
+        await cache_service.tag_keys(
+            test_workspace_id, test_client_id, [key1, key2], 300
+        )
+        await cache_service.tag_keys(test_workspace_id, None, [key3], 300)
+
         await redis_client.set(key1, "test1")
         await redis_client.set(key2, "test2")
         await redis_client.set(key3, "test3")
 
-        # Create service
-        cache_service = AICacheService(redis_client)
-
         # Invalidate client queries
         deleted = await cache_service.invalidate_client_queries(
             workspace_id=test_workspace_id,
@@ -204,3 +222,106 @@ class TestAICacheService:
 
         # Cleanup
         await redis_client.delete(key3)
+
+    async def test_invalidation_clears_semantic_cache_scopes(
+        self,
+        cache_service,
+        redis_client,
+        test_workspace_id,
+        test_client_id,
+    ):
+        """Test that client and workspace invalidation clear semantic scopes."""
+        client_scope = f"ai:semantic:{test_workspace_id}:{test_client_id}"
+        workspace_scope = f"ai:semantic:{test_workspace_id}:workspace"
+        other_client_id = uuid.uuid4()
+        other_client_scope = f"ai:semantic:{test_workspace_id}:{other_client_id}"
+        await cache_service.tag_keys(
+            test_workspace_id, test_client_id, [client_scope], 300
+        )
+        await cache_service.tag_keys(test_workspace_id, None, [workspace_scope], 300)
+        await cache_service.tag_keys(
+            test_workspace_id, other_client_id, [other_client_scope], 300
+        )
+        for key in (client_scope, workspace_scope, other_client_scope):
+            await redis_client.hset(key, "hash1", "{}")
+
+        # Client invalidation drops the client scope and workspace-wide scope
+        deleted = await cache_service.invalidate_client_queries(
+            workspace_id=test_workspace_id,
+            client_id=test_client_id,
+        )
+        assert deleted == 2
+        assert await redis_client.exists(other_client_scope) == 1
+
+        # Workspace invalidation drops every remaining scope
+        deleted = await cache_service.invalidate_workspace_queries(
+            workspace_id=test_workspace_id,
+        )
+        assert deleted == 1
+        assert await redis_client.exists(other_client_scope) == 0
+
+    async def test_invalidation_does_not_scan_keyspace(
+        self,
+        cache_service,
+        redis_client,
+        test_workspace_id,
+        test_client_id,
+    ):
+        """Test that invalidation never issues SCAN (cost independent of cache size)."""
+        key = f"ai:query:{test_workspace_id}:abc123:{test_client_id}"
+        await cache_service.tag_keys(test_workspace_id, test_client_id, [key], 300)
+        await redis_client.set(key, "test")
+
+        redis_client.scan = AsyncMock(side_effect=AssertionError("SCAN used"))
+
+        assert (
+            await cache_service.invalidate_client_queries(
+                workspace_id=test_workspace_id, client_id=test_client_id
+            )
+            == 1
+        )
+        assert (
+            await cache_service.invalidate_workspace_queries(
+                workspace_id=test_workspace_id
+            )
+            == 0
+        )
+
+    async def test_tags_expire_with_entries(
+        self,
+        cache_service,
+        redis_client,
+        test_workspace_id,
+        test_client_id,
+    ):
+        """Test that tag sets get the entry TTL so they do not leak."""
+        await cache_service.tag_keys(
+            test_workspace_id, test_client_id, ["ai:query:x"], 300
+        )
+
+        assert (
+            0 < await redis_client.ttl(get_workspace_tag_key(test_workspace_id)) <= 300
+        )
+        assert (
+            0
+            < await redis_client.ttl(
+                get_client_tag_key(test_workspace_id, test_client_id)
+            )
+            <= 300
+        )
+
+    async def test_tag_ttl_never_shortened(
+        self,
+        cache_service,
+        redis_client,
+        test_workspace_id,
+    ):
+        """Test that tagging a short-lived entry keeps the longer tag TTL."""
+        tag_key = get_workspace_tag_key(test_workspace_id)
+
+        await cache_service.tag_keys(test_workspace_id, None, ["ai:query:a"], 3600)
+        await cache_service.tag_keys(test_workspace_id, None, ["ai:query:b"], 60)
+        assert await redis_client.ttl(tag_key) > 60
+
+        await cache_service.tag_keys(test_workspace_id, None, ["ai:query:c"], 7200)
+        assert await redis_client.ttl(tag_key) > 3600
@@ -0,0 +1,225 @@
+"""Unit tests for the session draft write-behind buffer."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from pazpaz.services.draft_buffer_service import (
+    DRAFT_FLUSH_INTERVAL_SECONDS,
+    SessionDraftBuffer,
+    apply_buffered_draft,
+    flush_buffered_draft,
+    get_draft_buffer_key,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def _session(version: int = 1, finalized: bool = False) -> SimpleNamespace:
+    """Stand-in for a Session row with the fields the buffer touches."""
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+        version=version,
+        subjective="original",
+        objective=None,
+        assessment=None,
+        plan=None,
+        duration_minutes=None,
+        draft_last_saved_at=None,
+        is_draft=not finalized,
+        finalized_at=time.time() if finalized else None,
+    )
+
+
+async def test_saves_coalesce_and_bump_version(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session(version=3)
+
+    await buffer.save(session, {"subjective": "first"})
+    draft, flush_due = await buffer.save(session, {"plan": "second"})
+
+    assert draft.version == 5
+    assert draft.base_version == 3
+    assert draft.fields == {"subjective": "first", "plan": "second"}
+    assert flush_due is False
+    assert session.subjective == "original"
+
+
+async def test_buffer_is_encrypted_in_redis(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session()
+
+    await buffer.save(session, {"subjective": "patient reports shoulder pain"})
+
+    raw = await redis_client.get(get_draft_buffer_key(session.id))
+    assert raw.startswith("v")
+    assert "shoulder" not in raw
+
+
+async def test_flush_due_after_interval(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session()
+
+    draft, _ = await buffer.save(session, {"subjective": "a"})
+    draft.first_buffered_at -= DRAFT_FLUSH_INTERVAL_SECONDS
+    await redis_client.set(get_draft_buffer_key(session.id), buffer._encode(draft))
+
+    _, flush_due = await buffer.save(session, {"subjective": "b"})
+
+    assert flush_due is True
+
+
+async def test_apply_rejects_stale_buffer(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session(version=1)
+    draft, _ = await buffer.save(session, {"subjective": "buffered"})
+
+    session.version = 2  # written elsewhere after the buffer started
+
+    assert apply_buffered_draft(session, draft) is False
+    assert session.subjective == "original"
+
+
+async def test_flush_applies_and_clear_removes_buffer(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session(version=1)
+    await buffer.save(session, {"subjective": "buffered"})
+
+    draft = await flush_buffered_draft(redis_client, session)
+
+    assert session.subjective == "buffered"
+    assert session.version == 2
+    assert session.is_draft is True
+    assert await buffer.clear(draft) is True
+    assert await buffer.get(session.id) is None
+    assert await buffer.get_idle(idle_seconds=0) == []
+
+
+async def test_clear_keeps_newer_save(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session(version=1)
+    flushed, _ = await buffer.save(session, {"subjective": "flushed"})
+    await buffer.save(session, {"subjective": "newer"})
+
+    assert await buffer.clear(flushed) is False
+
+    remaining = await buffer.get(session.id)
+    assert remaining.fields["subjective"] == "newer"
+    assert remaining.base_version == flushed.version
+
+
+async def test_save_during_flush_keeps_buffered_fields(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    row = _session(version=1)
+    await buffer.save(row, {"subjective": "first"})
+    await buffer.save(row, {"plan": "second"})
+
+    # Worker flush commits the buffer (row now at version 3) ...
+    flushed = await flush_buffered_draft(redis_client, row)
+    assert row.version == 3
+
+    # ... and a save lands before the flush clears the buffer
+    draft, _ = await buffer.save(row, {"objective": "third"})
+    assert draft.version == 4
+    assert draft.fields == {
+        "subjective": "first",
+        "plan": "second",
+        "objective": "third",
+    }
+
+    assert await buffer.clear(flushed) is False
+    remaining = await buffer.get(row.id)
+    assert remaining.base_version == 3
+    assert apply_buffered_draft(row, remaining) is True
+    assert row.objective == "third"
+    assert row.version == 4
+
+
+async def test_save_with_row_read_before_flush(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    row = _session(version=1)
+    stale = SimpleNamespace(**vars(row))
+    await buffer.save(row, {"subjective": "first"})
+    await buffer.save(row, {"subjective": "second"})
+    await buffer.save(row, {"plan": "third"})
+
+    # Flush commits version 4 after the request read the row at version 1
+    flushed = await flush_buffered_draft(redis_client, row)
+    await buffer.save(row, {"assessment": "fourth"})
+    await buffer.clear(flushed)
+
+    draft, _ = await buffer.save(stale, {"objective": "fifth"})
+
+    # Continues the rebased buffer: no fields dropped, version never goes back
+    assert draft.version == 6
+    assert draft.base_version == 4
+    assert set(draft.fields) == {"subjective", "plan", "assessment", "objective"}
+    assert apply_buffered_draft(row, draft) is True
+
+
+async def test_save_restarts_buffer_overtaken_by_direct_write(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    row = _session(version=1)
+    await buffer.save(row, {"subjective": "buffered"})
+
+    row.version = 5  # written without the buffer
+
+    draft, _ = await buffer.save(row, {"plan": "new"})
+
+    assert draft.base_version == 5
+    assert draft.version == 6
+    assert draft.fields == {"plan": "new"}
+
+
+async def test_discard_keeps_newer_save(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session(version=1)
+    stale, _ = await buffer.save(session, {"subjective": "stale"})
+    await buffer.save(session, {"subjective": "newer"})
+
+    assert await buffer.discard(session.id, session.workspace_id, stale) is False
+    assert (await buffer.get(session.id)).fields["subjective"] == "newer"
+
+    # A buffer saved after the caller found none is kept too
+    assert await buffer.discard(session.id, session.workspace_id, None) is False
+    assert await buffer.get_idle(idle_seconds=0) == [(session.workspace_id, session.id)]
+
+
+async def test_discard_removes_seen_draft(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session(version=1)
+    draft, _ = await buffer.save(session, {"subjective": "stale"})
+
+    assert await buffer.discard(session.id, session.workspace_id, draft) is True
+    assert await buffer.get(session.id) is None
+    assert await buffer.get_idle(idle_seconds=0) == []
+
+
+async def test_get_idle_and_get_many(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session()
+    other = _session()
+    await buffer.save(session, {"subjective": "x"})
+
+    assert await buffer.get_idle(idle_seconds=60) == []
+    assert await buffer.get_idle(idle_seconds=0) == [(session.workspace_id, session.id)]
+
+    drafts = await buffer.get_many([session.id, other.id])
+    assert list(drafts) == [session.id]
+
+
+async def test_overlay_keeps_finalized_status(redis_client):
+    buffer = SessionDraftBuffer(redis_client)
+    session = _session(finalized=True)
+    draft, _ = await buffer.save(session, {"plan": "amended"})
+
+    overlay = draft.response_overlay(is_finalized=True)
+
+    assert overlay["plan"] == "amended"
+    assert overlay["version"] == draft.version
+    assert "is_draft" not in overlay
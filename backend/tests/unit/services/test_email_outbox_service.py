@@ -0,0 +1,223 @@
+"""Unit tests for the transactional email outbox."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiosmtplib
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pazpaz.models.email_outbox import EmailKind, EmailOutbox, EmailOutboxStatus
+from pazpaz.services.email_outbox_service import (
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_MAX_SECONDS,
+    build_outbox_message,
+    deliver_pending_emails,
+    get_retry_delay,
+    queue_magic_link_email,
+)
+from pazpaz.services.email_service import send_email_batch
+
+
+def _db_with_rows(rows: list[EmailOutbox]) -> MagicMock:
+    """AsyncSession mock whose execute() returns the given outbox rows."""
+    db = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    db.execute = AsyncMock(return_value=result)
+    db.commit = AsyncMock()
+    return db
+
+
+def _row(
+    kind: EmailKind = EmailKind.MAGIC_LINK,
+    attempts: int = 0,
+    expires_at: datetime | None = None,
+) -> EmailOutbox:
+    """Pending outbox row with a valid payload for its kind."""
+    payload = (
+        {"email": "user@example.com", "token": "tok123"}
+        if kind == EmailKind.MAGIC_LINK
+        else {"email": "user@example.com", "invitation_url": "http://x/accept"}
+    )
+    return EmailOutbox(
+        id=uuid.uuid4(),
+        kind=kind,
+        payload=json.dumps(payload),
+        status=EmailOutboxStatus.PENDING,
+        attempts=attempts,
+        next_attempt_at=datetime.now(UTC),
+        expires_at=expires_at,
+    )
+
+
+class TestBuildOutboxMessage:
+    """Test outbox template rendering."""
+
+    def test_magic_link_message(self):
+        """Test that magic link payloads render the login email."""
+        message = build_outbox_message(
+            EmailKind.MAGIC_LINK, {"email": "user@example.com", "token": "tok123"}
+        )
+
+        assert message["To"] == "user@example.com"
+        assert "tok123" in message.get_body(("plain",)).get_content()
+
+    def test_invitation_message(self):
+        """Test that invitation payloads render the invitation email."""
+        message = build_outbox_message(
+            EmailKind.INVITATION,
+            {"email": "new@example.com", "invitation_url": "http://x/accept"},
+        )
+
+        assert message["Subject"] == "Invitation to Join PazPaz"
+        assert "http://x/accept" in message.get_content()
+
+
+class TestRetryDelay:
+    """Test exponential retry backoff."""
+
+    def test_backoff_doubles_and_caps(self):
+        """Test that delays double per attempt up to the cap."""
+        assert get_retry_delay(2) == 2 * get_retry_delay(1)
+        assert get_retry_delay(50) == timedelta(seconds=OUTBOX_RETRY_MAX_SECONDS)
+
+
+@pytest.mark.asyncio
+class TestQueueEmail:
+    """Test queuing emails into the outbox."""
+
+    async def test_magic_link_upserts_on_pending_dedupe_key(self):
+        """Test that a pending magic link for the same user is replaced."""
+        db = _db_with_rows([])
+        user_id = uuid.uuid4()
+
+        await queue_magic_link_email(
+            db, user_id=user_id, email="u@example.com", token="t", expires_in=600
+        )
+
+        statement = db.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (dedupe_key) WHERE status = 'PENDING'" in sql
+        assert "DO UPDATE SET payload = excluded.payload" in sql
+        db.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestDeliverPendingEmails:
+    """Test draining the outbox."""
+
+    async def test_sends_batch_and_marks_sent(self):
+        """Test that due emails are sent in one batch and marked SENT."""
+        rows = [_row(), _row(EmailKind.INVITATION)]
+        db = _db_with_rows(rows)
+
+        with patch(
+            "pazpaz.services.email_outbox_service.send_email_batch",
+            AsyncMock(return_value=[None, None]),
+        ) as send_batch:
+            stats = await deliver_pending_emails(db)
+
+        assert stats["sent"] == 2
+        assert len(send_batch.await_args.args[0]) == 2
+        assert all(row.status == EmailOutboxStatus.SENT for row in rows)
+        assert all(row.sent_at is not None for row in rows)
+        db.commit.assert_awaited_once()
+
+    async def test_failed_send_is_rescheduled(self):
+        """Test that a failed send is retried later with backoff."""
+        row = _row()
+        db = _db_with_rows([row])
+
+        with patch(
+            "pazpaz.services.email_outbox_service.send_email_batch",
+            AsyncMock(return_value=[aiosmtplib.SMTPException("busy")]),
+        ):
+            stats = await deliver_pending_emails(db)
+
+        assert stats["retried"] == 1
+        assert row.status == EmailOutboxStatus.PENDING
+        assert row.attempts == 1
+        assert row.next_attempt_at > datetime.now(UTC)
+        assert row.last_error == "busy"
+
+    async def test_gives_up_after_max_attempts(self):
+        """Test that the final failed attempt marks the email FAILED."""
+        row = _row(attempts=OUTBOX_MAX_ATTEMPTS - 1)
+        db = _db_with_rows([row])
+
+        with patch(
+            "pazpaz.services.email_outbox_service.send_email_batch",
+            AsyncMock(return_value=[aiosmtplib.SMTPException("rejected")]),
+        ):
+            stats = await deliver_pending_emails(db)
+
+        assert stats["failed"] == 1
+        assert row.status == EmailOutboxStatus.FAILED
+
+    async def test_expired_email_not_sent(self):
+        """Test that an expired magic link is dropped instead of sent."""
+        row = _row(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        db = _db_with_rows([row])
+
+        with patch(
+            "pazpaz.services.email_outbox_service.send_email_batch",
+            AsyncMock(return_value=[]),
+        ) as send_batch:
+            stats = await deliver_pending_emails(db)
+
+        assert stats["expired"] == 1
+        assert row.status == EmailOutboxStatus.FAILED
+        assert send_batch.await_args.args[0] == []
+
+
+@pytest.mark.asyncio
+class TestSendEmailBatch:
+    """Test batched SMTP delivery."""
+
+    async def test_one_connection_per_batch(self):
+        """Test that a batch reuses one SMTP connection."""
+        messages = [
+            build_outbox_message(
+                EmailKind.MAGIC_LINK, {"email": f"u{i}@example.com", "token": "t"}
+            )
+            for i in range(3)
+        ]
+
+        with patch("pazpaz.services.email_service.aiosmtplib.SMTP") as mock_smtp:
+            mock_smtp_instance = AsyncMock()
+            mock_smtp.return_value.__aenter__.return_value = mock_smtp_instance
+            mock_smtp_instance.send_message.side_effect = [
+                None,
+                aiosmtplib.SMTPRecipientsRefused([]),
+                None,
+            ]
+
+            errors = await send_email_batch(messages)
+
+        mock_smtp.assert_called_once()
+        assert errors[0] is None
+        assert isinstance(errors[1], aiosmtplib.SMTPRecipientsRefused)
+        assert errors[2] is None
+
+    async def test_connection_failure_fails_all(self):
+        """Test that an SMTP connection error is reported for every message."""
+        messages = [
+            build_outbox_message(
+                EmailKind.MAGIC_LINK, {"email": "u@example.com", "token": "t"}
+            )
+            for _ in range(2)
+        ]
+
+        with patch("pazpaz.services.email_service.aiosmtplib.SMTP") as mock_smtp:
+            mock_smtp.return_value.__aenter__.side_effect = ConnectionRefusedError()
+
+            errors = await send_email_batch(messages)
+
+        assert len(errors) == 2
+        assert all(isinstance(error, ConnectionRefusedError) for error in errors)
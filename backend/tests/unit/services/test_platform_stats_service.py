@@ -0,0 +1,60 @@
+"""Unit tests for the platform stats snapshot."""
+
+from __future__ import annotations
+
+import time
+import uuid
+
+import pytest
+
+from pazpaz.services.platform_stats_service import (
+    ACTIVE_WORKSPACE_WINDOW_SECONDS,
+    PLATFORM_STATS_KEY,
+    count_active_workspaces,
+    load_platform_stats,
+    record_workspace_activity,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_active_workspaces_counts_recent_writes_once(redis_client):
+    now = time.time()
+    recent, stale = uuid.uuid4(), uuid.uuid4()
+
+    await record_workspace_activity(redis_client, recent, now - 60)
+    await record_workspace_activity(redis_client, recent, now)
+    await record_workspace_activity(
+        redis_client, stale, now - ACTIVE_WORKSPACE_WINDOW_SECONDS - 1
+    )
+
+    assert await count_active_workspaces(redis_client, now) == 1
+
+
+async def test_load_returns_none_without_complete_snapshot(redis_client):
+    assert await load_platform_stats(redis_client) is None
+
+    await redis_client.hset(PLATFORM_STATS_KEY, mapping={"total_workspaces": "3"})
+
+    assert await load_platform_stats(redis_client) is None
+
+
+async def test_load_parses_snapshot(redis_client):
+    await redis_client.hset(
+        PLATFORM_STATS_KEY,
+        mapping={
+            "total_workspaces": "3",
+            "active_users": "5",
+            "pending_invitations": "1",
+            "blacklisted_users": "0",
+            "active_workspaces_24h": "2",
+            "computed_at": "1700000000.5",
+        },
+    )
+
+    stats = await load_platform_stats(redis_client)
+
+    assert stats is not None
+    assert stats.total_workspaces == 3
+    assert stats.active_workspaces_24h == 2
+    assert stats.computed_at == 1700000000.5
@@ -0,0 +1,155 @@
+"""Unit tests for the key-rotation re-encryption engine."""
+
+from __future__ import annotations
+
+import secrets
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import pazpaz.models  # noqa: F401 - populate Base.metadata
+from pazpaz.core.config import settings
+from pazpaz.services.reencryption_service import (
+    CheckpointStore,
+    EncryptedTable,
+    PartitionProgress,
+    Throttle,
+    build_batch_update,
+    build_tasks,
+    detect_encryption_version,
+    discover_encrypted_tables,
+    partition_key_space,
+    reencrypt_value,
+)
+from pazpaz.utils.encryption import (
+    _KEY_REGISTRY,
+    EncryptionKeyMetadata,
+    decrypt_field,
+    encrypt_field,
+    register_key,
+)
+
+
+@pytest.fixture
+def rotated_keys():
+    """Register v1 (old) and v2 (current) keys, restoring the registry after."""
+    saved = dict(_KEY_REGISTRY)
+    _KEY_REGISTRY.clear()
+
+    created_at = datetime.now(UTC)
+    keys = {}
+    for version in ("v1", "v2"):
+        keys[version] = secrets.token_bytes(32)
+        register_key(
+            EncryptionKeyMetadata(
+                key=keys[version],
+                version=version,
+                created_at=created_at,
+                expires_at=created_at + timedelta(days=90),
+                is_current=version == "v2",
+            )
+        )
+
+    yield keys
+
+    _KEY_REGISTRY.clear()
+    _KEY_REGISTRY.update(saved)
+
+
+def test_discover_encrypted_tables_covers_phi_and_tokens():
+    tables = {table.name: table for table in discover_encrypted_tables()}
+
+    assert {"clients", "sessions", "session_versions"} <= set(tables)
+    assert {"subjective", "objective", "assessment", "plan"} <= set(
+        tables["sessions"].columns
+    )
+    assert "delta" in tables["session_versions"].columns
+    assert any("token" in name for name in tables)
+    assert all(table.primary_key == "id" for table in tables.values())
+
+
+def test_partition_key_space_covers_uuid_range_without_gaps():
+    ranges = partition_key_space(4)
+
+    assert len(ranges) == 4
+    assert ranges[0][0] is None
+    assert ranges[-1][1] is None
+    for (_, upper), (lower, _) in zip(ranges, ranges[1:], strict=False):
+        assert upper == lower
+    assert ranges[1][0] == uuid.UUID("40000000-0000-0000-0000-000000000000")
+
+
+def test_build_tasks_has_stable_ids():
+    table = EncryptedTable("sessions", "id", ("subjective",))
+    tasks = build_tasks([table], 3)
+
+    assert [task.task_id for task in tasks] == [
+        "sessions.000",
+        "sessions.001",
+        "sessions.002",
+    ]
+
+
+def test_detect_encryption_version():
+    assert detect_encryption_version(b"v2:ciphertext") == "v2"
+    assert detect_encryption_version(b"\x00\x01legacy-ciphertext") is None
+    assert detect_encryption_version(None) is None
+
+
+def test_reencrypt_value_from_old_version(rotated_keys):
+    raw = b"v1:" + encrypt_field("Lower back pain", rotated_keys["v1"])
+
+    new_value = reencrypt_value(raw, "v2", rotated_keys["v2"])
+
+    assert new_value.startswith(b"v2:")
+    assert decrypt_field(new_value[3:], rotated_keys["v2"]) == "Lower back pain"
+
+
+def test_reencrypt_value_from_legacy_format(rotated_keys):
+    raw = encrypt_field("Legacy note", settings.encryption_key)
+
+    new_value = reencrypt_value(raw, "v2", rotated_keys["v2"])
+
+    assert decrypt_field(new_value[3:], rotated_keys["v2"]) == "Legacy note"
+
+
+def test_reencrypt_value_skips_current_and_filtered_versions(rotated_keys):
+    current = b"v2:" + encrypt_field("Note", rotated_keys["v2"])
+    legacy = encrypt_field("Note", settings.encryption_key)
+
+    assert reencrypt_value(current, "v2", rotated_keys["v2"]) is None
+    assert reencrypt_value(legacy, "v2", rotated_keys["v2"], from_version="v1") is None
+    assert reencrypt_value(legacy, "v2", rotated_keys["v2"], from_version="legacy")
+
+
+def test_checkpoint_store_round_trip(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints")
+    progress = PartitionProgress(
+        "sessions.001", "v2", last_pk=str(uuid.uuid4()), scanned=500, updated=420
+    )
+
+    store.save(progress)
+
+    assert store.load("sessions.001", "v2") == progress
+    # A new rotation ignores checkpoints of the previous one
+    assert store.load("sessions.001", "v3").last_pk is None
+
+
+def test_build_batch_update_uses_values_list():
+    table = EncryptedTable("sessions", "id", ("subjective", "plan"))
+    stmt = build_batch_update(table, "plan", [(uuid.uuid4(), b"v1:old", b"v2:new")])
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("UPDATE sessions SET plan=reencrypted.new_value")
+    assert "FROM (VALUES" in sql
+    assert "sessions.plan = reencrypted.old_value" in sql
+
+
+def test_throttle_delays_to_row_budget():
+    throttle = Throttle(max_rows_per_second=100)
+
+    assert throttle.delay_for(50) == pytest.approx(0.5, abs=0.05)
+    assert Throttle(None, pause_seconds=0.2).delay_for(1000) == 0.2
@@ -0,0 +1,115 @@
+"""Unit tests for delta-compressed session version history."""
+
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+
+from pazpaz.models.session_version import SessionVersion
+from pazpaz.services.session_version_service import (
+    SESSION_VERSION_CHECKPOINT_INTERVAL,
+    _encode_row,
+    apply_delta,
+    apply_text_delta,
+    compute_delta,
+    compute_text_delta,
+)
+
+BASE = {
+    "subjective": "Patient reports lower back pain after lifting boxes.",
+    "objective": "Reduced lumbar flexion.\nTenderness at L4-L5.",
+    "assessment": "Mechanical low back pain.",
+    "plan": "Massage twice weekly.",
+}
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ("", "New note"),
+        ("Old note", ""),
+        ("Pain 6/10 today.", "Pain 4/10 today."),
+        ("Line one.\nLine two.", "Line one.\n\nLine two, amended."),
+        ("כאב בגב התחתון", "כאב בגב התחתון ובצוואר"),
+        ("same", "same"),
+    ],
+)
+def test_text_delta_round_trip(old, new):
+    ops = compute_text_delta(old, new)
+
+    assert apply_text_delta(old, ops) == new
+
+
+def test_text_delta_stores_only_changes():
+    old = "word " * 500
+    new = old + "one more sentence."
+
+    ops = compute_text_delta(old, new)
+
+    assert ops == [[0, len(old)], [1, "one more sentence."]]
+
+
+def test_apply_text_delta_rejects_mismatched_base():
+    ops = compute_text_delta("short", "short text")
+
+    with pytest.raises(ValueError):
+        apply_text_delta("different base text", ops)
+
+
+def test_delta_round_trip_with_cleared_and_new_fields():
+    new = {
+        **BASE,
+        "objective": None,
+        "plan": "Massage twice weekly. Add stretching routine.",
+    }
+
+    delta = compute_delta(BASE, new)
+
+    assert set(delta) == {"objective", "plan"}
+    assert delta["objective"] is None
+    assert apply_delta(BASE, delta) == new
+    assert (
+        apply_delta({**BASE, "plan": None}, compute_delta({**BASE, "plan": None}, new))
+        == new
+    )
+
+
+def _row(version_number: int) -> SessionVersion:
+    return SessionVersion(
+        session_id=uuid.uuid4(),
+        version_number=version_number,
+        created_by_user_id=uuid.uuid4(),
+    )
+
+
+def test_encode_small_amendment_as_delta():
+    row = _row(2)
+    amended = {**BASE, "assessment": "Mechanical low back pain, improving."}
+
+    _encode_row(row, amended, previous=BASE)
+
+    assert row.is_checkpoint is False
+    assert row.subjective is None and row.plan is None
+    assert apply_delta(BASE, json.loads(row.delta)) == amended
+
+
+def test_encode_checkpoint_positions_store_snapshot():
+    row = _row(SESSION_VERSION_CHECKPOINT_INTERVAL + 1)
+
+    _encode_row(row, BASE, previous=BASE)
+
+    assert row.is_checkpoint is True
+    assert row.delta is None
+    assert row.subjective == BASE["subjective"]
+
+
+def test_encode_rewrite_falls_back_to_snapshot():
+    row = _row(2)
+    rewritten = {field: f"Entirely new {field} text" for field in BASE}
+
+    _encode_row(row, rewritten, previous=BASE)
+
+    assert row.is_checkpoint is True
+    assert row.plan == rewritten["plan"]
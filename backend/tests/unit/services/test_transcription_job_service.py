@@ -0,0 +1,216 @@
+"""Unit tests for asynchronous long-audio transcription jobs."""
+
+import io
+import uuid
+
+import pytest
+
+from pazpaz.ai.audio_chunking import AudioSegment
+from pazpaz.ai.transcription_pipeline import transcribe_segments
+from pazpaz.services import transcription_job_service
+from pazpaz.services.transcription_job_service import (
+    TRANSCRIPTION_JOB_KEY,
+    TRANSCRIPTION_JOB_TTL_SECONDS,
+    TranscriptionJobStatus,
+    TranscriptionUploadTooLargeError,
+    _update_job,
+    create_transcription_job,
+    get_transcription_job,
+    run_transcription_job,
+    store_job_audio,
+    stream_job_events,
+    transcription_audio_object_key,
+)
+from tests.unit.ai.test_transcription_pipeline import FakeTranscriptionProvider
+from tests.unit.services.test_attachment_upload_service import FakeS3Client
+
+WORKSPACE_ID = uuid.uuid4()
+
+
+class FakeTransferS3Client(FakeS3Client):
+    """FakeS3Client with the managed (streaming) transfer methods."""
+
+    def __init__(self):
+        super().__init__()
+        self.extra_args: dict[str, dict] = {}
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None):  # noqa: N803
+        self.objects[Key] = Fileobj.read()
+        self.extra_args[Key] = ExtraArgs or {}
+
+    def download_file(self, Bucket, Key, Filename):  # noqa: N803
+        with open(Filename, "wb") as file:
+            file.write(self._get(Key))
+
+
+@pytest.fixture
+def s3_client():
+    return FakeTransferS3Client()
+
+
+@pytest.fixture
+def split_by_line(monkeypatch):
+    """Replace ffmpeg splitting: one segment per line of the uploaded file."""
+
+    async def transcribe_recording(path, provider, max_concurrency, on_progress):
+        with open(path, "rb") as recording:
+            lines = recording.read().splitlines()
+        segments = [
+            AudioSegment(i, i * 60.0, (i + 1) * 60.0) for i in range(len(lines))
+        ]
+
+        async def read_segment(segment: AudioSegment) -> bytes:
+            return lines[segment.index]
+
+        await on_progress(0, len(segments))
+        return await transcribe_segments(
+            provider, segments, read_segment, max_concurrency, on_progress
+        )
+
+    monkeypatch.setattr(
+        transcription_job_service, "transcribe_recording", transcribe_recording
+    )
+
+
+async def _queue_job(
+    redis_client, s3_client, audio: bytes, cleanup: bool = False
+) -> str:
+    job_id = str(uuid.uuid4())
+    audio_key = transcription_audio_object_key(WORKSPACE_ID, job_id)
+    store_job_audio(s3_client, audio_key, io.BytesIO(audio), max_bytes=1024)
+    await create_transcription_job(
+        redis_client,
+        job_id,
+        workspace_id=WORKSPACE_ID,
+        user_id=uuid.uuid4(),
+        field_name="subjective",
+        filename="session.webm",
+        cleanup=cleanup,
+        audio_key=audio_key,
+    )
+    return job_id
+
+
+async def test_job_transcribes_and_streams_result(
+    redis_client, s3_client, split_by_line
+):
+    job_id = await _queue_job(redis_client, s3_client, b"he:first\nhe:second\nhe:third")
+
+    job = await run_transcription_job(
+        redis_client, s3_client, job_id, FakeTranscriptionProvider(), max_concurrency=2
+    )
+
+    assert job.status == TranscriptionJobStatus.COMPLETED
+    assert job.text == "first second third"
+    assert (job.completed_segments, job.total_segments) == (3, 3)
+    # Staged audio is deleted once the worker has read it
+    assert s3_client.objects == {}
+    # Transcript is stored encrypted
+    stored = await redis_client.hget(f"transcription:job:{job_id}", "text")
+    assert "first" not in stored
+
+    events = [event async for event in stream_job_events(redis_client, job_id)]
+    assert events == [
+        (
+            "done",
+            {
+                "text": "first second third",
+                "cleaned_text": None,
+                "language": "he",
+                "duration_seconds": 180.0,
+            },
+        )
+    ]
+    assert await get_transcription_job(redis_client, job_id, uuid.uuid4()) is None
+
+
+async def test_job_runs_cleanup_when_requested(
+    redis_client, s3_client, split_by_line, monkeypatch
+):
+    async def cleanup_transcription(raw_text, field_name, language):
+        return raw_text.upper()
+
+    monkeypatch.setattr(
+        transcription_job_service, "cleanup_transcription", cleanup_transcription
+    )
+    job_id = await _queue_job(
+        redis_client, s3_client, b"en:um pain\nen:level 7", cleanup=True
+    )
+
+    job = await run_transcription_job(
+        redis_client, s3_client, job_id, FakeTranscriptionProvider(), max_concurrency=4
+    )
+
+    assert job.text == "um pain level 7"
+    assert job.cleaned_text == "UM PAIN LEVEL 7"
+
+
+async def test_failed_job_reports_error(redis_client, s3_client, split_by_line):
+    job_id = await _queue_job(redis_client, s3_client, b"he:one\nhe:two")
+    provider = FakeTranscriptionProvider(fail_on="segment-001.ogg")
+
+    with pytest.raises(Exception):
+        await run_transcription_job(
+            redis_client, s3_client, job_id, provider, max_concurrency=2
+        )
+
+    events = [event async for event in stream_job_events(redis_client, job_id)]
+    assert events[-1][0] == "error"
+
+
+async def test_upload_over_limit_is_rejected(s3_client):
+    audio_key = transcription_audio_object_key(WORKSPACE_ID, str(uuid.uuid4()))
+
+    with pytest.raises(TranscriptionUploadTooLargeError):
+        store_job_audio(s3_client, audio_key, io.BytesIO(b"x" * 1200), max_bytes=1000)
+
+    assert s3_client.objects == {}
+
+
+async def test_audio_is_staged_encrypted_outside_redis(redis_client, s3_client):
+    job_id = await _queue_job(redis_client, s3_client, b"RIFF session audio")
+
+    audio_key = transcription_audio_object_key(WORKSPACE_ID, job_id)
+    assert audio_key.startswith("quarantine/")
+    assert s3_client.objects[audio_key] == b"RIFF session audio"
+    assert s3_client.extra_args[audio_key]["ServerSideEncryption"] == "AES256"
+    # Redis holds only the job state
+    assert await redis_client.keys("*") == [TRANSCRIPTION_JOB_KEY.format(job_id=job_id)]
+
+
+async def test_job_with_expired_audio_fails(redis_client, s3_client):
+    job_id = await _queue_job(redis_client, s3_client, b"he:one")
+    s3_client.objects.clear()
+
+    job = await run_transcription_job(
+        redis_client, s3_client, job_id, FakeTranscriptionProvider(), max_concurrency=2
+    )
+
+    assert job is None
+    job = await get_transcription_job(redis_client, job_id)
+    assert job.status == TranscriptionJobStatus.FAILED
+    assert "expired" in job.error
+
+
+async def test_update_does_not_recreate_expired_job(redis_client):
+    job_id = str(uuid.uuid4())
+
+    updated = await _update_job(
+        redis_client, job_id, status=TranscriptionJobStatus.FAILED.value
+    )
+
+    assert updated is False
+    assert not await redis_client.exists(TRANSCRIPTION_JOB_KEY.format(job_id=job_id))
+    assert await get_transcription_job(redis_client, job_id) is None
+
+
+async def test_update_renews_job_ttl(redis_client, s3_client):
+    job_id = await _queue_job(redis_client, s3_client, b"he:one")
+    key = TRANSCRIPTION_JOB_KEY.format(job_id=job_id)
+    await redis_client.expire(key, 5)
+
+    await _update_job(
+        redis_client, job_id, status=TranscriptionJobStatus.PROCESSING.value
+    )
+
+    assert await redis_client.ttl(key) > TRANSCRIPTION_JOB_TTL_SECONDS - 5
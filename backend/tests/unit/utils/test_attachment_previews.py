@@ -0,0 +1,88 @@
+"""Unit tests for attachment thumbnail and preview rendering."""
+
+import io
+import shutil
+
+import pytest
+from PIL import Image
+from pypdf import PdfWriter
+
+from pazpaz.core.storage import build_derived_object_key
+from pazpaz.utils.attachment_previews import (
+    PREVIEW_MAX_DIMENSION,
+    PREVIEW_VARIANT,
+    THUMBNAIL_MAX_DIMENSION,
+    THUMBNAIL_VARIANT,
+    PreviewRenderError,
+    render_attachment_previews,
+)
+from pazpaz.utils.file_validation import FileType
+
+
+def _image_bytes(
+    size: tuple[int, int], mode: str, image_format: str, color="blue"
+) -> bytes:
+    buffer = io.BytesIO()
+    Image.new(mode, size, color=color).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def test_image_previews_are_small_webp():
+    """Test that a large photo yields bounded WebP thumbnail and preview."""
+    photo = _image_bytes((4000, 3000), "RGB", "JPEG")
+
+    images = render_attachment_previews(photo, FileType.JPEG)
+
+    expected = {
+        THUMBNAIL_VARIANT: THUMBNAIL_MAX_DIMENSION,
+        PREVIEW_VARIANT: PREVIEW_MAX_DIMENSION,
+    }
+    for variant, max_dimension in expected.items():
+        with Image.open(io.BytesIO(images[variant])) as img:
+            assert img.format == "WEBP"
+            assert max(img.size) == max_dimension
+            assert img.size[0] / img.size[1] == pytest.approx(4 / 3, rel=0.01)
+    assert len(images[THUMBNAIL_VARIANT]) < len(photo)
+
+
+def test_png_transparency_preserved():
+    """Test that transparent PNGs keep their alpha channel."""
+    logo = _image_bytes((800, 800), "LA", "PNG", color=(0, 0))
+
+    images = render_attachment_previews(logo, FileType.PNG)
+
+    with Image.open(io.BytesIO(images[THUMBNAIL_VARIANT])) as img:
+        assert img.mode == "RGBA"
+
+
+@pytest.mark.skipif(shutil.which("pdftoppm") is None, reason="needs poppler-utils")
+def test_pdf_preview_is_first_page():
+    """Test that PDFs are previewed by their first page."""
+    writer = PdfWriter()
+    writer.add_blank_page(width=612, height=792)
+    writer.add_blank_page(width=792, height=612)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+
+    images = render_attachment_previews(buffer.getvalue(), FileType.PDF)
+
+    with Image.open(io.BytesIO(images[PREVIEW_VARIANT])) as img:
+        assert img.size[1] == PREVIEW_MAX_DIMENSION  # Portrait first page
+
+
+def test_unrenderable_content_raises():
+    """Test that corrupt content and unsupported types raise PreviewRenderError."""
+    with pytest.raises(PreviewRenderError):
+        render_attachment_previews(b"not an image", FileType.JPEG)
+
+    with pytest.raises(PreviewRenderError):
+        render_attachment_previews(b"ID3", FileType.MP3)
+
+
+def test_derived_object_key_next_to_original():
+    """Test that derived objects share the original's prefix and stem."""
+    key = "workspaces/w/sessions/s/attachments/a1.jpg"
+
+    assert build_derived_object_key(key, "thumbnail", "webp") == (
+        "workspaces/w/sessions/s/attachments/a1.thumbnail.webp"
+    )
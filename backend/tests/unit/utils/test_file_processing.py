@@ -0,0 +1,93 @@
+"""Unit tests for the resource-limited upload processing pool."""
+
+import asyncio
+import io
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from pazpaz.utils.file_processing import (
+    FileProcessingCapacityError,
+    FileProcessingExecutor,
+    FileProcessingLimitError,
+)
+from pazpaz.utils.file_sanitization import validate_and_sanitize_file
+from pazpaz.utils.file_validation import FileType, FileValidationError
+
+
+@pytest.fixture
+def executor():
+    """Single-worker pool with tight limits, shut down after the test."""
+    pool = FileProcessingExecutor(
+        max_workers=1,
+        max_pending=1,
+        memory_limit_bytes=512 * 1024 * 1024,
+        timeout_seconds=1.0,
+    )
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def jpeg_with_exif() -> bytes:
+    """JPEG carrying EXIF metadata (camera model)."""
+    img = Image.new("RGB", (64, 64), color="red")
+    exif = Image.Exif()
+    exif[0x0110] = "Test Camera"  # Model
+    buffer = io.BytesIO()
+    img.save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+class TestFileProcessingExecutor:
+    """Test suite for FileProcessingExecutor."""
+
+    async def test_sanitizes_upload_in_worker_process(self, executor, jpeg_with_exif):
+        """Test that validation + sanitization run in a worker, in one job."""
+        worker_pid = await executor.run("test", os.getpid)
+
+        processed = await executor.run(
+            "upload", validate_and_sanitize_file, "photo.jpg", jpeg_with_exif
+        )
+
+        assert worker_pid != os.getpid()
+        assert processed.file_type == FileType.JPEG
+        assert processed.filename == "photo.jpg"
+        with Image.open(io.BytesIO(processed.content)) as img:
+            assert not img.getexif()
+
+    async def test_validation_errors_propagate(self, executor):
+        """Test that validation errors raised in the worker reach the caller."""
+        with pytest.raises(FileValidationError):
+            await executor.run(
+                "upload", validate_and_sanitize_file, "script.jpg", b"#!/bin/sh\n" * 8
+            )
+
+    async def test_time_limit(self, executor):
+        """Test that a job running past the time limit is aborted."""
+        with pytest.raises(FileProcessingLimitError):
+            await executor.run("test", time.sleep, 10)
+
+        assert executor.pending == 0
+        assert await executor.run("test", int, "7") == 7
+
+    async def test_memory_limit(self, executor):
+        """Test that an allocation beyond the memory limit fails the job only."""
+        with pytest.raises(FileProcessingLimitError):
+            await executor.run("test", bytearray, 1024 * 1024 * 1024)
+
+        assert await executor.run("test", int, "7") == 7
+
+    async def test_rejects_jobs_beyond_max_pending(self, executor):
+        """Test that the admission limit rejects instead of queueing."""
+        blocked = asyncio.create_task(executor.run("test", time.sleep, 0.2))
+        await asyncio.sleep(0)
+
+        with pytest.raises(FileProcessingCapacityError):
+            await executor.run("test", int, "7")
+
+        await blocked
+        assert executor.pending == 0
@@ -24,7 +24,7 @@ export interface BlacklistEntry {
  * - Fetching pending invitations
  * - Inviting new therapists
  * - Resending invitations
- * - Managing workspaces (list, suspend, reactivate, delete)
+ * - Managing workspaces (paginated list, suspend, reactivate, delete)
  * - Managing blacklist (list, add, remove)
  *
  * Security:
@@ -39,6 +39,11 @@ export interface BlacklistEntry {
 export function usePlatformAdmin() {
   const pendingInvitations: Ref<PendingInvitation[]> = ref([])
   const workspaces: Ref<Workspace[]> = ref([])
+  const workspacesTotal = ref(0)
+  const hasMoreWorkspaces = ref(false)
+  const workspacesPage = ref(1)
+  const workspacesSearch = ref<string | undefined>(undefined)
+  const workspacesPageSize = 50 // Backend default (max 100)
   const blacklist: Ref<BlacklistEntry[]> = ref([])
   const loading = ref(false)
   const error = ref<string | null>(null)
@@ -188,18 +193,27 @@ export function usePlatformAdmin() {
   // ==================== WORKSPACE MANAGEMENT ====================
 
   /**
-   * Fetch all workspaces
+   * Fetch a page of workspaces
    *
-   * GET /api/v1/platform-admin/workspaces
+   * GET /api/v1/platform-admin/workspaces?page=&page_size=&search=
+   *
+   * The backend paginates (newest first). Without append, loads the first
+   * page and replaces the list; with append, adds the next page (see
+   * loadMoreWorkspaces). Updates workspacesTotal and hasMoreWorkspaces.
    *
    * Error responses:
    * - 401: Not authenticated
    * - 403: Not platform admin
    */
-  async function fetchWorkspaces(search?: string): Promise<void> {
+  async function fetchWorkspaces(search?: string, append = false): Promise<void> {
     loading.value = true
     error.value = null
 
+    if (!append) {
+      workspacesPage.value = 1
+      workspacesSearch.value = search
+    }
+
     try {
       const response = await apiClient.get<{
         workspaces: Array<{
@@ -211,12 +225,19 @@ export function usePlatformAdmin() {
           user_count: number
           session_count: number
         }>
+        total: number
+        page: number
+        total_pages: number
       }>('/platform-admin/workspaces', {
-        params: search ? { search } : undefined,
+        params: {
+          page: workspacesPage.value,
+          page_size: workspacesPageSize,
+          ...(workspacesSearch.value ? { search: workspacesSearch.value } : {}),
+        },
       })
 
       // Transform API response to Workspace format
-      workspaces.value = response.data.workspaces.map((ws) => ({
+      const page = response.data.workspaces.map((ws) => ({
         id: ws.id,
         name: ws.name,
         email: ws.owner_email,
@@ -226,15 +247,43 @@ export function usePlatformAdmin() {
         activeUsers: ws.user_count, // Backend doesn't provide this separately yet
         appointmentCount: ws.session_count,
       }))
+
+      if (append) {
+        // Skip rows already shown (the list can shift while paging)
+        const loaded = new Set(workspaces.value.map((w) => w.id))
+        workspaces.value = [
+          ...workspaces.value,
+          ...page.filter((w) => !loaded.has(w.id)),
+        ]
+      } else {
+        workspaces.value = page
+      }
+      workspacesTotal.value = response.data.total
+      hasMoreWorkspaces.value = response.data.page < response.data.total_pages
     } catch (err) {
       const apiError = err as ApiError
       error.value = apiError.body?.detail || 'Failed to load workspaces'
       console.error('Failed to fetch workspaces:', err)
+      if (append) {
+        workspacesPage.value -= 1
+      }
     } finally {
       loading.value = false
     }
   }
 
+  /**
+   * Load the next page of workspaces and append it to the list
+   *
+   * Keeps the search of the last fetchWorkspaces call.
+   */
+  async function loadMoreWorkspaces(): Promise<void> {
+    if (!hasMoreWorkspaces.value || loading.value) return
+
+    workspacesPage.value += 1
+    await fetchWorkspaces(workspacesSearch.value, true)
+  }
+
   /**
    * Suspend a workspace
    *
@@ -325,6 +374,7 @@ export function usePlatformAdmin() {
 
       // Remove workspace from local state
       workspaces.value = workspaces.value.filter((w) => w.id !== workspaceId)
+      workspacesTotal.value = Math.max(workspacesTotal.value - 1, 0)
     } catch (err) {
       const apiError = err as ApiError
       error.value = apiError.body?.detail || 'Failed to delete workspace'
@@ -442,6 +492,8 @@ export function usePlatformAdmin() {
     // State
     pendingInvitations,
     workspaces,
+    workspacesTotal,
+    hasMoreWorkspaces,
     blacklist,
     loading,
     error,
@@ -453,6 +505,7 @@ export function usePlatformAdmin() {
 
     // Methods - Workspaces
     fetchWorkspaces,
+    loadMoreWorkspaces,
     suspendWorkspace,
     reactivateWorkspace,
     deleteWorkspace,